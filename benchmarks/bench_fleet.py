@@ -0,0 +1,369 @@
+"""Offline fleet simulation of KasprApp reconciliation.
+
+Runs the operator's reconciliation workers and handlers against an
+in-process fake Kubernetes API and fake member status endpoints (see
+:mod:`benchmarks.fake_cluster`), so no cluster is needed. N apps with M
+agents each are driven through these scenarios:
+
+* create:    no child resources exist yet
+* steady:    nothing changed since the last reconcile
+* resume:    the operator restarted with nothing changed; apps are resumed
+             through the startup warm-up and checked against one listing
+* update:    the spec of every app changed (a new image)
+* drift:     child resources were edited out of band
+* rebalance: every app rolled its pods and its members are rebalancing
+
+For each scenario the run reports reconciles/sec, API calls per reconcile,
+member status requests per reconcile, p50/p99 reconcile latency and RSS.
+
+Usage:
+    python -m benchmarks.bench_fleet [--apps N] [--components M] [--workers W]
+        [--api-latency SECONDS] [--member-latency SECONDS] [--calls]
+        [--server-side-apply] [--api-qps QPS] [--api-burst N]
+"""
+
+import argparse
+import asyncio
+import copy
+import logging
+import time
+from typing import Dict, List
+
+import yaml
+
+import kaspr.handlers.kasprapp as kasprapp
+from kaspr.resources import KasprApp
+from kaspr.resources.appcomponent import BaseAppComponent
+from kaspr.resources.base import BaseResource
+from kaspr.sensors import SensorDelegate
+from kaspr.types.settings import Settings
+from kaspr.utils.api_limiter import ApiRateLimiter, RateLimitedApiClient
+from kaspr.utils.lru import LRUCache
+from kaspr.utils.member_status import MemberStatusStore
+from kaspr.utils.warmup import ChildInventory, startup_warmup
+from benchmarks.common import EXAMPLES_DIR
+from benchmarks.fake_cluster import (
+    FakeApiClient,
+    FakeCluster,
+    FakeMemberClient,
+    percentile,
+    rss_mb,
+)
+
+NAMESPACE = "fleet"
+APP_EXAMPLE = "analytics-counter/app-analytics.yaml"
+AGENT_EXAMPLE = "analytics-counter/agent-counter-processor.yaml"
+
+logger = logging.getLogger("kaspr.benchmarks.fleet")
+
+
+class RateLimitedFakeApiClient(RateLimitedApiClient, FakeApiClient):
+    """Fake API client paced by the operator's API rate limiter."""
+
+
+def _load(path: str) -> Dict:
+    with open(f"{EXAMPLES_DIR}/{path}") as f:
+        return yaml.safe_load(f)
+
+
+def seed(cluster: FakeCluster, apps: int, components: int) -> List[str]:
+    """Create the KasprApps, their agents and the secrets they reference."""
+    app_doc, agent_doc = _load(APP_EXAMPLE), _load(AGENT_EXAMPLE)
+    secret_name = app_doc["spec"]["authentication"]["passwordSecret"]["secretName"]
+    cluster.put(
+        "secrets",
+        NAMESPACE,
+        {"metadata": {"name": secret_name}, "data": {"password": "c2VjcmV0"}},
+    )
+    names = []
+    for i in range(apps):
+        name = f"app-{i}"
+        cluster.put(
+            "kasprapps",
+            NAMESPACE,
+            {**app_doc, "metadata": {"name": name, "annotations": {}}},
+        )
+        for j in range(components):
+            cluster.put(
+                "kaspragents",
+                NAMESPACE,
+                {
+                    **agent_doc,
+                    "metadata": {
+                        "name": f"{name}-agent-{j}",
+                        "labels": {KasprApp.KASPR_APP_NAME_LABEL: name},
+                    },
+                },
+            )
+        names.append(name)
+    return names
+
+
+def update_specs(cluster: FakeCluster, names: List[str]):
+    for name in names:
+        app = copy.deepcopy(cluster.get("kasprapps", NAMESPACE, name))
+        app["spec"]["image"] = f"kasprio/kaspr:fleet-{app['metadata']['resourceVersion']}"
+        cluster.put("kasprapps", NAMESPACE, app)
+
+
+def edit_children(cluster: FakeCluster, names: List[str]):
+    for config_map in cluster.list("configmaps", NAMESPACE):
+        config_map["data"] = {}
+    for stateful_set in cluster.list("statefulsets", NAMESPACE):
+        stateful_set["spec"]["template"]["spec"]["containers"][0]["image"] = "drifted"
+
+
+def roll_members(cluster: FakeCluster, members: FakeMemberClient, names: List[str]):
+    for stateful_set in cluster.list("statefulsets", NAMESPACE):
+        cluster.replace_pods(NAMESPACE, stateful_set["metadata"]["name"])
+    members.leader = 1
+    members.rebalancing = {0, 1}
+
+
+class Fleet:
+    """Operator state wired to a fake cluster."""
+
+    def __init__(self, conf: Settings, cluster: FakeCluster, members: FakeMemberClient):
+        self.conf = conf
+        self.cluster = cluster
+        self.members = members
+        self.latencies: List[float] = []
+        self._pending = 0
+        self._done = asyncio.Event()
+
+    def install(self):
+        """Point the operator's shared clients and caches at the fakes."""
+        api_client = RateLimitedFakeApiClient(
+            self.cluster,
+            limiter=ApiRateLimiter(
+                qps=self.conf.kube_api_qps, burst=self.conf.kube_api_burst
+            ),
+        )
+        sensor = SensorDelegate()
+        KasprApp.conf = self.conf
+        BaseResource.server_side_apply = self.conf.server_side_apply_enabled
+        KasprApp.shared_api_client = api_client
+        BaseAppComponent.shared_api_client = api_client
+        KasprApp.web_client = self.members
+        KasprApp.status_client = self.members
+        KasprApp.member_status_store = MemberStatusStore(
+            ttl=self.conf.client_status_cache_ttl_seconds
+        )
+        KasprApp.render_cache = (
+            LRUCache(self.conf.render_cache_size)
+            if self.conf.render_cache_size > 0
+            else None
+        )
+        KasprApp.sensor = sensor
+        BaseAppComponent.sensor = sensor
+
+        reconcile_queued_app = kasprapp.reconcile_queued_app
+
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await reconcile_queued_app(*args, **kwargs)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+                self._pending -= 1
+                if self._pending <= 0:
+                    self._done.set()
+
+        # Workers look the coroutine up at call time
+        kasprapp.reconcile_queued_app = timed
+        return reconcile_queued_app
+
+    async def run(self, names: List[str]) -> Dict[str, float]:
+        """Queue every app once and wait until all of them were reconciled."""
+        self.latencies = []
+        self.cluster.reset_counters()
+        status_requests = self.members.requests
+        self._pending = len(names)
+        self._done.clear()
+        start = time.perf_counter()
+        for name in names:
+            await kasprapp.request_reconciliation(name, namespace=NAMESPACE)
+        await self._done.wait()
+        elapsed = time.perf_counter() - start
+        reconciles = len(self.latencies)
+        return {
+            "reconciles": reconciles,
+            "per_sec": reconciles / elapsed,
+            "api_calls": self.cluster.total_calls / reconciles,
+            "status_requests": (self.members.requests - status_requests) / reconciles,
+            "p50_ms": percentile(self.latencies, 50) * 1e3,
+            "p99_ms": percentile(self.latencies, 99) * 1e3,
+            "rss_mb": rss_mb(),
+            "calls": dict(self.cluster.calls),
+        }
+
+
+    async def resume(self, names: List[str]) -> Dict[str, float]:
+        """Resume every app as after an operator restart, with the startup warm-up.
+
+        Measures until every app was checked; apps found up to date are
+        only reconciled after the jitter window and are not waited for.
+        """
+        self.latencies = []
+        self.cluster.reset_counters()
+        status_requests = self.members.requests
+        if KasprApp.render_cache is not None:
+            KasprApp.render_cache = LRUCache(self.conf.render_cache_size)
+        startup_warmup.start(
+            ChildInventory(KasprApp.shared_api_client),
+            window_seconds=3600.0,
+            jitter_seconds=self.conf.startup_jitter_seconds,
+        )
+        semaphore = asyncio.Semaphore(self.conf.kopf_worker_limit)
+
+        async def resume_app(name: str):
+            body = self.cluster.get("kasprapps", NAMESPACE, name)
+            async with semaphore:
+                await kasprapp.on_resume(
+                    spec=body["spec"],
+                    name=name,
+                    meta=body["metadata"],
+                    status=body.get("status"),
+                    patch=kasprapp.kopf.Patch(),
+                    namespace=NAMESPACE,
+                    annotations=body["metadata"].get("annotations") or {},
+                    logger=logger,
+                )
+
+        # Drifted apps are reconciled right away; wait for those only
+        requested = []
+        request_reconciliation = kasprapp.request_reconciliation
+
+        async def counted(name, *args, **kwargs):
+            requested.append(name)
+            return await request_reconciliation(name, *args, **kwargs)
+
+        kasprapp.request_reconciliation = counted
+        self._pending = len(names) + 1
+        self._done.clear()
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(resume_app(name) for name in names))
+            self._pending = len(requested) - len(self.latencies)
+            if self._pending > 0:
+                await self._done.wait()
+            elapsed = time.perf_counter() - start
+        finally:
+            kasprapp.request_reconciliation = request_reconciliation
+            startup_warmup.finish()
+            for name in names:
+                kasprapp.reconciliation_queue.discard((NAMESPACE, name))
+        return {
+            "reconciles": len(names),
+            "per_sec": len(names) / elapsed,
+            "api_calls": self.cluster.total_calls / len(names),
+            "status_requests": (self.members.requests - status_requests) / len(names),
+            "p50_ms": percentile(self.latencies, 50) * 1e3,
+            "p99_ms": percentile(self.latencies, 99) * 1e3,
+            "rss_mb": rss_mb(),
+            "calls": dict(self.cluster.calls),
+        }
+
+
+def report_calls(results: Dict[str, Dict[str, float]]):
+    for name, r in results.items():
+        print(f"API calls during {name}")
+        for (verb, resource), count in sorted(r["calls"].items()):
+            print(f"  {verb:<8} {resource:<32} {count:>8}")
+
+
+def report(title: str, results: Dict[str, Dict[str, float]]):
+    print(title)
+    print(
+        f"  {'scenario':<10} {'reconciles':>10} {'rec/s':>9} {'api/rec':>8} "
+        f"{'status/rec':>10} {'p50 ms':>8} {'p99 ms':>8} {'rss MiB':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"  {name:<10} {r['reconciles']:>10} {r['per_sec']:>9.1f} "
+            f"{r['api_calls']:>8.1f} {r['status_requests']:>10.1f} "
+            f"{r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['rss_mb']:>8.1f}"
+        )
+
+
+async def simulate(args) -> Dict[str, Dict[str, float]]:
+    conf = Settings(
+        reconcile_workers=args.workers,
+        reconcile_qps=args.qps,
+        reconcile_burst=max(args.apps, 1),
+        reconcile_resync_interval_seconds=3600.0,
+        server_side_apply_enabled=args.server_side_apply,
+        kube_api_qps=args.api_qps,
+        kube_api_burst=args.api_burst,
+    )
+    cluster = FakeCluster(latency=args.api_latency)
+    members = FakeMemberClient(latency=args.member_latency)
+    names = seed(cluster, args.apps, args.components)
+    fleet = Fleet(conf, cluster, members)
+    reconcile_queued_app = fleet.install()
+    kasprapp.start_reconciliation_workers(conf, logger)
+    results = {}
+    try:
+        results["create"] = await fleet.run(names)
+        results["steady"] = await fleet.run(names)
+        results["resume"] = await fleet.resume(names)
+        update_specs(cluster, names)
+        results["update"] = await fleet.run(names)
+        edit_children(cluster, names)
+        results["drift"] = await fleet.run(names)
+        roll_members(cluster, members, names)
+        results["rebalance"] = await fleet.run(names)
+    finally:
+        await kasprapp.stop_reconciliation_workers()
+        kasprapp.reconcile_queued_app = reconcile_queued_app
+        kasprapp.known_apps.clear()
+        BaseResource.server_side_apply = False
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=100)
+    parser.add_argument("--components", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=Settings.reconcile_workers)
+    parser.add_argument(
+        "--qps",
+        type=float,
+        default=1e6,
+        help="Reconcile queue rate limit (default: effectively unlimited)",
+    )
+    parser.add_argument("--api-latency", type=float, default=0.0)
+    parser.add_argument("--member-latency", type=float, default=0.0)
+    parser.add_argument(
+        "--calls", action="store_true", help="Print API calls by verb and resource"
+    )
+    parser.add_argument(
+        "--server-side-apply",
+        action="store_true",
+        help="Sync child resources with server-side apply",
+    )
+    parser.add_argument(
+        "--api-qps",
+        type=float,
+        default=0.0,
+        help="API rate limit per verb (default: unlimited)",
+    )
+    parser.add_argument("--api-burst", type=int, default=Settings.kube_api_burst)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+    results = asyncio.run(simulate(args))
+    if args.calls:
+        report_calls(results)
+    report(
+        f"KasprApp fleet, {args.apps} apps x {args.components} agents, "
+        f"{args.workers} workers"
+        + (", server-side apply" if args.server_side_apply else "")
+        + (f", {args.api_qps:g} API qps/verb" if args.api_qps > 0 else ""),
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
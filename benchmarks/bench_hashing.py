@@ -0,0 +1,41 @@
+"""Micro-benchmarks for resource hashing.
+
+Compares the legacy ``compute_hash`` implementation with the compat and fast
+digests from :mod:`kaspr.utils.hashing` on real rendered resources.
+
+Usage:
+    python -m benchmarks.bench_hashing [--number N]
+"""
+
+import argparse
+
+from kaspr.utils.hashing import compat_digest, fast_digest, legacy_digest
+from benchmarks.common import load_example_app, report, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = load_example_app()
+    stateful_set = app.stateful_set.to_dict()
+    watch_fields = app.prepare_statefulset_watch_fields(app.stateful_set)
+    assert compat_digest(stateful_set) == legacy_digest(stateful_set)
+
+    for title, data in (
+        ("StatefulSet (to_dict)", stateful_set),
+        ("StatefulSet watch fields", watch_fields),
+    ):
+        report(
+            f"{title}, {args.number} calls",
+            {
+                "legacy compute_hash": timeit(lambda: legacy_digest(data), args.number),
+                "compat_digest": timeit(lambda: compat_digest(data), args.number),
+                "fast_digest": timeit(lambda: fast_digest(data), args.number),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Memory benchmark for the spec models of a fleet of apps.
+
+Loads the spec of every app and component of a fleet (the analytics
+example app with copies of its agent as components) through the real
+schemas and measures the memory held by the resulting models with
+tracemalloc. The same model trees are then rebuilt with the previous
+``SimpleNamespace`` based layout, where every model kept its attributes
+in a per-instance ``__dict__``, for comparison.
+
+Usage:
+    python -m benchmarks.bench_models [--apps N] [--components M]
+"""
+
+import argparse
+import gc
+import os
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+import yaml
+
+from kaspr.types.base import BaseModel
+from kaspr.types.schemas import KasprAgentSpecSchema
+from kaspr.types.schemas.kasprapp_spec import KasprAppSpecSchema
+from benchmarks.common import EXAMPLES_DIR
+
+APP_EXAMPLE = "analytics-counter/app-analytics.yaml"
+AGENT_EXAMPLE = "analytics-counter/agent-counter-processor.yaml"
+
+
+def _spec(path: str):
+    with open(os.path.join(EXAMPLES_DIR, path)) as f:
+        return yaml.safe_load(f)["spec"]
+
+
+def load_fleet(apps: int, components: int) -> List[Any]:
+    """Load the specs of ``apps`` apps with ``components`` components each."""
+    app_schema, app_spec = KasprAppSpecSchema(), _spec(APP_EXAMPLE)
+    agent_schema, agent_spec = KasprAgentSpecSchema(), _spec(AGENT_EXAMPLE)
+    fleet = []
+    for _ in range(apps):
+        fleet.append(app_schema.load(app_spec))
+        fleet.extend(agent_schema.load(agent_spec) for _ in range(components))
+    return fleet
+
+
+def as_namespace(value: Any) -> Any:
+    """Rebuild a model tree with ``SimpleNamespace`` models."""
+    if isinstance(value, BaseModel):
+        return SimpleNamespace(**{k: as_namespace(v) for k, v in value._items()})
+    if isinstance(value, list):
+        return [as_namespace(item) for item in value]
+    return value
+
+
+def count_models(value: Any) -> int:
+    if isinstance(value, BaseModel):
+        return 1 + sum(count_models(v) for _, v in value._items())
+    if isinstance(value, list):
+        return sum(count_models(item) for item in value)
+    return 0
+
+
+def measure(build: Callable[[], Any]) -> float:
+    """MiB still allocated by the object ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return size / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=1000)
+    parser.add_argument("--components", type=int, default=20)
+    args = parser.parse_args()
+
+    fleet = load_fleet(args.apps, args.components)
+    models = sum(count_models(spec) for spec in fleet)
+    del fleet
+
+    compact = measure(lambda: load_fleet(args.apps, args.components))
+    fleet = load_fleet(args.apps, args.components)
+    namespace = measure(lambda: [as_namespace(spec) for spec in fleet])
+    del fleet
+
+    print(
+        f"Spec models of {args.apps} apps x {args.components} components "
+        f"({models} models)"
+    )
+    print(f"  {'layout':<16} {'MiB':>8} {'bytes/model':>12}")
+    for name, size in (("SimpleNamespace", namespace), ("slots", compact)):
+        print(f"  {name:<16} {size:>8.1f} {size * 2**20 / models:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Micro-benchmark for the KasprApp render cache.
+
+Measures rendering all desired child resources of an example app from
+scratch against restoring them from :attr:`KasprApp.render_cache`.
+
+Usage:
+    python -m benchmarks.bench_render [--number N]
+"""
+
+import argparse
+
+from kaspr.resources import KasprApp
+from kaspr.utils.lru import LRUCache
+from benchmarks.common import load_example_spec, report, timeit
+
+META = {"uid": "bench", "generation": 1, "labels": {}}
+
+
+def render(app: KasprApp):
+    app.restore_rendered()
+    for attr in (
+        "service",
+        "headless_service",
+        "service_account",
+        "settings_config_map",
+        "stateful_set",
+        "hpa",
+        "volume_mounted_resources_hash",
+    ):
+        getattr(app, attr)
+    app.remember_rendered()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    name, spec = load_example_spec()
+
+    def reconcile():
+        app = KasprApp.from_spec(name, KasprApp.KIND, "default", spec, {})
+        render(app.with_meta(META))
+
+    KasprApp.render_cache = None
+    results = {"render from scratch": timeit(reconcile, args.number)}
+    KasprApp.render_cache = LRUCache(16)
+    results["render cache hit"] = timeit(reconcile, args.number)
+
+    report(f"KasprApp child resources, {args.number} reconciles", results)
+
+
+if __name__ == "__main__":
+    main()
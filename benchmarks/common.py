@@ -0,0 +1,52 @@
+"""Shared helpers for the operator micro-benchmarks."""
+
+import os
+import time
+from typing import Callable, Dict, Tuple
+
+import yaml
+
+from kaspr.resources import KasprApp
+from kaspr.types.models.kasprapp_spec import KasprAppSpec
+from kaspr.types.schemas.kasprapp_spec import KasprAppSpecSchema
+from kaspr.types.settings import Settings
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples")
+
+
+def load_example_spec(
+    path: str = "analytics-counter/app-analytics.yaml",
+) -> Tuple[str, KasprAppSpec]:
+    """Load the name and parsed spec of one of the bundled example apps."""
+    if getattr(KasprApp, "conf", None) is None:
+        KasprApp.conf = Settings()
+    with open(os.path.join(EXAMPLES_DIR, path)) as f:
+        doc = yaml.safe_load(f)
+    return doc["metadata"]["name"], KasprAppSpecSchema().load(doc["spec"])
+
+
+def load_example_app(
+    path: str = "analytics-counter/app-analytics.yaml", namespace: str = "default"
+) -> KasprApp:
+    """Build a KasprApp resource from one of the bundled examples."""
+    name, spec = load_example_spec(path)
+    return KasprApp.from_spec(name, KasprApp.KIND, namespace, spec, {})
+
+
+def timeit(func: Callable[[], object], number: int) -> Dict[str, float]:
+    """Run ``func`` ``number`` times and return total and per-call timings."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    total = time.perf_counter() - start
+    return {"total_s": total, "per_call_us": total / number * 1e6}
+
+
+def report(title: str, results: Dict[str, Dict[str, float]]):
+    """Print benchmark results as an aligned table."""
+    print(title)
+    baseline = None
+    for name, result in results.items():
+        per_call = result["per_call_us"]
+        baseline = baseline or per_call
+        print(f"  {name:<28} {per_call:>10.1f} us/call  x{baseline / per_call:.2f}")
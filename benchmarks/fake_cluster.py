@@ -0,0 +1,414 @@
+"""In-process fake Kubernetes API server and Kaspr member endpoints.
+
+:class:`FakeApiClient` is a drop-in ``ApiClient`` that answers requests from
+an in-memory :class:`FakeCluster` instead of the network. Requests still go
+through the generated client code (serialization, deserialization, error
+mapping), so the operator code under test runs unchanged and every call is
+counted by verb and resource.
+
+The cluster stores objects as JSON dicts keyed by resource plural, namespace
+and name, supports the GET/LIST/POST/PUT/PATCH (JSON and merge patch)/DELETE
+calls the operator makes, and runs a minimal StatefulSet controller that
+keeps pods and the StatefulSet status in line with the spec.
+"""
+
+import asyncio
+import copy
+import json
+import resource
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from kubernetes_asyncio.client import Configuration
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.rest import ApiException
+
+#: Content type of server-side apply requests
+APPLY_PATCH = "application/apply-patch+yaml"
+
+#: Resource plural to kind of the objects the operator creates
+KINDS = {
+    "services": "Service",
+    "serviceaccounts": "ServiceAccount",
+    "configmaps": "ConfigMap",
+    "secrets": "Secret",
+    "persistentvolumeclaims": "PersistentVolumeClaim",
+    "pods": "Pod",
+    "statefulsets": "StatefulSet",
+    "horizontalpodautoscalers": "HorizontalPodAutoscaler",
+    "storageclasses": "StorageClass",
+    "leases": "Lease",
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _merge(target: Dict, patch: Mapping):
+    """Apply a JSON merge patch (RFC 7386) to ``target`` in place."""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, Mapping) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def _json_patch(target: Dict, operations: List[Dict]):
+    """Apply the add/replace/remove operations of a JSON patch in place."""
+    for operation in operations:
+        parts = [
+            part.replace("~1", "/").replace("~0", "~")
+            for part in operation["path"].lstrip("/").split("/")
+        ]
+        parent = target
+        for part in parts[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        last = parts[-1]
+        op = operation["op"]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op == "add":
+                parent.insert(index, copy.deepcopy(operation["value"]))
+            elif op == "replace":
+                parent[index] = copy.deepcopy(operation["value"])
+            elif op == "remove":
+                del parent[index]
+        elif op in ("add", "replace"):
+            parent[last] = copy.deepcopy(operation["value"])
+        elif op == "remove":
+            parent.pop(last, None)
+
+
+def _matches(labels: Mapping, selector: Optional[str]) -> bool:
+    """True if ``labels`` match an equality based label selector."""
+    if not selector:
+        return True
+    for term in selector.split(","):
+        if "=" in term:
+            key, value = term.split("=", 1)
+            if labels.get(key.rstrip("=")) != value:
+                return False
+        elif term not in labels:
+            return False
+    return True
+
+
+class FakeResponse:
+    """Response object as returned by ``RESTClientObject``."""
+
+    def __init__(self, status: int, data: bytes):
+        self.status = status
+        self.reason = "OK"
+        self.data = data
+
+    def getheader(self, name, default=None):
+        return "application/json" if name.lower() == "content-type" else default
+
+    def getheaders(self):
+        return {"content-type": "application/json"}
+
+
+class FakeCluster:
+    """In-memory object store behind :class:`FakeApiClient`."""
+
+    def __init__(self, latency: float = 0.0):
+        #: Simulated round trip of every API call in seconds
+        self.latency = latency
+        self.objects: Dict[str, Dict[Tuple[Optional[str], str], Dict]] = {}
+        self.calls: Counter = Counter()
+        self._resource_version = 0
+
+    def reset_counters(self):
+        self.calls.clear()
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def _next_resource_version(self) -> str:
+        self._resource_version += 1
+        return str(self._resource_version)
+
+    def _store(self, plural: str) -> Dict[Tuple[Optional[str], str], Dict]:
+        return self.objects.setdefault(plural, {})
+
+    def get(self, plural: str, namespace: Optional[str], name: str) -> Optional[Dict]:
+        """Return the stored object (not a copy) or None."""
+        return self._store(plural).get((namespace, name))
+
+    def list(self, plural: str, namespace: Optional[str] = None) -> List[Dict]:
+        return [
+            obj
+            for (ns, _), obj in self._store(plural).items()
+            if namespace is None or ns == namespace
+        ]
+
+    def put(self, plural: str, namespace: Optional[str], obj: Dict) -> Dict:
+        """Create or replace an object directly, bypassing the API counters."""
+        obj = copy.deepcopy(obj)
+        metadata = obj.setdefault("metadata", {})
+        previous = self.get(plural, namespace, metadata["name"])
+        if namespace is not None:
+            metadata["namespace"] = namespace
+        if previous is None:
+            metadata.setdefault("uid", str(uuid.uuid4()))
+            metadata.setdefault("creationTimestamp", _now())
+            metadata.setdefault("generation", 1)
+        else:
+            metadata["uid"] = previous["metadata"]["uid"]
+            metadata["creationTimestamp"] = previous["metadata"]["creationTimestamp"]
+            generation = previous["metadata"].get("generation", 1)
+            if obj.get("spec") != previous.get("spec"):
+                generation += 1
+            metadata["generation"] = generation
+        metadata["resourceVersion"] = self._next_resource_version()
+        obj.setdefault("kind", KINDS.get(plural))
+        self._store(plural)[(namespace, metadata["name"])] = obj
+        if plural == "statefulsets":
+            self._reconcile_stateful_set(namespace, obj)
+        elif plural == "horizontalpodautoscalers":
+            target = (obj.get("spec") or {}).get("scaleTargetRef") or {}
+            stateful_set = self.get("statefulsets", namespace, target.get("name"))
+            if stateful_set is not None:
+                self._reconcile_stateful_set(namespace, stateful_set)
+        return obj
+
+    def delete(self, plural: str, namespace: Optional[str], name: str) -> Optional[Dict]:
+        obj = self._store(plural).pop((namespace, name), None)
+        if obj is not None and plural == "statefulsets":
+            for pod in self.list("pods", namespace):
+                if pod["metadata"]["name"].rsplit("-", 1)[0] == name:
+                    self._store("pods").pop((namespace, pod["metadata"]["name"]))
+        return obj
+
+    def replace_pods(self, namespace: str, name: str):
+        """Recreate all pods of a StatefulSet, as a rolling restart would."""
+        for pod in self.list("pods", namespace):
+            if pod["metadata"]["name"].rsplit("-", 1)[0] == name:
+                self._store("pods").pop((namespace, pod["metadata"]["name"]))
+        self._reconcile_stateful_set(namespace, self.get("statefulsets", namespace, name))
+
+    def _reconcile_stateful_set(self, namespace: str, stateful_set: Dict):
+        """Converge pods and status of a StatefulSet right away."""
+        name = stateful_set["metadata"]["name"]
+        spec = stateful_set.get("spec") or {}
+        replicas = spec.get("replicas")
+        replicas = 1 if replicas is None else replicas
+        # Autoscalers scale straight to their maximum
+        for hpa in self.list("horizontalpodautoscalers", namespace):
+            hpa_spec = hpa.get("spec") or {}
+            if replicas and (hpa_spec.get("scaleTargetRef") or {}).get("name") == name:
+                replicas = spec["replicas"] = hpa_spec.get("maxReplicas", replicas)
+        labels = ((spec.get("template") or {}).get("metadata") or {}).get("labels") or {}
+        pods = self._store("pods")
+        for idx in range(replicas):
+            pod_name = f"{name}-{idx}"
+            if (namespace, pod_name) not in pods:
+                pods[(namespace, pod_name)] = {
+                    "kind": "Pod",
+                    "metadata": {
+                        "name": pod_name,
+                        "namespace": namespace,
+                        "labels": dict(labels),
+                        "uid": str(uuid.uuid4()),
+                        "creationTimestamp": _now(),
+                        "resourceVersion": self._next_resource_version(),
+                    },
+                    "status": {"phase": "Running"},
+                }
+        for ns, pod_name in list(pods):
+            prefix, _, idx = pod_name.rpartition("-")
+            if ns == namespace and prefix == name and idx.isdigit() and int(idx) >= replicas:
+                del pods[(ns, pod_name)]
+        stateful_set["status"] = {
+            "replicas": replicas,
+            "availableReplicas": replicas,
+            "readyReplicas": replicas,
+            "currentReplicas": replicas,
+            "updatedReplicas": replicas,
+            "observedGeneration": stateful_set["metadata"].get("generation", 1),
+        }
+
+    def _parse(self, url: str):
+        """Split a request URL into (plural, namespace, name, subresource)."""
+        parts = [unquote(part) for part in urlparse(url).path.strip("/").split("/")]
+        # Drop /api/v1 or /apis/<group>/<version>
+        parts = parts[2:] if parts[0] == "api" else parts[3:]
+        namespace = None
+        if parts and parts[0] == "namespaces" and len(parts) > 2:
+            namespace = parts[1]
+            parts = parts[2:]
+        plural = parts[0]
+        name = parts[1] if len(parts) > 1 else None
+        subresource = parts[2] if len(parts) > 2 else None
+        return plural, namespace, name, subresource
+
+    def _error(self, status: int, reason: str):
+        error = ApiException(status=status, reason=reason)
+        error.body = json.dumps({"kind": "Status", "code": status, "reason": reason}).encode()
+        return error
+
+    async def handle(
+        self, method: str, url: str, query_params=None, body=None, headers=None
+    ) -> FakeResponse:
+        """Serve one API request.
+
+        Server-side apply is approximated by a merge patch that creates
+        missing objects.
+        """
+        plural, namespace, name, subresource = self._parse(url)
+        verb = {
+            "GET": "get" if name else "list",
+            "POST": "create",
+            "PUT": "replace",
+            "PATCH": "patch",
+            "DELETE": "delete",
+        }[method]
+        self.calls[(verb, plural + (f"/{subresource}" if subresource else ""))] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if verb == "list":
+            selector = dict(query_params or {}).get("labelSelector")
+            items = [
+                obj
+                for obj in self.list(plural, namespace)
+                if _matches(obj["metadata"].get("labels") or {}, selector)
+            ]
+            result = {"kind": "List", "metadata": {}, "items": items}
+        elif verb == "patch" and (headers or {}).get("Content-Type") == APPLY_PATCH:
+            current = self.get(plural, namespace, name)
+            if current is None:
+                result = self.put(plural, namespace, body)
+            else:
+                updated = copy.deepcopy(current)
+                _merge(updated, body)
+                result = self.put(plural, namespace, updated)
+        elif verb == "create":
+            body = body or {}
+            if self.get(plural, namespace, body["metadata"]["name"]) is not None:
+                raise self._error(409, "AlreadyExists")
+            result = self.put(plural, namespace, body)
+        else:
+            current = self.get(plural, namespace, name)
+            if current is None:
+                raise self._error(404, "NotFound")
+            if verb == "get":
+                result = current
+            elif verb == "delete":
+                result = self.delete(plural, namespace, name)
+            else:
+                updated = copy.deepcopy(current) if verb == "patch" else body
+                if verb == "patch" and isinstance(body, list):
+                    _json_patch(updated, body)
+                elif verb == "patch":
+                    _merge(updated, body)
+                if subresource == "status":
+                    status = updated.get("status")
+                    updated = copy.deepcopy(current)
+                    updated["status"] = status
+                result = self.put(plural, namespace, updated)
+        return FakeResponse(200, json.dumps(result).encode())
+
+
+class FakeApiClient(ApiClient):
+    """``ApiClient`` that sends every request to a :class:`FakeCluster`."""
+
+    def __init__(self, cluster: FakeCluster):
+        configuration = Configuration()
+        configuration.host = "https://fake-cluster"
+        self.configuration = configuration
+        self.pool_threads = 1
+        self.rest_client = None
+        self.default_headers = {}
+        self.cookie = None
+        self.user_agent = "kaspr-benchmark"
+        self.client_side_validation = False
+        self.cluster = cluster
+
+    async def request(
+        self,
+        method,
+        url,
+        query_params=None,
+        headers=None,
+        post_params=None,
+        body=None,
+        _preload_content=True,
+        _request_timeout=None,
+    ):
+        return await self.cluster.handle(
+            method, url, query_params=query_params, body=body, headers=headers
+        )
+
+    async def close(self):
+        pass
+
+
+class FakeMemberClient:
+    """Fake Kaspr member web endpoints.
+
+    Stands in for both :class:`kaspr.web.MemberStatusClient` and
+    :class:`kaspr.web.KasprWebClient`. Every member reports itself as a
+    stable member; member 0 is the leader unless ``leader`` is changed, and
+    members in ``rebalancing`` report an ongoing rebalance.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self.rebalances = 0
+        #: Member id reported as leader
+        self.leader = 0
+        #: Members currently reporting a rebalance
+        self.rebalancing: set = set()
+
+    async def get_status(self, member_id: int) -> Dict:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return {
+            "leader": member_id == self.leader,
+            "rebalancing": member_id in self.rebalancing,
+            "recovering": False,
+            "assignment": {"actives": {"events": [member_id]}, "standbys": {}},
+        }
+
+    async def get_statuses(
+        self, endpoints: Mapping[Hashable, str], deadline: float
+    ) -> Dict[Hashable, Dict]:
+        keys = list(endpoints)
+        results = await asyncio.gather(*(self.get_status(key) for key in keys))
+        return dict(zip(keys, results))
+
+    async def rebalance(self, url: str):
+        self.rebalances += 1
+        self.rebalancing.clear()
+
+    async def close(self):
+        pass
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        # Peak RSS; reported in KiB on Linux and bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
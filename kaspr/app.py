@@ -6,10 +6,30 @@ import kaspr.handlers.kasprwebview as kasprwebview
 from kaspr.types.settings import Settings
 from kaspr.resources.kasprapp import KasprApp
 from kaspr.resources.appcomponent import BaseAppComponent
-from kaspr.web import KasprWebClient
+from kaspr.resources.base import BaseResource
+from kaspr.informers import InformerRegistry
+from kaspr.sharding import (
+    OwnedDiffBaseStorage,
+    ShardCoordinator,
+    get_coordinator,
+    set_coordinator,
+)
+from kaspr.utils.api_limiter import (
+    ApiRateLimiter,
+    RateLimitedApiClient,
+    pace_kopf_requests,
+    parse_verb_limits,
+)
+from kaspr.utils.lru import LRUCache
+from kaspr.utils.member_status import MemberStatusStore
+from kaspr.utils.patch_bus import patch_bus
+from kaspr.utils.runtime_monitor import runtime_monitor
+from kaspr.utils.spec_memo import spec_memo
+from kaspr.utils.warmup import ChildInventory, startup_warmup
+from kaspr.web import KasprWebClient, MemberStatusClient
 from kaspr.sensors import init_metrics_server, SensorDelegate, PrometheusMonitor
 from kubernetes_asyncio import config
-from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client import CoordinationV1Api
 
 
 # Configure Kopf settings
@@ -33,20 +53,72 @@ async def setup(
     memo.conf = Settings()
     KasprApp.conf = memo.conf
     KasprApp.web_client = KasprWebClient()
-
-    # Create a shared ApiClient for all resources to prevent connection leaks
-    shared_client = ApiClient()
+    KasprApp.status_client = MemberStatusClient(
+        max_concurrency=memo.conf.client_status_max_concurrency,
+        request_timeout=memo.conf.client_status_request_timeout_seconds,
+        limit=memo.conf.client_status_connection_limit,
+        limit_per_host=memo.conf.client_status_connection_limit_per_host,
+        dns_cache_ttl=memo.conf.client_status_dns_cache_ttl_seconds,
+    )
+    KasprApp.member_status_store = MemberStatusStore(
+        ttl=memo.conf.client_status_cache_ttl_seconds
+    )
+
+    # Create a shared ApiClient for all resources to prevent connection leaks.
+    # Its requests are paced per verb so the operator stays within its API budget.
+    api_limiter = ApiRateLimiter(
+        qps=memo.conf.kube_api_qps,
+        burst=memo.conf.kube_api_burst,
+        verb_limits=parse_verb_limits(memo.conf.kube_api_verb_limits),
+    )
+    shared_client = RateLimitedApiClient(limiter=api_limiter)
     KasprApp.shared_api_client = shared_client
     BaseAppComponent.shared_api_client = shared_client
     logger.info("Shared Kubernetes API client initialized")
 
+    # Serve related resource lookups from a shared watch-based cache
+    if memo.conf.informer_cache_enabled:
+        BaseResource.informers = InformerRegistry(
+            shared_client,
+            index_label=KasprApp.KASPR_APP_NAME_LABEL,
+            sync_timeout_seconds=memo.conf.informer_sync_timeout_seconds,
+            watch_timeout_seconds=memo.conf.informer_watch_timeout_seconds,
+        )
+        logger.info("Informer cache initialized")
+
+    # Resumed resources check their children against one listing per namespace
+    if memo.conf.startup_warmup_enabled:
+        startup_warmup.start(
+            ChildInventory(
+                shared_client, annotation=BaseResource.RESOURCE_HASH_ANNOTATION
+            ),
+            window_seconds=memo.conf.startup_warmup_window_seconds,
+            jitter_seconds=memo.conf.startup_jitter_seconds,
+        )
+        logger.info("Startup warm-up enabled")
+
+    # Let the API server diff child resources instead of GET + patch
+    BaseResource.server_side_apply = memo.conf.server_side_apply_enabled
+
+    # Reuse rendered child resources of unchanged apps across reconciliations
+    if memo.conf.render_cache_size > 0:
+        KasprApp.render_cache = LRUCache(memo.conf.render_cache_size)
+
+    # Reuse loaded spec models of unchanged resources across handler calls
+    spec_memo.resize(memo.conf.spec_cache_size)
+
     # Initialize sensor infrastructure
     sensor_delegate = SensorDelegate()
-    prometheus_monitor = PrometheusMonitor()
+    prometheus_monitor = PrometheusMonitor(
+        aggregate_members=memo.conf.metrics_aggregate_members,
+        max_member_series=memo.conf.metrics_max_member_series,
+    )
     sensor_delegate.add(prometheus_monitor)
     memo.sensor = sensor_delegate
     KasprApp.sensor = sensor_delegate
     BaseAppComponent.sensor = sensor_delegate
+    api_limiter.sensor = sensor_delegate
+    shared_client.sensor = sensor_delegate
     logger.info("Sensor infrastructure initialized with PrometheusMonitor")
 
     # Initialize Prometheus metrics server
@@ -63,8 +135,54 @@ async def setup(
             "Some functionality will be limited."
         )
 
-    # Limit the number of concurrent workers to prevent flooding the API
-    settings.batching.worker_limit = 2
+    # Handlers send their requests through the rate-limited shared client, so
+    # many may run at once; kopf's own requests get a smaller budget of their own
+    settings.batching.worker_limit = memo.conf.kopf_worker_limit
+    pace_kopf_requests(
+        ApiRateLimiter(qps=memo.conf.kopf_api_qps, burst=memo.conf.kopf_api_burst)
+    )
+
+    # Status updates requested outside of handlers are coalesced per object
+    patch_bus.debounce_seconds = memo.conf.status_patch_debounce_seconds
+
+    # KasprApp reconciliations run on a shared, rate-limited work queue
+    kasprapp.start_reconciliation_workers(memo.conf, logger)
+    logger.info(
+        f"Started {memo.conf.reconcile_workers} KasprApp reconciliation workers"
+    )
+
+    # Sample event loop lag, queue depths, connection pools and caches
+    if memo.conf.runtime_monitor_interval_seconds > 0:
+        caches = {"spec": spec_memo.usage}
+        if KasprApp.render_cache is not None:
+            caches["render"] = KasprApp.render_cache.usage
+        runtime_monitor.start(
+            sensor_delegate,
+            interval_seconds=memo.conf.runtime_monitor_interval_seconds,
+            queues={"reconciliation": lambda: len(kasprapp.reconciliation_queue)},
+            pools={"member_status": KasprApp.status_client.pool_usage},
+            caches=caches,
+        )
+
+    # Split KasprApps across operator replicas; each replica only handles
+    # the apps it owns, so kopf peering must not pause the other replicas.
+    if memo.conf.sharding_enabled:
+        coordinator = ShardCoordinator(
+            CoordinationV1Api(shared_client),
+            namespace=memo.conf.sharding_namespace,
+            identity=memo.conf.sharding_identity,
+            lease_duration_seconds=memo.conf.sharding_lease_duration_seconds,
+            renew_interval_seconds=memo.conf.sharding_renew_interval_seconds,
+            on_change=kasprapp.requeue_owned_apps,
+        )
+        set_coordinator(coordinator)
+        await coordinator.start()
+        settings.persistence.diffbase_storage = OwnedDiffBaseStorage()
+        settings.peering.standalone = True
+        logger.info(
+            f"Sharding enabled as {memo.conf.sharding_identity} "
+            f"with members {sorted(coordinator.ring.members)}"
+        )
 
     # Disable posting events to the Kubernetes API for logging > Warning
     settings.posting.enabled = True
@@ -76,6 +194,26 @@ async def cleanup(logger: logging.Logger, **kwargs):
     """Cleanup handler for operator shutdown."""
     logger.info("Shutting down operator...")
 
+    await kasprapp.stop_reconciliation_workers()
+    await runtime_monitor.stop()
+
+    # Apply pending status updates while the API client is still open
+    await patch_bus.flush_all()
+    await patch_bus.close()
+
+    # Release this replica's shard so peers take over its apps right away
+    coordinator = get_coordinator()
+    if coordinator is not None:
+        await coordinator.stop()
+        set_coordinator(None)
+        logger.info("Operator shard lease released")
+
+    # Stop informer watches before closing the client they use
+    if BaseResource.informers is not None:
+        await BaseResource.informers.stop()
+        BaseResource.informers = None
+        logger.info("Informer cache stopped")
+
     # Close the shared API client
     if hasattr(KasprApp, "shared_api_client") and KasprApp.shared_api_client:
         await KasprApp.shared_api_client.close()
@@ -86,6 +224,11 @@ async def cleanup(logger: logging.Logger, **kwargs):
         await KasprApp.web_client.close()
         logger.info("Web client closed")
 
+    if KasprApp.status_client is not None:
+        await KasprApp.status_client.close()
+        KasprApp.status_client = None
+        logger.info("Member status client closed")
+
     logger.info("Operator shutdown complete")
 
 
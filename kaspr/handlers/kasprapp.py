@@ -4,8 +4,8 @@ import time
 import json
 import base64
 from logging import Logger
-from collections import defaultdict
-from typing import List, Dict, Optional
+import random
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime, timezone, timedelta
 from kubernetes_asyncio.client import ApiException
 from kubernetes_asyncio.stream import WsApiClient
@@ -21,9 +21,17 @@ from kaspr.types.schemas import (
     KasprTableSpecSchema,
 )
 from kaspr.resources import KasprApp, KasprAgent, KasprWebView, KasprTable, KasprTask
-from kaspr.utils.helpers import upsert_condition, deep_compare_dict, now
+from kaspr.utils.helpers import upsert_condition, deep_compare_dict, now, status_delta
 from kaspr.utils.errors import convert_api_exception
-from kaspr.utils.python_packages import compute_packages_hash
+from kaspr.utils.python_packages import compute_packages_hash, parse_install_result
+from kaspr.utils.lru import LRUCache
+from kaspr.utils.workqueue import WorkQueue, Priority
+from kaspr.informers import reference_index
+from kaspr.utils.spec_memo import load_spec
+from kaspr.utils.status_context import StatusContext
+from kaspr.utils.patch_bus import patch_bus
+from kaspr.utils.warmup import startup_warmup
+from kaspr.sharding import OWNER_ANNOTATION, get_coordinator, is_owned, owns
 
 APP_KIND = "KasprApp"
 
@@ -31,17 +39,16 @@ AGENTS_UPDATED = "AgentsUpdated"
 WEBVIEWS_UPDATED = "WebviewsUpdated"
 TABLES_UPDATED = "TablesUpdated"
 
-# Queue of requests to patch KasprApps
-patch_request_queues: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
-
-# Use a set to track which names are already queued
-names_in_queue = set()
-# The actual queue for ordered processing
-reconciliation_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
-# Locks to prevent race conditions when enqueueing reconciliation requests
-reconciliation_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+# Operator-wide queue of KasprApps to reconcile, keyed by (namespace, name)
+reconciliation_queue = WorkQueue()
+# KasprApps known to this operator, periodically requeued for resync
+known_apps: Set[Tuple[str, str]] = set()
+# Background tasks running reconciliation workers and the periodic resync
+reconciliation_tasks: List[asyncio.Task] = []
 # Track consecutive hung member detections: (app_name, member_id) -> consecutive_count
 hung_member_tracking: Dict[tuple[str, int], int] = {}
+# Python packages status of pods whose init container completed: (pod uid, packages hash) -> (metadata, state_info)
+packages_status_cache = LRUCache(1024)
 
 TRUTHY = ("true", "1", "yes", "True", "Yes", "YES")
 
@@ -96,23 +103,25 @@ async def fetch_app_related_resources(name: str, namespace: str) -> Dict[str, an
     }
 
 
-async def request_reconciliation(name, namespace: str = None, **kwargs):
+async def request_reconciliation(
+    name, namespace: str = None, priority: Priority = Priority.USER_EDIT, **kwargs
+):
     """Request reconciliation for the KasprApp.
 
-    Enqueues the request only if it's not already in the queue.
-    This prevents duplicate processing while preserving order.
-    Uses a lock to ensure atomicity of the check-and-add operation.
+    Enqueues the app on the operator-wide reconciliation queue. Requests for
+    an app that is already waiting are deduplicated (keeping the highest
+    priority), and requests made while the app is being reconciled are
+    processed once the current run completes.
     """
-    async with reconciliation_locks[name]:
-        if name not in names_in_queue:
-            names_in_queue.add(name)
-            await reconciliation_queue[name].put(name)
-            
-            # Instrument queue operation
-            sensor = get_sensor()
-            if sensor and namespace:
-                queue_depth = reconciliation_queue[name].qsize()
-                sensor.on_reconcile_queued(name, name, namespace, queue_depth)
+    key = (namespace, name)
+    known_apps.add(key)
+    if reconciliation_queue.add(key, priority):
+        # Instrument queue operation
+        sensor = get_sensor()
+        if sensor and namespace:
+            sensor.on_reconcile_queued(
+                name, name, namespace, len(reconciliation_queue)
+            )
 
 
 def on_error(error, spec, meta, status, patch, **_):
@@ -1015,6 +1024,11 @@ async def fetch_python_packages_status(app: KasprApp, logger: Logger) -> tuple[O
     1. Shared cache (PVC): All pods share storage, check marker files
     2. emptyDir: Per-pod ephemeral storage, check init container status only
     
+    In cache mode the install details are read from the termination message
+    the init container publishes; the marker file is only read by exec'ing
+    into the pod if there is no such message. Results of completed init
+    containers are cached per pod and packages hash.
+    
     Args:
         app: KasprApp instance
         logger: Logger instance
@@ -1043,7 +1057,7 @@ async def fetch_python_packages_status(app: KasprApp, logger: Logger) -> tuple[O
     
     try:
         # List pods for this app
-        pods = await app.list_pods(app.core_v1_api, app.namespace, app.labels.kasper_label_selectors().as_dict())
+        pods = await app.fetch_app_pods()
         
         if not pods or not pods.items:
             # No pods yet
@@ -1234,7 +1248,50 @@ async def fetch_python_packages_status(app: KasprApp, logger: Logger) -> tuple[O
                 }
                 return metadata, state_info
             
-            # For cache mode, try to read marker file
+            # A completed init container never changes, so its status is
+            # decoded once per pod and packages hash
+            cache_key = (target_pod.metadata.uid, packages_hash)
+            cached = packages_status_cache.get(cache_key) if target_pod.metadata.uid else None
+            if cached is not None:
+                metadata, state_info = cached
+                return dict(metadata), dict(state_info)
+            
+            # Prefer the result published as the init container's termination
+            # message over exec'ing into the pod to read the marker file
+            result = parse_install_result(init_container_status.state.terminated.message)
+            if result is not None:
+                if result["hash"] != packages_hash:
+                    metadata = {
+                        "hash": packages_hash,
+                        "cacheMode": cache_mode,
+                    }
+                    state_info = {
+                        "state": "Installing",
+                        "reason": "PackagesUpdating",
+                        "message": f"Updating packages to hash {packages_hash[:8]}...",
+                    }
+                    return metadata, state_info
+                
+                num_packages = len(app.python_packages.packages)
+                metadata = {
+                    "hash": packages_hash,
+                    "installed": app.python_packages.packages,
+                    "lastInstallTime": result.get("installTime"),
+                    "installDuration": result.get("duration"),
+                    "installedBy": result.get("installedBy"),
+                    "cacheMode": cache_mode,
+                    "warnings": None
+                }
+                state_info = {
+                    "state": "Ready",
+                    "reason": "PackagesInstalled",
+                    "message": f"Successfully installed {num_packages} package{'s' if num_packages != 1 else ''} in {result.get('duration') or 'unknown'}",
+                }
+                if target_pod.metadata.uid:
+                    packages_status_cache.put(cache_key, (metadata, state_info))
+                return dict(metadata), dict(state_info)
+            
+            # Fall back to reading the marker file (pods created by older operators)
             try:
                 # Read marker file from the pod
                 marker_file = f"/opt/kaspr/packages/.installed-{packages_hash}"
@@ -1353,7 +1410,9 @@ async def fetch_python_packages_status(app: KasprApp, logger: Logger) -> tuple[O
                     "reason": "PackagesInstalled",
                     "message": f"Successfully installed {num_packages} package{'s' if num_packages != 1 else ''} in {marker_data.get('duration', 'unknown')}",
                 }
-                return metadata, state_info
+                if target_pod.metadata.uid:
+                    packages_status_cache.put(cache_key, (metadata, state_info))
+                return dict(metadata), dict(state_info)
                 
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse marker file JSON from pod {target_pod.metadata.name}: {e}")
@@ -1472,12 +1531,16 @@ async def update_status(
     """Update KasprApp status based on the actual state of the app.
     
     Batches all status updates into a single atomic patch operation to prevent
-    conflicts and improve consistency.
+    conflicts and improve consistency. Only fields that differ from the
+    current status are patched.
     """
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
+    # All status collectors, including rebalance requests, share one read
+    # of the statefulset and one pod list
+    app.status_context = kwargs.get("status_context") or StatusContext()
     _status = status or {}
     try:
         gen = meta.get("generation", 0)
@@ -1602,19 +1665,30 @@ async def update_status(
         # including freshly computed member transition timestamps.
         effective_status = dict(_status)
         effective_status.update(status_update)
+        sensor = get_sensor()
+        if sensor and effective_status.get("members") is not None:
+            sensor.on_members_observed(
+                name,
+                namespace,
+                [member.get("id") for member in effective_status["members"]],
+            )
         hung_member_ids = await _detect_hung_members(effective_status, app, name, namespace, logger)
         
         _update_conditions(status_update, _status, _actual_status, gen, cur_gen, app, hung_member_ids)
         await _attempt_auto_rebalance(status_update, _status, _actual_status, annotations, app, name, namespace, logger)
 
-        # Apply all status updates in a single atomic operation
-        patch.status.update(status_update)
-        
-        # Instrument status update
-        sensor = get_sensor()
-        if sensor:
-            update_fields = list(status_update.keys())
-            sensor.on_status_update(name, namespace, update_fields)
+        # Apply the fields that actually changed in a single atomic operation;
+        # an unchanged status is not written at all to avoid needless
+        # resourceVersion bumps and watch events.
+        status_update = status_delta(_status, status_update)
+        if status_update:
+            patch.status.update(status_update)
+
+            # Instrument status update
+            sensor = get_sensor()
+            if sensor:
+                update_fields = list(status_update.keys())
+                sensor.on_status_update(name, namespace, update_fields)
 
         # Terminate hung members after status update
         await _terminate_hung_members(app, hung_member_ids, name, namespace, logger)
@@ -1625,8 +1699,11 @@ async def update_status(
 
 async def reconcile(
     name, namespace, spec, meta, status, patch, annotations, logger: Logger, trigger_source: str = "manual", **kwargs
-):
-    """Reconcile the KasprApp."""
+) -> bool:
+    """Reconcile the KasprApp.
+
+    Returns False if reconciliation failed, True otherwise.
+    """
     # Instrument reconciliation start
     sensor = get_sensor()
     generation = meta.get('generation', 0)
@@ -1637,21 +1714,30 @@ async def reconcile(
     success = True
     error = None
     
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
-    )
+    ).with_meta(meta)
     if app.reconciliation_paused:
         logger.info("Reconciliation is paused.")
         if sensor:
             sensor.on_reconcile_complete(name, name, namespace, sensor_state, True)
-        return
+        return True
     try:
         logger.debug(f"Reconciling {APP_KIND}/{name} in {namespace} namespace.")
+        app.status_context = StatusContext()
         await app.synchronize()
         logger.debug(f"Reconciled {APP_KIND}/{name} in {namespace} namespace.")
         await update_status(
-            name, spec, meta, status, patch, namespace, annotations, logger
+            name,
+            spec,
+            meta,
+            status,
+            patch,
+            namespace,
+            annotations,
+            logger,
+            status_context=app.status_context,
         )
     except Exception as e:
         success = False
@@ -1663,15 +1749,53 @@ async def reconcile(
         # Instrument reconciliation complete
         if sensor:
             sensor.on_reconcile_complete(name, name, namespace, sensor_state, success, error)
+    return success
 
 
-@kopf.on.resume(kind=APP_KIND)
-@kopf.on.create(kind=APP_KIND)
+@kopf.on.resume(kind=APP_KIND, when=owns)
+async def on_resume(
+    spec, name, meta, status, patch, namespace, annotations, logger: Logger, **kwargs
+):
+    """Resumes KasprApp handling after an operator restart.
+
+    During the startup warm-up, the hashes of the freshly rendered child
+    resources are compared with the ones listed in bulk at startup. Apps
+    whose children drifted are reconciled right away, the others at a
+    random time within the jitter window. Outside of the warm-up, apps are
+    synchronized as on creation.
+    """
+    if not startup_warmup.active:
+        return await on_create(
+            spec, name, meta, status, patch, namespace, annotations, logger, **kwargs
+        )
+    key = (namespace, name)
+    known_apps.add(key)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, key)
+    app = KasprApp.from_spec(
+        name, APP_KIND, namespace, spec_model, annotations, logger=logger
+    ).with_meta(meta)
+    if app.reconciliation_paused:
+        logger.info("Reconciliation is paused.")
+        return
+    app.restore_rendered()
+    unchanged = await startup_warmup.unchanged(namespace, app.prepare_child_hashes())
+    # The queued reconciliation reuses this rendering
+    app.remember_rendered()
+    if unchanged:
+        delay = startup_warmup.delay()
+        logger.debug(f"Child resources are up to date, reconciling in {delay:.1f}s.")
+        reconciliation_queue.add_after(key, delay, Priority.PERIODIC)
+    else:
+        await request_reconciliation(name, namespace=namespace, priority=Priority.DRIFT)
+
+
+@kopf.on.create(kind=APP_KIND, when=owns)
 async def on_create(
     spec, name, meta, status, patch, namespace, annotations, logger: Logger, **kwargs
 ):
     """Creates KasprApp resources."""
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    known_apps.add((namespace, name))
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1696,8 +1820,8 @@ async def on_create(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.image")
-@kopf.on.update(kind=APP_KIND, field="spec.version")
+@kopf.on.update(kind=APP_KIND, field="spec.image", when=owns)
+@kopf.on.update(kind=APP_KIND, field="spec.version", when=owns)
 async def on_version_update(
     old,
     new,
@@ -1712,7 +1836,7 @@ async def on_version_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1727,7 +1851,7 @@ async def on_version_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.replicas")
+@kopf.on.update(kind=APP_KIND, field="spec.replicas", when=owns)
 async def on_replicas_update(
     body,
     old,
@@ -1743,7 +1867,7 @@ async def on_replicas_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1759,9 +1883,9 @@ async def on_replicas_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.bootstrapServers")
-@kopf.on.update(kind=APP_KIND, field="spec.tls")
-@kopf.on.update(kind=APP_KIND, field="spec.authentication")
+@kopf.on.update(kind=APP_KIND, field="spec.bootstrapServers", when=owns)
+@kopf.on.update(kind=APP_KIND, field="spec.tls", when=owns)
+@kopf.on.update(kind=APP_KIND, field="spec.authentication", when=owns)
 async def on_kafka_credentials_update(
     old,
     new,
@@ -1776,7 +1900,7 @@ async def on_kafka_credentials_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1791,7 +1915,7 @@ async def on_kafka_credentials_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.resources")
+@kopf.on.update(kind=APP_KIND, field="spec.resources", when=owns)
 async def on_resource_requirements_update(
     old,
     new,
@@ -1806,7 +1930,7 @@ async def on_resource_requirements_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1821,7 +1945,7 @@ async def on_resource_requirements_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.config.web_port")
+@kopf.on.update(kind=APP_KIND, field="spec.config.web_port", when=owns)
 async def on_web_port_update(
     old,
     new,
@@ -1836,7 +1960,7 @@ async def on_web_port_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1851,7 +1975,7 @@ async def on_web_port_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.storage.deleteClaim")
+@kopf.on.update(kind=APP_KIND, field="spec.storage.deleteClaim", when=owns)
 async def on_storage_delete_claim_update(
     old,
     new,
@@ -1866,7 +1990,7 @@ async def on_storage_delete_claim_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1881,7 +2005,7 @@ async def on_storage_delete_claim_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.storage.size")
+@kopf.on.update(kind=APP_KIND, field="spec.storage.size", when=owns)
 async def on_storage_size_update(
     old,
     new,
@@ -1896,7 +2020,7 @@ async def on_storage_size_update(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1915,7 +2039,7 @@ async def on_storage_size_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.template.serviceAccount")
+@kopf.on.update(kind=APP_KIND, field="spec.template.serviceAccount", when=owns)
 async def on_template_service_account_updated(
     old,
     new,
@@ -1930,7 +2054,7 @@ async def on_template_service_account_updated(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1945,7 +2069,7 @@ async def on_template_service_account_updated(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.template.pod")
+@kopf.on.update(kind=APP_KIND, field="spec.template.pod", when=owns)
 async def on_template_pod_updated(
     old,
     new,
@@ -1960,7 +2084,7 @@ async def on_template_pod_updated(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -1976,7 +2100,7 @@ async def on_template_pod_updated(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.template.service")
+@kopf.on.update(kind=APP_KIND, field="spec.template.service", when=owns)
 async def on_template_service_updated(
     old,
     new,
@@ -1991,7 +2115,7 @@ async def on_template_service_updated(
     logger: Logger,
     **kwargs,
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -2007,18 +2131,18 @@ async def on_template_service_updated(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.config.topic_partitions")
+@kopf.on.update(kind=APP_KIND, field="spec.config.topic_partitions", when=owns)
 def immutable_config_updated_00(**kwargs):
     raise kopf.PermanentError(
         "Field 'spec.config.topic_partitions' can't change after creation."
     )
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.config")
+@kopf.on.update(kind=APP_KIND, field="spec.config", when=owns)
 async def general_config_update(
     spec, name, meta, patch, status, namespace, annotations, logger: Logger, **kwargs
 ):
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -2033,7 +2157,7 @@ async def general_config_update(
         raise
 
 
-@kopf.on.update(kind=APP_KIND, field="spec.pythonPackages")
+@kopf.on.update(kind=APP_KIND, field="spec.pythonPackages", when=owns)
 async def on_python_packages_update(
     old, new, spec, name, meta, patch, status, namespace, annotations, logger: Logger, **kwargs
 ):
@@ -2049,7 +2173,7 @@ async def on_python_packages_update(
     """
     logger.info(f"Python packages configuration changed for KasprApp {name}")
     
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
@@ -2073,140 +2197,210 @@ async def on_python_packages_update(
 
 
 @kopf.on.delete(kind=APP_KIND)
-async def on_delete(name, **kwargs):
+async def on_delete(name, namespace=None, uid=None, **kwargs):
     """Handle deletion of KasprApp resources."""
     # Clean up all global state for this resource
-    reconciliation_queue.pop(name, None)
-    patch_request_queues.pop(name, None)
-    reconciliation_locks.pop(name, None)
-    names_in_queue.discard(name)
+    KasprApp.forget_volume_mounted_resources_hash(name, namespace)
+    KasprApp.forget_rendered(uid)
+    if KasprApp.member_status_store is not None:
+        KasprApp.member_status_store.forget((namespace, name))
+    reconciliation_queue.discard((namespace, name))
+    known_apps.discard((namespace, name))
+    patch_bus.forget(APP_KIND, namespace, name)
     
     # Clean up hung member tracking
     keys_to_remove = [key for key in hung_member_tracking.keys() if key[0] == name]
     for key in keys_to_remove:
         del hung_member_tracking[key]
-    names_in_queue.discard(name)
 
+    # Drop the deleted app's metric series
+    sensor = get_sensor()
+    if sensor:
+        sensor.on_app_deleted(name, namespace)
 
-@kopf.timer(APP_KIND, interval=1)
-async def patch_resource(name, patch, **kwargs):
-    """Update KasprApp status.
 
-    Example usage:
-    ```
-        # Request to patch annotations
-        await patch_request_queues[resource_name].put(
-            {
-                "field": "metadata.annotations",
-                "value": {"kaspr.io/last-applied-agents-hash": "xyz"},
-            }
-        )
-    ```
-
-    Update multiple fields in one pass:
-    ```
-        # Request to patch annotations
-        await patch_request_queues[resource_name].put(
-            [
-                {
-                    "field": "metadata.annotations",
-                    "value": {
-                        "kaspr.io/last-applied-agents-hash": "xyz"
-                    },
-                },
-                {
-                    "field": "status",
-                    "value": {
-                        "agents": [{"name": "agent-1", "status": "running"}],
-                    },
-                },
-            ]
-        )
-    ```
+@kopf.on.event(kind=APP_KIND)
+async def track_known_apps(event, name, namespace, **kwargs):
+    """Track every KasprApp, owned or not.
+
+    Ownership changes requeue known apps, and components referencing an app
+    are notified when it appears or disappears.
     """
-    queue = patch_request_queues.get(name)
-    if queue is None:
-        return
+    deleted = event.get("type") == "DELETED"
+    if deleted:
+        known_apps.discard((namespace, name))
+    else:
+        known_apps.add((namespace, name))
+    reference_index.observe(APP_KIND, namespace, name, not deleted)
 
-    def set_patch(request):
-        fields = request["field"].split(".")
-        _patch = patch
-        for field in fields:
-            _patch = getattr(_patch, field)
-        _patch.update(request["value"])
-
-    while not queue.empty():
-        request = queue.get_nowait()
-        if isinstance(request, list):
-            for req in request:
-                set_patch(req)
-        else:
-            set_patch(request)
 
+async def patch_resource(name, namespace, patch):
+    """Apply a KasprApp patch collected by the patch bus.
 
-@kopf.timer(APP_KIND, initial_delay=3.0, interval=1.5)
-async def process_reconciliation_requests(
-    name,
-    namespace,
-    spec,
-    meta,
-    status,
-    patch,
-    annotations,
-    logger: Logger,
-    stopped,
-    **kwargs,
-):
-    """Process reconciliation requests from the queue.
+    See :mod:`kaspr.utils.patch_bus` for how to request one.
+    """
+    await KasprApp.default().patch_app(name, namespace, patch)
+
+
+patch_bus.register(APP_KIND, patch_resource)
 
-    Processes each request exactly once, even if it was
-    requested multiple times while processing another request.
+
+async def reconcile_queued_app(
+    name: str, namespace: str, logger: Logger, trigger_source: str = "queue"
+) -> bool:
+    """Reconcile a KasprApp taken from the reconciliation queue.
+
+    Workers run outside of kopf handlers, so the latest object is read from
+    the API server and the resulting status/metadata patch is applied here.
+    Returns False if reconciliation failed and should be retried.
     """
-    if stopped:
-        return
-    try:
-        queue = reconciliation_queue.get(name)
-        if queue is None:
-            names_in_queue.discard(name)
-            return
+    body = await KasprApp.default().fetch(name, namespace)
+    if body is None:
+        # Deleted while waiting in the queue
+        reconciliation_queue.discard((namespace, name))
+        known_apps.discard((namespace, name))
+        return True
 
-        queue_is_empty = queue.empty()
-        if not queue_is_empty:
-            queue_start_time = time.time()
-            queue.get_nowait()
-            
-            # Instrument dequeue with wait time
+    patch = kopf.Patch()
+    success = await reconcile(
+        name,
+        namespace,
+        body.get("spec", {}),
+        body.get("metadata", {}),
+        body.get("status"),
+        patch,
+        body.get("metadata", {}).get("annotations") or {},
+        logger,
+        trigger_source=trigger_source,
+    )
+    if patch:
+        await KasprApp.default().patch_app(name, namespace, patch)
+    return success
+
+
+async def reconciliation_worker(worker_id: int, logger: Logger):
+    """Process KasprApps from the reconciliation queue until shutdown."""
+    while True:
+        item = await reconciliation_queue.get()
+        if item is None:
+            return
+        key, priority, wait_time = item
+        namespace, name = key
+        try:
+            if not is_owned(namespace, name):
+                # Owned by another operator shard
+                reconciliation_queue.forget(key)
+                continue
             sensor = get_sensor()
             if sensor:
-                wait_time = time.time() - queue_start_time
                 sensor.on_reconcile_dequeued(name, name, namespace, wait_time)
-            
+
             start_time = time.time()
-            await reconcile(
+            success = await reconcile_queued_app(
                 name,
                 namespace,
-                spec,
-                meta,
-                status,
-                patch,
-                annotations,
                 logger,
-                trigger_source="queue",
-                **kwargs,
+                trigger_source=(
+                    "timer" if priority == Priority.PERIODIC else "queue"
+                ),
             )
             execution_time = time.time() - start_time
-            logger.info(
-                f"Reconciliation for {name} completed in {execution_time:.2f} seconds"
+            if success:
+                reconciliation_queue.forget(key)
+                logger.info(
+                    f"Reconciliation for {namespace}/{name} completed in {execution_time:.2f} seconds"
+                )
+            else:
+                delay = reconciliation_queue.add_rate_limited(key, priority)
+                logger.info(
+                    f"Reconciliation for {namespace}/{name} failed, retrying in {delay:.1f} seconds"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            delay = reconciliation_queue.add_rate_limited(key, priority)
+            logger.error(
+                f"Error processing reconciliation request for {namespace}/{name}: {e}; retrying in {delay:.1f} seconds"
             )
-            # Allow this name to be requeued after processing
-            names_in_queue.discard(name)
-            queue.task_done()
-    except asyncio.QueueEmpty:
-        pass
-    except Exception as e:
-        logger.error(f"Error processing reconciliation request: {e}")
-        # Ensure we don't get stuck on failed requests
-        names_in_queue.discard(name)
+        finally:
+            reconciliation_queue.done(key)
+
+
+async def periodic_resync(interval: float):
+    """Periodically requeue every known KasprApp.
+
+    Each app is scheduled at a random offset within the interval so that
+    periodic reconciliations are spread out instead of arriving in bursts.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        for key in list(known_apps):
+            if not is_owned(*key):
+                continue
+            reconciliation_queue.add_after(
+                key, random.uniform(0, interval), Priority.PERIODIC
+            )
+
+
+def requeue_owned_apps(members=None):
+    """Queue every known KasprApp owned by this operator shard.
+
+    Called when operator shard membership changes so that apps moving to
+    this shard are reconciled right away instead of at the next resync.
+    Apps that moved here are also annotated (see :func:`announce_owner`).
+    """
+    coordinator = get_coordinator()
+    for key in list(known_apps):
+        if is_owned(*key):
+            reconciliation_queue.add(key, Priority.DRIFT)
+            if coordinator is not None and coordinator.gained(*key):
+                announce_owner(*key, coordinator.identity)
+
+
+def announce_owner(namespace: str, name: str, identity: str):
+    """Annotate a KasprApp and its components with their new operator shard.
+
+    Kopf re-evaluates the ``owns`` filter of daemons and timers only when
+    an object changes. The annotation change starts them on this shard and
+    stops them on the previous owner.
+    """
+    request = {"field": "metadata.annotations", "value": {OWNER_ANNOTATION: identity}}
+    patch_bus.request(APP_KIND, namespace, name, request)
+    for kind, _, referrer in reference_index.referrers(APP_KIND, namespace, name):
+        patch_bus.request(kind, namespace, referrer, request)
+
+
+def start_reconciliation_workers(conf, logger: Logger):
+    """Start the reconciliation worker pool and periodic resync."""
+    global reconciliation_queue
+    reconciliation_queue = WorkQueue(
+        qps=conf.reconcile_qps,
+        burst=conf.reconcile_burst,
+        base_delay=conf.reconcile_backoff_base_seconds,
+        max_delay=conf.reconcile_backoff_max_seconds,
+    )
+    for worker_id in range(max(1, conf.reconcile_workers)):
+        reconciliation_tasks.append(
+            asyncio.create_task(
+                reconciliation_worker(worker_id, logger),
+                name=f"kasprapp-reconcile-worker-{worker_id}",
+            )
+        )
+    reconciliation_tasks.append(
+        asyncio.create_task(
+            periodic_resync(conf.reconcile_resync_interval_seconds),
+            name="kasprapp-periodic-resync",
+        )
+    )
+
+
+async def stop_reconciliation_workers():
+    """Stop the reconciliation worker pool."""
+    reconciliation_queue.shutdown()
+    for task in reconciliation_tasks:
+        task.cancel()
+    await asyncio.gather(*reconciliation_tasks, return_exceptions=True)
+    reconciliation_tasks.clear()
 
 
 @kopf.daemon(
@@ -2214,6 +2408,7 @@ async def process_reconciliation_requests(
     cancellation_backoff=2.0,
     cancellation_timeout=5.0,
     initial_delay=5.0,
+    when=owns,
 )
 async def monitor_related_resources(
     stopped,
@@ -2238,9 +2433,18 @@ async def monitor_related_resources(
     4. Update app annotations & status with changes.
     """
 
+    if startup_warmup.active:
+        # Do not start the monitors of all apps at once after a restart
+        await stopped.wait(startup_warmup.delay())
+
     while not stopped:
+        if not is_owned(namespace, name):
+            # Moved to another operator shard, kopf stops the daemon on the
+            # next event of the app
+            await stopped.wait(10)
+            continue
         try:
-            spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+            spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
             app = KasprApp.from_spec(
                 name, APP_KIND, namespace, spec_model, annotations, logger=logger
             )
@@ -2258,7 +2462,11 @@ async def monitor_related_resources(
                         agent["metadata"]["name"],
                         KasprAgent.KIND,
                         namespace,
-                        KasprAgentSpecSchema().load(agent["spec"]),
+                        load_spec(
+                            KasprAgentSpecSchema,
+                            agent["spec"],
+                            (namespace, agent["metadata"]["name"]),
+                        ),
                         dict(agent["metadata"]["labels"]),
                     )
                 )
@@ -2269,7 +2477,11 @@ async def monitor_related_resources(
                         webview["metadata"]["name"],
                         KasprWebView.KIND,
                         namespace,
-                        KasprWebViewSpecSchema().load(webview["spec"]),
+                        load_spec(
+                            KasprWebViewSpecSchema,
+                            webview["spec"],
+                            (namespace, webview["metadata"]["name"]),
+                        ),
                         dict(webview["metadata"]["labels"]),
                     )
                 )
@@ -2280,7 +2492,11 @@ async def monitor_related_resources(
                         table["metadata"]["name"],
                         KasprTable.KIND,
                         namespace,
-                        KasprTableSpecSchema().load(table["spec"]),
+                        load_spec(
+                            KasprTableSpecSchema,
+                            table["spec"],
+                            (namespace, table["metadata"]["name"]),
+                        ),
                         dict(table["metadata"]["labels"]),
                     )
                 )
@@ -2291,15 +2507,24 @@ async def monitor_related_resources(
                         task["metadata"]["name"],
                         KasprTask.KIND,
                         namespace,
-                        KasprTaskSpecSchema().load(task["spec"]),
+                        load_spec(
+                            KasprTaskSpecSchema,
+                            task["spec"],
+                            (namespace, task["metadata"]["name"]),
+                        ),
                         dict(task["metadata"]["labels"]),
                     )
                 )
+            app.with_meta(meta)
             app.with_agents(agents)
             app.with_webviews(webviews)
             app.with_tables(tables)
             app.with_tasks(tasks)
-            await app.patch_volume_mounted_resources()
+            if await app.patch_volume_mounted_resources():
+                logger.debug("Patched StatefulSet with updated volume-mounted resources.")
+                await request_reconciliation(
+                    name, namespace=namespace, priority=Priority.DRIFT
+                )
             await stopped.wait(10)  # Avoid tight loop and exit promptly on deletion
 
         except asyncio.CancelledError:
@@ -2311,16 +2536,11 @@ async def monitor_related_resources(
             await stopped.wait(10)  # Avoid tight loop on error and exit promptly on deletion
 
 
-@kopf.timer(APP_KIND, initial_delay=5.0, interval=30.0, backoff=10.0)
-async def periodic_reconciliation(name, namespace, **kwargs):
-    """Reconcile KasprApp resources."""
-    await request_reconciliation(name, namespace, **kwargs)
-
-
 @kopf.on.field(
     kind=APP_KIND,
     field="metadata.annotations",
     annotations={"kaspr.io/pause-reconciliation": kopf.PRESENT},
+    when=owns,
 )
 async def on_reconciliation_paused(
     name, diff, spec, namespace, logger: Logger, **kwargs
@@ -2333,6 +2553,7 @@ async def on_reconciliation_paused(
     kind=APP_KIND,
     field="metadata.annotations",
     annotations={"kaspr.io/pause-reconciliation": kopf.ABSENT},
+    when=owns,
 )
 async def on_reconciliation_resumed(
     name, diff, spec, namespace, logger: Logger, **kwargs
@@ -2345,6 +2566,7 @@ async def on_reconciliation_resumed(
     kind=APP_KIND,
     field="metadata.annotations",
     annotations={"kaspr.io/rebalance": kopf.PRESENT},
+    when=owns,
 )
 async def on_rebalance_requested(
     name, body, spec, namespace, annotations, patch, logger: Logger, **kwargs
@@ -2360,7 +2582,7 @@ async def on_rebalance_requested(
     2. Removes the annotation regardless of success/failure
     3. Posts an event indicating the result
     """
-    spec_model: KasprAppSpec = KasprAppSpecSchema().load(spec)
+    spec_model: KasprAppSpec = load_spec(KasprAppSpecSchema, spec, (namespace, name))
     app = KasprApp.from_spec(
         name, APP_KIND, namespace, spec_model, annotations, logger=logger
     )
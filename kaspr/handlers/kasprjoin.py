@@ -1,13 +1,15 @@
-import asyncio
 import kopf
 import logging
-from collections import defaultdict
 from typing import Dict
-from benedict import benedict
 from kaspr.types.schemas import KasprJoinSpecSchema
 from kaspr.types.models import KasprJoinSpec
 from kaspr.resources import KasprJoin, KasprApp, KasprTable
 from kaspr.sensors import SensorDelegate
+from kaspr.informers import reference_index, reported_existence
+from kaspr.utils.spec_memo import load_spec
+from kaspr.utils.warmup import startup_warmup
+from kaspr.utils.patch_bus import patch_bus
+from kaspr.sharding import owns
 
 KIND = "KasprJoin"
 APP_NOT_FOUND = "AppNotFound"
@@ -27,10 +29,6 @@ def get_sensor() -> SensorDelegate:
     return getattr(KasprJoin, "sensor", None)
 
 
-# Queue of requests to update KasprJoin status
-patch_request_queues: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
-
-
 class TimerLogFilter(logging.Filter):
     def filter(self, record):
         """Timer logs are noisy so we filter them out."""
@@ -41,44 +39,51 @@ kopf_logger = logging.getLogger("kopf.objects")
 kopf_logger.addFilter(TimerLogFilter())
 
 
-@kopf.on.resume(kind=KIND)
-@kopf.on.create(kind=KIND)
-@kopf.on.update(kind=KIND)
+@kopf.on.resume(kind=KIND, when=owns)
+@kopf.on.create(kind=KIND, when=owns)
+@kopf.on.update(kind=KIND, when=owns)
 async def reconciliation(
     body, spec, name, namespace, logger, labels, patch, annotations, **kwargs
 ):
     """Reconcile KasprJoin resources."""
-    spec_model: KasprJoinSpec = KasprJoinSpecSchema().load(spec)
+    spec_model: KasprJoinSpec = load_spec(KasprJoinSpecSchema, spec, (namespace, name))
     join_resource = KasprJoin.from_spec(
         name, KIND, namespace, spec_model, dict(labels)
     )
-    app = await KasprApp.default().fetch(join_resource.app_name, namespace)
-    await join_resource.create()
+    app_found = await reference_index.confirm(
+        KasprApp.KIND, namespace, join_resource.app_name, KasprApp.default().fetch
+    )
+    if not await startup_warmup.unchanged(namespace, join_resource.prepare_child_hashes()):
+        await join_resource.create()
 
     # Validate referenced tables exist
-    left_table = await KasprTable.default().fetch(spec_model.left_table, namespace)
-    right_table = await KasprTable.default().fetch(spec_model.right_table, namespace)
+    left_table_found = await reference_index.confirm(
+        KasprTable.KIND, namespace, spec_model.left_table, KasprTable.default().fetch
+    )
+    right_table_found = await reference_index.confirm(
+        KasprTable.KIND, namespace, spec_model.right_table, KasprTable.default().fetch
+    )
 
     patch.status.update(
         {
             "app": {
                 "name": join_resource.app_name,
-                "status": APP_FOUND if app else APP_NOT_FOUND,
+                "status": APP_FOUND if app_found else APP_NOT_FOUND,
             },
             "leftTable": {
                 "name": spec_model.left_table,
-                "status": LEFT_TABLE_FOUND if left_table else LEFT_TABLE_NOT_FOUND,
+                "status": LEFT_TABLE_FOUND if left_table_found else LEFT_TABLE_NOT_FOUND,
             },
             "rightTable": {
                 "name": spec_model.right_table,
-                "status": RIGHT_TABLE_FOUND if right_table else RIGHT_TABLE_NOT_FOUND,
+                "status": RIGHT_TABLE_FOUND if right_table_found else RIGHT_TABLE_NOT_FOUND,
             },
             "configMap": join_resource.config_map_name,
             "hash": join_resource.hash,
         }
     )
 
-    if app is None:
+    if not app_found:
         kopf.warn(
             body,
             reason=APP_NOT_FOUND,
@@ -92,7 +97,7 @@ async def reconciliation(
             message=f"KasprApp `{join_resource.app_name}` found in `{namespace or 'default'}` namespace.",
         )
 
-    if left_table is None:
+    if not left_table_found:
         kopf.warn(
             body,
             reason=LEFT_TABLE_NOT_FOUND,
@@ -106,7 +111,7 @@ async def reconciliation(
             message=f"KasprTable `{spec_model.left_table}` found in `{namespace or 'default'}` namespace.",
         )
 
-    if right_table is None:
+    if not right_table_found:
         kopf.warn(
             body,
             reason=RIGHT_TABLE_NOT_FOUND,
@@ -121,148 +126,88 @@ async def reconciliation(
         )
 
 
-@kopf.timer(KIND, interval=1)
-async def patch_resource(name, patch, **kwargs):
-    queue = patch_request_queues[name]
-
-    def set_patch(request):
-        fields = request["field"].split(".")
-        _patch = patch
-        for field in fields:
-            _patch = getattr(_patch, field)
-        _patch.update(request["value"])
-
-    while not queue.empty():
-        request = queue.get_nowait()
-        if isinstance(request, list):
-            for req in request:
-                set_patch(req)
-        else:
-            set_patch(request)
-
-
-@kopf.daemon(
-    kind=KIND, cancellation_backoff=2.0, cancellation_timeout=5.0, initial_delay=5.0
-)
-async def monitor_join(
-    stopped,
-    name,
-    body,
-    spec,
-    meta,
-    labels,
-    status,
-    namespace,
-    patch,
-    logger: logging.Logger,
-    **kwargs,
-):
-    """Monitor KasprJoin resources for app and table availability."""
-    while not stopped:
-        try:
-            _status = benedict(status, keyattr_dynamic=True)
-            _status_updates = benedict(keyattr_dynamic=True)
-            spec_model: KasprJoinSpec = KasprJoinSpecSchema().load(spec)
-            join_resource = KasprJoin.from_spec(
-                name, KIND, namespace, spec_model, dict(labels)
-            )
-
-            # Check app existence
-            app = await KasprApp.default().fetch(join_resource.app_name, namespace)
-            if app is None and _status.app.status == APP_FOUND:
-                kopf.warn(
-                    body,
-                    reason=APP_NOT_FOUND,
-                    message=f"KasprApp `{join_resource.app_name}` does not exist in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.app.status = APP_NOT_FOUND
-            elif app and _status.app.status == APP_NOT_FOUND:
-                kopf.event(
-                    body,
-                    type="Normal",
-                    reason=APP_FOUND,
-                    message=f"KasprApp `{join_resource.app_name}` found in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.app.status = APP_FOUND
-
-            # Check left table existence
-            left_table = await KasprTable.default().fetch(
-                spec_model.left_table, namespace
-            )
-            if (
-                left_table is None
-                and _status.get("leftTable", {}).get("status") == LEFT_TABLE_FOUND
-            ):
-                kopf.warn(
-                    body,
-                    reason=LEFT_TABLE_NOT_FOUND,
-                    message=f"KasprTable `{spec_model.left_table}` not found in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.leftTable.status = LEFT_TABLE_NOT_FOUND
-            elif (
-                left_table
-                and _status.get("leftTable", {}).get("status") == LEFT_TABLE_NOT_FOUND
-            ):
-                kopf.event(
-                    body,
-                    type="Normal",
-                    reason=LEFT_TABLE_FOUND,
-                    message=f"KasprTable `{spec_model.left_table}` found in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.leftTable.status = LEFT_TABLE_FOUND
-
-            # Check right table existence
-            right_table = await KasprTable.default().fetch(
-                spec_model.right_table, namespace
-            )
-            if (
-                right_table is None
-                and _status.get("rightTable", {}).get("status") == RIGHT_TABLE_FOUND
-            ):
-                kopf.warn(
-                    body,
-                    reason=RIGHT_TABLE_NOT_FOUND,
-                    message=f"KasprTable `{spec_model.right_table}` not found in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.rightTable.status = RIGHT_TABLE_NOT_FOUND
-            elif (
-                right_table
-                and _status.get("rightTable", {}).get("status")
-                == RIGHT_TABLE_NOT_FOUND
-            ):
-                kopf.event(
-                    body,
-                    type="Normal",
-                    reason=RIGHT_TABLE_FOUND,
-                    message=f"KasprTable `{spec_model.right_table}` found in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.rightTable.status = RIGHT_TABLE_FOUND
-
-            if _status_updates:
-                await patch_request_queues[name].put(
-                    [
-                        {"field": "status", "value": _status_updates},
-                    ]
-                )
-
-            await asyncio.sleep(10)
-        except asyncio.CancelledError:
-            logger.info("Monitoring stopped.")
-            break
-        except Exception as e:
-            logger.error(f"Unexpected error during monitoring: {e}")
-            logger.exception(e)
-
-
-@kopf.timer(KIND, initial_delay=5.0, interval=60.0, backoff=10.0)
-async def reconcile(name, spec, namespace, labels, logger: logging.Logger, **kwargs):
+async def patch_resource(name, namespace, patch):
+    """Apply a patch collected by the patch bus."""
+    await KasprJoin.default().patch_component(name, namespace, patch)
+
+
+patch_bus.register(KIND, patch_resource)
+
+
+@kopf.on.event(kind=KIND)
+async def track_references(event, body, name, namespace, labels, spec, status, **kwargs):
+    """Track the KasprApp and KasprTables referenced by every join, owned or not."""
+    if event.get("type") == "DELETED":
+        reference_index.untrack(KIND, namespace, name)
+        patch_bus.forget(KIND, namespace, name)
+    else:
+        reference_index.track(
+            body,
+            {
+                "app": (KasprApp.KIND, labels.get(KasprJoin.KASPR_APP_NAME_LABEL)),
+                "leftTable": (KasprTable.KIND, spec.get("leftTable")),
+                "rightTable": (KasprTable.KIND, spec.get("rightTable")),
+            },
+            reported={
+                role: reported_existence(status, role, found, not_found)
+                for role, (_, found, not_found) in REFERENCE_REASONS.items()
+            },
+        )
+
+
+# Role of a reference -> (kind, found reason, not found reason)
+REFERENCE_REASONS = {
+    "app": (KasprApp.KIND, APP_FOUND, APP_NOT_FOUND),
+    "leftTable": (KasprTable.KIND, LEFT_TABLE_FOUND, LEFT_TABLE_NOT_FOUND),
+    "rightTable": (KasprTable.KIND, RIGHT_TABLE_FOUND, RIGHT_TABLE_NOT_FOUND),
+}
+
+
+def on_reference_changed(join: Dict, role: str, exists: bool):
+    """Update the status of a join when a referenced app or table appears or disappears."""
+    if not owns(join):
+        return
+    metadata = join["metadata"]
+    namespace = metadata["namespace"]
+    kind, found, not_found = REFERENCE_REASONS[role]
+    referenced = reference_index.references_of(KIND, namespace, metadata["name"])[role]
+    if exists:
+        kopf.event(
+            join,
+            type="Normal",
+            reason=found,
+            message=f"{kind} `{referenced}` found in `{namespace or 'default'}` namespace.",
+        )
+    else:
+        kopf.warn(
+            join,
+            reason=not_found,
+            message=f"{kind} `{referenced}` not found in `{namespace or 'default'}` namespace.",
+        )
+    patch_bus.request(
+        KIND,
+        namespace,
+        metadata["name"],
+        [{"field": "status", "value": {role: {"status": found if exists else not_found}}}],
+    )
+
+
+reference_index.subscribe(KIND, on_reference_changed)
+
+
+@kopf.timer(KIND, initial_delay=5.0, interval=60.0, backoff=10.0, when=owns)
+async def reconcile(name, body, spec, namespace, labels, logger: logging.Logger, **kwargs):
     """Full sync."""
+    if not owns(body):
+        # Kopf only stops the timer on the next event after the app moved
+        # to another operator shard
+        return
     sensor = get_sensor()
     success = True
     error = None
 
     try:
-        spec_model: KasprJoinSpec = KasprJoinSpecSchema().load(spec)
+        spec_model: KasprJoinSpec = load_spec(KasprJoinSpecSchema, spec, (namespace, name))
         join_resource = KasprJoin.from_spec(
             name, KIND, namespace, spec_model, dict(labels)
         )
@@ -272,7 +217,8 @@ async def reconcile(name, spec, namespace, labels, logger: logging.Logger, **kwa
         )
 
         logger.debug(f"Reconciling {KIND}/{name} in {namespace} namespace.")
-        await join_resource.synchronize()
+        if not await startup_warmup.unchanged(namespace, join_resource.prepare_child_hashes()):
+            await join_resource.synchronize()
         logger.debug(f"Reconciled {KIND}/{name} in {namespace} namespace.")
     except Exception as e:
         success = False
@@ -1,13 +1,15 @@
-import asyncio
 import kopf
 import logging
-from collections import defaultdict
 from typing import Dict
-from benedict import benedict
 from kaspr.types.schemas import KasprWebViewSpecSchema
 from kaspr.types.models import KasprWebViewSpec
 from kaspr.resources import KasprWebView, KasprApp
 from kaspr.sensors import SensorDelegate
+from kaspr.informers import reference_index, reported_existence
+from kaspr.utils.spec_memo import load_spec
+from kaspr.utils.warmup import startup_warmup
+from kaspr.utils.patch_bus import patch_bus
+from kaspr.sharding import owns
 
 KIND = "KasprWebView"
 APP_NOT_FOUND = "AppNotFound"
@@ -22,9 +24,6 @@ def get_sensor() -> SensorDelegate:
     """
     return getattr(KasprWebView, 'sensor', None)
 
-# Queue of requests to update KasprWebView status
-patch_request_queues: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
-
 
 class TimerLogFilter(logging.Filter):
     def filter(self, record):
@@ -36,29 +35,32 @@ kopf_logger = logging.getLogger("kopf.objects")
 kopf_logger.addFilter(TimerLogFilter())
 
 
-@kopf.on.resume(kind=KIND)
-@kopf.on.create(kind=KIND)
-@kopf.on.update(kind=KIND)
+@kopf.on.resume(kind=KIND, when=owns)
+@kopf.on.create(kind=KIND, when=owns)
+@kopf.on.update(kind=KIND, when=owns)
 async def reconciliation(
     body, spec, name, namespace, logger, labels, patch, annotations, **kwargs
 ):
     """Reconcile KasprWebView resources."""
-    spec_model: KasprWebViewSpec = KasprWebViewSpecSchema().load(spec)
+    spec_model: KasprWebViewSpec = load_spec(KasprWebViewSpecSchema, spec, (namespace, name))
     webview = KasprWebView.from_spec(name, KIND, namespace, spec_model, dict(labels))
-    app = await KasprApp.default().fetch(webview.app_name, namespace)
-    await webview.create()
+    app_found = await reference_index.confirm(
+        KasprApp.KIND, namespace, webview.app_name, KasprApp.default().fetch
+    )
+    if not await startup_warmup.unchanged(namespace, webview.prepare_child_hashes()):
+        await webview.create()
     # fetch the webviews's app and update it's status.
     patch.status.update(
         {
             "app": {
                 "name": webview.app_name,
-                "status": APP_FOUND if app else APP_NOT_FOUND,
+                "status": APP_FOUND if app_found else APP_NOT_FOUND,
             },
             "configMap": webview.config_map_name,
             "hash": webview.hash,
         }
     )
-    if app is None:
+    if not app_found:
         kopf.warn(
             body,
             reason=APP_NOT_FOUND,
@@ -73,94 +75,77 @@ async def reconciliation(
         )
 
 
-@kopf.timer(KIND, interval=1)
-async def patch_resource(name, patch, **kwargs):
-    queue = patch_request_queues[name]
-
-    def set_patch(request):
-        fields = request["field"].split(".")
-        _patch = patch
-        for field in fields:
-            _patch = getattr(_patch, field)
-        _patch.update(request["value"])
-
-    while not queue.empty():
-        request = queue.get_nowait()
-        if isinstance(request, list):
-            for req in request:
-                set_patch(req)
-        else:
-            set_patch(request)
-
-
-@kopf.daemon(
-    kind=KIND, cancellation_backoff=2.0, cancellation_timeout=5.0, initial_delay=5.0
-)
-async def monitor_webview(
-    stopped,
-    name,
-    body,
-    spec,
-    meta,
-    labels,
-    status,
-    namespace,
-    patch,
-    logger: logging.Logger,
-    **kwargs,
-):
-    """Monitor webview resources for status updates."""
-    while not stopped:
-        try:
-            _status = benedict(status, keyattr_dynamic=True)
-            _status_updates = benedict(keyattr_dynamic=True)
-            spec_model: KasprWebViewSpec = KasprWebViewSpecSchema().load(spec)
-            webview = KasprWebView.from_spec(
-                name, KIND, namespace, spec_model, dict(labels)
-            )
-            # Warn if the webview's app does not exists.
-            app = await KasprApp.default().fetch(webview.app_name, namespace)
-            if app is None and _status.app.status == APP_FOUND:
-                kopf.warn(
-                    body,
-                    reason=APP_NOT_FOUND,
-                    message=f"KasprApp `{webview.app_name}` does not exist in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.app.status = APP_NOT_FOUND
-            elif app and _status.app.status == APP_NOT_FOUND:
-                kopf.event(
-                    body,
-                    type="Normal",
-                    reason=APP_FOUND,
-                    message=f"KasprApp `{webview.app_name}` found in `{namespace or 'default'}` namespace.",
-                )
-                _status_updates.app.status = APP_FOUND
-
-            if _status_updates:
-                await patch_request_queues[name].put(
-                    [
-                        {"field": "status", "value": _status_updates},
-                    ]
-                )
-
-            await asyncio.sleep(10)
-        except asyncio.CancelledError:
-            logger.info("Monitoring stopped.")
-            break
-        except Exception as e:
-            logger.error(f"Unexpected error during monitoring: {e}")
-            logger.exception(e)
-
-
-@kopf.timer(KIND, initial_delay=5.0, interval=60.0, backoff=10.0)
-async def reconcile(name, spec, namespace, labels, logger: logging.Logger, **kwargs):
+async def patch_resource(name, namespace, patch):
+    """Apply a patch collected by the patch bus."""
+    await KasprWebView.default().patch_component(name, namespace, patch)
+
+
+patch_bus.register(KIND, patch_resource)
+
+
+@kopf.on.event(kind=KIND)
+async def track_app_reference(event, body, name, namespace, labels, status, **kwargs):
+    """Track the KasprApp referenced by every webview, owned or not."""
+    if event.get("type") == "DELETED":
+        reference_index.untrack(KIND, namespace, name)
+        patch_bus.forget(KIND, namespace, name)
+    else:
+        reference_index.track(
+            body,
+            {"app": (KasprApp.KIND, labels.get(KasprWebView.KASPR_APP_NAME_LABEL))},
+            reported={"app": reported_existence(status, "app", APP_FOUND, APP_NOT_FOUND)},
+        )
+
+
+def on_app_reference_changed(webview: Dict, role: str, exists: bool):
+    """Update the app status of a webview when its KasprApp appears or disappears."""
+    if not owns(webview):
+        return
+    metadata = webview["metadata"]
+    app_name = metadata["labels"].get(KasprWebView.KASPR_APP_NAME_LABEL)
+    namespace = metadata["namespace"]
+    if exists:
+        kopf.event(
+            webview,
+            type="Normal",
+            reason=APP_FOUND,
+            message=f"KasprApp `{app_name}` found in `{namespace or 'default'}` namespace.",
+        )
+    else:
+        kopf.warn(
+            webview,
+            reason=APP_NOT_FOUND,
+            message=f"KasprApp `{app_name}` does not exist in `{namespace or 'default'}` namespace.",
+        )
+    patch_bus.request(
+        KIND,
+        namespace,
+        metadata["name"],
+        [
+            {
+                "field": "status",
+                "value": {"app": {"status": APP_FOUND if exists else APP_NOT_FOUND}},
+            }
+        ]
+    )
+
+
+reference_index.subscribe(KIND, on_app_reference_changed)
+
+
+@kopf.timer(KIND, initial_delay=5.0, interval=60.0, backoff=10.0, when=owns)
+async def reconcile(name, body, spec, namespace, labels, logger: logging.Logger, **kwargs):
     """Full sync."""
+    if not owns(body):
+        # Kopf only stops the timer on the next event after the app moved
+        # to another operator shard
+        return
     sensor = get_sensor()
     success = True
     error = None
     
     try:
-        spec_model: KasprWebViewSpec = KasprWebViewSpecSchema().load(spec)
+        spec_model: KasprWebViewSpec = load_spec(KasprWebViewSpecSchema, spec, (namespace, name))
         webview = KasprWebView.from_spec(name, KIND, namespace, spec_model, dict(labels))
         
         sensor_state = sensor.on_reconcile_start(
@@ -168,7 +153,8 @@ async def reconcile(name, spec, namespace, labels, logger: logging.Logger, **kwa
         )
         
         logger.debug(f"Reconciling {KIND}/{name} in {namespace} namespace.")
-        await webview.synchronize()
+        if not await startup_warmup.unchanged(namespace, webview.prepare_child_hashes()):
+            await webview.synchronize()
         logger.debug(f"Reconciled {KIND}/{name} in {namespace} namespace.")
     except Exception as e:
         success = False
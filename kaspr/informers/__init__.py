@@ -0,0 +1,25 @@
+"""In-process informer cache for kaspr custom resources.
+
+Informers keep a local, watch-driven copy of custom resources so that
+frequent lookups (e.g. all KasprAgents belonging to a KasprApp) do not
+require a LIST call against the Kubernetes API server. The reference index
+tracks which KasprApps and KasprTables exist and which objects reference
+them.
+"""
+
+from kaspr.informers.store import ObjectStore
+from kaspr.informers.informer import Informer, InformerRegistry
+from kaspr.informers.references import (
+    ReferenceIndex,
+    reference_index,
+    reported_existence,
+)
+
+__all__ = [
+    "ObjectStore",
+    "Informer",
+    "InformerRegistry",
+    "ReferenceIndex",
+    "reference_index",
+    "reported_existence",
+]
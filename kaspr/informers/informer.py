@@ -0,0 +1,224 @@
+"""Watch-based informers for kaspr custom resources.
+
+An informer performs an initial LIST of a custom resource plural in a
+namespace, then keeps a local :class:`ObjectStore` up to date by streaming
+WATCH events resumed from the last observed ``resourceVersion``. When the
+API server reports that the resource version is too old (HTTP 410 Gone),
+the informer relists and starts watching again.
+
+The :class:`InformerRegistry` lazily starts one informer per
+(group, version, plural, namespace) the first time it is queried, so
+lookups that used to be a LIST call per app become in-memory reads.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from kubernetes_asyncio import watch
+from kubernetes_asyncio.client import CustomObjectsApi
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.rest import ApiException
+
+from kaspr.informers.store import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+InformerKey = Tuple[str, str, str, str]
+
+
+class Informer:
+    """Keeps a local cache of one custom resource plural in one namespace."""
+
+    #: Seconds to wait before retrying after an unexpected watch failure
+    RETRY_BACKOFF_SECONDS = 5.0
+
+    def __init__(
+        self,
+        custom_objects_api: CustomObjectsApi,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: str,
+        index_label: str,
+        watch_timeout_seconds: int = 300,
+    ):
+        self.custom_objects_api = custom_objects_api
+        self.group = group
+        self.version = version
+        self.plural = plural
+        self.namespace = namespace
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.store = ObjectStore(index_label)
+        self.resource_version: Optional[str] = None
+        self._synced = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"<Informer {self.plural}.{self.group} namespace={self.namespace}>"
+
+    @property
+    def has_synced(self) -> bool:
+        """True once the initial list has populated the store."""
+        return self._synced.is_set()
+
+    def start(self):
+        """Start the list/watch loop in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=repr(self))
+
+    async def stop(self):
+        """Stop the list/watch loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._synced.clear()
+
+    async def wait_synced(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the initial list to complete."""
+        if self.has_synced:
+            return True
+        try:
+            await asyncio.wait_for(self._synced.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def relist(self):
+        """List all objects and replace the contents of the store."""
+        response = await self.custom_objects_api.list_namespaced_custom_object(
+            group=self.group,
+            version=self.version,
+            namespace=self.namespace,
+            plural=self.plural,
+        )
+        self.store.replace(response.get("items", []))
+        self.resource_version = (response.get("metadata") or {}).get(
+            "resourceVersion"
+        )
+        self._synced.set()
+
+    def apply(self, event: Dict):
+        """Apply a single watch event to the store."""
+        event_type = event.get("type")
+        obj = event.get("raw_object", event.get("object")) or {}
+        if event_type in ("ADDED", "MODIFIED"):
+            self.store.upsert(obj)
+        elif event_type == "DELETED":
+            self.store.delete(obj)
+        resource_version = (obj.get("metadata") or {}).get("resourceVersion")
+        if resource_version:
+            self.resource_version = resource_version
+
+    async def watch(self):
+        """Stream events from the last seen resource version until the
+        server closes the stream."""
+        async with watch.Watch() as stream:
+            async for event in stream.stream(
+                self.custom_objects_api.list_namespaced_custom_object,
+                group=self.group,
+                version=self.version,
+                namespace=self.namespace,
+                plural=self.plural,
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=self.watch_timeout_seconds,
+            ):
+                self.apply(event)
+
+    async def _run(self):
+        while True:
+            try:
+                if self.resource_version is None:
+                    await self.relist()
+                await self.watch()
+            except asyncio.CancelledError:
+                raise
+            except ApiException as ex:
+                if ex.status == 410:
+                    logger.debug(f"{self!r} resource version expired, relisting.")
+                    self.resource_version = None
+                    continue
+                logger.warning(f"{self!r} watch failed: {ex.status} {ex.reason}")
+                await asyncio.sleep(self.RETRY_BACKOFF_SECONDS)
+            except Exception as e:
+                logger.warning(f"{self!r} watch failed: {e}")
+                await asyncio.sleep(self.RETRY_BACKOFF_SECONDS)
+
+
+class InformerRegistry:
+    """Lazily creates and owns informers shared by all resources."""
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        index_label: str = "kaspr.io/app",
+        sync_timeout_seconds: float = 10.0,
+        watch_timeout_seconds: int = 300,
+    ):
+        self.custom_objects_api = CustomObjectsApi(api_client)
+        self.index_label = index_label
+        self.sync_timeout_seconds = sync_timeout_seconds
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.informers: Dict[InformerKey, Informer] = {}
+
+    def informer_for(
+        self, group: str, version: str, plural: str, namespace: str
+    ) -> Informer:
+        """Return the informer for the given resource, starting it if needed."""
+        key = (group, version, plural, namespace)
+        informer = self.informers.get(key)
+        if informer is None:
+            informer = Informer(
+                self.custom_objects_api,
+                group,
+                version,
+                plural,
+                namespace,
+                self.index_label,
+                watch_timeout_seconds=self.watch_timeout_seconds,
+            )
+            self.informers[key] = informer
+        informer.start()
+        return informer
+
+    async def _synced_informer(
+        self, group: str, version: str, plural: str, namespace: str
+    ) -> Optional[Informer]:
+        informer = self.informer_for(group, version, plural, namespace)
+        if await informer.wait_synced(self.sync_timeout_seconds):
+            return informer
+        return None
+
+    async def list(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: str,
+        label_values: List[str] = None,
+    ) -> Optional[Dict]:
+        """List cached objects in the same shape as a LIST response.
+
+        Returns None if the informer has not synced yet, in which case the
+        caller should fall back to the API server.
+        """
+        informer = await self._synced_informer(group, version, plural, namespace)
+        if informer is None:
+            return None
+        return {
+            "items": informer.store.list(label_values),
+            "metadata": {"resourceVersion": informer.resource_version},
+        }
+
+    async def stop(self):
+        """Stop all informers."""
+        await asyncio.gather(
+            *(informer.stop() for informer in self.informers.values()),
+            return_exceptions=True,
+        )
+        self.informers.clear()
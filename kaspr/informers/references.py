@@ -0,0 +1,182 @@
+"""Local index of referenced kaspr resources.
+
+App components reference their KasprApp through the ``kaspr.io/app`` label,
+and joins also reference their left and right KasprTables by name. The
+index is fed by kopf event handlers: it knows which KasprApps and
+KasprTables exist and which objects reference them, and notifies the
+referrers when a referenced object appears or disappears. Existence checks
+therefore need neither API calls nor polling.
+
+Referrers also record the existence they last reported in their status, so
+the initial listing after a restart does not notify referrers whose status
+is already right.
+"""
+
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Mapping, Optional, Set, Tuple
+
+#: (kind, namespace, name) of an object
+ObjectKey = Tuple[str, Optional[str], str]
+
+#: Called with the referrer, the role of the reference and whether the
+#: referenced object exists now
+Listener = Callable[[Dict, str, bool], None]
+
+#: Fetches an object by (name, namespace), returning None if it does not exist
+Fetch = Callable[[str, Optional[str]], Awaitable]
+
+
+def object_reference(body: Mapping) -> Dict:
+    """Minimal copy of ``body`` usable for kopf events and ``when`` filters."""
+    metadata = body.get("metadata") or {}
+    return {
+        "apiVersion": body.get("apiVersion"),
+        "kind": body.get("kind"),
+        "metadata": {
+            "name": metadata.get("name"),
+            "namespace": metadata.get("namespace"),
+            "uid": metadata.get("uid"),
+            "labels": dict(metadata.get("labels") or {}),
+        },
+    }
+
+
+def reported_existence(
+    status: Optional[Mapping], role: str, found: str, not_found: str
+) -> Optional[bool]:
+    """Existence of a reference as last reported in ``status[role].status``."""
+    reported = ((status or {}).get(role) or {}).get("status")
+    if reported == found:
+        return True
+    if reported == not_found:
+        return False
+    return None
+
+
+class ReferenceIndex:
+    """Existing objects by name and the objects referencing them."""
+
+    def __init__(self):
+        self._existing: Dict[Tuple[str, Optional[str]], Set[str]] = defaultdict(set)
+        self._observed_kinds: Set[str] = set()
+        # Referenced object -> referrer key -> role
+        self._referrers: Dict[ObjectKey, Dict[ObjectKey, str]] = defaultdict(dict)
+        # Referrer key -> (referrer, role -> referenced object)
+        self._references: Dict[ObjectKey, Tuple[Dict, Dict[str, ObjectKey]]] = {}
+        # Referrer key -> role -> existence last reported by the referrer
+        self._reported: Dict[ObjectKey, Dict[str, bool]] = {}
+        self._listeners: Dict[str, Listener] = {}
+
+    def subscribe(self, referrer_kind: str, listener: Listener):
+        """Notify ``listener`` when an object referenced by ``referrer_kind``
+        objects appears or disappears."""
+        self._listeners[referrer_kind] = listener
+
+    def exists(self, kind: str, namespace: Optional[str], name: str) -> Optional[bool]:
+        """True if the object exists, None if no object of ``kind`` was seen yet."""
+        if kind not in self._observed_kinds:
+            return None
+        return name in self._existing.get((kind, namespace), ())
+
+    async def confirm(
+        self, kind: str, namespace: Optional[str], name: str, fetch: Fetch
+    ) -> bool:
+        """True if the object exists, looking it up with ``fetch`` unless indexed.
+
+        Right after a restart the index may not have seen every object yet,
+        so only a positive answer is taken from the index.
+        """
+        if self.exists(kind, namespace, name):
+            return True
+        return await fetch(name, namespace) is not None
+
+    def observe(self, kind: str, namespace: Optional[str], name: str, exists: bool) -> bool:
+        """Record whether an object exists; returns True if that changed.
+
+        Referrers of the object are notified of the change, unless they
+        already reported the new state.
+        """
+        self._observed_kinds.add(kind)
+        names = self._existing.get((kind, namespace), ())
+        if exists == (name in names):
+            return False
+        if exists:
+            self._existing[(kind, namespace)].add(name)
+        else:
+            names.discard(name)
+            if not names:
+                del self._existing[(kind, namespace)]
+        for referrer_key, role in list(self._referrers.get((kind, namespace, name), {}).items()):
+            reported = self._reported.setdefault(referrer_key, {})
+            if reported.get(role) == exists:
+                continue
+            listener = self._listeners.get(referrer_key[0])
+            if listener is not None:
+                listener(self._references[referrer_key][0], role, exists)
+                reported[role] = exists
+        return True
+
+    def track(
+        self,
+        referrer: Mapping,
+        references: Mapping[str, Tuple[str, str]],
+        reported: Mapping[str, Optional[bool]] = None,
+    ):
+        """Record the objects ``referrer`` references, keyed by role.
+
+        Args:
+            referrer: Body of the referencing object
+            references: Role to (kind, name) of the referenced objects in the
+                referrer's namespace. References without a name are ignored.
+            reported: Role to the existence the referrer last reported, if
+                known (see ``reported_existence``). Only used for references
+                that are new or changed.
+        """
+        reference = object_reference(referrer)
+        metadata = reference["metadata"]
+        namespace = metadata["namespace"]
+        key = (reference["kind"], namespace, metadata["name"])
+        _, previous_targets = self._references.get(key, (None, {}))
+        previous = self._reported.get(key, {})
+        self.untrack(*key)
+        targets = {
+            role: (kind, namespace, name)
+            for role, (kind, name) in references.items()
+            if name
+        }
+        self._references[key] = (reference, targets)
+        self._reported[key] = {
+            role: exists for role, exists in (reported or {}).items() if exists is not None
+        }
+        # The body may predate the status patch of an earlier notification,
+        # so what was recorded for an unchanged reference wins
+        for role, exists in previous.items():
+            if role in targets and targets[role] == previous_targets.get(role):
+                self._reported[key][role] = exists
+        for role, target in targets.items():
+            self._referrers[target][key] = role
+
+    def untrack(self, kind: str, namespace: Optional[str], name: str):
+        """Forget the references of a deleted referrer."""
+        key = (kind, namespace, name)
+        _, targets = self._references.pop(key, (None, {}))
+        self._reported.pop(key, None)
+        for target in targets.values():
+            referrers = self._referrers.get(target)
+            if referrers is not None:
+                referrers.pop(key, None)
+                if not referrers:
+                    del self._referrers[target]
+
+    def references_of(self, kind: str, namespace: Optional[str], name: str) -> Dict[str, str]:
+        """Names of the objects a referrer references, keyed by role."""
+        _, targets = self._references.get((kind, namespace, name), (None, {}))
+        return {role: target[2] for role, target in targets.items()}
+
+    def referrers(self, kind: str, namespace: Optional[str], name: str) -> Dict[ObjectKey, str]:
+        """Referrers of an object mapped to the role of their reference."""
+        return dict(self._referrers.get((kind, namespace, name), {}))
+
+
+# Shared by the handlers of all kaspr resources
+reference_index = ReferenceIndex()
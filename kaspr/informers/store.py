@@ -0,0 +1,91 @@
+"""Local object store backing an informer.
+
+The store keeps the latest version of every object observed by a watch
+stream and maintains a secondary index on a single label (by default
+``kaspr.io/app``) so that lookups of all objects belonging to an app are
+O(1) instead of requiring a LIST call against the API server.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class ObjectStore:
+    """Thread-unsafe, asyncio-friendly store of raw kubernetes objects.
+
+    Objects are stored as the raw dictionaries returned by the API server
+    and keyed by ``metadata.name`` (a store is always scoped to a single
+    resource plural in a single namespace). Returned objects are shared
+    with the store and must be treated as read-only by callers.
+    """
+
+    def __init__(self, index_label: str):
+        self.index_label = index_label
+        self._objects: Dict[str, Dict] = {}
+        self._index: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._objects
+
+    @staticmethod
+    def _name_of(obj: Dict) -> Optional[str]:
+        return (obj.get("metadata") or {}).get("name")
+
+    def _label_of(self, obj: Dict) -> Optional[str]:
+        labels = (obj.get("metadata") or {}).get("labels") or {}
+        return labels.get(self.index_label)
+
+    def _unindex(self, name: str, obj: Dict):
+        label = self._label_of(obj)
+        if label is None:
+            return
+        names = self._index.get(label)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self._index[label]
+
+    def upsert(self, obj: Dict):
+        """Add or replace an object."""
+        name = self._name_of(obj)
+        if name is None:
+            return
+        previous = self._objects.get(name)
+        if previous is not None:
+            self._unindex(name, previous)
+        self._objects[name] = obj
+        label = self._label_of(obj)
+        if label is not None:
+            self._index[label].add(name)
+
+    def delete(self, obj: Dict):
+        """Remove an object if present."""
+        name = self._name_of(obj)
+        previous = self._objects.pop(name, None)
+        if previous is not None:
+            self._unindex(name, previous)
+
+    def replace(self, objects: Iterable[Dict]):
+        """Replace the entire contents of the store (used after a relist)."""
+        self._objects.clear()
+        self._index.clear()
+        for obj in objects:
+            self.upsert(obj)
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Return the object with the given name, if any."""
+        return self._objects.get(name)
+
+    def list(self, label_values: List[str] = None) -> List[Dict]:
+        """List objects, optionally restricted to those whose index label
+        matches one of ``label_values``."""
+        if not label_values:
+            return list(self._objects.values())
+        items = []
+        for value in label_values:
+            for name in sorted(self._index.get(value, ())):
+                items.append(self._objects[name])
+        return items
@@ -83,6 +83,23 @@ class BaseAppComponent(BaseResource):
 
     async def sync_config_map(self):
         """Sync config map."""
+        if self.server_side_apply:
+            sensor_state = self.sensor.on_resource_sync_start(
+                self.app_name, self.cluster, self.config_map.metadata.name, self.namespace, "config_map"
+            )
+            success = True
+            try:
+                self.unite()
+                await self.apply_config_map(self.core_v1_api, self.namespace, self.config_map)
+            except Exception:
+                success = False
+                raise
+            finally:
+                self.sensor.on_resource_sync_complete(
+                    self.app_name, self.cluster, self.config_map.metadata.name, self.namespace, "config_map", sensor_state, "apply", success
+                )
+            return
+
         config_map: V1ConfigMap = await self.fetch_config_map(
             self.core_v1_api, self.config_map_name, self.namespace
         )
@@ -106,8 +123,8 @@ class BaseAppComponent(BaseResource):
         else:
             actual = self.prepare_config_map_watch_fields(config_map)
             desired = self.prepare_config_map_watch_fields(self.config_map)
-            actual_hash = self.compute_hash(actual)
-            desired_hash = self.compute_hash(desired)
+            actual_hash = self.compute_hash(actual, compat=False)
+            desired_hash = self.compute_hash(desired, compat=False)
             
             if actual_hash != desired_hash:
                 # Detect drift
@@ -149,19 +166,39 @@ class BaseAppComponent(BaseResource):
 
     async def search(self, namespace: str, apps: List[str] = None):
         """Search for component type in kubernetes."""
-
-        label_selector = (
-            ",".join(f"kaspr.io/app={app}" for app in apps) if apps else None
-        )
-        return await self.list_custom_objects(
+        return await self.search_custom_objects(
             self.custom_objects_api,
             namespace=namespace,
             group=self.GROUP_NAME,
             version=self.GROUP_VERSION,
             plural=self.PLURAL_NAME,
-            label_selector=label_selector,
+            label=self.KASPR_APP_NAME_LABEL,
+            values=apps,
         )
 
+    async def patch_component(self, name: str, namespace: str, patch: Dict):
+        """Apply a merge patch (status and/or metadata) to a component resource."""
+        if patch.get("status"):
+            await self.patch_custom_object_status(
+                self.custom_objects_api,
+                namespace=namespace,
+                group=self.GROUP_NAME,
+                version=self.GROUP_VERSION,
+                plural=self.PLURAL_NAME,
+                name=name,
+                body={"status": patch["status"]},
+            )
+        if patch.get("metadata"):
+            await self.patch_custom_object(
+                self.custom_objects_api,
+                namespace=namespace,
+                group=self.GROUP_NAME,
+                version=self.GROUP_VERSION,
+                plural=self.PLURAL_NAME,
+                name=name,
+                body={"metadata": patch["metadata"]},
+            )
+
     async def patch_config_map(self, *args, **kwargs):
         """Patch a config map or, with no args, patch this component's config map."""
         if args or kwargs:
@@ -236,6 +273,10 @@ class BaseAppComponent(BaseResource):
 
         return patch
 
+    def prepare_child_hashes(self) -> Dict:
+        """Hash annotations of the child resources, keyed by (kind, name)."""
+        return {("ConfigMap", self.config_map_name): self.hash}
+
     def prepare_config_map_watch_fields(self, config_map: V1ConfigMap) -> Dict:
         """
         Prepare fields of interest when comparing actual vs desired state.
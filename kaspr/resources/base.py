@@ -1,13 +1,12 @@
 import copy
 import kaspr
-import mmh3
-import hashlib
 from typing import Any, List, Dict, Union
 from kaspr.utils.objects import cached_property
-from kaspr.utils.helpers import canonicalize_dict
+from kaspr.utils.hashing import compat_digest, fast_digest
 from kaspr.common.models.labels import Labels
 from kaspr.common.models.version import Version
 from kaspr.utils.errors import already_exists_error
+from kaspr.informers import InformerRegistry
 from kubernetes_asyncio.client import (
     ApiException,
     V1ResourceRequirements,
@@ -24,7 +23,9 @@ from kubernetes_asyncio.client import (
     V1PersistentVolumeClaim,
     V1DeleteOptions,
     V2HorizontalPodAutoscaler,
-    V1PodList
+    V1PodList,
+    BatchV1Api,
+    V1Job,
 )
 
 
@@ -33,6 +34,13 @@ class BaseResource:
 
     KASPR_OPERATOR_NAME = "kaspr-operator"
     RESOURCE_HASH_ANNOTATION = "kaspr.io/resource-hash"
+    # Field manager owning the fields set through server-side apply
+    FIELD_MANAGER = "kaspr-operator"
+
+    # Shared informer cache (set at operator startup, None disables it)
+    informers: InformerRegistry = None
+    # Sync child resources with server-side apply (set at operator startup)
+    server_side_apply: bool = False
 
     _cluster: str
     _namespace: str
@@ -88,28 +96,53 @@ class BaseResource:
     def generate_service_account(self) -> V1ServiceAccount:
         raise NotImplementedError()
     
-    def compute_hash(self, data: Any) -> str:
-        """Compute a murmur3 hash."""
-        if isinstance(data, dict):
-            _data = canonicalize_dict(data)
-        elif isinstance(data, str):
-            _data = data.encode()
-        else:
-            raise ValueError(f"Hash of {type(data)} is not supporetd.")        
-        # Compute the hash by encoding the string to bytes.
-        mumur_str = str(mmh3.hash128(_data))
+    def compute_hash(self, data: Any, compat: bool = True) -> str:
+        """Compute a 16 character hash of a dict or string.
+
+        Args:
+            data: dict or string to hash
+            compat: produce digests compatible with previously stored
+                hashes. Pass False for hashes that are only compared in
+                memory to use the faster encoding.
+        """
+        if compat:
+            return compat_digest(data)
+        return fast_digest(data)
 
-        # Compute SHA-256 hash
-        hash_obj = hashlib.sha256(mumur_str.encode('utf-8'))
-        full_hash = hash_obj.hexdigest()
-        
-        # Return first 16 characters for readability in labels/annotations
-        return full_hash[:16]        
-    
     def prepare_hash_annotation(self, hash: Union[str, int]) -> Dict[str, str]:
         """Prepare hash annotation for k8s resources."""
         return {"kaspr.io/resource-hash": str(hash)}
 
+    def prepare_hash_annotation_patch(self, actual: Any, desired: Any) -> List[Dict]:
+        """Prepare a JSON patch setting the hash annotation of ``actual`` to the one of ``desired``.
+
+        Returns an empty patch if the annotation is already current.
+        """
+        desired_hash = (desired.metadata.annotations or {}).get(
+            self.RESOURCE_HASH_ANNOTATION
+        )
+        annotations = actual.metadata.annotations
+        if desired_hash is None or (annotations or {}).get(
+            self.RESOURCE_HASH_ANNOTATION
+        ) == desired_hash:
+            return []
+        if annotations is None:
+            return [
+                {
+                    "op": "add",
+                    "path": "/metadata/annotations",
+                    "value": {self.RESOURCE_HASH_ANNOTATION: desired_hash},
+                }
+            ]
+        return [
+            {
+                "op": "add",
+                "path": "/metadata/annotations/"
+                + self.RESOURCE_HASH_ANNOTATION.replace("/", "~1"),
+                "value": desired_hash,
+            }
+        ]
+
     def compute_resource_hash(self, resource: Any) -> str:
         """Compute a stable resource hash excluding the operator hash annotation."""
         if hasattr(resource, "to_dict"):
@@ -136,6 +169,24 @@ class BaseResource:
 
         return self.compute_hash(resource_data)
 
+    def prepare_apply_body(self, resource: Any, api_version: str, kind: str) -> Dict:
+        """Serialize a rendered resource into a server-side apply request body."""
+        body = self.api_client.sanitize_for_serialization(resource)
+        body["apiVersion"] = api_version
+        body["kind"] = kind
+        metadata = body.get("metadata") or {}
+        for field in ("resourceVersion", "uid", "creationTimestamp", "managedFields"):
+            metadata.pop(field, None)
+        return body
+
+    def apply_options(self) -> Dict:
+        """Keyword arguments of a server-side apply PATCH request."""
+        return {
+            "field_manager": self.FIELD_MANAGER,
+            "force": True,
+            "_content_type": "application/apply-patch+yaml",
+        }
+
     async def fetch_service(
         self, core_v1_api: CoreV1Api, name: str, namespace: str
     ) -> V1Service:
@@ -181,6 +232,17 @@ class BaseResource:
             body=service,
         )
 
+    async def apply_service(
+        self, core_v1_api: CoreV1Api, namespace: str, service: V1Service
+    ):
+        """Create or update a service with server-side apply."""
+        await core_v1_api.patch_namespaced_service(
+            name=service.metadata.name,
+            namespace=namespace,
+            body=self.prepare_apply_body(service, "v1", "Service"),
+            **self.apply_options(),
+        )
+
     async def fetch_service_account(
         self, core_v1_api: CoreV1Api, name: str, namespace: str
     ) -> V1ServiceAccount:
@@ -356,6 +418,17 @@ class BaseResource:
             body=config_map,
         )
 
+    async def apply_config_map(
+        self, core_v1_api: CoreV1Api, namespace: str, config_map: V1ConfigMap
+    ):
+        """Create or update a config map with server-side apply."""
+        await core_v1_api.patch_namespaced_config_map(
+            name=config_map.metadata.name,
+            namespace=namespace,
+            body=self.prepare_apply_body(config_map, "v1", "ConfigMap"),
+            **self.apply_options(),
+        )
+
     async def create_persistent_volume_claim(
         self,
         core_v1_api: CoreV1Api,
@@ -483,7 +556,82 @@ class BaseResource:
             plural=plural,
             label_selector=label_selector,
         )
-    
+
+    async def patch_custom_object(
+        self,
+        custom_objects_api: CustomObjectsApi,
+        namespace: str,
+        group: str,
+        version: str,
+        plural: str,
+        name: str,
+        body: Dict,
+    ):
+        """Merge-patch a custom object."""
+        return await custom_objects_api.patch_namespaced_custom_object(
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            name=name,
+            body=body,
+            _content_type="application/merge-patch+json",
+        )
+
+    async def patch_custom_object_status(
+        self,
+        custom_objects_api: CustomObjectsApi,
+        namespace: str,
+        group: str,
+        version: str,
+        plural: str,
+        name: str,
+        body: Dict,
+    ):
+        """Merge-patch the status subresource of a custom object."""
+        return await custom_objects_api.patch_namespaced_custom_object_status(
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            name=name,
+            body=body,
+            _content_type="application/merge-patch+json",
+        )
+
+    async def search_custom_objects(
+        self,
+        custom_objects_api: CustomObjectsApi,
+        namespace: str,
+        group: str,
+        version: str,
+        plural: str,
+        label: str,
+        values: List[str] = None,
+    ):
+        """List custom objects whose ``label`` matches any of ``values``.
+
+        Served from the shared informer cache when it is enabled and synced,
+        otherwise falls back to a LIST call against the API server.
+        """
+        if self.informers is not None and namespace:
+            cached = await self.informers.list(
+                group, version, plural, namespace, label_values=values
+            )
+            if cached is not None:
+                return cached
+        label_selector = (
+            ",".join(f"{label}={value}" for value in values) if values else None
+        )
+        return await self.list_custom_objects(
+            custom_objects_api,
+            namespace=namespace,
+            group=group,
+            version=version,
+            plural=plural,
+            label_selector=label_selector,
+        )
+
     async def fetch_hpa(
         self, autoscaling_v2_api: AutoscalingV2Api, name: str, namespace: str
     ) -> V2HorizontalPodAutoscaler:
@@ -537,6 +685,20 @@ class BaseResource:
             name=name, namespace=namespace, body=hpa
         )
 
+    async def apply_hpa(
+        self,
+        autoscaling_v2_api: AutoscalingV2Api,
+        namespace: str,
+        hpa: V2HorizontalPodAutoscaler,
+    ):
+        """Create or update an HPA with server-side apply."""
+        await autoscaling_v2_api.patch_namespaced_horizontal_pod_autoscaler(
+            name=hpa.metadata.name,
+            namespace=namespace,
+            body=self.prepare_apply_body(hpa, "autoscaling/v2", "HorizontalPodAutoscaler"),
+            **self.apply_options(),
+        )
+
     async def delete_hpa(
         self,
         autoscaling_v2_api: AutoscalingV2Api,
@@ -576,6 +738,31 @@ class BaseResource:
                 return
             raise
 
+    async def fetch_job(
+        self, batch_v1_api: BatchV1Api, name: str, namespace: str
+    ) -> V1Job:
+        try:
+            return await batch_v1_api.read_namespaced_job(name=name, namespace=namespace)
+        except ApiException as ex:
+            if ex.status == 404:
+                return None
+            raise
+
+    async def create_job(self, batch_v1_api: BatchV1Api, namespace: str, job: V1Job):
+        """Create a job, unless one of the same name already exists."""
+        try:
+            await batch_v1_api.create_namespaced_job(namespace=namespace, body=job)
+        except ApiException as ex:
+            if not already_exists_error(ex):
+                raise
+
+    async def fetch_pod_log(
+        self, core_v1_api: CoreV1Api, name: str, namespace: str, container: str = None
+    ) -> str:
+        return await core_v1_api.read_namespaced_pod_log(
+            name=name, namespace=namespace, container=container
+        )
+
     async def list_pods(
         self, core_v1_api: CoreV1Api, namespace: str, label_selector: dict = None
     ) -> List[V1PodList]:
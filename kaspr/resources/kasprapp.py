@@ -1,12 +1,17 @@
 import asyncio
+import copy
 import os
 import kopf
 import time
 import logging
 from logging import Logger
-from typing import List, Dict, Optional
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Tuple
 from kaspr.utils.objects import cached_property
+from kaspr.utils.dag import run_steps
 from kaspr.utils.helpers import now
+from kaspr.utils.lru import LRUCache
+from kaspr.utils.member_status import MemberStatusStore
+from kaspr.utils.status_context import StatusContext
 from kaspr.types.settings import Settings
 from kaspr.types.models.kasprapp_spec import KasprAppSpec
 from kaspr.types.models.storage import KasprAppStorage
@@ -32,6 +37,9 @@ from kubernetes_asyncio.client import (
     CoreV1Api,
     CustomObjectsApi,
     AutoscalingV2Api,
+    BatchV1Api,
+    V1Job,
+    V1JobSpec,
     V1ObjectMeta,
     V1Service,
     V1ServiceSpec,
@@ -74,22 +82,56 @@ from kubernetes_asyncio.client import (
     V2HorizontalPodAutoscalerBehavior,
     V2HPAScalingRules,
     V2HPAScalingPolicy,
+    V1PodList,
 )
 from kubernetes_asyncio.client.api_client import ApiClient
 
 from kaspr.resources.base import BaseResource
 from kaspr.resources import KasprAgent, KasprWebView, KasprTable, KasprTask
 from kaspr.common.models.labels import Labels
-from kaspr.web import KasprWebClient
+from kaspr.web import KasprWebClient, MemberStatusClient
 from kaspr.sensors import SensorDelegate
 
 
+def _copy_rendered(value: Any, memo: Dict[int, Any] = None) -> Any:
+    """Deep copy rendered resources.
+
+    Faster than ``copy.deepcopy`` on Kubernetes models; objects shared between
+    the resources stay shared in the copy, the client configuration is not
+    copied at all.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if memo is None:
+        memo = {}
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+    if isinstance(value, list):
+        copied = memo[id(value)] = [_copy_rendered(item, memo) for item in value]
+    elif isinstance(value, dict):
+        copied = memo[id(value)] = {
+            key: _copy_rendered(item, memo) for key, item in value.items()
+        }
+    elif hasattr(value, "openapi_types"):
+        copied = memo[id(value)] = object.__new__(type(value))
+        for attr, item in vars(value).items():
+            if attr != "local_vars_configuration":
+                item = _copy_rendered(item, memo)
+            setattr(copied, attr, item)
+    else:
+        copied = memo[id(value)] = copy.deepcopy(value)
+    return copied
+
+
 class KasprApp(BaseResource):
     """Kaspr App kubernetes resource."""
 
     logger: Logger
     conf: Settings
     web_client: KasprWebClient
+    status_client: MemberStatusClient = None  # Shared across all KasprApp instances
+    member_status_store: MemberStatusStore = None  # Shared across all KasprApp instances
     sensor: SensorDelegate
     shared_api_client: ApiClient = None  # Shared across all KasprApp instances
 
@@ -101,6 +143,7 @@ class KasprApp(BaseResource):
     KASPR_APP_NAME_LABEL = "kaspr.io/app"
     WEB_PORT_NAME = "http"
     KASPR_CONTAINER_NAME = "kaspr"
+    VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION = "kaspr.io/volume-mounted-resources-hash"
 
     DEFAULT_REPLICAS = 1
     DEFAULT_DATA_DIR = "/var/lib/data"
@@ -124,8 +167,20 @@ class KasprApp(BaseResource):
     DEFAULT_GCS_PREFIX = "kaspr-packages/"
     DEFAULT_GCS_SECRET_KEY = "sa.json"
     DEFAULT_GCS_MAX_ARCHIVE_SIZE = "1Gi"
+    DEFAULT_GCS_COMPRESSION = "gzip"
     DEFAULT_GCS_SA_MOUNT_PATH = "/var/run/secrets/gcs"
 
+    # Shared wheel cache defaults
+    DEFAULT_WHEEL_CACHE_MOUNT_PATH = "/opt/kaspr/wheels"
+    DEFAULT_WHEEL_CACHE_RETENTION_DAYS = 30
+
+    # Resolution lock defaults
+    DEFAULT_PACKAGES_LOCK_ENABLED = False
+    DEFAULT_PACKAGES_LOCK_MOUNT_PATH = "/opt/kaspr/lock"
+    PACKAGES_RESOLVER_CONTAINER_NAME = "resolve-packages"
+    PACKAGES_RESOLVER_BACKOFF_LIMIT = 2
+    PACKAGES_RESOLVER_TTL_SECONDS = 3600
+
     replicas: int
     image: str
     service_name: str
@@ -138,6 +193,7 @@ class KasprApp(BaseResource):
     hpa_name: str
 
     annotations: Dict[str, str] = None
+    meta: Dict = None
 
     # CRD spec models
     tls: Optional[ClientTls]
@@ -161,6 +217,7 @@ class KasprApp(BaseResource):
     _core_v1_api: CoreV1Api = None
     _custom_objects_api: CustomObjectsApi = None
     _autoscaling_v2_api: AutoscalingV2Api = None
+    _batch_v1_api: BatchV1Api = None
     _service: V1Service = None
     _service_hash: str = None
     _headless_service: V1Service = None
@@ -174,6 +231,7 @@ class KasprApp(BaseResource):
     _packages_pvc_hash: str = None
     _packages_pvc_name: str = None
     _packages_init_container: V1Container = None
+    _packages_resolver_job: V1Job = None
     _settings_config_map: V1ConfigMap = None
     _settings_config_map_hash: str = None
     _env_vars: List[V1EnvVar] = None
@@ -191,6 +249,7 @@ class KasprApp(BaseResource):
     _table_pod_volumes: List[V1Volume] = None
     _task_pod_volumes: List[V1Volume] = None
     _hpa: V2HorizontalPodAutoscaler = None
+    _volume_mounted_resources_hash: str = None
 
     # Reference to agent resources
     agents: List[KasprAgent] = None
@@ -203,6 +262,20 @@ class KasprApp(BaseResource):
     _tasks_hash: str = None
     _packages_hash: str = None
 
+    # Last volume-mounted resources hash applied to each StatefulSet,
+    # keyed by (namespace, app name). Shared across all KasprApp instances.
+    _applied_volume_mounted_hashes: Dict[Tuple[str, str], str] = {}
+
+    # Rendered desired child resources shared across KasprApp instances,
+    # keyed by `prepare_render_cache_key`. None disables caching.
+    render_cache: LRUCache = None
+    # Backing attributes of the rendered properties, see `rendered_attributes`
+    _rendered_attributes: Tuple[str, ...] = None
+    _render_cache_key: Tuple = None
+
+    # Objects shared by the status collectors of the current status cycle
+    status_context: StatusContext = None
+
     # TODO: Templates allow customizing k8s behavior
     template_service_account: ResourceTemplate
     template_pod: PodTemplate
@@ -300,19 +373,75 @@ class KasprApp(BaseResource):
         )
 
     async def synchronize(self) -> "KasprApp":
-        """Compare current state with desired state for all child resources and create/patch as needed."""
+        """Compare current state with desired state for all child resources and create/patch as needed.
+
+        Child resources are synced concurrently; the StatefulSet is synced
+        last because it references all of the others.
+        """
+        self.restore_rendered()
         self.unite()
-        await self.sync_auth_credentials()
-        await self.sync_service()
-        await self.sync_headless_service()
-        await self.sync_service_account()
-        await self.sync_settings_config_map()
-        await self.sync_python_packages_pvc()
-        await self.sync_hpa()
-        await self.sync_stateful_set()
+        try:
+            await run_steps(
+                {
+                    "auth": (self.sync_auth_credentials, ()),
+                    "service": (self.sync_service, ()),
+                    "headless_service": (self.sync_headless_service, ()),
+                    "service_account": (self.sync_service_account, ()),
+                    "config_map": (self.sync_settings_config_map, ()),
+                    "python_packages_pvc": (self.sync_python_packages_pvc, ()),
+                    "python_packages_lock": (self.sync_python_packages_lock, ()),
+                    "hpa": (self.sync_hpa, ()),
+                    "stateful_set": (
+                        self.sync_stateful_set,
+                        (
+                            "auth",
+                            "headless_service",
+                            "service_account",
+                            "config_map",
+                            "python_packages_pvc",
+                            "hpa",
+                        ),
+                    ),
+                },
+                on_step_complete=self._on_sync_step_complete,
+            )
+        finally:
+            # Rendering does not depend on the sync outcome
+            self.remember_rendered()
+
+    def _on_sync_step_complete(self, step: str, duration: float, success: bool):
+        sensor = getattr(self, "sensor", None)
+        if sensor:
+            sensor.on_sync_step_complete(
+                self.cluster, self.namespace, step, duration, success
+            )
+
+    async def _apply_child(
+        self, resource_type: str, name: str, apply: Callable[[], Awaitable]
+    ):
+        """Server-side apply a child resource; the API server computes the diff."""
+        sensor_state = self.sensor.on_resource_sync_start(
+            self.cluster, self.cluster, name, self.namespace, resource_type
+        )
+        success = True
+        try:
+            await apply()
+        except Exception:
+            success = False
+            raise
+        finally:
+            self.sensor.on_resource_sync_complete(
+                self.cluster, self.cluster, name, self.namespace, resource_type, sensor_state, "apply", success
+            )
 
     async def sync_service(self):
         """Check current state of service and create/patch if needed."""
+        if self.server_side_apply:
+            return await self._apply_child(
+                "service",
+                self.service_name,
+                lambda: self.apply_service(self.core_v1_api, self.namespace, self.service),
+            )
         service: V1Service = await self.fetch_service(
             self.core_v1_api, self.service_name, self.namespace
         )
@@ -335,8 +464,8 @@ class KasprApp(BaseResource):
         else:
             actual = self.prepare_service_watch_fields(service)
             desired = self.prepare_service_watch_fields(self.service)
-            actual_hash = self.compute_hash(actual)
-            desired_hash = self.compute_hash(desired)
+            actual_hash = self.compute_hash(actual, compat=False)
+            desired_hash = self.compute_hash(desired, compat=False)
             
             if actual_hash != desired_hash:
                 # Detect drift
@@ -355,7 +484,8 @@ class KasprApp(BaseResource):
                         self.core_v1_api,
                         self.service_name,
                         self.namespace,
-                        service=self.prepare_service_patch(self.service),
+                        service=self.prepare_service_patch(self.service)
+                        + self.prepare_hash_annotation_patch(service, self.service),
                     )
                 except Exception:
                     success = False
@@ -364,9 +494,27 @@ class KasprApp(BaseResource):
                     self.sensor.on_resource_sync_complete(
                         self.cluster, self.cluster, self.service.metadata.name, self.namespace, "service", sensor_state, "patch", success
                     )
+            else:
+                # Keep the hash annotation current for drift checks on startup
+                annotation_patch = self.prepare_hash_annotation_patch(service, self.service)
+                if annotation_patch:
+                    await self.patch_service(
+                        self.core_v1_api,
+                        self.service_name,
+                        self.namespace,
+                        service=annotation_patch,
+                    )
 
     async def sync_headless_service(self):
         """Check current state of headless service and create/patch if needed"""
+        if self.server_side_apply:
+            return await self._apply_child(
+                "headless_service",
+                self.headless_service_name,
+                lambda: self.apply_service(
+                    self.core_v1_api, self.namespace, self.headless_service
+                ),
+            )
         headless_service: V1Service = await self.fetch_service(
             self.core_v1_api, self.headless_service_name, self.namespace
         )
@@ -391,8 +539,8 @@ class KasprApp(BaseResource):
         else:
             actual = self.prepare_headless_service_watch_fields(headless_service)
             desired = self.prepare_headless_service_watch_fields(self.headless_service)
-            actual_hash = self.compute_hash(actual)
-            desired_hash = self.compute_hash(desired)
+            actual_hash = self.compute_hash(actual, compat=False)
+            desired_hash = self.compute_hash(desired, compat=False)
             
             if actual_hash != desired_hash:
                 # Detect drift
@@ -411,7 +559,10 @@ class KasprApp(BaseResource):
                         self.core_v1_api,
                         self.headless_service_name,
                         self.namespace,
-                        service=self.prepare_headless_service_patch(self.headless_service),
+                        service=self.prepare_headless_service_patch(self.headless_service)
+                        + self.prepare_hash_annotation_patch(
+                            headless_service, self.headless_service
+                        ),
                     )
                 except Exception:
                     success = False
@@ -420,6 +571,17 @@ class KasprApp(BaseResource):
                     self.sensor.on_resource_sync_complete(
                         self.cluster, self.cluster, self.headless_service.metadata.name, self.namespace, "headless_service", sensor_state, "patch", success
                     )
+            else:
+                annotation_patch = self.prepare_hash_annotation_patch(
+                    headless_service, self.headless_service
+                )
+                if annotation_patch:
+                    await self.patch_service(
+                        self.core_v1_api,
+                        self.headless_service_name,
+                        self.namespace,
+                        service=annotation_patch,
+                    )
 
     async def sync_service_account(self):
         """Check current state of service account and create/patch if needed."""
@@ -450,6 +612,14 @@ class KasprApp(BaseResource):
 
     async def sync_settings_config_map(self):
         """Check current state of config map and create/patch if needed."""
+        if self.server_side_apply:
+            return await self._apply_child(
+                "config_map",
+                self.config_map_name,
+                lambda: self.apply_config_map(
+                    self.core_v1_api, self.namespace, self.settings_config_map
+                ),
+            )
         settings_config_map: V1ConfigMap = await self.fetch_config_map(
             self.core_v1_api, self.config_map_name, self.namespace
         )
@@ -476,8 +646,8 @@ class KasprApp(BaseResource):
             desired = self.prepare_settings_config_map_watch_fields(
                 self.settings_config_map
             )
-            actual_hash = self.compute_hash(actual)
-            desired_hash = self.compute_hash(desired)
+            actual_hash = self.compute_hash(actual, compat=False)
+            desired_hash = self.compute_hash(desired, compat=False)
             
             if actual_hash != desired_hash:
                 # Detect drift
@@ -572,8 +742,8 @@ class KasprApp(BaseResource):
             # PVC exists - check if it needs patching
             actual = self.prepare_python_packages_pvc_watch_fields(pvc)
             desired = self.prepare_python_packages_pvc_watch_fields(self.python_packages_pvc)
-            actual_hash = self.compute_hash(actual)
-            desired_hash = self.compute_hash(desired)
+            actual_hash = self.compute_hash(actual, compat=False)
+            desired_hash = self.compute_hash(desired, compat=False)
             
             if actual_hash != desired_hash:
                 # Detect drift
@@ -614,6 +784,96 @@ class KasprApp(BaseResource):
                         f"Manual intervention required (delete and recreate PVC)."
                     )
 
+    async def sync_python_packages_lock(self):
+        """Resolve the Python packages into a lock, once per packages hash.
+
+        A resolver Job is started for a hash without a lock. Once it
+        succeeded, the lock it printed is stored in the lock ConfigMap, which
+        init containers install from. Until then they resolve the packages
+        themselves, so the StatefulSet does not wait for this step.
+        """
+        if not self.packages_lock_enabled():
+            return
+        from kaspr.utils.python_packages import LOCK_HASH_KEY
+
+        config_map = await self.fetch_config_map(
+            self.core_v1_api, self.packages_lock_config_map_name, self.namespace
+        )
+        if config_map and (config_map.data or {}).get(LOCK_HASH_KEY) == self.packages_hash:
+            return
+
+        job_name = self.packages_resolver_job.metadata.name
+        job: V1Job = await self.fetch_job(self.batch_v1_api, job_name, self.namespace)
+        if not job:
+            sensor_state = self.sensor.on_resource_sync_start(
+                self.cluster, self.cluster, job_name, self.namespace, "job"
+            )
+            success = True
+            try:
+                await self.create_job(
+                    self.batch_v1_api, self.namespace, self.packages_resolver_job
+                )
+            except Exception:
+                success = False
+                raise
+            finally:
+                self.sensor.on_resource_sync_complete(
+                    self.cluster, self.cluster, job_name, self.namespace, "job", sensor_state, "create", success
+                )
+            return
+
+        conditions = {
+            condition.type: condition.status
+            for condition in (job.status.conditions or [])
+        } if job.status else {}
+        if conditions.get("Failed") == "True":
+            self.logger.warning(
+                f"Python packages resolver job {job_name} failed, pods resolve packages "
+                f"themselves. See the job logs for details."
+            )
+            return
+        if conditions.get("Complete") != "True":
+            return
+
+        lock = await self.fetch_packages_lock(job_name)
+        if not lock:
+            self.logger.warning(
+                f"Python packages resolver job {job_name} completed without printing a lock."
+            )
+            return
+        lock_config_map = self.prepare_packages_lock_config_map(lock)
+        sensor_state = self.sensor.on_resource_sync_start(
+            self.cluster, self.cluster, self.packages_lock_config_map_name, self.namespace, "config_map"
+        )
+        success = True
+        try:
+            await self.create_config_map(self.core_v1_api, self.namespace, lock_config_map)
+        except Exception:
+            success = False
+            raise
+        finally:
+            self.sensor.on_resource_sync_complete(
+                self.cluster, self.cluster, self.packages_lock_config_map_name, self.namespace, "config_map", sensor_state, "create", success
+            )
+
+    async def fetch_packages_lock(self, job_name: str) -> Optional[str]:
+        """Read the lock printed by a succeeded resolver Job from its pod log."""
+        from kaspr.utils.python_packages import parse_packages_lock
+
+        pods = await self.list_pods(
+            self.core_v1_api, self.namespace, {"job-name": job_name}
+        )
+        for pod in pods.items:
+            if pod.status and pod.status.phase == "Succeeded":
+                log = await self.fetch_pod_log(
+                    self.core_v1_api,
+                    pod.metadata.name,
+                    self.namespace,
+                    container=self.PACKAGES_RESOLVER_CONTAINER_NAME,
+                )
+                return parse_packages_lock(log)
+        return None
+
     async def sync_stateful_set(self):
         """Check current state of stateful set and create/patch if needed."""
         stateful_set: V1StatefulSet = await self.fetch_stateful_set(
@@ -634,6 +894,7 @@ class KasprApp(BaseResource):
                 await self.create_stateful_set(
                     self.apps_v1_api, self.namespace, self.stateful_set
                 )
+                self.forget_volume_mounted_resources_hash(self.cluster, self.namespace)
             except Exception:
                 success = False
                 raise
@@ -651,8 +912,8 @@ class KasprApp(BaseResource):
             elif desired["spec"]["replicas"] is None:
                 desired["spec"]["replicas"] = actual["spec"]["replicas"]
 
-            actual_hash = self.compute_hash(actual)
-            desired_hash = self.compute_hash(desired)
+            actual_hash = self.compute_hash(actual, compat=False)
+            desired_hash = self.compute_hash(desired, compat=False)
             
             if actual_hash != desired_hash:
                 # Detect drift
@@ -667,17 +928,31 @@ class KasprApp(BaseResource):
                 
                 success = True
                 try:
+                    # The template replace drops volume-mounted resources, so
+                    # clear their applied hash to have them patched back in.
+                    patch = self.prepare_statefulset_patch(
+                        self.stateful_set,
+                        replicas_override=self.prepare_statefulset_desired_replicas(
+                            actual
+                        ),
+                    )
+                    patch.extend(
+                        self.prepare_volume_mounted_resources_hash_reset_patch(
+                            stateful_set
+                        )
+                    )
+                    patch.extend(
+                        self.prepare_hash_annotation_patch(
+                            stateful_set, self.stateful_set
+                        )
+                    )
                     await self.patch_stateful_set(
                         self.apps_v1_api,
                         self.stateful_set_name,
                         self.namespace,
-                        stateful_set=self.prepare_statefulset_patch(
-                            self.stateful_set,
-                            replicas_override=self.prepare_statefulset_desired_replicas(
-                                actual
-                            ),
-                        ),
+                        stateful_set=patch,
                     )
+                    self.forget_volume_mounted_resources_hash(self.cluster, self.namespace)
                 except Exception:
                     success = False
                     raise
@@ -685,6 +960,21 @@ class KasprApp(BaseResource):
                     self.sensor.on_resource_sync_complete(
                         self.cluster, self.cluster, self.stateful_set.metadata.name, self.namespace, "stateful_set", sensor_state, "patch", success
                     )
+            else:
+                # The template is unchanged, so the status can use this read
+                if self.status_context is not None:
+                    self.status_context.put("stateful_set", stateful_set)
+                # Only the annotation; patching the template would roll the pods
+                annotation_patch = self.prepare_hash_annotation_patch(
+                    stateful_set, self.stateful_set
+                )
+                if annotation_patch:
+                    await self.patch_stateful_set(
+                        self.apps_v1_api,
+                        self.stateful_set_name,
+                        self.namespace,
+                        stateful_set=annotation_patch,
+                    )
 
     async def sync_auth_credentials(self):
         """Sync credentials secret; We only need to check that password secret exists."""
@@ -701,6 +991,12 @@ class KasprApp(BaseResource):
 
     async def sync_hpa(self):
         """Check current state of HPA and create/delete/patch if needed."""
+        if self.server_side_apply and self.replicas > 0 and not self.reconciliation_paused:
+            return await self._apply_child(
+                "hpa",
+                self.hpa_name,
+                lambda: self.apply_hpa(self.autoscaling_v2_api, self.namespace, self.hpa),
+            )
         hpa: V2HorizontalPodAutoscaler = await self.fetch_hpa(
             self.autoscaling_v2_api, self.hpa_name, self.namespace
         )
@@ -763,8 +1059,8 @@ class KasprApp(BaseResource):
             else:
                 actual = self.prepare_hpa_watch_fields(hpa)
                 desired = self.prepare_hpa_watch_fields(self.hpa)
-                actual_hash = self.compute_hash(actual)
-                desired_hash = self.compute_hash(desired)
+                actual_hash = self.compute_hash(actual, compat=False)
+                desired_hash = self.compute_hash(desired, compat=False)
                 
                 if actual_hash != desired_hash:
                     # Detect drift
@@ -783,7 +1079,8 @@ class KasprApp(BaseResource):
                             self.autoscaling_v2_api,
                             self.hpa_name,
                             self.namespace,
-                            hpa=self.prepare_hpa_patch(self.hpa),
+                            hpa=self.prepare_hpa_patch(self.hpa)
+                            + self.prepare_hash_annotation_patch(hpa, self.hpa),
                         )
                     except Exception:
                         success = False
@@ -792,6 +1089,15 @@ class KasprApp(BaseResource):
                         self.sensor.on_resource_sync_complete(
                             self.cluster, self.cluster, self.hpa.metadata.name, self.namespace, "hpa", sensor_state, "patch", success
                         )
+                else:
+                    annotation_patch = self.prepare_hash_annotation_patch(hpa, self.hpa)
+                    if annotation_patch:
+                        await self.patch_hpa(
+                            self.autoscaling_v2_api,
+                            self.hpa_name,
+                            self.namespace,
+                            hpa=annotation_patch,
+                        )
 
     async def recreate_statefulset(self, stateful_set: V1StatefulSet):
         """Check if statefulset needs migrations and perform them."""
@@ -806,6 +1112,11 @@ class KasprApp(BaseResource):
         await asyncio.sleep(self.conf.statefulset_deletion_timeout_seconds)
         await self.sync_stateful_set()
 
+    def with_meta(self, meta: Dict):
+        """Attach the KasprApp object metadata, enabling the render cache."""
+        self.meta = meta
+        return self
+
     def with_agents(self, agents: List[KasprAgent]):
         """Apply agent resources to the app."""
         self.agents = agents
@@ -837,6 +1148,29 @@ class KasprApp(BaseResource):
             name=name,
         )
 
+    async def patch_app(self, name: str, namespace: str, patch: Dict):
+        """Apply a merge patch (status and/or metadata) to a KasprApp."""
+        if patch.get("status"):
+            await self.patch_custom_object_status(
+                self.custom_objects_api,
+                namespace=namespace,
+                group=self.GROUP_NAME,
+                version=self.GROUP_VERSION,
+                plural=self.PLURAL_NAME,
+                name=name,
+                body={"status": patch["status"]},
+            )
+        if patch.get("metadata"):
+            await self.patch_custom_object(
+                self.custom_objects_api,
+                namespace=namespace,
+                group=self.GROUP_NAME,
+                version=self.GROUP_VERSION,
+                plural=self.PLURAL_NAME,
+                name=name,
+                body={"metadata": patch["metadata"]},
+            )
+
     def supported_version(self, version: str) -> bool:
         """Return True if version is supported."""
         if version:
@@ -1362,6 +1696,21 @@ class KasprApp(BaseResource):
         timeout = install_policy.timeout if install_policy and hasattr(install_policy, 'timeout') and install_policy.timeout else self.DEFAULT_PACKAGES_INSTALL_TIMEOUT
         retries = install_policy.retries if install_policy and hasattr(install_policy, 'retries') and install_policy.retries is not None else self.DEFAULT_PACKAGES_INSTALL_RETRIES
         
+        # Shared wheel cache, consulted by pip in every cache mode
+        wheel_cache = getattr(cache, 'wheel_cache', None) if cache else None
+        install_script_args = {}
+        if wheel_cache:
+            install_script_args = dict(
+                wheelhouse=self.DEFAULT_WHEEL_CACHE_MOUNT_PATH,
+                wheel_retention_days=getattr(wheel_cache, 'retention_days', None) or self.DEFAULT_WHEEL_CACHE_RETENTION_DAYS,
+                wheel_max_size_bytes=parse_size_to_bytes(wheel_cache.max_size) if getattr(wheel_cache, 'max_size', None) else 0,
+            )
+        
+        # Resolution lock, installed from once the resolver Job produced it
+        lock_enabled = self.packages_lock_enabled()
+        if lock_enabled:
+            install_script_args["lock_dir"] = self.DEFAULT_PACKAGES_LOCK_MOUNT_PATH
+        
         # Generate script based on cache mode
         if cache_type == "gcs":
             # GCS cache mode: Download from / upload to GCS bucket
@@ -1379,6 +1728,9 @@ class KasprApp(BaseResource):
                 packages_hash=self.packages_hash,
                 max_archive_size_bytes=max_archive_size_bytes,
                 sa_key_path=sa_key_path,
+                compression=getattr(gcs_config, 'compression', None) or self.DEFAULT_GCS_COMPRESSION,
+                compression_level=getattr(gcs_config, 'compression_level', None),
+                **install_script_args,
             )
             self.logger.debug(f"Generated GCS cache install script for hash {self.packages_hash}")
         elif cache_enabled:
@@ -1391,6 +1743,7 @@ class KasprApp(BaseResource):
                 timeout=timeout,
                 retries=retries,
                 packages_hash=self.packages_hash,
+                **install_script_args,
             )
             self.logger.debug(f"Generated shared cache install script for hash {self.packages_hash}")
         else:
@@ -1400,6 +1753,8 @@ class KasprApp(BaseResource):
                 cache_path=cache_path,
                 timeout=timeout,
                 retries=retries,
+                packages_hash=self.packages_hash,
+                **install_script_args,
             )
             self.logger.debug("Generated emptyDir install script (cache disabled)")
         
@@ -1439,6 +1794,25 @@ class KasprApp(BaseResource):
                 )
             )
         
+        # Add shared wheel cache volume mount
+        if wheel_cache:
+            volume_mounts.append(
+                V1VolumeMount(
+                    name=f"{self.component_name}-wheel-cache",
+                    mount_path=self.DEFAULT_WHEEL_CACHE_MOUNT_PATH,
+                )
+            )
+        
+        # Add resolution lock volume mount
+        if lock_enabled:
+            volume_mounts.append(
+                V1VolumeMount(
+                    name=f"{self.component_name}-packages-lock",
+                    mount_path=self.DEFAULT_PACKAGES_LOCK_MOUNT_PATH,
+                    read_only=True,
+                )
+            )
+        
         return V1Container(
             name="install-packages",
             image=self.image,  # Use same image as main container
@@ -1449,6 +1823,108 @@ class KasprApp(BaseResource):
             resources=resource_requirements,
         )
 
+    def packages_lock_enabled(self) -> bool:
+        """Check if Python packages are installed from a resolution lock.
+
+        Packages with direct references (VCS or archive URLs) cannot be
+        locked and are always resolved by the init containers.
+        """
+        if not self.python_packages:
+            return False
+        lock = getattr(self.python_packages, 'lock', None)
+        enabled = getattr(lock, 'enabled', None) if lock else None
+        if not (self.DEFAULT_PACKAGES_LOCK_ENABLED if enabled is None else enabled):
+            return False
+
+        from kaspr.utils.python_packages import can_lock_packages
+
+        return can_lock_packages(self.python_packages)
+
+    def prepare_packages_resolver_job(self) -> Optional[V1Job]:
+        """Build the one-shot Job resolving the Python packages into a lock.
+
+        The Job runs the app image, so packages resolve for the Python
+        version and platform of the app pods. Its pods do not carry the
+        app's selector labels, so they are never taken for app members.
+        """
+        if not self.packages_lock_enabled():
+            return None
+
+        from kaspr.utils.python_packages import generate_resolver_script
+
+        install_policy = getattr(self.python_packages, 'install_policy', None)
+        timeout = getattr(install_policy, 'timeout', None) or self.DEFAULT_PACKAGES_INSTALL_TIMEOUT
+        script = generate_resolver_script(self.python_packages, timeout=timeout)
+
+        labels = self.labels.as_dict()
+        labels["kaspr.io/component"] = "python-packages-resolver"
+        pod_labels = dict(labels)
+        for selector_label in self.labels.kasper_label_selectors().as_dict():
+            pod_labels.pop(selector_label, None)
+
+        resources_spec = getattr(self.python_packages, 'resources', None)
+        resource_requirements = None
+        if resources_spec:
+            resource_requirements = V1ResourceRequirements(
+                requests=getattr(resources_spec, 'requests', None),
+                limits=getattr(resources_spec, 'limits', None),
+            )
+        env_vars = self.prepare_python_packages_env_vars()
+
+        return V1Job(
+            api_version="batch/v1",
+            kind="Job",
+            metadata=V1ObjectMeta(
+                name=f"{self.component_name}-resolve-{self.packages_hash[:10]}",
+                namespace=self.namespace,
+                labels=labels,
+            ),
+            spec=V1JobSpec(
+                backoff_limit=self.PACKAGES_RESOLVER_BACKOFF_LIMIT,
+                active_deadline_seconds=timeout + 300,
+                ttl_seconds_after_finished=self.PACKAGES_RESOLVER_TTL_SECONDS,
+                template=V1PodTemplateSpec(
+                    metadata=V1ObjectMeta(labels=pod_labels),
+                    spec=V1PodSpec(
+                        restart_policy="Never",
+                        service_account_name=self.service_account_name,
+                        image_pull_secrets=self.template_pod.image_pull_secrets,
+                        security_context=self.template_pod.security_context,
+                        node_selector=self.template_pod.node_selector,
+                        affinity=self.template_pod.affinity,
+                        tolerations=self.template_pod.tolerations,
+                        containers=[
+                            V1Container(
+                                name=self.PACKAGES_RESOLVER_CONTAINER_NAME,
+                                image=self.image,
+                                command=["/bin/bash", "-c"],
+                                args=[script],
+                                env=env_vars if env_vars else None,
+                                resources=resource_requirements,
+                            )
+                        ],
+                    ),
+                ),
+            ),
+        )
+
+    def prepare_packages_lock_config_map(self, lock: str) -> V1ConfigMap:
+        """Build the ConfigMap holding the resolution lock of the packages hash."""
+        from kaspr.utils.python_packages import LOCK_FILE_KEY, LOCK_HASH_KEY
+
+        labels = self.labels.as_dict()
+        labels["kaspr.io/component"] = "python-packages"
+        config_map = V1ConfigMap(
+            metadata=V1ObjectMeta(
+                name=self.packages_lock_config_map_name,
+                namespace=self.namespace,
+                labels=labels,
+            ),
+            data={LOCK_FILE_KEY: lock, LOCK_HASH_KEY: self.packages_hash},
+        )
+        kopf.adopt(config_map, owner=self.prepare_owner())
+        return config_map
+
     def prepare_python_packages_init_container_env_vars(self) -> List[V1EnvVar]:
         """Prepare additional environment variables for the Python packages init container."""
         env_vars = []
@@ -1500,7 +1976,8 @@ class KasprApp(BaseResource):
             cache = self.python_packages.cache
             gcs_config = cache.gcs
             prefix = getattr(gcs_config, 'prefix', None) or self.DEFAULT_GCS_PREFIX
-            object_key = build_gcs_object_key(prefix, self.component_name, self.packages_hash)
+            compression = getattr(gcs_config, 'compression', None) or self.DEFAULT_GCS_COMPRESSION
+            object_key = build_gcs_object_key(prefix, self.component_name, self.packages_hash, compression)
             
             env_vars.append(V1EnvVar(name="GCS_BUCKET", value=gcs_config.bucket))
             env_vars.append(V1EnvVar(name="GCS_OBJECT_KEY", value=object_key))
@@ -1990,6 +2467,30 @@ class KasprApp(BaseResource):
                         ),
                     )
                 )
+            
+            # Shared wheel cache: Mount the existing PVC shared by many apps
+            wheel_cache = getattr(cache, 'wheel_cache', None) if cache else None
+            if wheel_cache:
+                volumes.append(
+                    V1Volume(
+                        name=f"{self.component_name}-wheel-cache",
+                        persistent_volume_claim=V1PersistentVolumeClaimVolumeSource(
+                            claim_name=wheel_cache.claim_name
+                        ),
+                    )
+                )
+            
+            # Resolution lock: Optional, pods resolve packages until it exists
+            if self.packages_lock_enabled():
+                volumes.append(
+                    V1Volume(
+                        name=f"{self.component_name}-packages-lock",
+                        config_map=V1ConfigMapVolumeSource(
+                            name=self.packages_lock_config_map_name,
+                            optional=True,
+                        ),
+                    )
+                )
         
         return volumes
 
@@ -2686,8 +3187,214 @@ class KasprApp(BaseResource):
                     self.core_v1_api, pvc.metadata.name, self.namespace, pvc
                 )
 
-    async def patch_volume_mounted_resources(self):
-        """Update resources as a result of volume mounted resources change."""
+    def prepare_volume_mounted_resources_hash(self) -> str:
+        """Digest of everything patched by `patch_volume_mounted_resources`."""
+        return self.compute_hash(
+            {
+                "agents": self.agents_hash,
+                "webviews": self.webviews_hash,
+                "tables": self.tables_hash,
+                "tasks": self.tasks_hash,
+                "env": [env_var.to_dict() for env_var in self.env_vars],
+                "volumes": [volume.to_dict() for volume in self.volumes],
+                "volumeMounts": [mount.to_dict() for mount in self.volume_mounts],
+            }
+        )
+
+    def prepare_volume_mounted_resources_hash_reset_patch(
+        self, stateful_set: V1StatefulSet
+    ) -> List[Dict]:
+        """Prepare patch removing the volume-mounted resources hash annotation."""
+        annotations = stateful_set.metadata.annotations or {}
+        if self.VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION not in annotations:
+            return []
+        return [
+            {
+                "op": "remove",
+                "path": "/metadata/annotations/"
+                + self.VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION.replace("/", "~1"),
+            }
+        ]
+
+    def prepare_child_hashes(self) -> Dict[Tuple[str, str], str]:
+        """Hash annotations of the child resources, keyed by (kind, name)."""
+        children = [
+            ("ConfigMap", self.settings_config_map),
+            ("Service", self.service),
+            ("Service", self.headless_service),
+            ("StatefulSet", self.stateful_set),
+        ]
+        if self.replicas > 0:
+            children.append(("HorizontalPodAutoscaler", self.hpa))
+        return {
+            (kind, child.metadata.name): child.metadata.annotations.get(
+                self.RESOURCE_HASH_ANNOTATION
+            )
+            for kind, child in children
+        }
+
+    def prepare_render_cache_key(self) -> Optional[Tuple]:
+        """Key identifying everything the rendered child resources depend on.
+
+        The uid and generation cover the spec, the metadata hash covers labels
+        and annotations inherited by children, and the related components
+        hash covers agents, webviews, tables and tasks that are mounted into
+        the pods. Returns None if the app metadata is unknown.
+        """
+        if not self.meta or not self.meta.get("uid"):
+            return None
+        metadata_hash = self.compute_hash(
+            {
+                "labels": dict(self.meta.get("labels") or {}),
+                "annotations": {
+                    key: value
+                    for key, value in (self.annotations or {}).items()
+                    # Kopf progress annotations do not affect rendering
+                    if not key.startswith("kopf.zalando.org/")
+                },
+            },
+            compat=False,
+        )
+        components_hash = self.compute_hash(
+            "|".join(
+                str(digest)
+                for digest in (
+                    self.agents_hash,
+                    self.webviews_hash,
+                    self.tables_hash,
+                    self.tasks_hash,
+                )
+            ),
+            compat=False,
+        )
+        return (
+            self.meta["uid"],
+            self.meta.get("generation"),
+            metadata_hash,
+            components_hash,
+        )
+
+    @classmethod
+    def rendered_attributes(cls) -> Tuple[str, ...]:
+        """Backing attributes of every property rendered from the cache key inputs.
+
+        These are all private attributes declared with a None default, the
+        idiom of the cached properties, except the Kubernetes API clients.
+        New properties following the idiom are cached without further ado.
+        """
+        if cls._rendered_attributes is None:
+            annotations = {}
+            for klass in reversed(cls.__mro__):
+                annotations.update(vars(klass).get("__annotations__", {}))
+            cls._rendered_attributes = tuple(
+                attr
+                for attr, annotation in annotations.items()
+                if attr.startswith("_")
+                and not attr.startswith("__")
+                and attr not in ("_render_cache_key", "_rendered_attributes")
+                and getattr(cls, attr, False) is None
+                # ApiClient and the *Api classes
+                and not getattr(annotation, "__module__", "").startswith(
+                    "kubernetes_asyncio.client.api"
+                )
+            )
+        return cls._rendered_attributes
+
+    def restore_rendered(self) -> bool:
+        """Reuse child resources rendered earlier for the same inputs.
+
+        Must be called before any rendered resource is accessed. The cache
+        hands out copies, so that changes such as owner references added by
+        ``unite`` never leak into other reconciliations. Returns True on a
+        cache hit.
+        """
+        if self.render_cache is None:
+            return False
+        self._render_cache_key = self.prepare_render_cache_key()
+        if self._render_cache_key is None:
+            return False
+        rendered = self.render_cache.get(self._render_cache_key)
+        if not rendered:
+            return False
+        for attr, value in _copy_rendered(rendered).items():
+            setattr(self, attr, value)
+        return True
+
+    def remember_rendered(self):
+        """Store copies of the child resources rendered so far for reuse."""
+        if self.render_cache is None or self._render_cache_key is None:
+            return
+        rendered = {
+            attr: getattr(self, attr)
+            for attr in self.rendered_attributes()
+            if getattr(self, attr) is not None
+        }
+        cached = self.render_cache.get(self._render_cache_key)
+        if cached:
+            if rendered.keys() <= cached.keys():
+                # Nothing rendered beyond what was restored
+                return
+            rendered = {**cached, **rendered}
+        self.render_cache.put(self._render_cache_key, _copy_rendered(rendered))
+
+    @classmethod
+    def forget_rendered(cls, uid: str):
+        """Evict every rendered entry of the KasprApp with ``uid``."""
+        if cls.render_cache is not None and uid:
+            cls.render_cache.discard_where(lambda key: key[0] == uid)
+
+    @classmethod
+    def forget_volume_mounted_resources_hash(cls, name: str, namespace: str):
+        """Drop the in-memory applied hash so the next patch checks the StatefulSet."""
+        cls._applied_volume_mounted_hashes.pop((namespace, name), None)
+
+    async def patch_volume_mounted_resources(self) -> bool:
+        """Update resources as a result of volume mounted resources change.
+
+        The patch is only sent when the combined hash of agents, webviews,
+        tables, tasks and the rendered env/volumes differs from the hash last
+        applied to the StatefulSet. The applied hash is remembered in memory
+        and stored as an annotation on the StatefulSet so it survives operator
+        restarts. Returns True if the StatefulSet was patched.
+        """
+        key = (self.namespace, self.cluster)
+        self.restore_rendered()
+        desired_hash = self.volume_mounted_resources_hash
+        self.remember_rendered()
+        if self._applied_volume_mounted_hashes.get(key) == desired_hash:
+            return False
+
+        stateful_set: V1StatefulSet = await self.fetch_stateful_set(
+            self.apps_v1_api, self.stateful_set_name, self.namespace
+        )
+        if not stateful_set:
+            self.logger.info(
+                "Skipping volume-mounted resource patch because StatefulSet %s is missing in %s namespace.",
+                self.stateful_set_name,
+                self.namespace,
+            )
+            return False
+
+        annotations = stateful_set.metadata.annotations
+        if (annotations or {}).get(
+            self.VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION
+        ) == desired_hash:
+            self._applied_volume_mounted_hashes[key] = desired_hash
+            return False
+
+        if annotations is None:
+            hash_op = {
+                "op": "add",
+                "path": "/metadata/annotations",
+                "value": {self.VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION: desired_hash},
+            }
+        else:
+            hash_op = {
+                "op": "add",
+                "path": "/metadata/annotations/"
+                + self.VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION.replace("/", "~1"),
+                "value": desired_hash,
+            }
         patch = [
             {
                 "op": "replace",
@@ -2704,22 +3411,16 @@ class KasprApp(BaseResource):
                 "path": "/spec/template/spec/containers/0/env",
                 "value": self.env_vars,
             },
+            hash_op,
         ]
-        if not await self.fetch_stateful_set(
-            self.apps_v1_api, self.stateful_set_name, self.namespace
-        ):
-            self.logger.info(
-                "Skipping volume-mounted resource patch because StatefulSet %s is missing in %s namespace.",
-                self.stateful_set_name,
-                self.namespace,
-            )
-            return
         await self.patch_stateful_set(
             self.apps_v1_api,
             self.stateful_set_name,
             self.namespace,
             stateful_set=patch,
         )
+        self._applied_volume_mounted_hashes[key] = desired_hash
+        return True
 
     async def patch_template_service_account(self):
         patch = [
@@ -2815,23 +3516,37 @@ class KasprApp(BaseResource):
             
             if delete_claim:
                 children.append(self.python_packages_pvc)
-        
-        kopf.adopt(children)
+
+        # Resolver jobs of the packages lock
+        if self.packages_resolver_job:
+            children.append(self.packages_resolver_job)
+
+        kopf.adopt(children, owner=self.prepare_owner())
+
+    def prepare_owner(self) -> Optional[Dict]:
+        """Owner of the child resources, for adopting them outside of kopf handlers.
+
+        Queued reconciliations run outside of kopf handlers, where kopf
+        cannot infer the owner, so pass it explicitly when known.
+        """
+        if self.meta and self.meta.get("uid"):
+            return {
+                "apiVersion": f"{self.GROUP_NAME}/{self.GROUP_VERSION}",
+                "kind": self.KIND,
+                "metadata": self.meta,
+            }
+        return None
 
     async def search(self, namespace: str, apps: List[str] = None):
         """Search for KasprApps in kubernetes."""
-        label_selector = (
-            ",".join(f"{self.KASPR_APP_NAME_LABEL}={app}" for app in apps)
-            if apps
-            else None
-        )
-        return await self.list_custom_objects(
+        return await self.search_custom_objects(
             self.custom_objects_api,
             namespace=namespace,
             group=self.GROUP_NAME,
             version=self.GROUP_VERSION,
             plural=self.PLURAL_NAME,
-            label_selector=label_selector,
+            label=self.KASPR_APP_NAME_LABEL,
+            values=apps,
         )
 
     def agents_status(self) -> Dict:
@@ -2850,11 +3565,38 @@ class KasprApp(BaseResource):
         """Return status of all tasks."""
         return [task.info() for task in self.tasks]
 
-    async def fetch_app_status(self) -> Dict:
-        """Fetch status of application's statefulset/pods"""
-        stateful_set = await self.fetch_stateful_set(
-            self.apps_v1_api, self.stateful_set_name, self.namespace
+    async def _from_status_context(self, key: str, fetch) -> Any:
+        """Result of ``fetch``, shared through the status context if one is set."""
+        if self.status_context is None:
+            return await fetch()
+        return await self.status_context.get(key, fetch)
+
+    async def fetch_app_stateful_set(self) -> Optional[V1StatefulSet]:
+        """Fetch the app's statefulset, once per status cycle."""
+        return await self._from_status_context(
+            "stateful_set",
+            lambda: self.fetch_stateful_set(
+                self.apps_v1_api, self.stateful_set_name, self.namespace
+            ),
+        )
+
+    async def fetch_app_pods(self) -> V1PodList:
+        """List the app's pods, once per status cycle."""
+        return await self._from_status_context(
+            "pods",
+            lambda: self.list_pods(
+                self.core_v1_api,
+                self.namespace,
+                self.labels.kasper_label_selectors().as_dict(),
+            ),
         )
+
+    async def fetch_app_status(self) -> Dict:
+        """Fetch status of application's statefulset/pods, once per status cycle."""
+        return await self._from_status_context("app_status", self._fetch_app_status)
+
+    async def _fetch_app_status(self) -> Dict:
+        stateful_set = await self.fetch_app_stateful_set()
         if not stateful_set:
             return
 
@@ -2898,24 +3640,36 @@ class KasprApp(BaseResource):
     async def fetch_all_member_statuses(self, available_replicas: int) -> List[Dict]:
         """Fetch status from all available worker instances concurrently.
 
+        Concurrent calls for the same app share a single fetch, and a member's
+        status is reused from the member status store while its pod is
+        unchanged and the status is fresh.
+
         Args:
             available_replicas: Number of available replicas to check
 
         Returns:
-            Dictionary mapping worker index to status data for successful calls
+            Status data of every worker that answered before the deadline
         """
         if not self.conf.client_status_check_enabled:
             return []
+        if self.member_status_store is None:
+            return await self._fetch_all_member_statuses(available_replicas)
+        # Callers expecting a different number of members must not share a fetch
+        return await self.member_status_store.single_flight(
+            (self.namespace, self.cluster, available_replicas),
+            lambda: self._fetch_all_member_statuses(available_replicas),
+        )
+
+    async def _fetch_all_member_statuses(self, available_replicas: int) -> List[Dict]:
+        """Fetch member statuses, reusing fresh ones from the store."""
+        store = self.member_status_store
+        app_key = (self.namespace, self.cluster)
 
         # Map StatefulSet ordinals to pod incarnation metadata so callers can
         # distinguish a fresh pod from a previous incarnation of the same member id.
         pod_metadata_by_idx: Dict[int, Dict[str, str]] = {}
         try:
-            pods = await self.list_pods(
-                self.core_v1_api,
-                self.namespace,
-                self.labels.kasper_label_selectors().as_dict(),
-            )
+            pods = await self.fetch_app_pods()
             if pods and pods.items:
                 for pod in pods.items:
                     pod_name = getattr(pod.metadata, "name", "") if pod.metadata else ""
@@ -2941,47 +3695,57 @@ class KasprApp(BaseResource):
         except Exception as e:
             self.logger.warning(f"Failed to fetch pod metadata for member statuses: {e}")
 
-        async def fetch_member_status(idx: int):
-            """Fetch status from a single member."""
-            try:
-                url = self.prepare_member_url(idx)
-                status = await self.web_client.get_status(url)
-                return idx, status
-            except Exception as e:
-                self.logger.warning(f"Failed to get status from member {idx}: {e}")
-                return idx, None
-
-        # Create tasks for all members
-        tasks = [fetch_member_status(idx) for idx in range(available_replicas)]
-
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=self.conf.client_status_check_timeout_seconds,
-            )
-
-            # Filter out failed calls and collect successful results
-            member_statuses = []
-            for result in results:
-                if isinstance(result, Exception):
-                    # This shouldn't happen since we handle exceptions in fetch_member_status
-                    continue
-                idx, status = result
+        reused: Dict[int, Dict] = {}
+        if store is not None:
+            for idx in range(available_replicas):
+                status = store.fresh(
+                    app_key, idx, pod_metadata_by_idx.get(idx, {}).get("podUID")
+                )
                 if status is not None:
-                    member_status = {"id": idx, "lastUpdateTime": now(), **status}
-                    member_status.update(pod_metadata_by_idx.get(idx, {}))
-                    member_statuses.append(member_status)
-
-            if not member_statuses:
-                self.logger.warning("All worker status checks failed")
-
-            return member_statuses
+                    reused[idx] = status
+
+        # Slow or unreachable members only lose their own status
+        timeout = self.conf.client_status_check_timeout_seconds
+        endpoints = {
+            idx: self.prepare_member_url(idx)
+            for idx in range(available_replicas)
+            if idx not in reused
+        }
+        results = (
+            await self.status_client.get_statuses(endpoints, deadline=timeout)
+            if endpoints
+            else {}
+        )
 
-        except asyncio.TimeoutError:
-            self.logger.warning(
-                f"Timed out fetching member statuses after {self.conf.client_status_check_timeout_seconds} seconds."
+        member_statuses = list(reused.values())
+        for idx, status in sorted(results.items()):
+            if isinstance(status, asyncio.TimeoutError):
+                self.logger.warning(
+                    f"Timed out getting status from member {idx} after {timeout} seconds."
+                )
+                continue
+            if isinstance(status, BaseException):
+                self.logger.warning(f"Failed to get status from member {idx}: {status}")
+                continue
+            if status is not None:
+                member_status = {"id": idx, "lastUpdateTime": now(), **status}
+                member_status.update(pod_metadata_by_idx.get(idx, {}))
+                member_statuses.append(member_status)
+
+        if results and not member_statuses:
+            self.logger.warning("All worker status checks failed")
+
+        member_statuses.sort(key=lambda member_status: member_status["id"])
+        if store is not None:
+            store.update(
+                app_key,
+                {
+                    member_status["id"]: (member_status.get("podUID"), member_status)
+                    for member_status in member_statuses
+                },
+                reused=set(reused),
             )
-            return []
+        return member_statuses
 
     def prepare_member_url(self, pod_index: int) -> str:
         """Prepare the worker URL for a given pod index."""
@@ -3128,6 +3892,12 @@ class KasprApp(BaseResource):
             self._autoscaling_v2_api = AutoscalingV2Api(self.api_client)
         return self._autoscaling_v2_api
 
+    @cached_property
+    def batch_v1_api(self) -> BatchV1Api:
+        if self._batch_v1_api is None:
+            self._batch_v1_api = BatchV1Api(self.api_client)
+        return self._batch_v1_api
+
     @cached_property
     def custom_objects_api(self) -> CustomObjectsApi:
         if self._custom_objects_api is None:
@@ -3256,6 +4026,16 @@ class KasprApp(BaseResource):
             self._packages_pvc_hash = self.prepare_python_packages_pvc_hash(self.python_packages_pvc)
         return self._packages_pvc_hash
 
+    @cached_property
+    def packages_lock_config_map_name(self) -> str:
+        return f"{self.component_name}-packages-lock"
+
+    @cached_property
+    def packages_resolver_job(self) -> Optional[V1Job]:
+        if self._packages_resolver_job is None:
+            self._packages_resolver_job = self.prepare_packages_resolver_job()
+        return self._packages_resolver_job
+
     @cached_property
     def packages_init_container(self) -> Optional[V1Container]:
         if self._packages_init_container is None:
@@ -3384,6 +4164,14 @@ class KasprApp(BaseResource):
             )
         return self._tasks_hash
 
+    @cached_property
+    def volume_mounted_resources_hash(self) -> str:
+        if self._volume_mounted_resources_hash is None:
+            self._volume_mounted_resources_hash = (
+                self.prepare_volume_mounted_resources_hash()
+            )
+        return self._volume_mounted_resources_hash
+
     @cached_property
     def packages_hash(self) -> Optional[str]:
         """Hash of Python packages configuration."""
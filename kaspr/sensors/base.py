@@ -193,6 +193,25 @@ class OperatorSensor:
         """
         pass
 
+    def on_sync_step_complete(
+        self,
+        app_name: str,
+        namespace: str,
+        step: str,
+        duration: float,
+        success: bool,
+    ) -> None:
+        """Called when a single step of KasprApp synchronization completes.
+        
+        Args:
+            app_name: KasprApp resource name
+            namespace: Kubernetes namespace
+            step: Synchronization step (service, config_map, stateful_set, etc.)
+            duration: Time spent in the step (seconds)
+            success: Whether the step succeeded
+        """
+        pass
+
     # =============================================================================
     # Member Management Hooks
     # =============================================================================
@@ -289,6 +308,34 @@ class OperatorSensor:
         """
         pass
 
+    def on_members_observed(
+        self,
+        name: str,
+        namespace: str,
+        member_ids: list[int],
+    ) -> None:
+        """Called with the members currently reported in the app status.
+        
+        Args:
+            name: KasprApp resource name
+            namespace: Kubernetes namespace
+            member_ids: IDs of the app's current members
+        """
+        pass
+
+    def on_app_deleted(
+        self,
+        name: str,
+        namespace: str,
+    ) -> None:
+        """Called when a KasprApp is deleted.
+        
+        Args:
+            name: KasprApp resource name
+            namespace: Kubernetes namespace
+        """
+        pass
+
     # =============================================================================
     # Package Installation Hooks
     # =============================================================================
@@ -387,6 +434,104 @@ class OperatorSensor:
         """
         pass
 
+    # =============================================================================
+    # Kubernetes API Hooks
+    # =============================================================================
+
+    def on_api_rate_limit_wait(
+        self,
+        verb: str,
+        wait_time: float,
+    ) -> None:
+        """Called when a Kubernetes API request passed the client-side rate limiter.
+        
+        Args:
+            verb: API verb of the request (get, watch, create, update, patch, delete)
+            wait_time: Time the request was queued by the rate limiter (seconds)
+        """
+        pass
+
+    def on_api_request(
+        self,
+        verb: str,
+        resource: str,
+        code: str,
+        duration: float,
+    ) -> None:
+        """Called when a Kubernetes API request completes.
+        
+        Args:
+            verb: API verb of the request (get, watch, create, update, patch, delete)
+            resource: Resource type of the request, e.g. statefulsets or pods/exec
+            code: HTTP status code of the response, or "error" if none was received
+            duration: Time from sending the request to its response (seconds)
+        """
+        pass
+
+    # =============================================================================
+    # Runtime Health Hooks
+    # =============================================================================
+
+    def on_event_loop_sample(
+        self,
+        lag: float,
+        tasks: int,
+    ) -> None:
+        """Called periodically with the health of the operator's event loop.
+        
+        Args:
+            lag: Time a scheduled wakeup of the event loop was late (seconds)
+            tasks: Number of live asyncio tasks
+        """
+        pass
+
+    def on_queue_depth(
+        self,
+        queue: str,
+        depth: int,
+    ) -> None:
+        """Called periodically with the depth of a work queue.
+        
+        Args:
+            queue: Queue name (kopf_workers, reconciliation)
+            depth: Number of items waiting or in progress
+        """
+        pass
+
+    def on_http_pool_sample(
+        self,
+        pool: str,
+        connections_in_use: int,
+        connections_limit: int,
+        requests_in_flight: int,
+    ) -> None:
+        """Called periodically with the utilisation of an HTTP connection pool.
+        
+        Args:
+            pool: Pool name (member_status)
+            connections_in_use: Connections currently acquired from the pool
+            connections_limit: Maximum number of connections of the pool
+            requests_in_flight: Requests currently sent through the pool
+        """
+        pass
+
+    def on_cache_sample(
+        self,
+        cache: str,
+        hits: int,
+        misses: int,
+        entries: int,
+    ) -> None:
+        """Called periodically with the effectiveness of an in-memory cache.
+        
+        Args:
+            cache: Cache name (spec, render)
+            hits: Lookups answered from the cache since it was created
+            misses: Lookups not answered from the cache since it was created
+            entries: Number of entries currently cached
+        """
+        pass
+
     # =============================================================================
     # Utility Methods
     # =============================================================================
@@ -227,6 +227,24 @@ class SensorDelegate(OperatorSensor):
                     exc_info=True,
                 )
 
+    def on_sync_step_complete(
+        self,
+        app_name: str,
+        namespace: str,
+        step: str,
+        duration: float,
+        success: bool,
+    ) -> None:
+        """Delegate sync_step_complete to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_sync_step_complete(app_name, namespace, step, duration, success)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_sync_step_complete: {e}",
+                    exc_info=True,
+                )
+
     # =============================================================================
     # Member Management Hooks
     # =============================================================================
@@ -329,6 +347,37 @@ class SensorDelegate(OperatorSensor):
                     exc_info=True,
                 )
 
+    def on_members_observed(
+        self,
+        name: str,
+        namespace: str,
+        member_ids: list[int],
+    ) -> None:
+        """Delegate members_observed to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_members_observed(name, namespace, member_ids)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_members_observed: {e}",
+                    exc_info=True,
+                )
+
+    def on_app_deleted(
+        self,
+        name: str,
+        namespace: str,
+    ) -> None:
+        """Delegate app_deleted to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_app_deleted(name, namespace)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_app_deleted: {e}",
+                    exc_info=True,
+                )
+
     # =============================================================================
     # Status Update Hooks
     # =============================================================================
@@ -434,6 +483,110 @@ class SensorDelegate(OperatorSensor):
                     exc_info=True,
                 )
 
+    # =============================================================================
+    # Kubernetes API Hooks
+    # =============================================================================
+
+    def on_api_rate_limit_wait(
+        self,
+        verb: str,
+        wait_time: float,
+    ) -> None:
+        """Delegate api_rate_limit_wait to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_api_rate_limit_wait(verb, wait_time)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_api_rate_limit_wait: {e}",
+                    exc_info=True,
+                )
+
+    def on_api_request(
+        self,
+        verb: str,
+        resource: str,
+        code: str,
+        duration: float,
+    ) -> None:
+        """Delegate api_request to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_api_request(verb, resource, code, duration)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_api_request: {e}",
+                    exc_info=True,
+                )
+
+    # =============================================================================
+    # Runtime Health Hooks
+    # =============================================================================
+
+    def on_event_loop_sample(
+        self,
+        lag: float,
+        tasks: int,
+    ) -> None:
+        """Delegate event_loop_sample to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_event_loop_sample(lag, tasks)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_event_loop_sample: {e}",
+                    exc_info=True,
+                )
+
+    def on_queue_depth(
+        self,
+        queue: str,
+        depth: int,
+    ) -> None:
+        """Delegate queue_depth to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_queue_depth(queue, depth)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_queue_depth: {e}",
+                    exc_info=True,
+                )
+
+    def on_http_pool_sample(
+        self,
+        pool: str,
+        connections_in_use: int,
+        connections_limit: int,
+        requests_in_flight: int,
+    ) -> None:
+        """Delegate http_pool_sample to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_http_pool_sample(pool, connections_in_use, connections_limit, requests_in_flight)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_http_pool_sample: {e}",
+                    exc_info=True,
+                )
+
+    def on_cache_sample(
+        self,
+        cache: str,
+        hits: int,
+        misses: int,
+        entries: int,
+    ) -> None:
+        """Delegate cache_sample to all sensors."""
+        for sensor in self._sensors:
+            try:
+                sensor.on_cache_sample(cache, hits, misses, entries)
+            except Exception as e:
+                logger.error(
+                    f"Error in {sensor.__class__.__name__}.on_cache_sample: {e}",
+                    exc_info=True,
+                )
+
     # =============================================================================
     # Utility Methods
     # =============================================================================
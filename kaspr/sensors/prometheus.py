@@ -7,21 +7,105 @@ categories identified in the design:
 1. Reconciliation Loop Health - Duration, queue depth, throughput, errors
 2. Rebalance & Member Health - Rebalance tracking, hung members, state transitions
 3. Kubernetes Resource Sync - Operation counts, latency, drift detection
+4. Runtime Health - Event loop lag, API request latency, queue and pool usage
 
 All metrics include labels for multi-dimensional analysis (app_name, namespace, etc.).
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any, Set, Tuple
 import time
 import logging
 
-from prometheus_client import Counter, Histogram, Gauge
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, Gauge
 
 from kaspr.sensors.base import OperatorSensor
 
 logger = logging.getLogger(__name__)
 
 
+class CardinalityManager:
+    """Tracks the labelled series of every app so they can be removed.
+
+    Series of an app are removed when the app is deleted, and series of a
+    member when it is no longer reported in the app's status. Series with
+    a ``member_id`` label are limited to ``max_member_series`` in total;
+    once the budget is spent, new members are recorded under the
+    ``overflow`` member id so totals stay correct. A member stays in
+    overflow until it departs, even if budget is freed in the meantime.
+    """
+
+    OVERFLOW_MEMBER_ID = 'overflow'
+
+    def __init__(self, max_member_series: int = 0, overflow: Optional[Counter] = None):
+        self.max_member_series = max_member_series
+        self.overflow = overflow
+        self.member_series = 0
+        # (namespace, app_name) -> metric -> label values of its series
+        self._series: Dict[Tuple[str, str], Dict[Any, Set[Tuple[str, ...]]]] = {}
+        # (namespace, app_name) -> ids of the members recorded as overflow
+        self._overflowed: Dict[Tuple[str, str], Set[str]] = {}
+
+    def labels(self, metric, **labels):
+        """Child of ``metric`` with ``labels``, tracked under its app."""
+        labels = {key: str(value) for key, value in labels.items()}
+        app = (labels['namespace'], labels['app_name'])
+        tracked = self._series.setdefault(app, {}).setdefault(metric, set())
+        member_id = labels.get('member_id')
+        if member_id is not None and member_id in self._overflowed.get(app, ()):
+            labels['member_id'] = self.OVERFLOW_MEMBER_ID
+        values = tuple(labels[name] for name in metric._labelnames)
+        if values in tracked:
+            return metric.labels(**labels)
+        if labels.get('member_id', self.OVERFLOW_MEMBER_ID) != self.OVERFLOW_MEMBER_ID:
+            if self.max_member_series and self.member_series >= self.max_member_series:
+                self._overflowed.setdefault(app, set()).add(member_id)
+                if self.overflow is not None:
+                    self.overflow.inc()
+                labels['member_id'] = self.OVERFLOW_MEMBER_ID
+                values = tuple(labels[name] for name in metric._labelnames)
+            else:
+                self.member_series += 1
+        tracked.add(values)
+        return metric.labels(**labels)
+
+    def remove_app(self, app_name: str, namespace: str) -> None:
+        """Remove every series of an app."""
+        self._overflowed.pop((namespace, app_name), None)
+        for metric, tracked in self._series.pop((namespace, app_name), {}).items():
+            for values in tracked:
+                self._remove(metric, values)
+
+    def remove_members(self, app_name: str, namespace: str, keep: Iterable[str]) -> None:
+        """Remove the series of an app's members that are not in ``keep``."""
+        keep = {str(member_id) for member_id in keep} | {self.OVERFLOW_MEMBER_ID}
+        overflowed = self._overflowed.get((namespace, app_name))
+        if overflowed:
+            overflowed &= keep
+        for metric, tracked in self._series.get((namespace, app_name), {}).items():
+            if 'member_id' not in metric._labelnames:
+                continue
+            idx = metric._labelnames.index('member_id')
+            for values in [values for values in tracked if values[idx] not in keep]:
+                tracked.discard(values)
+                self._remove(metric, values)
+
+    def _remove(self, metric, values: Tuple[str, ...]) -> None:
+        if 'member_id' in metric._labelnames:
+            if values[metric._labelnames.index('member_id')] != self.OVERFLOW_MEMBER_ID:
+                self.member_series -= 1
+        try:
+            metric.remove(*values)
+        except KeyError:
+            pass
+
+    def __len__(self) -> int:
+        return sum(
+            len(tracked)
+            for metrics in self._series.values()
+            for tracked in metrics.values()
+        )
+
+
 class PrometheusMonitor(OperatorSensor):
     """Prometheus metrics monitor for Kaspr operator.
     
@@ -33,6 +117,11 @@ class PrometheusMonitor(OperatorSensor):
     - kaspr_rebalance_* / kaspr_member_* - Member and rebalance metrics  
     - kaspr_resource_* - Kubernetes resource sync metrics
     
+    Series labelled with an app are tracked by a :class:`CardinalityManager`
+    and removed when the app or its members go away. With
+    ``aggregate_members`` member metrics are recorded per app instead of
+    per member, and hung member gauges become per-app histograms.
+    
     Example:
         monitor = PrometheusMonitor()
         
@@ -43,9 +132,22 @@ class PrometheusMonitor(OperatorSensor):
         # Metrics are automatically recorded and exposed via /metrics endpoint
     """
 
-    def __init__(self):
-        """Initialize Prometheus metrics."""
+    def __init__(
+        self,
+        aggregate_members: bool = False,
+        max_member_series: int = 0,
+        registry: CollectorRegistry = REGISTRY,
+    ):
+        """Initialize Prometheus metrics.
+        
+        Args:
+            aggregate_members: Record member metrics per app instead of per member
+            max_member_series: Maximum number of series with a member_id label (0 = unlimited)
+            registry: Registry the metrics are registered with
+        """
         super().__init__()
+        self.aggregate_members = aggregate_members
+        member_labels = [] if aggregate_members else ['member_id']
         
         # =============================================================================
         # Reconciliation Loop Metrics
@@ -56,24 +158,28 @@ class PrometheusMonitor(OperatorSensor):
             'Time spent in reconciliation loop',
             labelnames=['app_name', 'component_name', 'namespace', 'trigger_source', 'result'],
             buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0],
+            registry=registry,
         )
         
         self.reconcile_total = Counter(
             'kasprop_reconcile_total',
             'Total number of reconciliation attempts',
             labelnames=['app_name', 'component_name', 'namespace', 'trigger_source', 'result'],
+            registry=registry,
         )
         
         self.reconcile_errors = Counter(
             'kasprop_reconcile_errors_total',
             'Total number of reconciliation errors',
             labelnames=['app_name', 'component_name', 'namespace', 'error_type'],
+            registry=registry,
         )
         
         self.reconcile_queue_depth = Gauge(
             'kasprop_reconcile_queue_depth',
             'Current reconciliation queue depth per resource',
             labelnames=['app_name', 'component_name', 'namespace'],
+            registry=registry,
         )
         
         self.reconcile_queue_wait_seconds = Histogram(
@@ -81,6 +187,7 @@ class PrometheusMonitor(OperatorSensor):
             'Time spent waiting in reconciliation queue',
             labelnames=['app_name', 'component_name', 'namespace'],
             buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0],
+            registry=registry,
         )
         
         # =============================================================================
@@ -92,44 +199,76 @@ class PrometheusMonitor(OperatorSensor):
             'Time spent in rebalancing',
             labelnames=['app_name', 'namespace', 'trigger_reason', 'result'],
             buckets=[1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0],
+            registry=registry,
         )
         
         self.rebalance_total = Counter(
             'kasprop_rebalance_total',
             'Total number of rebalance attempts',
             labelnames=['app_name', 'namespace', 'trigger_reason', 'result'],
+            registry=registry,
         )
         
         self.member_state_transitions = Counter(
             'kasprop_member_state_transitions_total',
             'Total number of member state transitions',
-            labelnames=['app_name', 'namespace', 'member_id', 'from_state', 'to_state'],
+            labelnames=['app_name', 'namespace', *member_labels, 'from_state', 'to_state'],
+            registry=registry,
         )
         
         self.hung_members_detected = Counter(
             'kasprop_hung_members_detected_total',
             'Total number of hung member detections',
-            labelnames=['app_name', 'namespace', 'member_id'],
+            labelnames=['app_name', 'namespace', *member_labels],
+            registry=registry,
         )
         
-        self.hung_member_consecutive_detections = Gauge(
-            'kasprop_hung_member_consecutive_detections',
-            'Current consecutive hung detection count (3-strike system)',
-            labelnames=['app_name', 'namespace', 'member_id'],
-        )
-        
-        self.hung_member_duration_seconds = Gauge(
-            'kasprop_hung_member_duration_seconds',
-            'Time member has been in hung state',
-            labelnames=['app_name', 'namespace', 'member_id'],
-        )
+        if aggregate_members:
+            self.hung_member_consecutive_detections = Histogram(
+                'kasprop_hung_member_consecutive_detections',
+                'Consecutive hung detection counts of members (3-strike system)',
+                labelnames=['app_name', 'namespace'],
+                buckets=[1, 2, 3, 5, 10],
+                registry=registry,
+            )
+            
+            self.hung_member_duration_seconds = Histogram(
+                'kasprop_hung_member_duration_seconds',
+                'Time members have been in hung state',
+                labelnames=['app_name', 'namespace'],
+                buckets=[60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0],
+                registry=registry,
+            )
+        else:
+            self.hung_member_consecutive_detections = Gauge(
+                'kasprop_hung_member_consecutive_detections',
+                'Current consecutive hung detection count (3-strike system)',
+                labelnames=['app_name', 'namespace', 'member_id'],
+                registry=registry,
+            )
+            
+            self.hung_member_duration_seconds = Gauge(
+                'kasprop_hung_member_duration_seconds',
+                'Time member has been in hung state',
+                labelnames=['app_name', 'namespace', 'member_id'],
+                registry=registry,
+            )
         
         self.member_terminations = Counter(
             'kasprop_member_terminations_total',
             'Total number of member pod terminations',
-            labelnames=['app_name', 'namespace', 'member_id', 'reason'],
+            labelnames=['app_name', 'namespace', *member_labels, 'reason'],
+            registry=registry,
+        )
+        
+        self.member_series_overflow = Counter(
+            'kasprop_member_series_overflow_total',
+            'Total number of members recorded as overflow because the series budget was spent',
+            registry=registry,
         )
         
+        self.series = CardinalityManager(max_member_series, self.member_series_overflow)
+        
         # =============================================================================
         # Kubernetes Resource Sync Metrics
         # =============================================================================
@@ -139,24 +278,36 @@ class PrometheusMonitor(OperatorSensor):
             'Time spent syncing Kubernetes resources',
             labelnames=['app_name', 'component_name', 'resource_name', 'namespace', 'resource_type', 'operation', 'result'],
             buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0],
+            registry=registry,
         )
         
         self.resource_sync_total = Counter(
             'kasprop_resource_sync_total',
             'Total number of resource sync operations',
             labelnames=['app_name', 'component_name', 'resource_name', 'namespace', 'resource_type', 'operation', 'result'],
+            registry=registry,
         )
         
         self.resource_sync_errors = Counter(
             'kasprop_resource_sync_errors_total',
             'Total number of resource sync errors',
             labelnames=['app_name', 'component_name', 'resource_name', 'namespace', 'resource_type', 'error_type'],
+            registry=registry,
         )
         
         self.resource_drift_detected = Counter(
             'kasprop_resource_drift_detected_total',
             'Total number of resource drift detections',
             labelnames=['app_name', 'component_name', 'resource_name', 'namespace', 'resource_type', 'drift_field'],
+            registry=registry,
+        )
+        
+        self.sync_step_duration = Histogram(
+            'kasprop_sync_step_duration_seconds',
+            'Time spent in each step of KasprApp synchronization',
+            labelnames=['app_name', 'namespace', 'step', 'result'],
+            buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            registry=registry,
         )
         
         # =============================================================================
@@ -167,8 +318,104 @@ class PrometheusMonitor(OperatorSensor):
             'kasprop_status_updates_total',
             'Total number of status updates',
             labelnames=['app_name', 'namespace', 'update_field'],
+            registry=registry,
         )
         
+        # =============================================================================
+        # Kubernetes API Metrics
+        # =============================================================================
+        
+        self.api_rate_limit_wait_seconds = Histogram(
+            'kasprop_api_rate_limit_wait_seconds',
+            'Time Kubernetes API requests spent queued by the client-side rate limiter',
+            labelnames=['verb'],
+            buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0],
+            registry=registry,
+        )
+        
+        self.api_request_duration_seconds = Histogram(
+            'kasprop_api_request_duration_seconds',
+            'Latency of Kubernetes API requests',
+            labelnames=['verb', 'resource'],
+            buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            registry=registry,
+        )
+        
+        self.api_requests_total = Counter(
+            'kasprop_api_requests_total',
+            'Total number of Kubernetes API requests',
+            labelnames=['verb', 'resource', 'code'],
+            registry=registry,
+        )
+        
+        # =============================================================================
+        # Runtime Health Metrics
+        # =============================================================================
+        
+        self.event_loop_lag_seconds = Histogram(
+            'kasprop_event_loop_lag_seconds',
+            'Delay of scheduled event loop wakeups (high values indicate CPU-bound load)',
+            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+            registry=registry,
+        )
+        
+        self.event_loop_tasks = Gauge(
+            'kasprop_event_loop_tasks',
+            'Number of live asyncio tasks',
+            registry=registry,
+        )
+        
+        self.queue_depth = Gauge(
+            'kasprop_queue_depth',
+            'Current number of items waiting or in progress in a work queue',
+            labelnames=['queue'],
+            registry=registry,
+        )
+        
+        self.http_pool_connections_in_use = Gauge(
+            'kasprop_http_pool_connections_in_use',
+            'Connections currently acquired from an HTTP connection pool',
+            labelnames=['pool'],
+            registry=registry,
+        )
+        
+        self.http_pool_connections_limit = Gauge(
+            'kasprop_http_pool_connections_limit',
+            'Maximum number of connections of an HTTP connection pool',
+            labelnames=['pool'],
+            registry=registry,
+        )
+        
+        self.http_pool_requests_in_flight = Gauge(
+            'kasprop_http_pool_requests_in_flight',
+            'Requests currently sent through an HTTP connection pool',
+            labelnames=['pool'],
+            registry=registry,
+        )
+        
+        self.cache_hits = Counter(
+            'kasprop_cache_hits_total',
+            'Total number of lookups answered from an in-memory cache',
+            labelnames=['cache'],
+            registry=registry,
+        )
+        
+        self.cache_misses = Counter(
+            'kasprop_cache_misses_total',
+            'Total number of lookups not answered from an in-memory cache',
+            labelnames=['cache'],
+            registry=registry,
+        )
+        
+        self.cache_entries = Gauge(
+            'kasprop_cache_entries',
+            'Current number of entries in an in-memory cache',
+            labelnames=['cache'],
+            registry=registry,
+        )
+        # cache -> (hits, misses) at the previous sample
+        self._cache_counts: Dict[str, Tuple[int, int]] = {}
+        
         # =============================================================================
         # Python Package Installation Metrics
         # =============================================================================
@@ -178,18 +425,21 @@ class PrometheusMonitor(OperatorSensor):
             'Time taken to install Python packages',
             labelnames=['app_name', 'namespace'],
             buckets=[1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0],
+            registry=registry,
         )
         
         self.package_install_total = Counter(
             'kasprop_package_install_total',
             'Total number of package installations',
             labelnames=['app_name', 'namespace', 'result'],  # result: success/failure
+            registry=registry,
         )
         
         self.package_install_errors_total = Counter(
             'kasprop_package_install_errors_total',
             'Total number of package installation errors',
             labelnames=['app_name', 'namespace', 'error_type'],
+            registry=registry,
         )
         
         # Phase 2: Authentication metrics
@@ -197,6 +447,7 @@ class PrometheusMonitor(OperatorSensor):
             'kasprop_package_auth_enabled',
             'Whether PyPI authentication is configured (1=enabled, 0=disabled)',
             labelnames=['app_name', 'namespace'],
+            registry=registry,
         )
         
         # Phase 2: Custom index metrics
@@ -204,6 +455,7 @@ class PrometheusMonitor(OperatorSensor):
             'kasprop_package_custom_index_enabled',
             'Whether custom PyPI index is configured (1=enabled, 0=disabled)',
             labelnames=['app_name', 'namespace'],
+            registry=registry,
         )
         
         # Phase 2: Cache usage metrics
@@ -211,12 +463,14 @@ class PrometheusMonitor(OperatorSensor):
             'kasprop_package_cache_usage_bytes',
             'Python package cache disk usage in bytes',
             labelnames=['app_name', 'namespace', 'type'],  # type: total|used|available
+            registry=registry,
         )
         
         self.package_cache_usage_percent = Gauge(
             'kasprop_package_cache_usage_percent',
             'Python package cache disk usage percentage',
             labelnames=['app_name', 'namespace'],
+            registry=registry,
         )
         
         # Phase 2: Install policy metrics
@@ -224,12 +478,14 @@ class PrometheusMonitor(OperatorSensor):
             'kasprop_package_install_retries_total',
             'Total number of package installation retries',
             labelnames=['app_name', 'namespace'],
+            registry=registry,
         )
         
         self.package_install_timeouts_total = Counter(
             'kasprop_package_install_timeouts_total',
             'Total number of package installation timeouts',
             labelnames=['app_name', 'namespace'],
+            registry=registry,
         )
         
         logger.info("PrometheusMonitor initialized with all metrics")
@@ -267,7 +523,8 @@ class PrometheusMonitor(OperatorSensor):
             trigger_source = state['trigger_source']
             result = 'success' if success else 'failure'
             
-            self.reconcile_duration.labels(
+            self.series.labels(
+                self.reconcile_duration,
                 app_name=app_name,
                 component_name=component_name,
                 namespace=namespace,
@@ -275,7 +532,8 @@ class PrometheusMonitor(OperatorSensor):
                 result=result,
             ).observe(duration)
             
-            self.reconcile_total.labels(
+            self.series.labels(
+                self.reconcile_total,
                 app_name=app_name,
                 component_name=component_name,
                 namespace=namespace,
@@ -285,7 +543,8 @@ class PrometheusMonitor(OperatorSensor):
             
             if error:
                 error_type = error.__class__.__name__
-                self.reconcile_errors.labels(
+                self.series.labels(
+                    self.reconcile_errors,
                     app_name=app_name,
                     component_name=component_name,
                     namespace=namespace,
@@ -300,7 +559,8 @@ class PrometheusMonitor(OperatorSensor):
         queue_depth: int,
     ) -> None:
         """Record reconciliation queue depth."""
-        self.reconcile_queue_depth.labels(
+        self.series.labels(
+            self.reconcile_queue_depth,
             app_name=app_name,
             component_name=component_name,
             namespace=namespace,
@@ -314,7 +574,8 @@ class PrometheusMonitor(OperatorSensor):
         wait_time: float,
     ) -> None:
         """Record time spent waiting in queue."""
-        self.reconcile_queue_wait_seconds.labels(
+        self.series.labels(
+            self.reconcile_queue_wait_seconds,
             app_name=app_name,
             component_name=component_name,
             namespace=namespace,
@@ -356,7 +617,8 @@ class PrometheusMonitor(OperatorSensor):
             duration = time.time() - state['start_time']
             result = 'success' if success else 'failure'
             
-            self.resource_sync_duration.labels(
+            self.series.labels(
+                self.resource_sync_duration,
                 app_name=app_name,
                 component_name=component_name,
                 resource_name=resource_name,
@@ -366,7 +628,8 @@ class PrometheusMonitor(OperatorSensor):
                 result=result,
             ).observe(duration)
             
-            self.resource_sync_total.labels(
+            self.series.labels(
+                self.resource_sync_total,
                 app_name=app_name,
                 component_name=component_name,
                 resource_name=resource_name,
@@ -378,7 +641,8 @@ class PrometheusMonitor(OperatorSensor):
             
             if error:
                 error_type = error.__class__.__name__
-                self.resource_sync_errors.labels(
+                self.series.labels(
+                    self.resource_sync_errors,
                     app_name=app_name,
                     component_name=component_name,
                     resource_name=resource_name,
@@ -398,7 +662,8 @@ class PrometheusMonitor(OperatorSensor):
     ) -> None:
         """Record resource drift detection."""
         for field in drift_fields:
-            self.resource_drift_detected.labels(
+            self.series.labels(
+                self.resource_drift_detected,
                 app_name=app_name,
                 component_name=component_name,
                 resource_name=resource_name,
@@ -407,6 +672,23 @@ class PrometheusMonitor(OperatorSensor):
                 drift_field=field,
             ).inc()
 
+    def on_sync_step_complete(
+        self,
+        app_name: str,
+        namespace: str,
+        step: str,
+        duration: float,
+        success: bool,
+    ) -> None:
+        """Record synchronization step duration."""
+        self.series.labels(
+            self.sync_step_duration,
+            app_name=app_name,
+            namespace=namespace,
+            step=step,
+            result='success' if success else 'failure',
+        ).observe(duration)
+
     # =============================================================================
     # Member Management Hooks
     # =============================================================================
@@ -438,20 +720,26 @@ class PrometheusMonitor(OperatorSensor):
             trigger_reason = state['trigger_reason']
             result = 'success' if success else 'failure'
             
-            self.rebalance_duration.labels(
+            self.series.labels(
+                self.rebalance_duration,
                 app_name=name,
                 namespace=namespace,
                 trigger_reason=trigger_reason,
                 result=result,
             ).observe(actual_duration)
             
-            self.rebalance_total.labels(
+            self.series.labels(
+                self.rebalance_total,
                 app_name=name,
                 namespace=namespace,
                 trigger_reason=trigger_reason,
                 result=result,
             ).inc()
 
+    def _member_labels(self, member_id: int) -> Dict[str, str]:
+        """member_id label of a member, unless member metrics are aggregated."""
+        return {} if self.aggregate_members else {'member_id': str(member_id)}
+
     def on_member_state_change(
         self,
         name: str,
@@ -461,12 +749,13 @@ class PrometheusMonitor(OperatorSensor):
         new_state: str,
     ) -> None:
         """Record member state transition."""
-        self.member_state_transitions.labels(
+        self.series.labels(
+            self.member_state_transitions,
             app_name=name,
             namespace=namespace,
-            member_id=str(member_id),
             from_state=old_state,
             to_state=new_state,
+            **self._member_labels(member_id),
         ).inc()
 
     def on_hung_member_detected(
@@ -478,25 +767,33 @@ class PrometheusMonitor(OperatorSensor):
         hung_duration: float,
     ) -> None:
         """Record hung member detection."""
-        member_id_str = str(member_id)
+        member_labels = self._member_labels(member_id)
         
-        self.hung_members_detected.labels(
+        self.series.labels(
+            self.hung_members_detected,
             app_name=name,
             namespace=namespace,
-            member_id=member_id_str,
+            **member_labels,
         ).inc()
         
-        self.hung_member_consecutive_detections.labels(
+        consecutive_detections_metric = self.series.labels(
+            self.hung_member_consecutive_detections,
             app_name=name,
             namespace=namespace,
-            member_id=member_id_str,
-        ).set(consecutive_detections)
-        
-        self.hung_member_duration_seconds.labels(
+            **member_labels,
+        )
+        hung_duration_metric = self.series.labels(
+            self.hung_member_duration_seconds,
             app_name=name,
             namespace=namespace,
-            member_id=member_id_str,
-        ).set(hung_duration)
+            **member_labels,
+        )
+        if self.aggregate_members:
+            consecutive_detections_metric.observe(consecutive_detections)
+            hung_duration_metric.observe(hung_duration)
+        else:
+            consecutive_detections_metric.set(consecutive_detections)
+            hung_duration_metric.set(hung_duration)
 
     def on_member_terminated(
         self,
@@ -506,28 +803,51 @@ class PrometheusMonitor(OperatorSensor):
         reason: str,
     ) -> None:
         """Record member termination."""
-        member_id_str = str(member_id)
+        member_labels = self._member_labels(member_id)
         
-        self.member_terminations.labels(
+        self.series.labels(
+            self.member_terminations,
             app_name=name,
             namespace=namespace,
-            member_id=member_id_str,
             reason=reason,
+            **member_labels,
         ).inc()
         
+        if self.aggregate_members:
+            return
+        
         # Clear hung member gauges when terminated
-        self.hung_member_consecutive_detections.labels(
+        self.series.labels(
+            self.hung_member_consecutive_detections,
             app_name=name,
             namespace=namespace,
-            member_id=member_id_str,
+            **member_labels,
         ).set(0)
         
-        self.hung_member_duration_seconds.labels(
+        self.series.labels(
+            self.hung_member_duration_seconds,
             app_name=name,
             namespace=namespace,
-            member_id=member_id_str,
+            **member_labels,
         ).set(0)
 
+    def on_members_observed(
+        self,
+        name: str,
+        namespace: str,
+        member_ids: list[int],
+    ) -> None:
+        """Remove series of members that are gone."""
+        self.series.remove_members(name, namespace, member_ids)
+
+    def on_app_deleted(
+        self,
+        name: str,
+        namespace: str,
+    ) -> None:
+        """Remove all series of a deleted app."""
+        self.series.remove_app(name, namespace)
+
     # =============================================================================
     # Status Update Hooks
     # =============================================================================
@@ -563,14 +883,16 @@ class PrometheusMonitor(OperatorSensor):
             duration = time.time() - state.get('start_time', time.time())
             
             # Record duration
-            self.package_install_duration_seconds.labels(
+            self.series.labels(
+                self.package_install_duration_seconds,
                 app_name=app_name,
                 namespace=namespace,
             ).observe(duration)
         
         # Record result
         result = "success" if success else "failure"
-        self.package_install_total.labels(
+        self.series.labels(
+            self.package_install_total,
             app_name=app_name,
             namespace=namespace,
             result=result,
@@ -578,7 +900,8 @@ class PrometheusMonitor(OperatorSensor):
         
         # Record error if failed
         if not success and error_type:
-            self.package_install_errors_total.labels(
+            self.series.labels(
+                self.package_install_errors_total,
                 app_name=app_name,
                 namespace=namespace,
                 error_type=error_type,
@@ -586,14 +909,16 @@ class PrometheusMonitor(OperatorSensor):
         
         # Record retries
         if retries > 0:
-            self.package_install_retries_total.labels(
+            self.series.labels(
+                self.package_install_retries_total,
                 app_name=app_name,
                 namespace=namespace,
             ).inc(retries)
         
         # Record timeout
         if error_type == 'timeout':
-            self.package_install_timeouts_total.labels(
+            self.series.labels(
+                self.package_install_timeouts_total,
                 app_name=app_name,
                 namespace=namespace,
             ).inc()
@@ -613,12 +938,14 @@ class PrometheusMonitor(OperatorSensor):
             auth_enabled: Whether PyPI authentication is configured
             custom_index_enabled: Whether a custom PyPI index is configured
         """
-        self.package_auth_enabled.labels(
+        self.series.labels(
+            self.package_auth_enabled,
             app_name=app_name,
             namespace=namespace,
         ).set(1 if auth_enabled else 0)
         
-        self.package_custom_index_enabled.labels(
+        self.series.labels(
+            self.package_custom_index_enabled,
             app_name=app_name,
             namespace=namespace,
         ).set(1 if custom_index_enabled else 0)
@@ -642,25 +969,29 @@ class PrometheusMonitor(OperatorSensor):
             available_bytes: Available cache space in bytes
             usage_percent: Cache usage as a percentage (0-100)
         """
-        self.package_cache_usage_bytes.labels(
+        self.series.labels(
+            self.package_cache_usage_bytes,
             app_name=app_name,
             namespace=namespace,
             type='total',
         ).set(total_bytes)
         
-        self.package_cache_usage_bytes.labels(
+        self.series.labels(
+            self.package_cache_usage_bytes,
             app_name=app_name,
             namespace=namespace,
             type='used',
         ).set(used_bytes)
         
-        self.package_cache_usage_bytes.labels(
+        self.series.labels(
+            self.package_cache_usage_bytes,
             app_name=app_name,
             namespace=namespace,
             type='available',
         ).set(available_bytes)
         
-        self.package_cache_usage_percent.labels(
+        self.series.labels(
+            self.package_cache_usage_percent,
             app_name=app_name,
             namespace=namespace,
         ).set(usage_percent)
@@ -673,8 +1004,87 @@ class PrometheusMonitor(OperatorSensor):
     ) -> None:
         """Record status update."""
         for field in update_fields:
-            self.status_updates.labels(
+            self.series.labels(
+                self.status_updates,
                 app_name=app_name,
                 namespace=namespace,
                 update_field=field,
             ).inc()
+
+    # =============================================================================
+    # Kubernetes API Hooks
+    # =============================================================================
+
+    def on_api_rate_limit_wait(
+        self,
+        verb: str,
+        wait_time: float,
+    ) -> None:
+        """Record time spent waiting for the API rate limiter."""
+        self.api_rate_limit_wait_seconds.labels(verb=verb).observe(wait_time)
+
+    def on_api_request(
+        self,
+        verb: str,
+        resource: str,
+        code: str,
+        duration: float,
+    ) -> None:
+        """Record latency and outcome of a Kubernetes API request."""
+        self.api_request_duration_seconds.labels(verb=verb, resource=resource).observe(duration)
+        self.api_requests_total.labels(verb=verb, resource=resource, code=code).inc()
+
+    # =============================================================================
+    # Runtime Health Hooks
+    # =============================================================================
+
+    def on_event_loop_sample(
+        self,
+        lag: float,
+        tasks: int,
+    ) -> None:
+        """Record event loop lag and number of live tasks."""
+        self.event_loop_lag_seconds.observe(lag)
+        self.event_loop_tasks.set(tasks)
+
+    def on_queue_depth(
+        self,
+        queue: str,
+        depth: int,
+    ) -> None:
+        """Record depth of a work queue."""
+        self.queue_depth.labels(queue=queue).set(depth)
+
+    def on_http_pool_sample(
+        self,
+        pool: str,
+        connections_in_use: int,
+        connections_limit: int,
+        requests_in_flight: int,
+    ) -> None:
+        """Record utilisation of an HTTP connection pool."""
+        self.http_pool_connections_in_use.labels(pool=pool).set(connections_in_use)
+        self.http_pool_connections_limit.labels(pool=pool).set(connections_limit)
+        self.http_pool_requests_in_flight.labels(pool=pool).set(requests_in_flight)
+
+    def on_cache_sample(
+        self,
+        cache: str,
+        hits: int,
+        misses: int,
+        entries: int,
+    ) -> None:
+        """Record hits, misses and size of an in-memory cache.
+
+        The cache reports running totals; counters advance by the change
+        since the previous sample, or by the totals of a replaced cache.
+        """
+        last_hits, last_misses = self._cache_counts.get(cache, (0, 0))
+        self.cache_hits.labels(cache=cache).inc(
+            hits - last_hits if hits >= last_hits else hits
+        )
+        self.cache_misses.labels(cache=cache).inc(
+            misses - last_misses if misses >= last_misses else misses
+        )
+        self.cache_entries.labels(cache=cache).set(entries)
+        self._cache_counts[cache] = (hits, misses)
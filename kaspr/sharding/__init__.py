@@ -0,0 +1,28 @@
+"""Sharding of kaspr resources across operator replicas.
+
+Each operator replica owns the KasprApps (and their components) that hash
+to it on a consistent hash ring of live replicas, so several replicas can
+share the load of a large cluster.
+"""
+
+from kaspr.sharding.ring import HashRing
+from kaspr.sharding.coordinator import (
+    OWNER_ANNOTATION,
+    ShardCoordinator,
+    get_coordinator,
+    set_coordinator,
+    owns,
+    is_owned,
+)
+from kaspr.sharding.storage import OwnedDiffBaseStorage
+
+__all__ = [
+    "OWNER_ANNOTATION",
+    "HashRing",
+    "ShardCoordinator",
+    "OwnedDiffBaseStorage",
+    "get_coordinator",
+    "set_coordinator",
+    "owns",
+    "is_owned",
+]
@@ -0,0 +1,215 @@
+"""Sharding of kaspr resources across operator replicas.
+
+Every operator replica holds a Lease labelled ``kaspr.io/operator-shard`` in
+the operator namespace and renews it periodically. Replicas whose lease is
+current form the members of a :class:`HashRing`, and each KasprApp is owned
+by the replica its namespace/name hashes to. App components (agents,
+webviews, tables, tasks, joins) follow the app named by their
+``kaspr.io/app`` label, so an app and its components are always handled by
+the same replica.
+
+Handlers are limited to owned objects with the :func:`owns` kopf filter.
+When a replica joins or leaves, the ring is rebuilt on the next renewal and
+``on_change`` is called so the new owners pick up their apps. Kopf only
+re-evaluates ``when`` filters on events, so the new owner also annotates
+moved objects with :data:`OWNER_ANNOTATION`, which starts their daemons
+and timers there and stops them on the previous owner.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Mapping, Optional
+
+from kubernetes_asyncio.client import CoordinationV1Api, V1Lease, V1LeaseSpec, V1ObjectMeta
+from kubernetes_asyncio.client.rest import ApiException
+
+from kaspr.sharding.ring import HashRing
+
+logger = logging.getLogger(__name__)
+
+SHARD_LABEL = "kaspr.io/operator-shard"
+APP_LABEL = "kaspr.io/app"
+APP_KIND = "KasprApp"
+OWNER_ANNOTATION = "kaspr.io/operator-shard-owner"
+
+
+def micro_time(value: datetime) -> str:
+    """Format ``value`` as a Kubernetes MicroTime (RFC 3339 with microseconds).
+
+    ``datetime.isoformat`` omits the fraction when it is zero, which the
+    API server rejects for MicroTime fields.
+    """
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def shard_key(namespace: str, app_name: str) -> str:
+    return f"{namespace}/{app_name}"
+
+
+class ShardCoordinator:
+    """Maintains this replica's lease and the ring of live replicas."""
+
+    def __init__(
+        self,
+        coordination_api: CoordinationV1Api,
+        namespace: str,
+        identity: str,
+        lease_duration_seconds: int = 15,
+        renew_interval_seconds: float = 5.0,
+        vnodes: int = 64,
+        on_change: Optional[Callable[[frozenset], None]] = None,
+    ):
+        self.coordination_api = coordination_api
+        self.namespace = namespace
+        self.identity = identity
+        self.lease_duration_seconds = lease_duration_seconds
+        self.renew_interval_seconds = renew_interval_seconds
+        self.on_change = on_change
+        self.ring = HashRing([identity], vnodes=vnodes)
+        # Ring before the last membership change
+        self.previous_ring: Optional[HashRing] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lease_name(self) -> str:
+        return f"kaspr-operator-shard-{self.identity}"
+
+    def owns(self, namespace: str, app_name: str) -> bool:
+        """True if this replica owns the app ``namespace/app_name``."""
+        return self.ring.owner(shard_key(namespace, app_name)) == self.identity
+
+    def gained(self, namespace: str, app_name: str) -> bool:
+        """True if the app moved to this replica with the last membership change."""
+        if self.previous_ring is None or not self.owns(namespace, app_name):
+            return False
+        return self.previous_ring.owner(shard_key(namespace, app_name)) != self.identity
+
+    def owns_object(self, body: Mapping) -> bool:
+        """True if this replica owns the app of a KasprApp or app component."""
+        metadata = body.get("metadata", {})
+        app_name = metadata.get("name")
+        if body.get("kind") != APP_KIND:
+            app_name = (metadata.get("labels") or {}).get(APP_LABEL, app_name)
+        return self.owns(metadata.get("namespace"), app_name)
+
+    def prepare_lease(self, now: datetime) -> V1Lease:
+        return V1Lease(
+            metadata=V1ObjectMeta(
+                name=self.lease_name,
+                namespace=self.namespace,
+                labels={SHARD_LABEL: "member"},
+            ),
+            spec=V1LeaseSpec(
+                holder_identity=self.identity,
+                lease_duration_seconds=self.lease_duration_seconds,
+                acquire_time=micro_time(now),
+                renew_time=micro_time(now),
+            ),
+        )
+
+    async def renew(self):
+        """Renew this replica's lease, creating it if needed."""
+        now = datetime.now(timezone.utc)
+        try:
+            await self.coordination_api.patch_namespaced_lease(
+                self.lease_name,
+                self.namespace,
+                {
+                    "spec": {
+                        "holderIdentity": self.identity,
+                        "leaseDurationSeconds": self.lease_duration_seconds,
+                        "renewTime": micro_time(now),
+                    }
+                },
+            )
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            await self.coordination_api.create_namespaced_lease(
+                self.namespace, self.prepare_lease(now)
+            )
+
+    async def refresh_members(self) -> bool:
+        """Rebuild the ring from current leases; returns True if it changed."""
+        leases = await self.coordination_api.list_namespaced_lease(
+            self.namespace, label_selector=SHARD_LABEL
+        )
+        now = datetime.now(timezone.utc)
+        members = {self.identity}
+        for lease in leases.items:
+            spec = lease.spec
+            if not spec or not spec.holder_identity or not spec.renew_time:
+                continue
+            duration = timedelta(seconds=spec.lease_duration_seconds or 0)
+            if spec.renew_time + duration > now:
+                members.add(spec.holder_identity)
+        previous_members = self.ring.members
+        changed = self.ring.set_members(members)
+        if changed:
+            self.previous_ring = HashRing(previous_members, vnodes=self.ring.vnodes)
+            logger.info(
+                f"Operator shard members changed: {sorted(members)} "
+                f"(this replica: {self.identity})"
+            )
+            if self.on_change is not None:
+                self.on_change(self.ring.members)
+        return changed
+
+    async def start(self):
+        """Join the ring and keep the lease renewed in the background."""
+        await self.renew()
+        await self.refresh_members()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="shard-coordinator")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.renew_interval_seconds)
+            try:
+                await self.renew()
+                await self.refresh_members()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to renew operator shard lease: {e}")
+
+    async def stop(self):
+        """Stop renewing and release the lease so peers rebalance right away."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.coordination_api.delete_namespaced_lease(
+                self.lease_name, self.namespace
+            )
+        except ApiException as e:
+            if e.status != 404:
+                logger.warning(f"Failed to release operator shard lease: {e}")
+
+
+# Coordinator of this replica; None when sharding is disabled
+_coordinator: Optional[ShardCoordinator] = None
+
+
+def get_coordinator() -> Optional[ShardCoordinator]:
+    return _coordinator
+
+
+def set_coordinator(coordinator: Optional[ShardCoordinator]):
+    global _coordinator
+    _coordinator = coordinator
+
+
+def owns(body: Mapping, **_) -> bool:
+    """Kopf ``when`` filter limiting handlers to objects owned by this replica."""
+    return _coordinator is None or _coordinator.owns_object(body)
+
+
+def is_owned(namespace: str, app_name: str) -> bool:
+    """True if this replica owns the app, or sharding is disabled."""
+    return _coordinator is None or _coordinator.owns(namespace, app_name)
@@ -0,0 +1,47 @@
+"""Consistent hash ring."""
+
+import bisect
+from typing import Iterable, List, Optional, Tuple
+
+import mmh3
+
+
+class HashRing:
+    """Consistent hash ring mapping keys to members.
+
+    Every member is placed on the ring ``vnodes`` times so keys spread
+    evenly, and adding or removing a member only moves the keys that hash
+    next to it.
+    """
+
+    def __init__(self, members: Iterable[str] = (), vnodes: int = 64):
+        self.vnodes = vnodes
+        self._members = frozenset()
+        self._points: List[Tuple[int, str]] = []
+        self._hashes: List[int] = []
+        self.set_members(members)
+
+    @property
+    def members(self) -> frozenset:
+        return self._members
+
+    def set_members(self, members: Iterable[str]) -> bool:
+        """Replace the ring members; returns True if they changed."""
+        members = frozenset(members)
+        if members == self._members:
+            return False
+        self._members = members
+        self._points = sorted(
+            (mmh3.hash(f"{member}#{i}", signed=False), member)
+            for member in members
+            for i in range(self.vnodes)
+        )
+        self._hashes = [point for point, _ in self._points]
+        return True
+
+    def owner(self, key: str) -> Optional[str]:
+        """Member owning ``key``, or None if the ring is empty."""
+        if not self._points:
+            return None
+        idx = bisect.bisect(self._hashes, mmh3.hash(key, signed=False))
+        return self._points[idx % len(self._points)][1]
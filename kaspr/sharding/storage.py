@@ -0,0 +1,19 @@
+"""Kopf persistence that is safe to share between operator shards."""
+
+import kopf
+
+from kaspr.sharding.coordinator import owns
+
+
+class OwnedDiffBaseStorage(kopf.AnnotationsDiffBaseStorage):
+    """Only records the last-handled configuration of owned objects.
+
+    Kopf stores the diff-base of an object even when none of its handlers
+    matched. Without this guard a replica that does not own an object could
+    record a change before the owner has handled it, and the owner would
+    never see the change.
+    """
+
+    def store(self, *, body, patch, essence):
+        if owns(body):
+            super().store(body=body, patch=patch, essence=essence)
@@ -1,5 +1,4 @@
-from types import SimpleNamespace
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
 from marshmallow import INCLUDE, EXCLUDE, Schema, post_load
 
 EXCLUDE = EXCLUDE
@@ -19,36 +18,122 @@ def _process_dict_values(model: Any, key: str, value: Any) -> Any:
     else:
         return value
 
-class BaseModel(SimpleNamespace):
+# Field orders shared by all models loaded with the same fields
+_FIELD_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class ModelMeta(type):
+    """Declares the annotated attributes of a model class as ``__slots__``.
+
+    Annotated attributes without a class level default get a slot unless a
+    base class already provides the name. Attributes that are not annotated
+    (e.g. unknown spec fields) are kept in the instance ``__dict__``, which
+    is only allocated once such an attribute is set.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if "__slots__" not in namespace:
+            annotations = namespace.get("__annotations__", {})
+            namespace["__slots__"] = tuple(
+                field
+                for field in annotations
+                if field not in namespace
+                and not field.startswith("__")
+                and not any(hasattr(base, field) for base in bases)
+            )
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        members = {}
+        for klass in reversed(cls.__mro__):
+            for slot in klass.__dict__.get("__slots__", ()):
+                if slot not in ("__dict__", "_field_order"):
+                    members[slot] = klass.__dict__[slot]
+        cls.__slot_members__ = members
+        return cls
+
+
+class BaseModel(metaclass=ModelMeta):
     """BaseModel that all models should inherit from.
     Note:
-        If a passed parameter is a nested dictionary, then it is created with the
-        `UnknownModel` class. If it is a list, then it is created with
+        Annotated attributes are stored in slots, everything else in the
+        instance ``__dict__``. Attributes keep the order they were passed in.
     Args:
         **kwargs: All passed parameters as converted to instance attributes.
     """
 
+    __slots__ = ("__dict__", "_field_order")
+    __slot_members__: Mapping = {}
     __related__: Mapping = dict()
 
     def __init__(self, **kwargs: Any) -> None:
-        kwargs = {k: _process_dict_values(self, k, v) for k, v in kwargs.items()}
+        members = self.__slot_members__
+        for key, value in kwargs.items():
+            value = _process_dict_values(self, key, value)
+            member = members.get(key)
+            if member is not None:
+                member.__set__(self, value)
+            else:
+                self.__dict__[key] = value
+        order = tuple(kwargs)
+        self._field_order = _FIELD_ORDERS.setdefault(order, order)
 
-        self.__dict__.update(kwargs)
+    def _extra(self) -> Dict[str, Any]:
+        """Attributes kept in the instance ``__dict__``.
+
+        Reading ``__dict__`` allocates it, so an empty one is dropped again.
+        """
+        extra = self.__dict__
+        if not extra:
+            del self.__dict__
+        return extra
+
+    def _items(self) -> Iterator[Tuple[str, Any]]:
+        """Set attributes in the order they were passed, then any set later."""
+        members = self.__slot_members__
+        instance_dict = self._extra()
+        order = getattr(self, "_field_order", ())
+        for key in order:
+            member = members.get(key)
+            if member is None:
+                if key in instance_dict:
+                    yield key, instance_dict[key]
+                continue
+            try:
+                yield key, member.__get__(self, type(self))
+            except AttributeError:
+                pass
+        for key, member in members.items():
+            if key in order:
+                continue
+            try:
+                yield key, member.__get__(self, type(self))
+            except AttributeError:
+                pass
+        for key, value in instance_dict.items():
+            if key not in order:
+                yield key, value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return dict(self._items()) == dict(other._items())
+
+    __hash__ = None
 
     def __repr__(self) -> str:
         """Return a default repr of any Model.
         Returns:
             The string model parameters up to a `MAX_REPR_LEN`.
         """
-        repr_ = super().__repr__()
+        params = ", ".join(f"{key}={value!r}" for key, value in self._items())
+        repr_ = f"{type(self).__name__}({params})"
         if len(repr_) > MAX_REPR_LEN:
             return repr_[:MAX_REPR_LEN] + " ...)"
         else:
             return repr_
-        
+
     def as_dict(self) -> Dict[str, Any]:
         result = {}
-        for key, value in self.__dict__.items():
+        for key, value in self._items():
             if isinstance(value, BaseModel):
                 result[key] = value.as_dict()
             elif isinstance(value, list):
@@ -58,19 +143,21 @@ class BaseModel(SimpleNamespace):
                 ]
             else:
                 result[key] = value
-        return result   
+        return result
+
 
 class UnknownModel(BaseModel):
     """A convenience class that inherits from `BaseModel`."""
 
     def keys(self):
-        return self.__dict__.keys()
-    
+        return dict(self._items()).keys()
+
     def values(self):
-        return self.__dict__.values()
+        return dict(self._items()).values()
 
     def items(self):
-        return self.__dict__.items()
+        return dict(self._items()).items()
+
 
 class BaseSchema(Schema):
     """The default schema for all models."""
@@ -72,6 +72,7 @@ from .kasprjoin_spec import KasprJoinSpec
 from .python_packages import (
     PythonPackagesCache,
     PythonPackagesInstallPolicy,
+    PythonPackagesLock,
     PythonPackagesResources,
     PythonPackagesSpec,
     PythonPackagesStatus,
@@ -143,6 +144,7 @@ __all__ = [
     "KasprJoinSpec",
     "PythonPackagesCache",
     "PythonPackagesInstallPolicy",
+    "PythonPackagesLock",
     "PythonPackagesResources",
     "PythonPackagesSpec",
     "PythonPackagesStatus",
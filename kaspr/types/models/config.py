@@ -52,6 +52,6 @@ class KasprAppConfig(BaseModel):
     def as_envs(self, exclude_none=True):
         return {
             self.env_for(k): str(v)
-            for k, v in vars(self).items()
+            for k, v in self._items()
             if exclude_none and v is not None
         }
@@ -17,9 +17,19 @@ class GCSCacheConfig(BaseModel):
     bucket: str
     prefix: Optional[str]
     max_archive_size: Optional[str]
+    compression: Optional[str]
+    compression_level: Optional[int]
     secret_ref: GCSSecretReference
 
 
+class WheelCacheConfig(BaseModel):
+    """Wheel cache shared by apps through an existing PVC."""
+
+    claim_name: str
+    retention_days: Optional[int]
+    max_size: Optional[str]
+
+
 class PythonPackagesCache(BaseModel):
     """Python packages cache configuration."""
     
@@ -30,6 +40,7 @@ class PythonPackagesCache(BaseModel):
     access_mode: Optional[str]
     delete_claim: Optional[bool]
     gcs: Optional[GCSCacheConfig]
+    wheel_cache: Optional[WheelCacheConfig]
 
 
 class PythonPackagesInstallPolicy(BaseModel):
@@ -40,6 +51,12 @@ class PythonPackagesInstallPolicy(BaseModel):
     on_failure: Optional[str]
 
 
+class PythonPackagesLock(BaseModel):
+    """Resolution lock computed once per packages hash."""
+
+    enabled: Optional[bool]
+
+
 class PythonPackagesResources(BaseModel):
     """Resource requirements for init container."""
     
@@ -71,6 +88,7 @@ class PythonPackagesSpec(BaseModel):
     credentials: Optional[PythonPackagesCredentials]
     cache: Optional[PythonPackagesCache]
     install_policy: Optional[PythonPackagesInstallPolicy]
+    lock: Optional[PythonPackagesLock]
     resources: Optional[PythonPackagesResources]
 
 
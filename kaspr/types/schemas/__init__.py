@@ -61,6 +61,7 @@ from .kasprjoin_spec import KasprJoinSpecSchema
 from .python_packages import (
     PythonPackagesCacheSchema,
     PythonPackagesInstallPolicySchema,
+    PythonPackagesLockSchema,
     PythonPackagesResourcesSchema,
     PythonPackagesSpecSchema,
     PythonPackagesStatusSchema,
@@ -118,6 +119,7 @@ __all__ = [
     "KasprJoinSpecSchema",
     "PythonPackagesCacheSchema",
     "PythonPackagesInstallPolicySchema",
+    "PythonPackagesLockSchema",
     "PythonPackagesResourcesSchema",
     "PythonPackagesSpecSchema",
     "PythonPackagesStatusSchema",
@@ -10,11 +10,14 @@ from kaspr.types.models.python_packages import (
     PythonPackagesCache,
     PythonPackagesCredentials,
     PythonPackagesInstallPolicy,
+    PythonPackagesLock,
     PythonPackagesResources,
     PythonPackagesSpec,
     PythonPackagesStatus,
     SecretReference,
+    WheelCacheConfig,
 )
+from kaspr.utils.gcs import compression_commands, parse_size_to_bytes
 
 
 class GCSSecretReferenceSchema(BaseSchema):
@@ -52,12 +55,68 @@ class GCSCacheConfigSchema(BaseSchema):
         allow_none=True,
         load_default=None,
     )
+    compression = fields.String(
+        data_key="compression",
+        allow_none=True,
+        load_default=None,
+    )
+    compression_level = fields.Integer(
+        data_key="compressionLevel",
+        allow_none=True,
+        load_default=None,
+    )
     secret_ref = fields.Nested(
         GCSSecretReferenceSchema(),
         data_key="secretRef",
         required=True,
     )
 
+    @validates_schema
+    def validate_compression(self, data, **kwargs):
+        """Validate the compressor and its level."""
+        try:
+            compression_commands(
+                data.get("compression"), data.get("compression_level")
+            )
+        except ValueError as e:
+            raise ValidationError(str(e), field_name="compression")
+
+
+class WheelCacheConfigSchema(BaseSchema):
+    """Schema for the shared wheel cache configuration."""
+
+    __model__ = WheelCacheConfig
+
+    claim_name = fields.String(
+        data_key="claimName",
+        required=True,
+    )
+    retention_days = fields.Integer(
+        data_key="retentionDays",
+        allow_none=True,
+        load_default=None,
+    )
+    max_size = fields.String(
+        data_key="maxSize",
+        allow_none=True,
+        load_default=None,
+    )
+
+    @validates("retention_days")
+    def validate_retention_days(self, value):
+        """Validate retention is at least a day."""
+        if value is not None and value < 1:
+            raise ValidationError("Retention must be at least 1 day")
+
+    @validates("max_size")
+    def validate_max_size(self, value):
+        """Validate max size is a K8s-style size."""
+        if value is not None:
+            try:
+                parse_size_to_bytes(value)
+            except ValueError as e:
+                raise ValidationError(str(e))
+
 
 class PythonPackagesCacheSchema(BaseSchema):
     """Schema for Python packages cache configuration."""
@@ -100,6 +159,12 @@ class PythonPackagesCacheSchema(BaseSchema):
         allow_none=True,
         load_default=None,
     )
+    wheel_cache = fields.Nested(
+        WheelCacheConfigSchema(),
+        data_key="wheelCache",
+        allow_none=True,
+        load_default=None,
+    )
     
     @validates("type")
     def validate_type(self, value):
@@ -183,6 +248,18 @@ class PythonPackagesInstallPolicySchema(BaseSchema):
                 )
 
 
+class PythonPackagesLockSchema(BaseSchema):
+    """Schema for the resolution lock."""
+
+    __model__ = PythonPackagesLock
+
+    enabled = fields.Boolean(
+        data_key="enabled",
+        allow_none=True,
+        load_default=None,
+    )
+
+
 class PythonPackagesResourcesSchema(BaseSchema):
     """Schema for init container resources."""
     
@@ -282,6 +359,12 @@ class PythonPackagesSpecSchema(BaseSchema):
         allow_none=True,
         load_default=None,
     )
+    lock = fields.Nested(
+        PythonPackagesLockSchema(),
+        data_key="lock",
+        allow_none=True,
+        load_default=None,
+    )
     resources = fields.Nested(
         PythonPackagesResourcesSchema(),
         data_key="resources",
@@ -66,6 +66,32 @@ CLIENT_STATUS_CHECK_TIMEOUT_SECONDS = float(
     _getenv("CLIENT_STATUS_CHECK_TIMEOUT_SECONDS", 15.0)
 )
 
+#: Timeout in seconds for the status call to a single app member
+CLIENT_STATUS_REQUEST_TIMEOUT_SECONDS = float(
+    _getenv("CLIENT_STATUS_REQUEST_TIMEOUT_SECONDS", 5.0)
+)
+
+#: Seconds a member status is reused before the member is polled again
+CLIENT_STATUS_CACHE_TTL_SECONDS = float(
+    _getenv("CLIENT_STATUS_CACHE_TTL_SECONDS", 5.0)
+)
+
+#: Maximum number of in-flight member status calls across all apps
+CLIENT_STATUS_MAX_CONCURRENCY = int(_getenv("CLIENT_STATUS_MAX_CONCURRENCY", 100))
+
+#: Maximum number of pooled connections used for member status calls
+CLIENT_STATUS_CONNECTION_LIMIT = int(_getenv("CLIENT_STATUS_CONNECTION_LIMIT", 200))
+
+#: Maximum number of pooled connections to a single app member
+CLIENT_STATUS_CONNECTION_LIMIT_PER_HOST = int(
+    _getenv("CLIENT_STATUS_CONNECTION_LIMIT_PER_HOST", 2)
+)
+
+#: Seconds to cache DNS lookups of app member hostnames
+CLIENT_STATUS_DNS_CACHE_TTL_SECONDS = int(
+    _getenv("CLIENT_STATUS_DNS_CACHE_TTL_SECONDS", 30)
+)
+
 #: Custom container image registry to use instead of Docker Hub
 KASPR_IMAGE_REGISTRY = str(_getenv("KASPR_IMAGE_REGISTRY", ""))
 
@@ -84,6 +110,111 @@ HUNG_REBALANCING_THRESHOLD_SECONDS = int(
     _getenv("HUNG_REBALANCING_THRESHOLD_SECONDS", 300)
 )
 
+#: Serve related resource lookups from a shared watch-based informer cache
+INFORMER_CACHE_ENABLED = bool(_getenv("INFORMER_CACHE_ENABLED", True))
+
+#: Seconds to wait for an informer's initial list before falling back to the API
+INFORMER_SYNC_TIMEOUT_SECONDS = float(
+    _getenv("INFORMER_SYNC_TIMEOUT_SECONDS", 10.0)
+)
+
+#: Server side timeout in seconds for each informer watch request
+INFORMER_WATCH_TIMEOUT_SECONDS = int(
+    _getenv("INFORMER_WATCH_TIMEOUT_SECONDS", 300)
+)
+
+#: Number of async workers processing the KasprApp reconciliation queue
+RECONCILE_WORKERS = int(_getenv("RECONCILE_WORKERS", 16))
+
+#: Sustained rate (per second) at which reconciliations are dequeued
+RECONCILE_QPS = float(_getenv("RECONCILE_QPS", 10.0))
+
+#: Number of reconciliations that may be dequeued in a burst above RECONCILE_QPS
+RECONCILE_BURST = int(_getenv("RECONCILE_BURST", 50))
+
+#: Initial retry delay in seconds for a failed reconciliation (doubles per failure)
+RECONCILE_BACKOFF_BASE_SECONDS = float(
+    _getenv("RECONCILE_BACKOFF_BASE_SECONDS", 1.0)
+)
+
+#: Maximum retry delay in seconds for a failed reconciliation
+RECONCILE_BACKOFF_MAX_SECONDS = float(
+    _getenv("RECONCILE_BACKOFF_MAX_SECONDS", 300.0)
+)
+
+#: Seconds between periodic reconciliations of every KasprApp
+RECONCILE_RESYNC_INTERVAL_SECONDS = float(
+    _getenv("RECONCILE_RESYNC_INTERVAL_SECONDS", 30.0)
+)
+
+#: Maximum number of rendered KasprApp child resource sets kept in memory (0 disables)
+RENDER_CACHE_SIZE = int(_getenv("RENDER_CACHE_SIZE", 512))
+
+#: Maximum number of loaded resource spec models kept in memory (0 disables)
+SPEC_CACHE_SIZE = int(_getenv("SPEC_CACHE_SIZE", 1024))
+
+#: Split KasprApps across all operator replicas instead of a single active one
+SHARDING_ENABLED = bool(_getenv("SHARDING_ENABLED", False))
+
+#: Namespace holding the operator shard leases
+SHARDING_NAMESPACE = _getenv("SHARDING_NAMESPACE", _getenv("POD_NAMESPACE", "default"))
+
+#: Unique identity of this operator replica
+SHARDING_IDENTITY = _getenv("SHARDING_IDENTITY", _getenv("HOSTNAME", "kaspr-operator"))
+
+#: Seconds after its last renewal that an operator replica is considered gone
+SHARDING_LEASE_DURATION_SECONDS = int(_getenv("SHARDING_LEASE_DURATION_SECONDS", 15))
+
+#: Seconds between operator shard lease renewals
+SHARDING_RENEW_INTERVAL_SECONDS = float(
+    _getenv("SHARDING_RENEW_INTERVAL_SECONDS", 5.0)
+)
+
+#: Sync services, config maps and HPAs with server-side apply instead of GET + patch
+SERVER_SIDE_APPLY_ENABLED = bool(_getenv("SERVER_SIDE_APPLY_ENABLED", False))
+
+#: Seconds to collect status updates for an object before patching them at once
+STATUS_PATCH_DEBOUNCE_SECONDS = float(_getenv("STATUS_PATCH_DEBOUNCE_SECONDS", 0.5))
+
+#: Maximum number of kopf workers handling object events at the same time
+KOPF_WORKER_LIMIT = int(_getenv("KOPF_WORKER_LIMIT", 16))
+
+#: Sustained rate (per second) of each verb of kopf's own API requests, i.e.
+#: watches and handler progress/status patches (0 disables limiting)
+KOPF_API_QPS = float(_getenv("KOPF_API_QPS", 10.0))
+
+#: Number of kopf API requests of a verb that may be sent in a burst above KOPF_API_QPS
+KOPF_API_BURST = int(_getenv("KOPF_API_BURST", 20))
+
+#: Sustained rate (per second) of Kubernetes API requests of each verb (0 disables limiting)
+KUBE_API_QPS = float(_getenv("KUBE_API_QPS", 50.0))
+
+#: Number of Kubernetes API requests of a verb that may be sent in a burst above KUBE_API_QPS
+KUBE_API_BURST = int(_getenv("KUBE_API_BURST", 100))
+
+#: Per-verb overrides of KUBE_API_QPS/KUBE_API_BURST, e.g. "patch=20:40,watch=5:10"
+KUBE_API_VERB_LIMITS = str(_getenv("KUBE_API_VERB_LIMITS", ""))
+
+#: Check child resources against a bulk listing on startup and only sync drifted resources
+STARTUP_WARMUP_ENABLED = bool(_getenv("STARTUP_WARMUP_ENABLED", True))
+
+#: Seconds after startup during which the bulk listing of child resources is used
+STARTUP_WARMUP_WINDOW_SECONDS = float(_getenv("STARTUP_WARMUP_WINDOW_SECONDS", 120.0))
+
+#: Window in seconds over which reconciliations of up to date apps are spread on startup
+STARTUP_JITTER_SECONDS = float(_getenv("STARTUP_JITTER_SECONDS", 30.0))
+
+#: Interval in seconds of event loop, queue and connection pool samples (0 disables)
+RUNTIME_MONITOR_INTERVAL_SECONDS = float(
+    _getenv("RUNTIME_MONITOR_INTERVAL_SECONDS", 5.0)
+)
+
+#: Record member metrics per app instead of per member
+METRICS_AGGREGATE_MEMBERS = bool(_getenv("METRICS_AGGREGATE_MEMBERS", False))
+
+#: Maximum number of metric series labelled with a member id (0 = unlimited)
+METRICS_MAX_MEMBER_SERIES = int(_getenv("METRICS_MAX_MEMBER_SERIES", 10000))
+
 class Settings:
     """Operator settings"""
 
@@ -93,10 +224,46 @@ class Settings:
     statefulset_deletion_timeout_seconds: int = STATEFULSET_DELETION_TIMEOUT_SECONDS
     client_status_check_enabled: bool = CLIENT_STATUS_CHECK_ENABLED
     client_status_check_timeout_seconds: float = CLIENT_STATUS_CHECK_TIMEOUT_SECONDS
+    client_status_request_timeout_seconds: float = CLIENT_STATUS_REQUEST_TIMEOUT_SECONDS
+    client_status_cache_ttl_seconds: float = CLIENT_STATUS_CACHE_TTL_SECONDS
+    client_status_max_concurrency: int = CLIENT_STATUS_MAX_CONCURRENCY
+    client_status_connection_limit: int = CLIENT_STATUS_CONNECTION_LIMIT
+    client_status_connection_limit_per_host: int = CLIENT_STATUS_CONNECTION_LIMIT_PER_HOST
+    client_status_dns_cache_ttl_seconds: int = CLIENT_STATUS_DNS_CACHE_TTL_SECONDS
     auto_rebalance_enabled: bool = AUTO_REBALANCE_ENABLED
     hung_member_detection_enabled: bool = HUNG_MEMBER_DETECTION_ENABLED
     hung_rebalancing_threshold_seconds: int = HUNG_REBALANCING_THRESHOLD_SECONDS
     kaspr_image_registry: str = KASPR_IMAGE_REGISTRY
+    informer_cache_enabled: bool = INFORMER_CACHE_ENABLED
+    informer_sync_timeout_seconds: float = INFORMER_SYNC_TIMEOUT_SECONDS
+    informer_watch_timeout_seconds: int = INFORMER_WATCH_TIMEOUT_SECONDS
+    reconcile_workers: int = RECONCILE_WORKERS
+    reconcile_qps: float = RECONCILE_QPS
+    reconcile_burst: int = RECONCILE_BURST
+    reconcile_backoff_base_seconds: float = RECONCILE_BACKOFF_BASE_SECONDS
+    reconcile_backoff_max_seconds: float = RECONCILE_BACKOFF_MAX_SECONDS
+    reconcile_resync_interval_seconds: float = RECONCILE_RESYNC_INTERVAL_SECONDS
+    render_cache_size: int = RENDER_CACHE_SIZE
+    spec_cache_size: int = SPEC_CACHE_SIZE
+    sharding_enabled: bool = SHARDING_ENABLED
+    sharding_namespace: str = SHARDING_NAMESPACE
+    sharding_identity: str = SHARDING_IDENTITY
+    sharding_lease_duration_seconds: int = SHARDING_LEASE_DURATION_SECONDS
+    sharding_renew_interval_seconds: float = SHARDING_RENEW_INTERVAL_SECONDS
+    status_patch_debounce_seconds: float = STATUS_PATCH_DEBOUNCE_SECONDS
+    server_side_apply_enabled: bool = SERVER_SIDE_APPLY_ENABLED
+    kopf_worker_limit: int = KOPF_WORKER_LIMIT
+    kopf_api_qps: float = KOPF_API_QPS
+    kopf_api_burst: int = KOPF_API_BURST
+    kube_api_qps: float = KUBE_API_QPS
+    kube_api_burst: int = KUBE_API_BURST
+    kube_api_verb_limits: str = KUBE_API_VERB_LIMITS
+    startup_warmup_enabled: bool = STARTUP_WARMUP_ENABLED
+    startup_warmup_window_seconds: float = STARTUP_WARMUP_WINDOW_SECONDS
+    startup_jitter_seconds: float = STARTUP_JITTER_SECONDS
+    runtime_monitor_interval_seconds: float = RUNTIME_MONITOR_INTERVAL_SECONDS
+    metrics_aggregate_members: bool = METRICS_AGGREGATE_MEMBERS
+    metrics_max_member_series: int = METRICS_MAX_MEMBER_SERIES
 
     def __init__(
         self,
@@ -110,6 +277,42 @@ class Settings:
         auto_rebalance_enabled: bool = None,
         hung_member_detection_enabled: bool = None,
         hung_rebalancing_threshold_seconds: int = None,
+        informer_cache_enabled: bool = None,
+        informer_sync_timeout_seconds: float = None,
+        informer_watch_timeout_seconds: int = None,
+        reconcile_workers: int = None,
+        reconcile_qps: float = None,
+        reconcile_burst: int = None,
+        reconcile_backoff_base_seconds: float = None,
+        reconcile_backoff_max_seconds: float = None,
+        reconcile_resync_interval_seconds: float = None,
+        render_cache_size: int = None,
+        spec_cache_size: int = None,
+        client_status_request_timeout_seconds: float = None,
+        client_status_cache_ttl_seconds: float = None,
+        client_status_max_concurrency: int = None,
+        client_status_connection_limit: int = None,
+        client_status_connection_limit_per_host: int = None,
+        client_status_dns_cache_ttl_seconds: int = None,
+        sharding_enabled: bool = None,
+        sharding_namespace: str = None,
+        sharding_identity: str = None,
+        sharding_lease_duration_seconds: int = None,
+        sharding_renew_interval_seconds: float = None,
+        status_patch_debounce_seconds: float = None,
+        server_side_apply_enabled: bool = None,
+        kopf_worker_limit: int = None,
+        kopf_api_qps: float = None,
+        kopf_api_burst: int = None,
+        kube_api_qps: float = None,
+        kube_api_burst: int = None,
+        kube_api_verb_limits: str = None,
+        startup_warmup_enabled: bool = None,
+        startup_warmup_window_seconds: float = None,
+        startup_jitter_seconds: float = None,
+        runtime_monitor_interval_seconds: float = None,
+        metrics_aggregate_members: bool = None,
+        metrics_max_member_series: int = None,
         **kwargs,
     ):
         if initial_max_replicas is not None:
@@ -139,4 +342,117 @@ class Settings:
 
         if hung_rebalancing_threshold_seconds is not None:
             self.hung_rebalancing_threshold_seconds = hung_rebalancing_threshold_seconds
-            
+
+        if informer_cache_enabled is not None:
+            self.informer_cache_enabled = informer_cache_enabled
+
+        if informer_sync_timeout_seconds is not None:
+            self.informer_sync_timeout_seconds = informer_sync_timeout_seconds
+
+        if informer_watch_timeout_seconds is not None:
+            self.informer_watch_timeout_seconds = informer_watch_timeout_seconds
+
+        if reconcile_workers is not None:
+            self.reconcile_workers = reconcile_workers
+
+        if reconcile_qps is not None:
+            self.reconcile_qps = reconcile_qps
+
+        if reconcile_burst is not None:
+            self.reconcile_burst = reconcile_burst
+
+        if reconcile_backoff_base_seconds is not None:
+            self.reconcile_backoff_base_seconds = reconcile_backoff_base_seconds
+
+        if reconcile_backoff_max_seconds is not None:
+            self.reconcile_backoff_max_seconds = reconcile_backoff_max_seconds
+
+        if reconcile_resync_interval_seconds is not None:
+            self.reconcile_resync_interval_seconds = reconcile_resync_interval_seconds
+
+        if render_cache_size is not None:
+            self.render_cache_size = render_cache_size
+
+        if spec_cache_size is not None:
+            self.spec_cache_size = spec_cache_size
+
+        if client_status_request_timeout_seconds is not None:
+            self.client_status_request_timeout_seconds = (
+                client_status_request_timeout_seconds
+            )
+
+        if client_status_cache_ttl_seconds is not None:
+            self.client_status_cache_ttl_seconds = client_status_cache_ttl_seconds
+
+        if client_status_max_concurrency is not None:
+            self.client_status_max_concurrency = client_status_max_concurrency
+
+        if client_status_connection_limit is not None:
+            self.client_status_connection_limit = client_status_connection_limit
+
+        if client_status_connection_limit_per_host is not None:
+            self.client_status_connection_limit_per_host = (
+                client_status_connection_limit_per_host
+            )
+
+        if client_status_dns_cache_ttl_seconds is not None:
+            self.client_status_dns_cache_ttl_seconds = (
+                client_status_dns_cache_ttl_seconds
+            )
+
+        if sharding_enabled is not None:
+            self.sharding_enabled = sharding_enabled
+
+        if sharding_namespace is not None:
+            self.sharding_namespace = sharding_namespace
+
+        if sharding_identity is not None:
+            self.sharding_identity = sharding_identity
+
+        if sharding_lease_duration_seconds is not None:
+            self.sharding_lease_duration_seconds = sharding_lease_duration_seconds
+
+        if sharding_renew_interval_seconds is not None:
+            self.sharding_renew_interval_seconds = sharding_renew_interval_seconds
+
+        if status_patch_debounce_seconds is not None:
+            self.status_patch_debounce_seconds = status_patch_debounce_seconds
+
+        if server_side_apply_enabled is not None:
+            self.server_side_apply_enabled = server_side_apply_enabled
+
+        if kopf_worker_limit is not None:
+            self.kopf_worker_limit = kopf_worker_limit
+
+        if kopf_api_qps is not None:
+            self.kopf_api_qps = kopf_api_qps
+
+        if kopf_api_burst is not None:
+            self.kopf_api_burst = kopf_api_burst
+
+        if kube_api_qps is not None:
+            self.kube_api_qps = kube_api_qps
+
+        if kube_api_burst is not None:
+            self.kube_api_burst = kube_api_burst
+
+        if kube_api_verb_limits is not None:
+            self.kube_api_verb_limits = kube_api_verb_limits
+
+        if startup_warmup_enabled is not None:
+            self.startup_warmup_enabled = startup_warmup_enabled
+
+        if startup_warmup_window_seconds is not None:
+            self.startup_warmup_window_seconds = startup_warmup_window_seconds
+
+        if startup_jitter_seconds is not None:
+            self.startup_jitter_seconds = startup_jitter_seconds
+
+        if runtime_monitor_interval_seconds is not None:
+            self.runtime_monitor_interval_seconds = runtime_monitor_interval_seconds
+
+        if metrics_aggregate_members is not None:
+            self.metrics_aggregate_members = metrics_aggregate_members
+
+        if metrics_max_member_series is not None:
+            self.metrics_max_member_series = metrics_max_member_series
@@ -0,0 +1,187 @@
+"""Client-side rate limiting of Kubernetes API requests.
+
+Like client-go's QPS/burst settings, every request sent through the shared
+API client first takes a token from a token bucket. Each verb has its own
+bucket, so e.g. a burst of patches during a cold start cannot starve the
+reads and watches reconciliations depend on. Operator throughput is then
+bounded by the API budget instead of by a fixed number of workers.
+
+The client also reports the latency and outcome of every request by verb
+and resource, so slow reconciliations can be told apart as API-bound.
+
+Kopf sends its own requests (watches, handler progress and status
+patches, events) through a separate client; :func:`pace_kopf_requests`
+gives them a budget of their own.
+
+Example usage:
+```
+    limiter = ApiRateLimiter(qps=50, burst=100, verb_limits={"patch": (20, 40)})
+    api_client = RateLimitedApiClient(limiter=limiter)
+```
+"""
+
+import asyncio
+import time
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.rest import ApiException
+
+from kaspr.utils.workqueue import TokenBucket
+
+#: HTTP method -> API verb
+VERBS = {
+    "GET": "get",
+    "HEAD": "get",
+    "OPTIONS": "get",
+    "POST": "create",
+    "PUT": "update",
+    "PATCH": "patch",
+    "DELETE": "delete",
+}
+
+
+def parse_verb_limits(value: str) -> Dict[str, Tuple[float, int]]:
+    """Parse per-verb limits given as ``verb=qps:burst`` pairs.
+
+    For example ``"patch=20:40,watch=5:10"``. A missing burst defaults to
+    the qps (at least 1).
+    """
+    limits = {}
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        verb, _, limit = item.partition("=")
+        qps, _, burst = limit.partition(":")
+        qps = float(qps)
+        limits[verb.strip().lower()] = (qps, int(burst) if burst else max(1, int(qps)))
+    return limits
+
+
+def request_verb(method: str, query_params=None) -> str:
+    """API verb of a request; watch requests are told apart from reads."""
+    verb = VERBS.get(method.upper(), method.lower())
+    if verb == "get" and query_params:
+        for key, value in query_params:
+            if key == "watch" and value:
+                return "watch"
+    return verb
+
+
+def request_resource(url: str) -> str:
+    """Resource (and subresource) a request URL targets, e.g. ``pods/exec``.
+
+    Names of namespaces and objects are dropped to keep the number of
+    distinct values bounded.
+    """
+    parts = [part for part in urlsplit(url).path.split("/") if part]
+    if parts[:1] == ["api"]:
+        parts = parts[2:]
+    elif parts[:1] == ["apis"]:
+        parts = parts[3:]
+    if len(parts) > 2 and parts[0] == "namespaces":
+        parts = parts[2:]
+    if not parts:
+        return ""
+    if len(parts) > 2:
+        return f"{parts[0]}/{parts[2]}"
+    return parts[0]
+
+
+class ApiRateLimiter:
+    """Token buckets of outgoing API requests, one per verb.
+
+    Args:
+        qps: Sustained requests per second of every verb (0 disables limiting)
+        burst: Requests of a verb that may be sent in a burst above ``qps``
+        verb_limits: (qps, burst) of specific verbs, overriding the defaults
+    """
+
+    #: Notified of the queueing delay of every request (see ``on_api_rate_limit_wait``)
+    sensor = None
+
+    def __init__(
+        self,
+        qps: float = 50.0,
+        burst: int = 100,
+        verb_limits: Optional[Mapping[str, Tuple[float, int]]] = None,
+    ):
+        self.qps = qps
+        self.burst = burst
+        self.verb_limits = dict(verb_limits or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, verb: str) -> TokenBucket:
+        """Token bucket of ``verb``."""
+        bucket = self._buckets.get(verb)
+        if bucket is None:
+            qps, burst = self.verb_limits.get(verb, (self.qps, self.burst))
+            bucket = self._buckets[verb] = TokenBucket(qps, burst)
+        return bucket
+
+    async def acquire(self, verb: str) -> float:
+        """Wait for a token of ``verb``; returns the seconds waited."""
+        delay = self.bucket(verb).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.sensor is not None:
+            self.sensor.on_api_rate_limit_wait(verb, delay)
+        return delay
+
+
+class RateLimitedApiClient(ApiClient):
+    """``ApiClient`` that paces its requests with an :class:`ApiRateLimiter`."""
+
+    limiter: Optional[ApiRateLimiter] = None
+
+    #: Notified of the latency of every request (see ``on_api_request``)
+    sensor = None
+
+    def __init__(self, *args, limiter: Optional[ApiRateLimiter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter
+
+    async def request(self, method, url, query_params=None, *args, **kwargs):
+        verb = request_verb(method, query_params)
+        if self.limiter is not None:
+            await self.limiter.acquire(verb)
+        if self.sensor is None:
+            return await super().request(method, url, query_params, *args, **kwargs)
+        code = "error"
+        start_time = time.monotonic()
+        try:
+            response = await super().request(
+                method, url, query_params, *args, **kwargs
+            )
+            code = str(getattr(response, "status", 200))
+            return response
+        except ApiException as e:
+            code = str(e.status or code)
+            raise
+        finally:
+            self.sensor.on_api_request(
+                verb, request_resource(url), code, time.monotonic() - start_time
+            )
+
+
+def pace_kopf_requests(limiter: ApiRateLimiter):
+    """Pace the API requests kopf sends with its own client through ``limiter``.
+
+    Every request of kopf's client, including the (re)connections of its
+    watch streams, goes through ``kopf._cogs.clients.api.request``, which
+    is wrapped to take a token of the request's verb first. Calling this
+    again replaces the limiter.
+    """
+    from kopf._cogs.clients import api
+
+    request = getattr(api.request, "__wrapped__", api.request)
+
+    async def paced_request(method: str, url: str, *args, **kwargs):
+        query = parse_qsl(urlsplit(url).query)
+        await limiter.acquire(request_verb(method, query))
+        return await request(method, url, *args, **kwargs)
+
+    paced_request.__wrapped__ = request
+    api.request = paced_request
@@ -0,0 +1,63 @@
+"""Concurrent execution of dependent async steps."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+#: A step is an async callable plus the names of the steps it depends on
+Step = Tuple[Callable[[], Awaitable], Sequence[str]]
+
+
+class DependencyFailed(Exception):
+    """Raised for a step that was skipped because a dependency failed."""
+
+
+async def run_steps(
+    steps: Dict[str, Step],
+    on_step_complete: Optional[Callable[[str, float, bool], None]] = None,
+):
+    """Run ``steps`` concurrently, each one after all of its dependencies.
+
+    Steps must be declared after the steps they depend on. Independent steps
+    run concurrently; a step whose dependency failed is skipped. Once every
+    step has finished or been skipped, the first step error is raised.
+
+    Args:
+        steps: Mapping of step name to (async callable, dependency names)
+        on_step_complete: Called with (name, duration seconds, success) after
+            each step that ran
+    """
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run(name: str, func: Callable[[], Awaitable], deps: Sequence[str]):
+        if deps:
+            results = await asyncio.gather(
+                *(tasks[dep] for dep in deps), return_exceptions=True
+            )
+            if any(isinstance(result, BaseException) for result in results):
+                raise DependencyFailed(name)
+        start = time.monotonic()
+        success = False
+        try:
+            await func()
+            success = True
+        finally:
+            if on_step_complete is not None:
+                on_step_complete(name, time.monotonic() - start, success)
+
+    declared = set()
+    for name, (_, deps) in steps.items():
+        unknown = [dep for dep in deps if dep not in declared]
+        if unknown:
+            raise ValueError(f"Step `{name}` depends on undeclared steps {unknown}")
+        declared.add(name)
+
+    for name, (func, deps) in steps.items():
+        tasks[name] = asyncio.ensure_future(run(name, func, deps))
+
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(
+            result, DependencyFailed
+        ):
+            raise result
@@ -1,6 +1,32 @@
 """GCS utility functions for Python packages cache."""
 
+import json
 import re
+from typing import List, NamedTuple, Optional
+
+
+class Compression(NamedTuple):
+    """How package archives are compressed."""
+
+    extension: str
+    content_type: str
+    command: str
+    default_level: int
+    max_level: int
+
+
+#: Supported archive compressors, keyed by ``cache.gcs.compression``
+COMPRESSIONS = {
+    "gzip": Compression(".tar.gz", "application/gzip", "gzip", 6, 9),
+    "zstd": Compression(".tar.zst", "application/zstd", "zstd", 3, 19),
+}
+
+DEFAULT_COMPRESSION = "gzip"
+
+#: Bytes sent per resumable upload request, a multiple of 256 KiB
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+_UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
 
 
 # K8s-style size suffixes to bytes multipliers
@@ -19,13 +45,54 @@ _SIZE_SUFFIXES = {
 _SIZE_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*([A-Za-z]*)$')
 
 
-def build_gcs_object_key(prefix: str, app_name: str, packages_hash: str) -> str:
+def get_compression(name: Optional[str]) -> Compression:
+    """Look up an archive compressor by name (default: gzip).
+
+    Raises:
+        ValueError: If the compressor is not supported
+    """
+    try:
+        return COMPRESSIONS[name or DEFAULT_COMPRESSION]
+    except KeyError:
+        raise ValueError(
+            f"Unknown compression: {name}. Must be one of {sorted(COMPRESSIONS)}"
+        ) from None
+
+
+def compression_commands(
+    compression: Optional[str] = None, level: Optional[int] = None
+) -> "tuple[List[str], List[str]]":
+    """Build the (compress, decompress) commands of an archive compressor.
+
+    Both commands filter stdin to stdout, so archives are streamed through
+    them without being written to disk.
+
+    Raises:
+        ValueError: If the compressor or level is not supported
+    """
+    codec = get_compression(compression)
+    if level is None:
+        level = codec.default_level
+    if not 1 <= level <= codec.max_level:
+        raise ValueError(
+            f"Invalid {compression or DEFAULT_COMPRESSION} compression level: "
+            f"{level}. Must be between 1 and {codec.max_level}"
+        )
+    if codec.command == "zstd":
+        return ["zstd", "-q", "-T0", f"-{level}"], ["zstd", "-q", "-d", "-c"]
+    return [codec.command, f"-{level}"], [codec.command, "-d", "-c"]
+
+
+def build_gcs_object_key(
+    prefix: str, app_name: str, packages_hash: str, compression: str = None
+) -> str:
     """Build the GCS object key for a packages archive.
     
     Args:
         prefix: Key prefix (e.g., "kaspr-packages/")
         app_name: Application name
         packages_hash: Hash of the packages spec
+        compression: Archive compressor, determines the extension (default: gzip)
         
     Returns:
         Object key string, e.g. "kaspr-packages/my-app/a1b2c3d4e5f6g7h8.tar.gz"
@@ -33,7 +100,8 @@ def build_gcs_object_key(prefix: str, app_name: str, packages_hash: str) -> str:
     # Ensure prefix ends with /
     if prefix and not prefix.endswith("/"):
         prefix = prefix + "/"
-    return f"{prefix}{app_name}/{packages_hash}.tar.gz"
+    extension = get_compression(compression).extension
+    return f"{prefix}{app_name}/{packages_hash}{extension}"
 
 
 def parse_size_to_bytes(size_str: str) -> int:
@@ -134,44 +202,70 @@ def get_access_token():
 '''
 
 
-def generate_gcs_download_python_script(sa_key_path: str = "/var/run/secrets/gcs/sa.json") -> str:
-    """Generate inline Python code for downloading an archive from GCS.
+def _generate_gcs_request_python_script() -> str:
+    """Generate inline Python code shared by the download and upload scripts.
+
+    Requests go to ``STORAGE_EMULATOR_HOST`` instead of GCS when it is set
+    (the convention of the Google Cloud client libraries), in which case no
+    access token is requested.
+    """
+    return '''
+bucket = os.environ["GCS_BUCKET"]
+object_key = os.environ["GCS_OBJECT_KEY"]
+_safe = ""
+emulator = os.environ.get("STORAGE_EMULATOR_HOST", "").rstrip("/")
+endpoint = emulator or "https://storage.googleapis.com"
+
+def auth_headers():
+    if emulator:
+        return {}
+    return {"Authorization": f"Bearer {get_access_token()}"}
+
+def stop(*procs):
+    for proc in procs:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+'''
+
+
+def generate_gcs_download_python_script(
+    sa_key_path: str = "/var/run/secrets/gcs/sa.json",
+    extract_dir: str = "/opt/kaspr/packages",
+    compression: str = None,
+) -> str:
+    """Generate inline Python code for streaming an archive from GCS.
     
-    The script reads GCS_BUCKET and GCS_OBJECT_KEY from environment variables.
-    Returns exit code 0 on success (cache hit), 1 on 404 (cache miss).
+    The archive is piped from the HTTP response through the decompressor
+    into ``tar`` as it downloads, so it is never stored on disk or held in
+    memory. The script reads GCS_BUCKET and GCS_OBJECT_KEY from environment
+    variables. Returns exit code 0 on success (cache hit), 1 on 404 (cache
+    miss) or any failure before extraction started, and 2 if extraction
+    failed midway, leaving a partial tree in ``extract_dir``.
     
     Args:
         sa_key_path: Path to mounted SA key JSON file
+        extract_dir: Directory the archive is extracted into
+        compression: Archive compressor (default: gzip)
         
     Returns:
         Complete Python script as string
     """
     auth_script = generate_gcs_auth_python_script(sa_key_path)
+    _, decompress = compression_commands(compression)
     return f'''{auth_script}
 
 import sys
-
-bucket = os.environ["GCS_BUCKET"]
-object_key = os.environ["GCS_OBJECT_KEY"]
-_safe = ""
-
+{_generate_gcs_request_python_script()}
 try:
-    token = get_access_token()
+    headers = auth_headers()
 except Exception as e:
     print(f"GCS auth failed: {{e}}")
     sys.exit(1)
 
-url = f"https://storage.googleapis.com/storage/v1/b/{{urllib.parse.quote(bucket, safe=_safe)}}/o/{{urllib.parse.quote(object_key, safe=_safe)}}?alt=media"
-req = urllib.request.Request(url, headers={{"Authorization": f"Bearer {{token}}"}})
+url = f"{{endpoint}}/storage/v1/b/{{urllib.parse.quote(bucket, safe=_safe)}}/o/{{urllib.parse.quote(object_key, safe=_safe)}}?alt=media"
 try:
-    with urllib.request.urlopen(req) as r, open("/tmp/packages.tar.gz", "wb") as f:
-        while True:
-            chunk = r.read(65536)
-            if not chunk:
-                break
-            f.write(chunk)
-    print("Cache hit - downloaded archive from GCS")
-    sys.exit(0)
+    response = urllib.request.urlopen(urllib.request.Request(url, headers=headers))
 except urllib.error.HTTPError as e:
     if e.code == 404:
         print("Cache miss - archive not found in GCS")
@@ -181,54 +275,173 @@ except urllib.error.HTTPError as e:
 except Exception as e:
     print(f"GCS download failed: {{e}}")
     sys.exit(1)
+
+# Stream the response through the decompressor into tar
+decompress = subprocess.Popen({json.dumps(decompress)}, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+untar = subprocess.Popen(["tar", "-x", "-C", {json.dumps(extract_dir)}], stdin=decompress.stdout)
+decompress.stdout.close()
+size = 0
+try:
+    with response:
+        while True:
+            chunk = response.read(1048576)
+            if not chunk:
+                break
+            decompress.stdin.write(chunk)
+            size += len(chunk)
+    decompress.stdin.close()
+except Exception as e:
+    print(f"GCS download failed after {{size}} bytes: {{e}}")
+    stop(decompress, untar)
+    sys.exit(2)
+if decompress.wait() != 0 or untar.wait() != 0:
+    print(f"Failed to extract cached archive after {{size}} bytes")
+    sys.exit(2)
+print(f"Cache hit - extracted {{size}} bytes from GCS")
+sys.exit(0)
 '''
 
 
 def generate_gcs_upload_python_script(
     sa_key_path: str = "/var/run/secrets/gcs/sa.json",
-    archive_path: str = "/tmp/packages.tar.gz",
+    source_dir: str = "/opt/kaspr/packages",
+    max_archive_size_bytes: int = 1073741824,  # 1Gi
+    compression: str = None,
+    compression_level: int = None,
+    chunk_size_bytes: int = DEFAULT_UPLOAD_CHUNK_SIZE,
 ) -> str:
-    """Generate inline Python code for uploading an archive to GCS.
+    """Generate inline Python code for streaming an archive to GCS.
+    
+    ``tar`` output is piped through the compressor and sent to a GCS
+    resumable upload session in ``chunk_size_bytes`` requests while the
+    archive is still being produced, so at most two chunks are held in
+    memory and nothing is written to disk. Chunks GCS did not persist are
+    resent, and a failed request is retried from the offset GCS reports.
+    The object only becomes visible once the last chunk is committed; the
+    session is cancelled if the archive grows beyond
+    ``max_archive_size_bytes`` or ``tar`` fails.
     
     The script reads GCS_BUCKET and GCS_OBJECT_KEY from environment variables.
     Non-fatal: logs errors but always exits 0.
     
     Args:
         sa_key_path: Path to mounted SA key JSON file
-        archive_path: Path to the archive file to upload
+        source_dir: Directory to archive
+        max_archive_size_bytes: Maximum compressed archive size to upload
+        compression: Archive compressor (default: gzip)
+        compression_level: Compression level (default depends on compressor)
+        chunk_size_bytes: Bytes per upload request, a multiple of 256 KiB
         
     Returns:
         Complete Python script as string
+        
+    Raises:
+        ValueError: If the compression or chunk size is invalid
     """
+    if chunk_size_bytes <= 0 or chunk_size_bytes % _UPLOAD_CHUNK_ALIGNMENT:
+        raise ValueError(
+            f"Upload chunk size must be a positive multiple of "
+            f"{_UPLOAD_CHUNK_ALIGNMENT} bytes, got {chunk_size_bytes}"
+        )
     auth_script = generate_gcs_auth_python_script(sa_key_path)
+    compress, _ = compression_commands(compression, compression_level)
+    content_type = get_compression(compression).content_type
     return f'''{auth_script}
 
-bucket = os.environ["GCS_BUCKET"]
-object_key = os.environ["GCS_OBJECT_KEY"]
-_safe = ""
+import sys
+{_generate_gcs_request_python_script()}
+CHUNK_SIZE = {chunk_size_bytes}
+MAX_SIZE = {max_archive_size_bytes}
+
+class ArchiveTooLarge(Exception):
+    pass
+
+def request(url, method, data=b"", headers=None):
+    req = urllib.request.Request(url, data=data, method=method, headers=dict(auth, **(headers or {{}})))
+    try:
+        with urllib.request.urlopen(req) as r:
+            return r.status, r.headers
+    except urllib.error.HTTPError as e:
+        # 308 Resume Incomplete: GCS is waiting for more chunks
+        if e.code == 308:
+            return e.code, e.headers
+        raise
+
+def persisted(headers):
+    # Range of a 308 response is "bytes=0-<last persisted byte>"
+    rng = headers.get("Range")
+    return int(rng.rsplit("-", 1)[1]) + 1 if rng else 0
 
+def put_chunk(session, data, offset, total="*", attempts=3):
+    # Returns the offset GCS has persisted up to
+    for attempt in range(1, attempts + 1):
+        try:
+            status, headers = request(session, "PUT", data, {{"Content-Range": f"bytes {{offset}}-{{offset + len(data) - 1}}/{{total}}"}})
+            return persisted(headers) if status == 308 else offset + len(data)
+        except (urllib.error.URLError, OSError) as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code < 500 and e.code != 429:
+                raise
+            if attempt == attempts:
+                raise
+            print(f"GCS upload of bytes {{offset}}+ failed ({{e}}), retrying")
+            time.sleep(2 ** attempt)
+            status, headers = request(session, "PUT", b"", {{"Content-Range": f"bytes */{{total}}"}})
+            if status != 308:
+                return offset + len(data)
+            done = persisted(headers)
+            data, offset = data[done - offset:], done
+
+tar = compress = session = None
 try:
-    token = get_access_token()
-    
-    with open("{archive_path}", "rb") as f:
-        file_data = f.read()
-    
+    auth = auth_headers()
     upload_url = (
-        f"https://storage.googleapis.com/upload/storage/v1/b/"
+        f"{{endpoint}}/upload/storage/v1/b/"
         f"{{urllib.parse.quote(bucket, safe=_safe)}}/o"
-        f"?uploadType=media&name={{urllib.parse.quote(object_key, safe=_safe)}}"
-    )
-    req = urllib.request.Request(
-        upload_url,
-        data=file_data,
-        method="POST",
-        headers={{
-            "Authorization": f"Bearer {{token}}",
-            "Content-Type": "application/gzip",
-        }},
+        f"?uploadType=resumable&name={{urllib.parse.quote(object_key, safe=_safe)}}"
     )
-    urllib.request.urlopen(req)
-    print("Uploaded packages archive to GCS cache")
+    _, headers = request(upload_url, "POST", headers={{"X-Upload-Content-Type": "{content_type}"}})
+    session = headers["Location"]
+
+    tar = subprocess.Popen(["tar", "-c", "-C", {json.dumps(source_dir)}, "."], stdout=subprocess.PIPE)
+    compress = subprocess.Popen({json.dumps(compress)}, stdin=tar.stdout, stdout=subprocess.PIPE)
+    tar.stdout.close()
+
+    # Only full chunks are sent until the archive ends, the last one
+    # carries the total size and commits the object.
+    offset, buffer = 0, b""
+    while True:
+        while len(buffer) <= CHUNK_SIZE:
+            data = compress.stdout.read(CHUNK_SIZE)
+            if not data:
+                break
+            buffer += data
+            if offset + len(buffer) > MAX_SIZE:
+                raise ArchiveTooLarge(f"Archive size exceeds limit ({{MAX_SIZE}} bytes), skipping upload")
+        if len(buffer) <= CHUNK_SIZE:
+            break
+        done = put_chunk(session, buffer[:CHUNK_SIZE], offset)
+        if done <= offset:
+            raise RuntimeError(f"GCS persisted no bytes after offset {{offset}}")
+        buffer, offset = buffer[done - offset:], done
+
+    if tar.wait() != 0 or compress.wait() != 0:
+        raise RuntimeError("failed to create archive")
+    total = offset + len(buffer)
+    put_chunk(session, buffer, offset, total)
+    session = None
+    print(f"Uploaded packages archive to GCS cache ({{total}} bytes)")
+except ArchiveTooLarge as e:
+    print(e)
 except Exception as e:
     print(f"GCS upload failed (non-fatal): {{e}}")
+finally:
+    for proc in (compress, tar):
+        if proc is not None:
+            stop(proc)
+    if session is not None:
+        # Cancel the session so no partial object is left behind
+        try:
+            request(session, "DELETE")
+        except Exception:
+            pass
 '''
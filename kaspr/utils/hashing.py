@@ -0,0 +1,100 @@
+"""Canonical hashing of resource specs.
+
+Two digest modes are provided:
+
+* :func:`compat_digest` reproduces the historical ``BaseResource.compute_hash``
+  output (jsonpickle canonical JSON -> murmur3 128 -> SHA-256, first 16 hex
+  characters) bit for bit, so digests stored in ``kaspr.io/resource-hash``
+  annotations and ``*_HASH`` env vars remain valid. Plain JSON data is
+  encoded in a single pass by the C JSON encoder with ``sort_keys`` instead
+  of building a sorted copy and running it through jsonpickle; anything
+  else falls back to the legacy encoding.
+* :func:`fast_digest` is for digests that are only compared in memory
+  (e.g. actual vs desired watch fields). It encodes compactly, also handles
+  kubernetes models via ``to_dict()``, and hashes once with murmur3.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import mmh3
+
+from kaspr.utils.helpers import canonicalize_dict
+
+_SCALARS = (str, int, float, bool, type(None))
+
+# Matches the encoding jsonpickle produces for plain JSON data
+_compat_encoder = json.JSONEncoder(sort_keys=True)
+_fast_encoder = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    default=lambda obj: obj.to_dict() if hasattr(obj, "to_dict") else str(obj),
+)
+
+
+def _is_plain(data: Any) -> bool:
+    """True if ``data`` only contains JSON-native dicts, lists and scalars.
+
+    Tuples, non-string keys and other types are encoded differently by
+    jsonpickle and must take the legacy path.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            for key, value in item.items():
+                if type(key) is not str:
+                    return False
+                stack.append(value)
+        elif kind is list:
+            stack.extend(item)
+        elif kind not in _SCALARS:
+            return False
+    return True
+
+
+def canonical_json(data: dict) -> str:
+    """Canonical JSON identical to :func:`kaspr.utils.helpers.canonicalize_dict`."""
+    if _is_plain(data):
+        return _compat_encoder.encode(data)
+    return canonicalize_dict(data)
+
+
+def _finalize_compat(murmur: int) -> str:
+    return hashlib.sha256(str(murmur).encode("utf-8")).hexdigest()[:16]
+
+
+def compat_digest(data: Any) -> str:
+    """16 character digest compatible with historical resource hashes."""
+    if isinstance(data, dict):
+        _data = canonical_json(data)
+    elif isinstance(data, str):
+        _data = data.encode()
+    else:
+        raise ValueError(f"Hash of {type(data)} is not supported.")
+    return _finalize_compat(mmh3.hash128(_data))
+
+
+def legacy_digest(data: Any) -> str:
+    """The original compute_hash implementation, kept as a reference."""
+    if isinstance(data, dict):
+        _data = canonicalize_dict(data)
+    elif isinstance(data, str):
+        _data = data.encode()
+    else:
+        raise ValueError(f"Hash of {type(data)} is not supporetd.")
+    return _finalize_compat(mmh3.hash128(_data))
+
+
+def fast_digest(data: Any) -> str:
+    """16 character digest for in-memory comparisons only.
+
+    Not compatible with :func:`compat_digest`; never persist these digests.
+    """
+    if isinstance(data, str):
+        encoded = data.encode()
+    else:
+        encoded = _fast_encoder.encode(data).encode()
+    return format(mmh3.hash128(encoded), "032x")[:16]
@@ -281,6 +281,51 @@ def upsert_condition(conds, newc):
         conds.append({**newc, "lastTransitionTime": now()})
     return conds
 
+#: Status fields that change on every status computation
+VOLATILE_STATUS_FIELDS = frozenset({"lastUpdateTime"})
+
+
+def _without_volatile(data, volatile):
+    if isinstance(data, Mapping):
+        return {
+            k: _without_volatile(v, volatile)
+            for k, v in data.items()
+            if k not in volatile
+        }
+    if isinstance(data, list):
+        return [_without_volatile(v, volatile) for v in data]
+    return data
+
+
+def status_delta(current: Mapping, update: Mapping, volatile=VOLATILE_STATUS_FIELDS) -> dict:
+    """Return the entries of a status update that change the current status.
+
+    Entries are compared ignoring ``volatile`` fields at any depth, so an
+    entry whose only difference is e.g. a timestamp refreshed on every
+    cycle is dropped. Entries that did change are returned in full,
+    volatile fields included. Removing a field that is not set is not a
+    change. An empty result means no status patch is needed.
+    """
+    current = current or {}
+    delta = {}
+    for key, value in update.items():
+        if key in volatile:
+            continue
+        previous = current.get(key)
+        if value is None and previous is None:
+            continue
+        if key in current and _without_volatile(value, volatile) == _without_volatile(
+            previous, volatile
+        ):
+            continue
+        delta[key] = value
+    if delta:
+        for key in volatile:
+            if key in update:
+                delta[key] = update[key]
+    return delta
+
+
 def deep_compare_dict(data1, data2) -> bool:
     """Compare two data structures deeply, handling nested structures and type normalization.
     
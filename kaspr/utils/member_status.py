@@ -0,0 +1,87 @@
+"""Incremental store of app member statuses.
+
+Keeps the last status reported by every app member together with the UID of
+the pod that reported it. A status is reused until it is older than the TTL
+or the member's pod is replaced, and concurrent fetches of the same app
+share a single request.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+class MemberSnapshot:
+    """Last status of one member."""
+
+    __slots__ = ("pod_uid", "status", "fetched_at")
+
+    def __init__(self, pod_uid: Optional[str], status: Dict, fetched_at: float):
+        self.pod_uid = pod_uid
+        self.status = status
+        self.fetched_at = fetched_at
+
+
+class MemberStatusStore:
+    """Member status snapshots of all apps, keyed by app and member id."""
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._snapshots: Dict[Hashable, Dict[int, MemberSnapshot]] = {}
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def fresh(self, app: Hashable, member_id: int, pod_uid: Optional[str]) -> Optional[Dict]:
+        """Return the cached status of a member if it can be reused.
+
+        A status is only reused for the same pod UID and within the TTL.
+        """
+        snapshot = self._snapshots.get(app, {}).get(member_id)
+        if snapshot is None or pod_uid is None or snapshot.pod_uid != pod_uid:
+            return None
+        if time.monotonic() - snapshot.fetched_at > self.ttl:
+            return None
+        return snapshot.status
+
+    def update(
+        self,
+        app: Hashable,
+        statuses: Dict[int, Tuple[Optional[str], Dict]],
+        reused: Set[int] = frozenset(),
+    ):
+        """Replace the snapshot of ``app``.
+
+        Args:
+            app: App key
+            statuses: Member id to (pod UID, status) of every member that
+                reported a status
+            reused: Ids of members whose status was served from the store
+        """
+        previous = self._snapshots.get(app, {})
+        fetched_at = time.monotonic()
+        current: Dict[int, MemberSnapshot] = {}
+        for member_id, (pod_uid, status) in statuses.items():
+            before = previous.get(member_id)
+            if member_id in reused and before is not None:
+                current[member_id] = before
+            else:
+                current[member_id] = MemberSnapshot(pod_uid, status, fetched_at)
+        self._snapshots[app] = current
+
+    async def single_flight(self, app: Hashable, fetch: Callable[[], Awaitable]):
+        """Run ``fetch`` for ``app`` unless one is already running; share its result."""
+        future = self._in_flight.get(app)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._in_flight[app] = future
+
+            def done(f: asyncio.Future):
+                if self._in_flight.get(app) is f:
+                    del self._in_flight[app]
+
+            future.add_done_callback(done)
+        # A cancelled caller must not cancel the fetch other callers wait on
+        return await asyncio.shield(future)
+
+    def forget(self, app: Hashable):
+        """Drop all snapshots of ``app``."""
+        self._snapshots.pop(app, None)
@@ -0,0 +1,188 @@
+"""Coalescing bus of patch requests for kaspr resources.
+
+Handlers request field updates of an object (usually its status) from
+outside of kopf handlers, e.g. when a referenced object appears. Pending
+requests of an object are merged into a single merge patch, which is
+applied once the object's debounce window elapses or when flushed on
+demand. Nothing is polled: an object without pending requests costs no
+timer, and its entry is dropped after the flush or when the object is
+deleted.
+
+Example usage:
+```
+    # Request to patch annotations and status in one pass
+    patch_bus.request(
+        "KasprApp",
+        namespace,
+        name,
+        [
+            {
+                "field": "metadata.annotations",
+                "value": {"kaspr.io/last-applied-agents-hash": "xyz"},
+            },
+            {
+                "field": "status",
+                "value": {"agents": [{"name": "agent-1", "status": "running"}]},
+            },
+        ],
+    )
+```
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
+
+from kubernetes_asyncio.client.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+#: (kind, namespace, name) of an object
+ObjectKey = Tuple[str, Optional[str], str]
+
+#: A ``{"field": "status", "value": {...}}`` request or a list of them
+PatchRequest = Union[Mapping, List[Mapping]]
+
+#: Applies a merge patch to the named object: (name, namespace, patch)
+Patcher = Callable[[str, Optional[str], Dict], Awaitable]
+
+#: Client errors that may succeed when retried (timeout, conflict, throttling)
+TRANSIENT_CLIENT_ERRORS = (408, 409, 429)
+
+
+def is_transient(error: Exception) -> bool:
+    """True if a patch that failed with ``error`` may succeed later."""
+    if isinstance(error, ApiException):
+        return error.status in TRANSIENT_CLIENT_ERRORS or (error.status or 0) >= 500
+    # Connection errors and timeouts
+    return True
+
+
+def merge_patch(target: Dict, patch: Mapping) -> Dict:
+    """Merge ``patch`` into ``target`` in place; later values win."""
+    for key, value in patch.items():
+        if isinstance(value, Mapping) and isinstance(target.get(key), dict):
+            merge_patch(target[key], value)
+        elif isinstance(value, Mapping):
+            target[key] = merge_patch({}, value)
+        else:
+            target[key] = value
+    return target
+
+
+class PatchBus:
+    """Pending merge patches of kaspr objects, keyed by kind/namespace/name."""
+
+    def __init__(self, debounce_seconds: float = 0.5, retry_seconds: float = 5.0):
+        self.debounce_seconds = debounce_seconds
+        self.retry_seconds = retry_seconds
+        self._patchers: Dict[str, Patcher] = {}
+        self._pending: Dict[ObjectKey, Dict] = {}
+        self._handles: Dict[ObjectKey, asyncio.TimerHandle] = {}
+        self._flushes: Set[asyncio.Task] = set()
+
+    def register(self, kind: str, patcher: Patcher):
+        """Apply the patches of ``kind`` objects with ``patcher``."""
+        self._patchers[kind] = patcher
+
+    def request(
+        self, kind: str, namespace: Optional[str], name: str, request: PatchRequest
+    ):
+        """Merge field updates into the pending patch of an object.
+
+        The patch is applied after the debounce window; further requests
+        within the window join the same patch.
+        """
+        key = (kind, namespace, name)
+        pending = self._pending.setdefault(key, {})
+        for req in request if isinstance(request, list) else [request]:
+            value = req["value"]
+            for field in reversed(req["field"].split(".")):
+                value = {field: value}
+            merge_patch(pending, value)
+        self._schedule(key, self.debounce_seconds)
+
+    def pending(self, kind: str, namespace: Optional[str], name: str) -> Optional[Dict]:
+        """The patch waiting to be applied to an object, if any."""
+        return self._pending.get((kind, namespace, name))
+
+    def _schedule(self, key: ObjectKey, delay: float):
+        if key in self._handles:
+            return
+        loop = asyncio.get_running_loop()
+        self._handles[key] = loop.call_later(delay, self._start_flush, key)
+
+    def _start_flush(self, key: ObjectKey):
+        self._handles.pop(key, None)
+        task = asyncio.create_task(self.flush(*key), name=f"patch-{'/'.join(map(str, key))}")
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self, kind: str, namespace: Optional[str], name: str) -> bool:
+        """Apply the pending patch of an object now; returns True if one was applied.
+
+        A patch that failed with a transient error is merged back under
+        newer requests and retried. Other failures (e.g. a status rejected
+        by validation) would fail again, so the patch is dropped and newer
+        requests are applied on their own.
+        """
+        key = (kind, namespace, name)
+        handle = self._handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        patch = self._pending.pop(key, None)
+        if not patch:
+            return False
+        patcher = self._patchers.get(kind)
+        if patcher is None:
+            logger.warning(f"No patcher registered for {kind}, dropping patch of {name}")
+            return False
+        try:
+            await patcher(name, namespace, patch)
+        except Exception as e:
+            if isinstance(e, ApiException) and e.status == 404:
+                # Deleted before the patch was applied
+                return False
+            if not is_transient(e):
+                logger.error(f"Failed to patch {kind} {name}, dropping patch {patch}: {e}")
+                return False
+            self._retry(key, patch, e)
+            return False
+        return True
+
+    def _retry(self, key: ObjectKey, patch: Dict, error: Exception):
+        logger.warning(f"Failed to patch {key[0]} {key[2]}, retrying: {error}")
+        self._pending[key] = merge_patch(patch, self._pending.get(key, {}))
+        self._schedule(key, self.retry_seconds)
+
+    async def flush_all(self):
+        """Apply the pending patches of all objects now."""
+        for key in list(self._pending):
+            await self.flush(*key)
+
+    def forget(self, kind: str, namespace: Optional[str], name: str):
+        """Drop the pending patch of a deleted object."""
+        key = (kind, namespace, name)
+        self._pending.pop(key, None)
+        handle = self._handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    async def close(self):
+        """Cancel scheduled and running flushes; pending patches are dropped."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self._pending.clear()
+        for task in list(self._flushes):
+            task.cancel()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        self._flushes.clear()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+# Shared by the handlers of all kaspr resources
+patch_bus = PatchBus()
@@ -0,0 +1,107 @@
+"""Periodic samples of the operator's own runtime health.
+
+Every interval the monitor sleeps on the event loop and measures how late
+it woke up. Under CPU-bound load (e.g. rendering or diffing many resources)
+the loop is busy and this lag grows, while API-bound load shows up as
+request latency instead. Along with the lag it samples the number of live
+asyncio tasks, the depth of work queues, the utilisation of HTTP
+connection pools and the hit counts of in-memory caches, and reports
+everything to the sensor.
+
+Example usage:
+```
+    runtime_monitor.start(
+        sensor,
+        interval_seconds=5.0,
+        queues={"reconciliation": lambda: len(reconciliation_queue)},
+        pools={"member_status": status_client.pool_usage},
+        caches={"spec": spec_memo.usage},
+    )
+```
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+#: Name prefix of the per-object worker tasks kopf spawns for watch events
+KOPF_WORKER_PREFIX = "worker for "
+
+#: Returns (connections in use, connection limit, requests in flight)
+PoolUsage = Callable[[], Tuple[int, int, int]]
+
+#: Returns (hits, misses, entries) of a cache
+CacheUsage = Callable[[], Tuple[int, int, int]]
+
+
+def count_kopf_workers(tasks: Iterable[asyncio.Task]) -> int:
+    """Number of objects kopf is currently processing events of."""
+    return sum(
+        1 for task in tasks if task.get_name().startswith(KOPF_WORKER_PREFIX)
+    )
+
+
+class RuntimeMonitor:
+    """Samples event loop lag, tasks, queue depths, HTTP pools and caches."""
+
+    def __init__(self):
+        self.sensor = None
+        self.interval_seconds = 5.0
+        self.queues: Dict[str, Callable[[], int]] = {}
+        self.pools: Dict[str, PoolUsage] = {}
+        self.caches: Dict[str, CacheUsage] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(
+        self,
+        sensor,
+        interval_seconds: float,
+        queues: Optional[Mapping[str, Callable[[], int]]] = None,
+        pools: Optional[Mapping[str, PoolUsage]] = None,
+        caches: Optional[Mapping[str, CacheUsage]] = None,
+    ):
+        """Start sampling every ``interval_seconds``."""
+        self.sensor = sensor
+        self.interval_seconds = interval_seconds
+        self.queues = dict(queues or {})
+        self.pools = dict(pools or {})
+        self.caches = dict(caches or {})
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="runtime monitor")
+
+    async def stop(self):
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                self.sample(max(0.0, loop.time() - expected))
+            except Exception as e:
+                logger.error(f"Failed to sample runtime metrics: {e}", exc_info=True)
+
+    def sample(self, lag_seconds: float):
+        """Report one sample with the measured event loop lag."""
+        tasks = asyncio.all_tasks()
+        self.sensor.on_event_loop_sample(lag_seconds, len(tasks))
+        self.sensor.on_queue_depth("kopf_workers", count_kopf_workers(tasks))
+        for queue, depth in self.queues.items():
+            self.sensor.on_queue_depth(queue, depth())
+        for pool, usage in self.pools.items():
+            in_use, limit, in_flight = usage()
+            self.sensor.on_http_pool_sample(pool, in_use, limit, in_flight)
+        for cache, usage in self.caches.items():
+            hits, misses, entries = usage()
+            self.sensor.on_cache_sample(cache, hits, misses, entries)
+
+
+# Started by the operator on startup
+runtime_monitor = RuntimeMonitor()
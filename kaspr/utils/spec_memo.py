@@ -0,0 +1,83 @@
+"""Memoized loading of kaspr resource specs.
+
+Handlers load the spec of the object they handle with its marshmallow
+schema on every invocation, and the related resources monitor reloads the
+specs of every component of an app each cycle. Loaded spec models are
+cached by schema, object and a digest of the raw spec, so a spec is only
+loaded again after it changed, and schema instances are reused.
+
+Cached models are shared between callers and must be treated as read-only.
+"""
+
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple, Type
+
+from marshmallow import Schema
+
+from kaspr.utils.hashing import fast_digest
+from kaspr.utils.lru import LRUCache
+
+
+class SpecMemo:
+    """Loaded spec models keyed by (schema, object, spec digest)."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.cache: Optional[LRUCache] = LRUCache(maxsize) if maxsize > 0 else None
+        self._schemas: Dict[Type[Schema], Schema] = {}
+
+    def resize(self, maxsize: int):
+        """Replace the cache with an empty one of ``maxsize`` entries (0 disables it)."""
+        self.cache = LRUCache(maxsize) if maxsize > 0 else None
+
+    def schema(self, schema_cls: Type[Schema]) -> Schema:
+        """Shared instance of ``schema_cls``."""
+        schema = self._schemas.get(schema_cls)
+        if schema is None:
+            schema = self._schemas[schema_cls] = schema_cls()
+        return schema
+
+    def load(
+        self, schema_cls: Type[Schema], spec: Mapping, owner: Hashable = None
+    ) -> Any:
+        """Load ``spec`` with ``schema_cls``, reusing the model of an identical spec.
+
+        Args:
+            schema_cls: Schema of the spec
+            spec: Raw spec of the object
+            owner: Identifies the object the spec belongs to. Models are
+                not shared between objects because resources set
+                object-specific fields (e.g. the name) on them.
+        """
+        schema = self.schema(schema_cls)
+        if self.cache is None:
+            return schema.load(spec)
+        key = (schema_cls, owner, fast_digest(dict(spec)))
+        model = self.cache.get(key)
+        if model is None:
+            model = schema.load(spec)
+            self.cache.put(key, model)
+        return model
+
+    @property
+    def hits(self) -> int:
+        return self.cache.hits if self.cache is not None else 0
+
+    @property
+    def misses(self) -> int:
+        return self.cache.misses if self.cache is not None else 0
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        return self.cache.hit_ratio if self.cache is not None else None
+
+    def usage(self) -> Tuple[int, int, int]:
+        """(hits, misses, entries) of the cache, reported by the runtime monitor."""
+        return self.cache.usage() if self.cache is not None else (0, 0, 0)
+
+
+# Shared by the handlers of all kaspr resources
+spec_memo = SpecMemo()
+
+
+def load_spec(schema_cls: Type[Schema], spec: Mapping, owner: Hashable = None) -> Any:
+    """Load a spec through the shared :class:`SpecMemo`."""
+    return spec_memo.load(schema_cls, spec, owner)
@@ -0,0 +1,42 @@
+"""Cluster state shared by the status collectors of one reconciliation.
+
+A status update of a KasprApp used to read the StatefulSet and list the
+app's pods separately for the app status, the member statuses, the
+Python packages status and any rebalance request. A status context is
+attached to the app for one cycle instead: every collector reads the same
+snapshot, and each object is fetched at most once. Concurrent readers
+share the in-flight request.
+
+Example usage:
+```
+    app.status_context = StatusContext()
+    # Both calls share a single LIST request
+    pods, same_pods = await asyncio.gather(app.fetch_app_pods(), app.fetch_app_pods())
+```
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class StatusContext:
+    """Objects fetched during one status cycle, keyed by name."""
+
+    def __init__(self):
+        self._results: Dict[str, asyncio.Future] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._results
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of ``fetch``, called only by the first reader of ``key``."""
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = asyncio.ensure_future(fetch())
+        return await asyncio.shield(result)
+
+    def put(self, key: str, value: Any):
+        """Seed ``key`` with an object that was already fetched this cycle."""
+        result = asyncio.get_running_loop().create_future()
+        result.set_result(value)
+        self._results[key] = result
@@ -0,0 +1,161 @@
+"""Startup warm-up of kaspr resources.
+
+When the operator starts, kopf resumes every KasprApp and starts every
+component timer at once, and each of them would fetch and compare all of
+its child resources. During the warm-up window the StatefulSets, Services,
+ConfigMaps and HPAs managed by the operator in a namespace are instead
+listed once, keeping only
+their ``kaspr.io/resource-hash`` annotations. Handlers compare these with
+the hashes of freshly rendered children in memory: only resources whose
+children drifted are synchronized right away, the others are reconciled
+at a random time within the jitter window.
+
+Example usage:
+```
+    if await startup_warmup.unchanged(namespace, app.prepare_child_hashes()):
+        # Children are up to date, reconcile later
+        delay = startup_warmup.delay()
+```
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from kubernetes_asyncio.client import AppsV1Api, AutoscalingV2Api, CoreV1Api
+from kubernetes_asyncio.client.api_client import ApiClient
+
+from kaspr.common.models.labels import Labels
+
+logger = logging.getLogger(__name__)
+
+#: (kind, name) of a child resource
+ChildKey = Tuple[str, str]
+
+RESOURCE_HASH_ANNOTATION = "kaspr.io/resource-hash"
+
+#: Selects the child resources created by the operator
+MANAGED_BY_SELECTOR = f"{Labels.KUBERNETES_MANAGED_BY_LABEL}=kaspr-operator"
+
+
+class ChildInventory:
+    """Resource hash annotations of child resources, listed once per namespace."""
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        annotation: str = RESOURCE_HASH_ANNOTATION,
+        label_selector: str = MANAGED_BY_SELECTOR,
+    ):
+        self.annotation = annotation
+        self.label_selector = label_selector
+        self.apps_v1_api = AppsV1Api(api_client)
+        self.core_v1_api = CoreV1Api(api_client)
+        self.autoscaling_v2_api = AutoscalingV2Api(api_client)
+        self._namespaces: Dict[str, asyncio.Future] = {}
+
+    async def hashes(self, namespace: str) -> Dict[ChildKey, Optional[str]]:
+        """Hash annotation of every child resource in ``namespace``.
+
+        The namespace is listed by the first caller; concurrent callers
+        share the result.
+        """
+        listing = self._namespaces.get(namespace)
+        if listing is None:
+            listing = self._namespaces[namespace] = asyncio.ensure_future(
+                self._list(namespace)
+            )
+        return await asyncio.shield(listing)
+
+    async def _list(self, namespace: str) -> Dict[ChildKey, Optional[str]]:
+        selector = self.label_selector
+        results = await asyncio.gather(
+            self.apps_v1_api.list_namespaced_stateful_set(
+                namespace, label_selector=selector
+            ),
+            self.core_v1_api.list_namespaced_service(
+                namespace, label_selector=selector
+            ),
+            self.core_v1_api.list_namespaced_config_map(
+                namespace, label_selector=selector
+            ),
+            self.autoscaling_v2_api.list_namespaced_horizontal_pod_autoscaler(
+                namespace, label_selector=selector
+            ),
+        )
+        hashes = {}
+        for kind, result in zip(
+            ("StatefulSet", "Service", "ConfigMap", "HorizontalPodAutoscaler"),
+            results,
+        ):
+            for item in result.items or []:
+                hashes[(kind, item.metadata.name)] = (
+                    item.metadata.annotations or {}
+                ).get(self.annotation)
+        logger.debug(f"Listed {len(hashes)} child resources in {namespace}")
+        return hashes
+
+    def clear(self):
+        self._namespaces.clear()
+
+
+class StartupWarmup:
+    """Drift checks against bulk-listed children while the operator starts."""
+
+    def __init__(self):
+        self.inventory: Optional[ChildInventory] = None
+        self.jitter_seconds = 0.0
+        self._deadline = 0.0
+
+    def start(
+        self, inventory: ChildInventory, window_seconds: float, jitter_seconds: float
+    ):
+        """Serve drift checks from ``inventory`` for ``window_seconds``."""
+        self.inventory = inventory
+        self.jitter_seconds = jitter_seconds
+        self._deadline = time.monotonic() + window_seconds
+        asyncio.get_running_loop().call_later(window_seconds, self.finish)
+
+    def finish(self):
+        """End the warm-up and drop the listed hashes."""
+        if self.inventory is not None:
+            self.inventory.clear()
+        self.inventory = None
+
+    @property
+    def active(self) -> bool:
+        return self.inventory is not None and time.monotonic() < self._deadline
+
+    def delay(self) -> float:
+        """Random delay spreading deferred work over the jitter window."""
+        return random.uniform(0, self.jitter_seconds)
+
+    async def unchanged(
+        self, namespace: str, hashes: Mapping[ChildKey, Optional[str]]
+    ) -> bool:
+        """True if every child exists with the expected hash annotation.
+
+        Children rendered without a hash annotation only need to exist.
+
+        Always False outside of the warm-up or if the namespace could not be
+        listed, so callers fall back to a full sync.
+        """
+        if not self.active:
+            return False
+        try:
+            actual = await self.inventory.hashes(namespace)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to list child resources in {namespace}: {e}")
+            return False
+        return all(
+            key in actual and actual[key] == expected
+            for key, expected in hashes.items()
+        )
+
+
+# Shared by the handlers of all kaspr resources
+startup_warmup = StartupWarmup()
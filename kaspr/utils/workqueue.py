@@ -0,0 +1,209 @@
+"""Operator-wide priority work queue.
+
+Modelled on controller-runtime's workqueue: keys are deduplicated while
+waiting, a key that is re-added while being processed is queued again once
+the worker calls :meth:`WorkQueue.done`, failed keys are retried with
+per-key exponential backoff, and dequeues are paced by a token bucket so a
+burst of requests cannot flood the API server.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+class Priority(IntEnum):
+    """Work item priority; lower values are dequeued first."""
+
+    USER_EDIT = 0
+    DRIFT = 1
+    PERIODIC = 2
+
+
+class TokenBucket:
+    """Token bucket rate limiter allowing ``qps`` sustained with ``burst``."""
+
+    def __init__(self, qps: float, burst: int):
+        self.qps = qps
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+        self._last = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        if self.qps <= 0:
+            return 0.0
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.qps
+
+    async def acquire(self):
+        """Wait until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class WorkQueue:
+    """Deduplicating priority queue with delayed and rate-limited adds."""
+
+    def __init__(
+        self,
+        qps: float = 10.0,
+        burst: int = 100,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+    ):
+        self.limiter = TokenBucket(qps, burst)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._counter = itertools.count()
+        # key -> (priority, enqueue time) for keys waiting to be processed
+        self._queued: Dict[Hashable, Tuple[Priority, float]] = {}
+        # keys currently held by a worker
+        self._processing: Set[Hashable] = set()
+        # keys re-added while processing -> priority to requeue with
+        self._dirty: Dict[Hashable, Priority] = {}
+        self._delayed: Dict[Hashable, Tuple[float, asyncio.TimerHandle]] = {}
+        self._failures: Dict[Hashable, int] = {}
+        self._not_empty = asyncio.Event()
+        self._shutting_down = False
+
+    def __len__(self) -> int:
+        return len(self._queued)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._queued
+
+    @property
+    def shutting_down(self) -> bool:
+        return self._shutting_down
+
+    def _push(self, key: Hashable, priority: Priority):
+        heapq.heappush(self._heap, (int(priority), next(self._counter), key))
+        self._not_empty.set()
+
+    def add(self, key: Hashable, priority: Priority = Priority.PERIODIC) -> bool:
+        """Queue ``key``; returns True if it was not already waiting."""
+        if self._shutting_down:
+            return False
+        if key in self._processing:
+            current = self._dirty.get(key)
+            if current is None or priority < current:
+                self._dirty[key] = priority
+            return False
+        queued = self._queued.get(key)
+        if queued is not None:
+            if priority < queued[0]:
+                # Upgrade in place; the stale heap entry is skipped on pop.
+                self._queued[key] = (priority, queued[1])
+                self._push(key, priority)
+            return False
+        self._queued[key] = (priority, time.monotonic())
+        self._push(key, priority)
+        return True
+
+    def add_after(
+        self, key: Hashable, delay: float, priority: Priority = Priority.PERIODIC
+    ):
+        """Queue ``key`` after ``delay`` seconds; keeps the earliest deadline."""
+        if self._shutting_down:
+            return
+        if delay <= 0:
+            self.add(key, priority)
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+        pending = self._delayed.get(key)
+        if pending is not None:
+            if pending[0] <= deadline:
+                return
+            pending[1].cancel()
+
+        def fire():
+            self._delayed.pop(key, None)
+            self.add(key, priority)
+
+        self._delayed[key] = (deadline, loop.call_later(delay, fire))
+
+    def backoff(self, key: Hashable) -> float:
+        """Exponential backoff delay for the next retry of ``key``."""
+        failures = self._failures.get(key, 0)
+        return min(self.max_delay, self.base_delay * (2**failures))
+
+    def add_rate_limited(
+        self, key: Hashable, priority: Priority = Priority.PERIODIC
+    ) -> float:
+        """Requeue a failed ``key`` with exponential backoff; returns the delay."""
+        delay = self.backoff(key)
+        self._failures[key] = self._failures.get(key, 0) + 1
+        self.add_after(key, delay, priority)
+        return delay
+
+    def forget(self, key: Hashable):
+        """Reset the failure count of ``key`` after a successful run."""
+        self._failures.pop(key, None)
+
+    def num_requeues(self, key: Hashable) -> int:
+        return self._failures.get(key, 0)
+
+    async def get(self) -> Optional[Tuple[Hashable, Priority, float]]:
+        """Wait for the next key.
+
+        Returns the key, its priority and the seconds it spent waiting, or
+        None once the queue is shut down. The caller must call :meth:`done`
+        once it has processed the key.
+        """
+        while True:
+            while not self._heap:
+                if self._shutting_down:
+                    return None
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            priority, _, key = heapq.heappop(self._heap)
+            queued = self._queued.get(key)
+            if queued is None or int(queued[0]) != priority:
+                continue  # stale entry (discarded or upgraded)
+            del self._queued[key]
+            self._processing.add(key)
+            await self.limiter.acquire()
+            return key, Priority(priority), time.monotonic() - queued[1]
+
+    def done(self, key: Hashable):
+        """Mark ``key`` processed; requeue it if it was added meanwhile."""
+        self._processing.discard(key)
+        priority = self._dirty.pop(key, None)
+        if priority is not None:
+            self.add(key, priority)
+
+    def discard(self, key: Hashable):
+        """Drop all state for ``key`` (e.g. when the object is deleted)."""
+        self._queued.pop(key, None)
+        self._dirty.pop(key, None)
+        self._failures.pop(key, None)
+        pending = self._delayed.pop(key, None)
+        if pending is not None:
+            pending[1].cancel()
+
+    def shutdown(self):
+        """Stop accepting keys and wake up idle workers."""
+        self._shutting_down = True
+        for _, handle in self._delayed.values():
+            handle.cancel()
+        self._delayed.clear()
+        self._not_empty.set()
+
+    def priority_of(self, key: Hashable) -> Optional[Priority]:
+        queued = self._queued.get(key)
+        return queued[0] if queued else None
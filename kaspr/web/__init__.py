@@ -1,3 +1,4 @@
 from .client import KasprWebClient
+from .status import MemberStatusClient
 
-__all__ = ["KasprWebClient"]
\ No newline at end of file
+__all__ = ["KasprWebClient", "MemberStatusClient"]
\ No newline at end of file
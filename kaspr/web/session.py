@@ -27,6 +27,7 @@ class SessionManager(BaseModel):
     def __init__(
         self,
         headers: Optional[Mapping] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
         **kwargs: Any
     ) -> None:
         
@@ -34,7 +35,8 @@ class SessionManager(BaseModel):
         merged_headers.update(headers or {})
 
         self.session = aiohttp.ClientSession(
-            headers = merged_headers
+            headers = merged_headers,
+            connector = connector,
         )
         self.timeout = kwargs.pop("timeout", TIMEOUT)
         super().__init__(**kwargs)
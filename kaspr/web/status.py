@@ -0,0 +1,109 @@
+"""Kaspr member status client."""
+import asyncio
+from typing import Any, Dict, Hashable, Mapping, Tuple, Union
+
+import aiohttp
+from yarl import URL
+
+from .client import KasprWebClient
+
+"""Default maximum number of in-flight status requests across all apps"""
+MAX_CONCURRENCY: int = 100
+
+"""Default timeout in seconds of a single status request"""
+REQUEST_TIMEOUT: float = 5.0
+
+
+class MemberStatusClient(KasprWebClient):
+    """Pooled client for polling the status endpoint of app members.
+
+    All apps share one keep-alive connection pool that is limited per host,
+    DNS lookups of member FQDNs are cached, and a semaphore caps the number
+    of in-flight requests across all apps. Every request has its own
+    timeout, and :meth:`get_statuses` returns whatever members answered
+    before the overall deadline instead of failing as a whole.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        request_timeout: float = REQUEST_TIMEOUT,
+        limit: int = 200,
+        limit_per_host: int = 2,
+        dns_cache_ttl: int = 30,
+        keepalive_timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> None:
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=dns_cache_ttl,
+            keepalive_timeout=keepalive_timeout,
+        )
+        super().__init__(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=request_timeout),
+            **kwargs,
+        )
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+
+    def pool_usage(self) -> Tuple[int, int, int]:
+        """Connections in use, the connection limit, and requests in flight.
+
+        A request holds at most one pooled connection, so connections in use
+        are estimated from the requests in flight, capped by the pool limit.
+        """
+        connector = self.session.connector
+        limit = connector.limit if connector else 0
+        in_use = min(self.in_flight, limit) if limit else self.in_flight
+        return in_use, limit, self.in_flight
+
+    async def get_status(self, endpoint: URL) -> Dict:
+        """Get the status of a single member, waiting for a free slot."""
+        async with self.semaphore:
+            self.in_flight += 1
+            try:
+                return await super().get_status(endpoint)
+            finally:
+                self.in_flight -= 1
+
+    async def get_statuses(
+        self, endpoints: Mapping[Hashable, URL], deadline: float
+    ) -> Dict[Hashable, Union[Dict, BaseException]]:
+        """Get the status of many members concurrently.
+
+        Args:
+            endpoints: Member endpoints keyed by member id
+            deadline: Seconds to wait for all members
+
+        Returns:
+            Status or error for every member id. Members that did not answer
+            before the deadline map to an `asyncio.TimeoutError`.
+        """
+        tasks = {
+            asyncio.ensure_future(self.get_status(endpoint)): key
+            for key, endpoint in endpoints.items()
+        }
+        if not tasks:
+            return {}
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            for task in tasks:
+                task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = {}
+        for task, key in tasks.items():
+            if task not in done:
+                results[key] = asyncio.TimeoutError(
+                    f"No response within {deadline} seconds"
+                )
+            elif task.exception() is not None:
+                results[key] = task.exception()
+            else:
+                results[key] = task.result()
+        return results
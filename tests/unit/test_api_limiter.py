@@ -0,0 +1,162 @@
+"""Unit tests for client-side API rate limiting."""
+
+import asyncio
+from unittest.mock import Mock
+
+from kubernetes_asyncio.client.api_client import ApiClient
+from kubernetes_asyncio.client.rest import ApiException
+
+from kaspr.utils.api_limiter import (
+    ApiRateLimiter,
+    RateLimitedApiClient,
+    pace_kopf_requests,
+    parse_verb_limits,
+    request_resource,
+    request_verb,
+)
+
+
+def test_parse_verb_limits():
+    assert parse_verb_limits("") == {}
+    assert parse_verb_limits("patch=20:40, Watch=5") == {
+        "patch": (20.0, 40),
+        "watch": (5.0, 5),
+    }
+
+
+def test_request_verb_tells_watches_from_reads():
+    assert request_verb("GET") == "get"
+    assert request_verb("GET", [("labelSelector", "a=b")]) == "get"
+    assert request_verb("GET", [("watch", True)]) == "watch"
+    assert request_verb("PATCH") == "patch"
+    assert request_verb("POST") == "create"
+
+
+def test_verbs_have_separate_buckets(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    limiter = ApiRateLimiter(qps=10, burst=1, verb_limits={"patch": (1, 1)})
+    limiter.sensor = Mock()
+
+    async def run():
+        return [
+            await limiter.acquire("get"),
+            await limiter.acquire("patch"),
+            await limiter.acquire("get"),
+            await limiter.acquire("patch"),
+        ]
+
+    first_get, first_patch, second_get, second_patch = asyncio.run(run())
+
+    assert first_get == first_patch == 0
+    assert 0 < second_get <= 0.1
+    assert 0.9 < second_patch <= 1.0
+    assert sleeps == [second_get, second_patch]
+    verbs = [call.args[0] for call in limiter.sensor.on_api_rate_limit_wait.call_args_list]
+    assert verbs == ["get", "patch", "get", "patch"]
+
+
+def test_zero_qps_disables_limiting():
+    limiter = ApiRateLimiter(qps=0, burst=1)
+
+    async def run():
+        return [await limiter.acquire("get") for _ in range(5)]
+
+    assert asyncio.run(run()) == [0.0] * 5
+
+
+def test_client_acquires_a_token_per_request(monkeypatch):
+    calls = []
+
+    async def fake_request(self, method, url, query_params=None, *args, **kwargs):
+        calls.append((method, url))
+        return "response"
+
+    monkeypatch.setattr(ApiClient, "request", fake_request)
+    client = object.__new__(RateLimitedApiClient)
+    client.limiter = Mock()
+
+    async def acquire(verb):
+        return 0.0
+
+    client.limiter.acquire = Mock(side_effect=acquire)
+
+    result = asyncio.run(
+        client.request("GET", "https://k8s/api/v1/pods", [("watch", True)])
+    )
+
+    assert result == "response"
+    assert calls == [("GET", "https://k8s/api/v1/pods")]
+    client.limiter.acquire.assert_called_once_with("watch")
+
+
+def test_kopf_requests_take_tokens_of_their_own_limiter(monkeypatch):
+    from kopf._cogs.clients import api
+
+    calls = []
+
+    async def fake_request(method, url, **kwargs):
+        calls.append((method, url))
+        return "response"
+
+    monkeypatch.setattr(api, "request", fake_request)
+    verbs = []
+
+    async def acquire(verb):
+        verbs.append(verb)
+        return 0.0
+
+    limiter = Mock(acquire=Mock(side_effect=acquire))
+    pace_kopf_requests(Mock())
+    pace_kopf_requests(limiter)
+
+    async def run():
+        return [
+            await api.request("patch", "/apis/kaspr.io/v1alpha1/kasprapps/a"),
+            await api.request("get", "/apis/kaspr.io/v1alpha1/kasprapps?watch=true"),
+        ]
+
+    assert asyncio.run(run()) == ["response", "response"]
+    assert verbs == ["patch", "watch"]
+    assert [method for method, _ in calls] == ["patch", "get"]
+
+
+def test_request_resource_drops_names():
+    assert request_resource("https://k8s/api/v1/namespaces/default/pods") == "pods"
+    assert request_resource("https://k8s/api/v1/namespaces/default/pods/app-0/exec") == "pods/exec"
+    assert request_resource("https://k8s/api/v1/namespaces/default") == "namespaces"
+    assert (
+        request_resource("https://k8s/apis/apps/v1/namespaces/default/statefulsets/app")
+        == "statefulsets"
+    )
+    assert (
+        request_resource("https://k8s/apis/kaspr.io/v1alpha1/namespaces/ns/kasprapps/app/status")
+        == "kasprapps/status"
+    )
+
+
+def test_client_reports_request_latency(monkeypatch):
+    async def fake_request(self, method, url, query_params=None, *args, **kwargs):
+        if method == "DELETE":
+            raise ApiException(status=404)
+        return Mock(status=200)
+
+    monkeypatch.setattr(ApiClient, "request", fake_request)
+    client = object.__new__(RateLimitedApiClient)
+    client.sensor = Mock()
+
+    async def run():
+        await client.request("PATCH", "https://k8s/apis/apps/v1/namespaces/ns/statefulsets/app")
+        try:
+            await client.request("DELETE", "https://k8s/api/v1/namespaces/ns/services/app")
+        except ApiException:
+            pass
+
+    asyncio.run(run())
+
+    calls = [call.args[:3] for call in client.sensor.on_api_request.call_args_list]
+    assert calls == [("patch", "statefulsets", "200"), ("delete", "services", "404")]
@@ -1,8 +1,18 @@
 """Unit tests for GCS utility functions."""
 
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
 import pytest
 from kaspr.utils.gcs import (
     build_gcs_object_key,
+    compression_commands,
     parse_size_to_bytes,
     generate_gcs_auth_python_script,
     generate_gcs_download_python_script,
@@ -29,6 +39,30 @@ class TestBuildGcsObjectKey:
         key = build_gcs_object_key("org/team/cache/", "app", "h")
         assert key == "org/team/cache/app/h.tar.gz"
 
+    def test_zstd_extension(self):
+        key = build_gcs_object_key("kaspr-packages/", "app", "h", "zstd")
+        assert key == "kaspr-packages/app/h.tar.zst"
+
+
+class TestCompressionCommands:
+    """Tests for compression_commands()."""
+
+    def test_gzip_default_level(self):
+        assert compression_commands() == (["gzip", "-6"], ["gzip", "-d", "-c"])
+
+    def test_zstd_level(self):
+        compress, decompress = compression_commands("zstd", 19)
+        assert compress == ["zstd", "-q", "-T0", "-19"]
+        assert decompress == ["zstd", "-q", "-d", "-c"]
+
+    def test_invalid_level_raises(self):
+        with pytest.raises(ValueError, match="between 1 and 9"):
+            compression_commands("gzip", 12)
+
+    def test_unknown_compression_raises(self):
+        with pytest.raises(ValueError, match="Unknown compression"):
+            compression_commands("bzip2")
+
 
 class TestParseSizeToBytes:
     """Tests for parse_size_to_bytes()."""
@@ -126,9 +160,19 @@ class TestGenerateGcsDownloadPythonScript:
         script = generate_gcs_download_python_script()
         assert "Cache hit" in script
 
-    def test_writes_to_tmp(self):
-        script = generate_gcs_download_python_script()
-        assert "/tmp/packages.tar.gz" in script
+    def test_streams_into_tar(self):
+        script = generate_gcs_download_python_script(extract_dir="/data/pkgs")
+        assert "/tmp/packages.tar.gz" not in script
+        assert '["tar", "-x", "-C", "/data/pkgs"]' in script
+        assert '["gzip", "-d", "-c"]' in script
+
+    def test_zstd_decompressor(self):
+        script = generate_gcs_download_python_script(compression="zstd")
+        assert '["zstd", "-q", "-d", "-c"]' in script
+
+    def test_has_no_single_quotes(self):
+        """The script is embedded in a single-quoted bash argument."""
+        assert "'" not in generate_gcs_download_python_script()
 
     def test_uses_storage_api(self):
         script = generate_gcs_download_python_script()
@@ -164,13 +208,26 @@ class TestGenerateGcsUploadPythonScript:
         script = generate_gcs_upload_python_script()
         assert "upload/storage/v1" in script
 
-    def test_default_archive_path(self):
+    def test_uses_resumable_upload(self):
         script = generate_gcs_upload_python_script()
-        assert "/tmp/packages.tar.gz" in script
+        assert "uploadType=resumable" in script
+        assert "f.read()" not in script
+
+    def test_streams_from_tar(self):
+        script = generate_gcs_upload_python_script(source_dir="/data/pkgs")
+        assert '["tar", "-c", "-C", "/data/pkgs", "."]' in script
 
-    def test_custom_archive_path(self):
-        script = generate_gcs_upload_python_script(archive_path="/data/pkg.tar.gz")
-        assert "/data/pkg.tar.gz" in script
+    def test_compression_level(self):
+        script = generate_gcs_upload_python_script(compression="zstd", compression_level=9)
+        assert '["zstd", "-q", "-T0", "-9"]' in script
+        assert "application/zstd" in script
+
+    def test_chunk_size_must_be_aligned(self):
+        with pytest.raises(ValueError, match="multiple of 262144"):
+            generate_gcs_upload_python_script(chunk_size_bytes=1000)
+
+    def test_has_no_single_quotes(self):
+        assert "'" not in generate_gcs_upload_python_script()
 
     def test_is_valid_python_syntax(self):
         script = generate_gcs_upload_python_script()
@@ -179,3 +236,145 @@ class TestGenerateGcsUploadPythonScript:
     def test_sets_content_type(self):
         script = generate_gcs_upload_python_script()
         assert "application/gzip" in script
+
+
+class FakeGcs(BaseHTTPRequestHandler):
+    """Minimal GCS JSON API: media downloads and resumable uploads.
+
+    Like GCS, intermediate chunks may be persisted only partially: the
+    first chunk of every session is cut in half, so clients must resend
+    from the offset reported in the 308 response.
+    """
+
+    objects = {}
+    sessions = {}
+    puts = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, code, headers=None, body=b""):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        key = unquote(urlparse(self.path).path.rsplit("/o/", 1)[1])
+        if key not in self.objects:
+            return self._reply(404)
+        self._reply(200, body=self.objects[key])
+
+    def do_POST(self):
+        key = parse_qs(urlparse(self.path).query)["name"][0]
+        session = f"/session/{len(self.sessions)}"
+        self.sessions[session] = (key, bytearray())
+        host, port = self.server.server_address
+        self._reply(200, {"Location": f"http://{host}:{port}{session}"})
+
+    def do_PUT(self):
+        key, data = self.sessions[self.path]
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.puts.append(self.headers["Content-Range"])
+        match = re.match(r"bytes (\d+)-(\d+)/(\*|\d+)", self.headers["Content-Range"])
+        if match:
+            start, total = int(match.group(1)), match.group(3)
+            assert start == len(data)
+            if total == "*" and not data:
+                body = body[: len(body) // 2]
+            data.extend(body)
+            if total != "*":
+                assert int(total) == len(data)
+                self.objects[key] = bytes(data)
+                return self._reply(200)
+        self._reply(308, {"Range": f"bytes=0-{len(data) - 1}"} if data else {})
+
+    def do_DELETE(self):
+        del self.sessions[self.path]
+        self._reply(499)
+
+
+@pytest.fixture
+def fake_gcs():
+    FakeGcs.objects, FakeGcs.sessions, FakeGcs.puts = {}, {}, []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGcs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _run_script(script, server, object_key="kaspr-packages/app/h.tar.gz"):
+    host, port = server.server_address
+    env = dict(
+        os.environ,
+        STORAGE_EMULATOR_HOST=f"http://{host}:{port}",
+        GCS_BUCKET="bucket",
+        GCS_OBJECT_KEY=object_key,
+    )
+    return subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=60
+    )
+
+
+class TestGcsStreaming:
+    """Round trips of the generated scripts against a fake GCS server."""
+
+    @pytest.mark.parametrize("compression", ["gzip", "zstd"])
+    def test_upload_and_download_round_trip(self, fake_gcs, tmp_path, compression):
+        if not shutil.which(compression):
+            pytest.skip(f"{compression} is not installed")
+        source = tmp_path / "source"
+        (source / "pkg").mkdir(parents=True)
+        payload = os.urandom(700 * 1024)
+        (source / "pkg" / "module.so").write_bytes(payload)
+
+        upload = _run_script(
+            generate_gcs_upload_python_script(
+                source_dir=str(source),
+                compression=compression,
+                chunk_size_bytes=256 * 1024,
+            ),
+            fake_gcs,
+        )
+        assert "Uploaded packages archive" in upload.stdout, upload.stdout
+        assert FakeGcs.puts[-1].endswith(f"/{len(FakeGcs.objects['kaspr-packages/app/h.tar.gz'])}")
+        # Several chunks, the first one resent after a partial persist
+        assert len(FakeGcs.puts) >= 4
+        assert FakeGcs.puts[1].startswith("bytes 131072-")
+
+        target = tmp_path / "target"
+        target.mkdir()
+        download = _run_script(
+            generate_gcs_download_python_script(
+                extract_dir=str(target), compression=compression
+            ),
+            fake_gcs,
+        )
+        assert download.returncode == 0, download.stdout + download.stderr
+        assert (target / "pkg" / "module.so").read_bytes() == payload
+
+    def test_upload_over_limit_cancels_session(self, fake_gcs, tmp_path):
+        (tmp_path / "big").write_bytes(os.urandom(600 * 1024))
+        result = _run_script(
+            generate_gcs_upload_python_script(
+                source_dir=str(tmp_path),
+                max_archive_size_bytes=300 * 1024,
+                chunk_size_bytes=256 * 1024,
+            ),
+            fake_gcs,
+        )
+        assert result.returncode == 0
+        assert "exceeds limit" in result.stdout
+        assert FakeGcs.objects == {}
+        assert FakeGcs.sessions == {}
+
+    def test_download_miss_and_corrupt_archive(self, fake_gcs, tmp_path):
+        script = generate_gcs_download_python_script(extract_dir=str(tmp_path))
+        assert _run_script(script, fake_gcs).returncode == 1
+
+        FakeGcs.objects["kaspr-packages/app/h.tar.gz"] = b"not an archive"
+        assert _run_script(script, fake_gcs).returncode == 2
@@ -0,0 +1,66 @@
+"""Unit tests for canonical resource hashing."""
+
+import pytest
+from kubernetes_asyncio.client import V1ServicePort
+
+from kaspr.utils.hashing import compat_digest, fast_digest, legacy_digest
+
+
+STATEFUL_SET_LIKE = {
+    "metadata": {"name": "app", "labels": {"kaspr.io/app": "app", "tier": "x"}},
+    "spec": {
+        "replicas": 3,
+        "template": {
+            "spec": {
+                "containers": [
+                    {
+                        "name": "kaspr",
+                        "env": [{"name": "A", "value": "1"}, {"name": "B", "value": None}],
+                        "resources": {"limits": {"cpu": 0.5, "memory": "1Gi"}},
+                        "ports": [{"containerPort": 6065, "name": "web"}],
+                    }
+                ],
+                "hostNetwork": False,
+            }
+        },
+        "volumeClaimTemplates": [],
+    },
+    "unicode": "ñ ✓",
+}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        STATEFUL_SET_LIKE,
+        {},
+        "plain string",
+        {"tuple": (1, 2), "nested": {"b": 1, "a": [3, 2]}},
+        {1: "non-string key"},
+    ],
+)
+def test_compat_digest_matches_legacy(data):
+    assert compat_digest(data) == legacy_digest(data)
+    assert len(compat_digest(data)) == 16
+
+
+def test_compat_digest_rejects_unsupported_types():
+    with pytest.raises(ValueError):
+        compat_digest(["not", "a", "dict"])
+
+
+def test_fast_digest_ignores_key_order():
+    reordered = dict(reversed(list(STATEFUL_SET_LIKE.items())))
+
+    assert fast_digest(STATEFUL_SET_LIKE) == fast_digest(reordered)
+    assert fast_digest(STATEFUL_SET_LIKE) != fast_digest({**STATEFUL_SET_LIKE, "x": 1})
+    assert len(fast_digest(STATEFUL_SET_LIKE)) == 16
+
+
+def test_fast_digest_encodes_kubernetes_models():
+    ports = [V1ServicePort(name="web", port=80, target_port=6065)]
+    same = [V1ServicePort(name="web", port=80, target_port=6065)]
+    other = [V1ServicePort(name="web", port=81, target_port=6065)]
+
+    assert fast_digest({"ports": ports}) == fast_digest({"ports": same})
+    assert fast_digest({"ports": ports}) != fast_digest({"ports": other})
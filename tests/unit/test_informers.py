@@ -0,0 +1,116 @@
+"""Unit tests for the informer cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+from kaspr.informers import Informer, InformerRegistry, ObjectStore
+from kaspr.resources import KasprAgent
+from kaspr.resources.base import BaseResource
+
+
+def _obj(name, app=None, rv="1"):
+    labels = {"kaspr.io/app": app} if app else {}
+    return {"metadata": {"name": name, "labels": labels, "resourceVersion": rv}}
+
+
+class FakeCustomObjectsApi:
+    def __init__(self, items, resource_version="10"):
+        self.items = items
+        self.resource_version = resource_version
+        self.calls = []
+
+    async def list_namespaced_custom_object(self, **kwargs):
+        self.calls.append(kwargs)
+        return {
+            "items": list(self.items),
+            "metadata": {"resourceVersion": self.resource_version},
+        }
+
+
+def test_store_indexes_objects_by_label():
+    store = ObjectStore("kaspr.io/app")
+    store.upsert(_obj("a1", app="app-a"))
+    store.upsert(_obj("a2", app="app-a"))
+    store.upsert(_obj("b1", app="app-b"))
+
+    assert [o["metadata"]["name"] for o in store.list(["app-a"])] == ["a1", "a2"]
+    assert [o["metadata"]["name"] for o in store.list(["app-b"])] == ["b1"]
+    assert len(store.list()) == 3
+
+
+def test_store_reindexes_on_label_change_and_delete():
+    store = ObjectStore("kaspr.io/app")
+    store.upsert(_obj("a1", app="app-a"))
+    store.upsert(_obj("a1", app="app-b"))
+
+    assert store.list(["app-a"]) == []
+    assert [o["metadata"]["name"] for o in store.list(["app-b"])] == ["a1"]
+
+    store.delete(_obj("a1", app="app-b"))
+    assert store.list(["app-b"]) == []
+    assert "a1" not in store
+
+
+def test_informer_relist_and_apply_events_track_resource_version():
+    api = FakeCustomObjectsApi([_obj("a1", app="app-a", rv="5")], "7")
+    informer = Informer(api, "kaspr.io", "v1alpha1", "kaspragents", "ns", "kaspr.io/app")
+
+    asyncio.run(informer.relist())
+    assert informer.has_synced
+    assert informer.resource_version == "7"
+
+    informer.apply({"type": "ADDED", "raw_object": _obj("a2", app="app-a", rv="8")})
+    informer.apply({"type": "DELETED", "raw_object": _obj("a1", app="app-a", rv="9")})
+    informer.apply(
+        {"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "12"}}}
+    )
+
+    assert [o["metadata"]["name"] for o in informer.store.list(["app-a"])] == ["a2"]
+    assert informer.resource_version == "12"
+
+
+def test_registry_returns_none_until_synced():
+    async def run():
+        registry = InformerRegistry(None, sync_timeout_seconds=0.01)
+        informer = Informer(
+            FakeCustomObjectsApi([]), "kaspr.io", "v1alpha1", "kaspragents", "ns", "kaspr.io/app"
+        )
+        informer.start = lambda: None
+        registry.informers[("kaspr.io", "v1alpha1", "kaspragents", "ns")] = informer
+        return await registry.list("kaspr.io", "v1alpha1", "kaspragents", "ns", ["app-a"])
+
+    assert asyncio.run(run()) is None
+
+
+def test_component_search_reads_from_informer_cache(monkeypatch):
+    calls = []
+
+    class FakeRegistry:
+        async def list(self, group, version, plural, namespace, label_values=None):
+            calls.append((plural, namespace, label_values))
+            return {"items": [_obj("a1", app="app-a")]}
+
+    monkeypatch.setattr(BaseResource, "informers", FakeRegistry())
+    agent = KasprAgent.default()
+    agent._custom_objects_api = SimpleNamespace()
+
+    result = asyncio.run(agent.search("ns", apps=["app-a"]))
+
+    assert result["items"][0]["metadata"]["name"] == "a1"
+    assert calls == [("kaspragents", "ns", ["app-a"])]
+
+
+def test_component_search_falls_back_to_api_when_cache_not_synced(monkeypatch):
+    class UnsyncedRegistry:
+        async def list(self, *args, **kwargs):
+            return None
+
+    api = FakeCustomObjectsApi([_obj("a1", app="app-a")])
+    monkeypatch.setattr(BaseResource, "informers", UnsyncedRegistry())
+    agent = KasprAgent.default()
+    agent._custom_objects_api = api
+
+    result = asyncio.run(agent.search("ns", apps=["app-a"]))
+
+    assert len(result["items"]) == 1
+    assert api.calls[0]["label_selector"] == "kaspr.io/app=app-a"
@@ -32,6 +32,10 @@ class _FakeApp:
         self.tasks = None
         self.patched = False
 
+    def with_meta(self, meta):
+        self.meta = meta
+        return self
+
     def with_agents(self, agents):
         self.agents = agents
 
@@ -149,55 +153,161 @@ def test_monitor_related_resources_uses_task_schema(monkeypatch):
     assert stop_flag.wait_calls == [10]
 
 
-def test_patch_resource_skips_missing_queue():
-    patch = SimpleNamespace(status={})
+def test_patch_resource_applies_bus_patch_to_app(monkeypatch):
+    applied = []
+
+    async def fake_patch_app(self, name, namespace, patch):
+        applied.append((name, namespace, patch))
+
+    monkeypatch.setattr(handler.KasprApp, "patch_app", fake_patch_app)
+
+    asyncio.run(
+        handler.patch_bus.flush(handler.APP_KIND, "test-namespace", "missing-app")
+    )
+    assert applied == []
+
+    async def run():
+        handler.patch_bus.request(
+            handler.APP_KIND,
+            "test-namespace",
+            "my-app",
+            {"field": "status", "value": {"phase": "Running"}},
+        )
+        await handler.patch_bus.flush(handler.APP_KIND, "test-namespace", "my-app")
 
-    asyncio.run(handler.patch_resource(name="missing-app", patch=patch))
+    asyncio.run(run())
 
-    assert patch.status == {}
+    assert applied == [("my-app", "test-namespace", {"status": {"phase": "Running"}})]
 
 
-def test_process_reconciliation_requests_skips_missing_queue(monkeypatch):
-    handler.names_in_queue.add("missing-app")
+def test_reconcile_queued_app_discards_deleted_app(monkeypatch):
+    key = ("test-namespace", "missing-app")
+    handler.known_apps.add(key)
     reconcile_calls = []
 
+    async def fake_fetch(self, name, namespace):
+        return None
+
     async def fake_reconcile(*args, **kwargs):
         reconcile_calls.append(True)
 
+    monkeypatch.setattr(handler.KasprApp, "fetch", fake_fetch)
     monkeypatch.setattr(handler, "reconcile", fake_reconcile)
 
-    asyncio.run(
-        handler.process_reconciliation_requests(
-            name="missing-app",
-            namespace="test-namespace",
-            spec={},
-            meta={},
-            status={},
-            patch=SimpleNamespace(status={}),
-            annotations={},
-            logger=Mock(),
-            stopped=False,
-        )
+    result = asyncio.run(
+        handler.reconcile_queued_app("missing-app", "test-namespace", Mock())
     )
 
+    assert result is True
     assert reconcile_calls == []
-    assert "missing-app" not in handler.names_in_queue
+    assert key not in handler.known_apps
+
+
+def test_reconcile_queued_app_applies_status_patch(monkeypatch):
+    applied = []
+    body = {
+        "metadata": {"name": "test-app", "generation": 3, "annotations": {"a": "b"}},
+        "spec": {"replicas": 1},
+        "status": {"observedGeneration": 2},
+    }
+
+    async def fake_fetch(self, name, namespace):
+        return body
+
+    async def fake_reconcile(name, namespace, spec, meta, status, patch, annotations, logger, **kwargs):
+        assert spec == body["spec"] and annotations == {"a": "b"}
+        patch.status["observedGeneration"] = meta["generation"]
+        return True
+
+    async def fake_patch_app(self, name, namespace, patch):
+        applied.append((name, namespace, dict(patch)))
+
+    monkeypatch.setattr(handler.KasprApp, "fetch", fake_fetch)
+    monkeypatch.setattr(handler.KasprApp, "patch_app", fake_patch_app)
+    monkeypatch.setattr(handler, "reconcile", fake_reconcile)
+
+    assert asyncio.run(handler.reconcile_queued_app("test-app", "test-namespace", Mock()))
+    assert applied == [("test-app", "test-namespace", {"status": {"observedGeneration": 3}})]
+
+
+def test_request_reconciliation_deduplicates_and_keeps_highest_priority(monkeypatch):
+    async def run():
+        queue = handler.WorkQueue()
+        monkeypatch.setattr(handler, "reconciliation_queue", queue)
+        await handler.request_reconciliation(
+            "test-app", "test-namespace", priority=handler.Priority.PERIODIC
+        )
+        await handler.request_reconciliation(
+            "test-app", "test-namespace", priority=handler.Priority.USER_EDIT
+        )
+        return queue
+
+    queue = asyncio.run(run())
+
+    assert len(queue) == 1
+    assert queue.priority_of(("test-namespace", "test-app")) == handler.Priority.USER_EDIT
+
+
+def test_requeue_owned_apps_announces_moved_apps(monkeypatch):
+    coordinator = SimpleNamespace(
+        identity="replica-a",
+        gained=lambda namespace, name: name == "moved-app",
+    )
+    queue = handler.WorkQueue()
+    monkeypatch.setattr(handler, "reconciliation_queue", queue)
+    monkeypatch.setattr(handler, "get_coordinator", lambda: coordinator)
+    monkeypatch.setattr(handler, "is_owned", lambda namespace, name: True)
+    monkeypatch.setattr(handler, "known_apps", {("ns", "moved-app"), ("ns", "kept-app")})
+    handler.reference_index.track(
+        {"kind": "KasprAgent", "metadata": {"name": "agent", "namespace": "ns"}},
+        {"app": (handler.APP_KIND, "moved-app")},
+    )
+
+    async def run():
+        handler.requeue_owned_apps()
+        pending = {
+            name: handler.patch_bus.pending(kind, "ns", name)
+            for kind, name in (
+                (handler.APP_KIND, "moved-app"),
+                (handler.APP_KIND, "kept-app"),
+                ("KasprAgent", "agent"),
+            )
+        }
+        await handler.patch_bus.close()
+        return pending
+
+    try:
+        pending = asyncio.run(run())
+    finally:
+        handler.reference_index.untrack("KasprAgent", "ns", "agent")
+
+    annotation = {"metadata": {"annotations": {handler.OWNER_ANNOTATION: "replica-a"}}}
+    assert len(queue) == 2
+    assert pending["moved-app"] == annotation
+    assert pending["kept-app"] is None
+    assert pending["agent"] == annotation
 
 
 def test_on_delete_cleans_up_global_state(monkeypatch):
     app_name = "delete-me"
-    handler.reconciliation_queue[app_name].put_nowait(app_name)
-    handler.patch_request_queues[app_name].put_nowait({"field": "status", "value": {}})
-    _ = handler.reconciliation_locks[app_name]
-    handler.names_in_queue.add(app_name)
+    key = ("test-namespace", app_name)
+    queue = handler.WorkQueue()
+    monkeypatch.setattr(handler, "reconciliation_queue", queue)
+    queue.add(key)
+    handler.known_apps.add(key)
     handler.hung_member_tracking[(app_name, 0)] = 1
 
-    asyncio.run(handler.on_delete(app_name))
+    async def run():
+        handler.patch_bus.request(
+            handler.APP_KIND, "test-namespace", app_name, {"field": "status", "value": {}}
+        )
+        await handler.on_delete(app_name, namespace="test-namespace")
+
+    asyncio.run(run())
 
-    assert app_name not in handler.reconciliation_queue
-    assert app_name not in handler.patch_request_queues
-    assert app_name not in handler.reconciliation_locks
-    assert app_name not in handler.names_in_queue
+    assert key not in queue
+    assert key not in handler.known_apps
+    assert handler.patch_bus.pending(handler.APP_KIND, "test-namespace", app_name) is None
     assert (app_name, 0) not in handler.hung_member_tracking
 
 
@@ -514,4 +624,81 @@ def test_on_create_requests_reconciliation(monkeypatch):
         )
     )
 
-    assert calls == ["create", ("request_reconciliation", "test-app", "test-namespace")]
\ No newline at end of file
+    assert calls == ["create", ("request_reconciliation", "test-app", "test-namespace")]
+
+def test_python_packages_status_reads_termination_message(monkeypatch):
+    from kubernetes_asyncio.client import (
+        V1Container,
+        V1ContainerState,
+        V1ContainerStateTerminated,
+        V1ContainerStatus,
+        V1EnvVar,
+        V1Pod,
+        V1PodList,
+        V1PodSpec,
+        V1PodStatus,
+    )
+
+    packages = SimpleNamespace(packages=["requests"], cache=SimpleNamespace(enabled=True))
+    packages_hash = handler.compute_packages_hash(packages)
+    message = (
+        f'{{"hash":"{packages_hash}","installTime":"2025-01-01T00:00:00+00:00",'
+        '"duration":"12s","installedBy":"test-app-0"}'
+    )
+    pod = V1Pod(
+        metadata=V1ObjectMeta(name="test-app-0", uid="pod-uid"),
+        spec=V1PodSpec(
+            containers=[],
+            init_containers=[
+                V1Container(
+                    name="install-packages",
+                    env=[V1EnvVar(name="PACKAGES_HASH", value=packages_hash)],
+                )
+            ],
+        ),
+        status=V1PodStatus(
+            init_container_statuses=[
+                V1ContainerStatus(
+                    name="install-packages",
+                    image="kaspr",
+                    image_id="",
+                    ready=True,
+                    restart_count=0,
+                    state=V1ContainerState(
+                        terminated=V1ContainerStateTerminated(exit_code=0, message=message)
+                    ),
+                )
+            ]
+        ),
+    )
+    list_calls = []
+
+    async def fake_fetch_app_pods():
+        list_calls.append(pod)
+        return V1PodList(items=[pod])
+
+    app = SimpleNamespace(
+        python_packages=packages,
+        DEFAULT_PACKAGES_CACHE_ENABLED=True,
+        fetch_app_pods=fake_fetch_app_pods,
+    )
+    monkeypatch.setattr(handler, "packages_status_cache", handler.LRUCache(8))
+    monkeypatch.setattr(
+        handler, "WsApiClient", Mock(side_effect=AssertionError("exec is not needed"))
+    )
+
+    metadata, state_info = asyncio.run(handler.fetch_python_packages_status(app, Mock()))
+
+    assert state_info["state"] == "Ready"
+    assert metadata["hash"] == packages_hash
+    assert metadata["installed"] == ["requests"]
+    assert metadata["installDuration"] == "12s"
+    assert metadata["installedBy"] == "test-app-0"
+    assert ("pod-uid", packages_hash) in handler.packages_status_cache
+
+    # The cached result is reused even if the message is gone
+    pod.status.init_container_statuses[0].state.terminated.message = None
+    assert asyncio.run(handler.fetch_python_packages_status(app, Mock())) == (
+        metadata,
+        state_info,
+    )
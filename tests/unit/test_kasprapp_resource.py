@@ -18,7 +18,9 @@ from kaspr.types.models.python_packages import (
     PythonPackagesSpec,
     PythonPackagesCache,
     PythonPackagesInstallPolicy,
+    PythonPackagesLock,
     PythonPackagesResources,
+    WheelCacheConfig,
 )
 from kaspr.types.models.kasprapp_spec import KasprAppSpec
 from kaspr.types.models.storage import KasprAppStorage
@@ -365,6 +367,428 @@ def test_synchronize_unites_before_syncing_children(monkeypatch, kasprapp_withou
     ]
 
 
+def _record_sync_steps(monkeypatch, app, calls, events=None, fail=None):
+    import asyncio
+
+    def recorder(name):
+        async def record():
+            calls.append(f"start:{name}")
+            if name == fail:
+                raise RuntimeError(name)
+            await asyncio.sleep(0)
+            calls.append(f"end:{name}")
+
+        return record
+
+    for attr, name in [
+        ("sync_auth_credentials", "auth"),
+        ("sync_service", "service"),
+        ("sync_headless_service", "headless_service"),
+        ("sync_service_account", "service_account"),
+        ("sync_settings_config_map", "config_map"),
+        ("sync_python_packages_pvc", "python_packages_pvc"),
+        ("sync_python_packages_lock", "python_packages_lock"),
+        ("sync_hpa", "hpa"),
+        ("sync_stateful_set", "stateful_set"),
+    ]:
+        monkeypatch.setattr(app, attr, recorder(name))
+    monkeypatch.setattr(app, "unite", lambda: None)
+
+
+def test_synchronize_runs_independent_steps_concurrently(
+    monkeypatch, kasprapp_without_packages
+):
+    import asyncio
+
+    calls = []
+    app = kasprapp_without_packages
+    app.sensor = Mock()
+    _record_sync_steps(monkeypatch, app, calls)
+
+    asyncio.run(app.synchronize())
+
+    # Every independent step starts before any of them finishes, and the
+    # StatefulSet is only synced once all of its dependencies completed.
+    first_end = min(i for i, c in enumerate(calls) if c.startswith("end:"))
+    assert all(c.startswith("start:") for c in calls[:first_end])
+    assert len(calls[:first_end]) == 8
+    assert calls[-2:] == ["start:stateful_set", "end:stateful_set"]
+    steps = {c.args[2] for c in app.sensor.on_sync_step_complete.call_args_list}
+    assert len(steps) == 9
+
+
+def test_synchronize_skips_stateful_set_when_dependency_fails(
+    monkeypatch, kasprapp_without_packages
+):
+    import asyncio
+
+    calls = []
+    app = kasprapp_without_packages
+    _record_sync_steps(monkeypatch, app, calls, fail="config_map")
+
+    with pytest.raises(RuntimeError, match="config_map"):
+        asyncio.run(app.synchronize())
+
+    assert "end:service" in calls
+    assert "start:stateful_set" not in calls
+
+
+def _stub_volume_mounted_resources(app, monkeypatch, annotations, calls):
+    from kubernetes_asyncio.client import V1ObjectMeta, V1StatefulSet
+
+    async def fake_fetch_stateful_set(*args, **kwargs):
+        calls.append("fetch")
+        return V1StatefulSet(metadata=V1ObjectMeta(annotations=annotations))
+
+    async def fake_patch_stateful_set(*args, **kwargs):
+        calls.append(("patch", kwargs["stateful_set"]))
+
+    app.logger = Mock()
+    app.__dict__["volume_mounts"] = []
+    app.__dict__["volumes"] = []
+    app.__dict__["env_vars"] = []
+    monkeypatch.setattr(app, "fetch_stateful_set", fake_fetch_stateful_set)
+    monkeypatch.setattr(app, "patch_stateful_set", fake_patch_stateful_set)
+    monkeypatch.setattr(KasprApp, "_applied_volume_mounted_hashes", {})
+
+
+def test_patch_volume_mounted_resources_patches_once_per_hash(
+    monkeypatch, kasprapp_without_packages
+):
+    import asyncio
+
+    calls = []
+    app = kasprapp_without_packages
+    _stub_volume_mounted_resources(app, monkeypatch, {"kaspr.io/resource-hash": "x"}, calls)
+
+    assert asyncio.run(app.patch_volume_mounted_resources()) is True
+    assert asyncio.run(app.patch_volume_mounted_resources()) is False
+
+    assert calls[0] == "fetch"
+    assert len(calls) == 2
+    hash_op = calls[1][1][-1]
+    assert hash_op == {
+        "op": "add",
+        "path": "/metadata/annotations/kaspr.io~1volume-mounted-resources-hash",
+        "value": app.prepare_volume_mounted_resources_hash(),
+    }
+
+
+def test_patch_volume_mounted_resources_skips_when_annotation_matches(
+    monkeypatch, kasprapp_without_packages
+):
+    import asyncio
+
+    calls = []
+    app = kasprapp_without_packages
+    _stub_volume_mounted_resources(app, monkeypatch, {}, calls)
+    desired_hash = app.prepare_volume_mounted_resources_hash()
+    _stub_volume_mounted_resources(
+        app,
+        monkeypatch,
+        {KasprApp.VOLUME_MOUNTED_RESOURCES_HASH_ANNOTATION: desired_hash},
+        calls,
+    )
+
+    assert asyncio.run(app.patch_volume_mounted_resources()) is False
+    assert calls == ["fetch"]
+    assert KasprApp._applied_volume_mounted_hashes[("test-namespace", "test-app")] == desired_hash
+
+
+def test_unite_passes_owner_outside_of_handlers(monkeypatch, kasprapp_without_packages):
+    app = kasprapp_without_packages.with_meta(
+        {"uid": "uid-1", "name": "test-app", "namespace": "test-namespace"}
+    )
+    for attr in (
+        "_service_account",
+        "_settings_config_map",
+        "_service",
+        "_headless_service",
+        "_stateful_set",
+        "_hpa",
+    ):
+        setattr(app, attr, Mock())
+    adopt = Mock()
+    monkeypatch.setattr("kaspr.resources.kasprapp.kopf.adopt", adopt)
+
+    app.unite()
+
+    owner = adopt.call_args.kwargs["owner"]
+    assert owner["kind"] == "KasprApp"
+    assert owner["apiVersion"] == "kaspr.io/v1alpha1"
+    assert owner["metadata"]["uid"] == "uid-1"
+
+
+def _app_with_meta(base_spec, **meta):
+    app = KasprApp.from_spec(
+        name="test-app",
+        kind="KasprApp",
+        namespace="test-namespace",
+        spec=base_spec,
+        annotations={"kopf.zalando.org/last-handled-configuration": "{}"},
+    )
+    return app.with_meta({"uid": "uid-1", "generation": 1, **meta})
+
+
+def test_render_cache_reuses_rendered_resources(monkeypatch, base_spec):
+    from kubernetes_asyncio.client import V1ObjectMeta, V1Service
+    from kaspr.utils.lru import LRUCache
+
+    base_spec.python_packages = None
+    monkeypatch.setattr(KasprApp, "render_cache", LRUCache(4))
+    service = V1Service(metadata=V1ObjectMeta(name="svc", labels={"a": "b"}))
+
+    first = _app_with_meta(base_spec)
+    assert first.restore_rendered() is False
+    first._service = service
+    first.remember_rendered()
+    # Changes after rendering, e.g. by kopf.adopt, do not reach the cache
+    service.metadata.labels["changed"] = "true"
+
+    second = _app_with_meta(base_spec)
+    assert second.restore_rendered() is True
+    assert second.service is not service
+    assert second.service.metadata.labels == {"a": "b"}
+    second.service.metadata.labels["changed"] = "true"
+
+    third = _app_with_meta(base_spec)
+    assert third.restore_rendered() is True
+    assert third.service.metadata.labels == {"a": "b"}
+
+    changed = _app_with_meta(base_spec, generation=2)
+    assert changed.restore_rendered() is False
+    assert changed._service is None
+
+
+def test_render_cache_forget_rendered_evicts_app(monkeypatch, base_spec):
+    from kubernetes_asyncio.client import V1Service
+    from kaspr.utils.lru import LRUCache
+
+    base_spec.python_packages = None
+    monkeypatch.setattr(KasprApp, "render_cache", LRUCache(4))
+    app = _app_with_meta(base_spec)
+    app.restore_rendered()
+    app._service = V1Service()
+    app.remember_rendered()
+
+    KasprApp.forget_rendered("uid-1")
+
+    assert len(KasprApp.render_cache) == 0
+    assert _app_with_meta(base_spec).restore_rendered() is False
+
+
+def test_rendered_attributes_cover_rendered_properties():
+    attrs = KasprApp.rendered_attributes()
+
+    assert "_stateful_set" in attrs
+    assert "_packages_resolver_job" in attrs
+    assert "_core_v1_api" not in attrs
+    assert "_render_cache_key" not in attrs
+
+
+def test_fetch_all_member_statuses_reuses_fresh_statuses(
+    monkeypatch, kasprapp_without_packages
+):
+    import asyncio
+    from types import SimpleNamespace
+    from kaspr.utils.member_status import MemberStatusStore
+
+    app = kasprapp_without_packages
+    app.logger = Mock()
+    app.conf = SimpleNamespace(
+        client_status_check_enabled=True, client_status_check_timeout_seconds=1
+    )
+    app.__dict__["core_v1_api"] = Mock()
+    requested = []
+
+    async def fake_list_pods(*args, **kwargs):
+        pods = [
+            SimpleNamespace(
+                metadata=SimpleNamespace(
+                    name=f"{app.component_name}-{idx}",
+                    uid=f"uid-{idx}",
+                    creation_timestamp=None,
+                )
+            )
+            for idx in range(2)
+        ]
+        return SimpleNamespace(items=pods)
+
+    async def fake_get_statuses(endpoints, deadline):
+        requested.append(sorted(endpoints))
+        return {idx: {"leader": idx == 0} for idx in endpoints}
+
+    monkeypatch.setattr(app, "list_pods", fake_list_pods)
+    monkeypatch.setattr(
+        KasprApp, "status_client", SimpleNamespace(get_statuses=fake_get_statuses)
+    )
+    monkeypatch.setattr(KasprApp, "member_status_store", MemberStatusStore(ttl=60))
+
+    first = asyncio.run(app.fetch_all_member_statuses(2))
+    second = asyncio.run(app.fetch_all_member_statuses(2))
+
+    assert requested == [[0, 1]]
+    assert first == second
+    assert [member["podUID"] for member in second] == ["uid-0", "uid-1"]
+
+
+def test_fetch_all_member_statuses_shares_fetches_per_replica_count(
+    monkeypatch, kasprapp_without_packages
+):
+    import asyncio
+    from types import SimpleNamespace
+    from kaspr.utils.member_status import MemberStatusStore
+
+    app = kasprapp_without_packages
+    app.conf = SimpleNamespace(client_status_check_enabled=True)
+    fetched = []
+
+    async def fake_fetch(available_replicas):
+        fetched.append(available_replicas)
+        await asyncio.sleep(0.01)
+        return [{"id": idx} for idx in range(available_replicas)]
+
+    monkeypatch.setattr(app, "_fetch_all_member_statuses", fake_fetch)
+    monkeypatch.setattr(KasprApp, "member_status_store", MemberStatusStore())
+
+    async def run():
+        return await asyncio.gather(
+            app.fetch_all_member_statuses(1),
+            app.fetch_all_member_statuses(2),
+            app.fetch_all_member_statuses(2),
+        )
+
+    one, two, shared = asyncio.run(run())
+
+    assert sorted(fetched) == [1, 2]
+    assert len(one) == 1
+    assert two == shared and len(two) == 2
+
+
+def test_sync_service_with_server_side_apply_skips_fetch(kasprapp_without_packages):
+    from kubernetes_asyncio.client import (
+        ApiClient,
+        V1ObjectMeta,
+        V1Service,
+        V1ServicePort,
+        V1ServiceSpec,
+    )
+
+    app = kasprapp_without_packages
+    app.server_side_apply = True
+    app.sensor = Mock()
+    applied = []
+
+    async def fake_patch_namespaced_service(**kwargs):
+        applied.append(kwargs)
+
+    app.__dict__["api_client"] = object.__new__(ApiClient)
+    app.__dict__["core_v1_api"] = Mock(
+        patch_namespaced_service=fake_patch_namespaced_service,
+        read_namespaced_service=Mock(side_effect=AssertionError("no GET expected")),
+    )
+    app.__dict__["service"] = V1Service(
+        metadata=V1ObjectMeta(name="test-app", resource_version="7"),
+        spec=V1ServiceSpec(ports=[V1ServicePort(name="http", port=6065)]),
+    )
+
+    import asyncio
+
+    asyncio.run(app.sync_service())
+
+    assert len(applied) == 1
+    request = applied[0]
+    assert request["_content_type"] == "application/apply-patch+yaml"
+    assert request["field_manager"] == KasprApp.FIELD_MANAGER
+    assert request["force"] is True
+    assert request["body"] == {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": "test-app"},
+        "spec": {"ports": [{"name": "http", "port": 6065}]},
+    }
+    assert app.sensor.on_resource_sync_complete.call_args.args[6] == "apply"
+
+
+def test_sync_service_refreshes_stale_hash_annotation_only(kasprapp_without_packages):
+    import asyncio
+    from kubernetes_asyncio.client import (
+        V1ObjectMeta,
+        V1Service,
+        V1ServicePort,
+        V1ServiceSpec,
+    )
+
+    def service(hash):
+        return V1Service(
+            metadata=V1ObjectMeta(
+                name="test-app",
+                annotations={KasprApp.RESOURCE_HASH_ANNOTATION: hash},
+            ),
+            spec=V1ServiceSpec(ports=[V1ServicePort(name="http", port=6065)]),
+        )
+
+    app = kasprapp_without_packages
+    app.sensor = Mock()
+    patches = []
+
+    async def fake_fetch_service(*args):
+        return service("stale")
+
+    async def fake_patch_service(core_v1_api, name, namespace, service):
+        patches.append(service)
+
+    app.fetch_service = fake_fetch_service
+    app.patch_service = fake_patch_service
+    app.__dict__["core_v1_api"] = Mock()
+    app.__dict__["service"] = service("current")
+
+    asyncio.run(app.sync_service())
+
+    assert patches == [
+        [
+            {
+                "op": "add",
+                "path": "/metadata/annotations/kaspr.io~1resource-hash",
+                "value": "current",
+            }
+        ]
+    ]
+    app.sensor.on_resource_drift_detected.assert_not_called()
+
+
+def test_prepare_child_hashes_covers_synced_children(kasprapp_without_packages):
+    from types import SimpleNamespace
+    from kubernetes_asyncio.client import V1ObjectMeta
+
+    app = kasprapp_without_packages
+    app.replicas = 2
+    for attr, name in (
+        ("settings_config_map", app.config_map_name),
+        ("service", app.service_name),
+        ("headless_service", app.headless_service_name),
+        ("stateful_set", app.stateful_set_name),
+        ("hpa", app.hpa_name),
+    ):
+        annotations = {KasprApp.RESOURCE_HASH_ANNOTATION: f"{attr}-hash"}
+        if attr == "headless_service":
+            annotations = {}
+        app.__dict__[attr] = SimpleNamespace(
+            metadata=V1ObjectMeta(name=name, annotations=annotations)
+        )
+
+    assert app.prepare_child_hashes() == {
+        ("ConfigMap", app.config_map_name): "settings_config_map-hash",
+        ("Service", app.service_name): "service-hash",
+        ("Service", app.headless_service_name): None,
+        ("StatefulSet", app.stateful_set_name): "stateful_set-hash",
+        ("HorizontalPodAutoscaler", app.hpa_name): "hpa-hash",
+    }
+
+    app.replicas = 0
+    assert ("HorizontalPodAutoscaler", app.hpa_name) not in app.prepare_child_hashes()
+
+
 def test_patch_volume_mounted_resources_skips_missing_statefulset(
     monkeypatch, kasprapp_without_packages
 ):
@@ -783,6 +1207,30 @@ class TestPrepareVolumes:
         assert packages_volumes[0].empty_dir is not None
         assert packages_volumes[0].persistent_volume_claim is None
     
+    def test_prepare_volumes_with_wheel_cache(self, base_spec):
+        """Test that the shared wheel cache PVC is mounted as is."""
+        base_spec.python_packages = PythonPackagesSpec(
+            packages=["pandas"],
+            cache=PythonPackagesCache(
+                enabled=False,
+                wheel_cache=WheelCacheConfig(claim_name="kaspr-wheels"),
+            ),
+            install_policy=None,
+            resources=None,
+        )
+        app = KasprApp.from_spec(
+            name="test-app",
+            kind="KasprApp",
+            namespace="test-namespace",
+            spec=base_spec,
+        )
+
+        volumes = {v.name: v for v in app.prepare_volumes()}
+
+        wheel_cache = volumes[f"{app.component_name}-wheel-cache"]
+        assert wheel_cache.persistent_volume_claim.claim_name == "kaspr-wheels"
+        assert volumes[f"{app.component_name}-packages"].empty_dir is not None
+    
     def test_prepare_volumes_no_packages(self, kasprapp_without_packages):
         """Test that no packages volume when packages not configured."""
         volumes = kasprapp_without_packages.prepare_volumes()
@@ -997,3 +1445,168 @@ class TestFromSpec:
         )
         
         assert app.python_packages is None
+
+
+class TestPackagesLock:
+    """Tests for the resolution lock of Python packages."""
+
+    LOCK_LOG = (
+        "Python Package Resolver\n"
+        "KASPR_PACKAGES_LOCK_BEGIN\n"
+        "pandas==2.0.0 --hash=sha256:aaaa\n"
+        "KASPR_PACKAGES_LOCK_END\n"
+    )
+
+    def _app(self, base_spec, packages=("pandas==2.0.0",)):
+        base_spec.python_packages = PythonPackagesSpec(
+            packages=list(packages),
+            cache=None,
+            install_policy=None,
+            lock=PythonPackagesLock(enabled=True),
+            resources=None,
+        )
+        app = _app_with_meta(base_spec, name="test-app", namespace="test-namespace")
+        app.__dict__["image"] = "kasprio/kaspr:test"
+        app.sensor = Mock()
+        return app
+
+    def _fake_apis(self, app, config_map=None, job=None):
+        from kubernetes_asyncio.client import (
+            V1ObjectMeta,
+            V1Pod,
+            V1PodList,
+            V1PodStatus,
+        )
+
+        created = {}
+
+        async def read_namespaced_config_map(name, namespace):
+            if config_map is None:
+                from kubernetes_asyncio.client import ApiException
+
+                raise ApiException(status=404)
+            return config_map
+
+        async def create_namespaced_config_map(namespace, body):
+            created["config_map"] = body
+
+        async def read_namespaced_job(name, namespace):
+            if job is None:
+                from kubernetes_asyncio.client import ApiException
+
+                raise ApiException(status=404)
+            return job
+
+        async def create_namespaced_job(namespace, body):
+            created["job"] = body
+
+        async def list_namespaced_pod(namespace, label_selector):
+            created["label_selector"] = label_selector
+            return V1PodList(
+                items=[
+                    V1Pod(
+                        metadata=V1ObjectMeta(name="resolver-1"),
+                        status=V1PodStatus(phase="Failed"),
+                    ),
+                    V1Pod(
+                        metadata=V1ObjectMeta(name="resolver-2"),
+                        status=V1PodStatus(phase="Succeeded"),
+                    ),
+                ]
+            )
+
+        async def read_namespaced_pod_log(name, namespace, container):
+            assert (name, container) == ("resolver-2", "resolve-packages")
+            return self.LOCK_LOG
+
+        app.__dict__["core_v1_api"] = Mock(
+            read_namespaced_config_map=read_namespaced_config_map,
+            create_namespaced_config_map=create_namespaced_config_map,
+            list_namespaced_pod=list_namespaced_pod,
+            read_namespaced_pod_log=read_namespaced_pod_log,
+        )
+        app.__dict__["batch_v1_api"] = Mock(
+            read_namespaced_job=read_namespaced_job,
+            create_namespaced_job=create_namespaced_job,
+        )
+        return created
+
+    def test_prepare_packages_resolver_job(self, base_spec):
+        app = self._app(base_spec)
+
+        job = app.prepare_packages_resolver_job()
+
+        assert job.metadata.name == f"{app.component_name}-resolve-{app.packages_hash[:10]}"
+        pod_spec = job.spec.template.spec
+        assert pod_spec.restart_policy == "Never"
+        assert pod_spec.containers[0].image == "kasprio/kaspr:test"
+        assert "--dry-run" in pod_spec.containers[0].args[0]
+        # Resolver pods are never listed as app members
+        selectors = app.labels.kasper_label_selectors().as_dict()
+        assert not set(selectors) & set(job.spec.template.metadata.labels)
+
+    def test_lock_disabled_for_direct_references(self, base_spec):
+        app = self._app(
+            base_spec, packages=["git+https://github.com/org/repo.git@v1.0.0"]
+        )
+
+        assert app.packages_lock_enabled() is False
+        assert app.prepare_packages_resolver_job() is None
+
+    def test_prepare_volumes_with_lock(self, base_spec):
+        app = self._app(base_spec)
+
+        volumes = {v.name: v for v in app.prepare_volumes()}
+
+        lock = volumes[f"{app.component_name}-packages-lock"]
+        assert lock.config_map.name == app.packages_lock_config_map_name
+        assert lock.config_map.optional is True
+
+    def test_sync_starts_resolver_job(self, base_spec):
+        import asyncio
+
+        app = self._app(base_spec)
+        created = self._fake_apis(app)
+
+        asyncio.run(app.sync_python_packages_lock())
+
+        assert created["job"] is app.packages_resolver_job
+        assert "config_map" not in created
+
+    def test_sync_stores_lock_of_completed_job(self, monkeypatch, base_spec):
+        import asyncio
+        from kubernetes_asyncio.client import V1JobCondition, V1JobStatus
+
+        adopt = Mock()
+        monkeypatch.setattr("kaspr.resources.kasprapp.kopf.adopt", adopt)
+        app = self._app(base_spec)
+        job = app.packages_resolver_job
+        job.status = V1JobStatus(
+            conditions=[V1JobCondition(type="Complete", status="True")]
+        )
+        created = self._fake_apis(app, job=job)
+
+        asyncio.run(app.sync_python_packages_lock())
+
+        assert created["label_selector"] == f"job-name={job.metadata.name}"
+        config_map = created["config_map"]
+        assert config_map.metadata.name == app.packages_lock_config_map_name
+        assert adopt.call_args.args[0] is config_map
+        assert adopt.call_args.kwargs["owner"]["metadata"]["uid"] == "uid-1"
+        assert config_map.data == {
+            "requirements.lock": "pandas==2.0.0 --hash=sha256:aaaa\n",
+            "packages-hash": app.packages_hash,
+        }
+
+    def test_sync_skips_current_lock(self, base_spec):
+        import asyncio
+        from kubernetes_asyncio.client import V1ConfigMap
+
+        app = self._app(base_spec)
+        created = self._fake_apis(
+            app, config_map=V1ConfigMap(data={"packages-hash": app.packages_hash})
+        )
+
+        asyncio.run(app.sync_python_packages_lock())
+
+        assert created == {}
@@ -0,0 +1,34 @@
+"""Unit tests for the LRU cache."""
+
+from kaspr.utils.lru import LRUCache
+
+
+def test_put_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_get_counts_hits_and_misses():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses, cache.hit_ratio) == (1, 1, 0.5)
+
+
+def test_discard_where_drops_matching_keys():
+    cache = LRUCache(maxsize=4)
+    cache.put(("uid-1", 1), "x")
+    cache.put(("uid-1", 2), "y")
+    cache.put(("uid-2", 1), "z")
+
+    assert cache.discard_where(lambda key: key[0] == "uid-1") == 2
+    assert len(cache) == 1
@@ -0,0 +1,58 @@
+"""Unit tests for the member status store."""
+
+import asyncio
+
+from kaspr.utils.member_status import MemberStatusStore
+
+APP = ("ns", "app")
+
+
+def test_fresh_reuses_status_for_same_pod_within_ttl():
+    store = MemberStatusStore(ttl=60)
+    store.update(APP, {0: ("uid-a", {"id": 0, "leader": True})})
+
+    assert store.fresh(APP, 0, "uid-a") == {"id": 0, "leader": True}
+    assert store.fresh(APP, 0, "uid-b") is None
+    assert store.fresh(APP, 0, None) is None
+    assert MemberStatusStore(ttl=0).fresh(APP, 0, "uid-a") is None
+
+
+def test_update_keeps_reused_snapshots_and_drops_departed_members(monkeypatch):
+    import kaspr.utils.member_status as member_status
+
+    clock = [100.0]
+    monkeypatch.setattr(member_status.time, "monotonic", lambda: clock[0])
+    store = MemberStatusStore(ttl=10)
+    store.update(
+        APP,
+        {
+            0: ("uid-a", {"id": 0, "leader": True}),
+            1: ("uid-b", {"id": 1, "leader": False}),
+        },
+    )
+    clock[0] = 108.0
+    store.update(APP, {0: ("uid-a", {"id": 0, "leader": True})}, reused={0})
+    clock[0] = 111.0
+
+    # The reused status keeps the time it was fetched at
+    assert store.fresh(APP, 0, "uid-a") is None
+    assert store.fresh(APP, 1, "uid-b") is None
+    assert store._snapshots[APP].keys() == {0}
+
+
+def test_single_flight_shares_concurrent_fetches():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def run():
+        store = MemberStatusStore()
+        results = await asyncio.gather(
+            store.single_flight(APP, fetch), store.single_flight(APP, fetch)
+        )
+        return results, await store.single_flight(APP, fetch)
+
+    assert asyncio.run(run()) == ([1, 1], 2)
@@ -0,0 +1,87 @@
+"""Unit tests for the pooled member status client."""
+
+import asyncio
+
+from kaspr.web import KasprWebClient, MemberStatusClient
+
+
+def _run_with_client(monkeypatch, delays, deadline, **kwargs):
+    async def fake_get_status(self, endpoint):
+        delay = delays[endpoint]
+        if delay is None:
+            raise RuntimeError("connection refused")
+        await asyncio.sleep(delay)
+        return {"endpoint": endpoint}
+
+    monkeypatch.setattr(KasprWebClient, "get_status", fake_get_status)
+
+    async def run():
+        client = MemberStatusClient(**kwargs)
+        try:
+            return await client.get_statuses(
+                {idx: endpoint for idx, endpoint in enumerate(delays)},
+                deadline=deadline,
+            )
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_get_statuses_keeps_results_of_members_that_answered(monkeypatch):
+    results = _run_with_client(
+        monkeypatch, {"http://a": 0, "http://slow": 5, "http://down": None}, 0.1
+    )
+
+    assert results[0] == {"endpoint": "http://a"}
+    assert isinstance(results[1], asyncio.TimeoutError)
+    assert isinstance(results[2], RuntimeError)
+
+
+def test_get_statuses_limits_concurrency(monkeypatch):
+    in_flight, peak = 0, 0
+
+    async def fake_get_status(self, endpoint):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {}
+
+    monkeypatch.setattr(KasprWebClient, "get_status", fake_get_status)
+
+    async def run():
+        client = MemberStatusClient(max_concurrency=2)
+        try:
+            return await client.get_statuses({idx: idx for idx in range(6)}, 1)
+        finally:
+            await client.close()
+
+    assert len(asyncio.run(run())) == 6
+    assert peak == 2
+
+
+def test_pool_usage_counts_requests_in_flight(monkeypatch):
+    started = asyncio.Event()
+
+    async def fake_get_status(self, endpoint):
+        started.set()
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(KasprWebClient, "get_status", fake_get_status)
+
+    async def run():
+        client = MemberStatusClient(max_concurrency=4, limit=50)
+        try:
+            idle = client.pool_usage()
+            task = asyncio.ensure_future(client.get_status("http://a"))
+            await started.wait()
+            busy = client.pool_usage()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return idle, busy, client.pool_usage()
+        finally:
+            await client.close()
+
+    assert asyncio.run(run()) == ((0, 50, 0), (1, 50, 1), (0, 50, 0))
@@ -0,0 +1,67 @@
+"""Unit tests for the slotted model base."""
+
+import gc
+from typing import Optional
+
+from kaspr.types.base import BaseModel, UnknownModel
+
+
+class Inner(BaseModel):
+    value: int
+
+
+class Outer(BaseModel):
+    name: str
+    inner: Optional[Inner]
+    replicas: int = 1
+
+
+def test_annotated_attributes_are_slots():
+    assert Outer.__slots__ == ("name", "inner")
+    outer = Outer(name="a", inner=Inner(value=1))
+
+    assert outer.name == "a"
+    assert outer.inner.value == 1
+    assert outer.replicas == 1
+
+
+def test_defaults_are_not_shadowed():
+    assert Outer(name="a").replicas == 1
+    assert Outer(name="a", replicas=3).replicas == 3
+
+
+def test_unknown_attributes_are_kept():
+    outer = Outer(name="a", extra={"x": 1})
+
+    assert outer.extra == {"x": 1}
+    assert outer.as_dict() == {"name": "a", "extra": {"x": 1}}
+
+
+def test_as_dict_keeps_field_order():
+    outer = Outer(replicas=2, inner=Inner(value=1), name="a")
+    outer.other = True
+
+    assert list(outer.as_dict()) == ["replicas", "inner", "name", "other"]
+    assert outer.as_dict()["inner"] == {"value": 1}
+
+
+def test_instance_dict_is_not_left_allocated():
+    outer = Outer(name="a", inner=Inner(value=1))
+    outer.as_dict()
+    repr(outer)
+
+    assert not any(isinstance(ref, dict) for ref in gc.get_referents(outer))
+
+
+def test_equality_compares_attributes():
+    assert Outer(name="a", inner=Inner(value=1)) == Outer(name="a", inner=Inner(value=1))
+    assert Outer(name="a") != Outer(name="b")
+    assert Outer(name="a") != Outer(name="a", extra=1)
+
+
+def test_unknown_model_mapping_helpers():
+    model = UnknownModel(a=1, b=2)
+
+    assert list(model.keys()) == ["a", "b"]
+    assert list(model.values()) == [1, 2]
+    assert list(model.items()) == [("a", 1), ("b", 2)]
@@ -0,0 +1,112 @@
+"""Unit tests for the coalescing patch bus."""
+
+import asyncio
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from kaspr.utils.patch_bus import PatchBus
+
+
+def _recording_bus(debounce_seconds=0.0, error=None):
+    bus = PatchBus(debounce_seconds=debounce_seconds, retry_seconds=60)
+    applied = []
+
+    async def patcher(name, namespace, patch):
+        if error is not None and not applied:
+            applied.append(None)
+            raise error
+        applied.append((namespace, name, patch))
+
+    bus.register("KasprAgent", patcher)
+    return bus, applied
+
+
+def test_requests_within_debounce_window_are_merged_into_one_patch():
+    bus, applied = _recording_bus()
+
+    async def run():
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"app": {"name": "x"}}})
+        bus.request(
+            "KasprAgent",
+            "ns",
+            "a",
+            [
+                {"field": "status", "value": {"app": {"status": "AppFound"}}},
+                {"field": "metadata.annotations", "value": {"k": "v"}},
+            ],
+        )
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert applied == [
+        (
+            "ns",
+            "a",
+            {
+                "status": {"app": {"name": "x", "status": "AppFound"}},
+                "metadata": {"annotations": {"k": "v"}},
+            },
+        )
+    ]
+    assert len(bus) == 0
+
+
+def test_flush_on_demand_and_forget():
+    bus, applied = _recording_bus(debounce_seconds=60)
+
+    async def run():
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"x": 1}})
+        bus.request("KasprAgent", "ns", "b", {"field": "status", "value": {"x": 2}})
+        bus.forget("KasprAgent", "ns", "b")
+        flushed = await bus.flush("KasprAgent", "ns", "a")
+        await bus.close()
+        return flushed
+
+    assert asyncio.run(run()) is True
+    assert applied == [("ns", "a", {"status": {"x": 1}})]
+    assert len(bus) == 0
+
+
+def test_failed_patch_is_retried_under_newer_requests():
+    bus, applied = _recording_bus(error=ApiException(status=500))
+
+    async def run():
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"x": 1, "y": 1}})
+        await asyncio.sleep(0.01)
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"y": 2}})
+        await bus.flush("KasprAgent", "ns", "a")
+        await bus.close()
+
+    asyncio.run(run())
+
+    assert applied[1:] == [("ns", "a", {"status": {"x": 1, "y": 2}})]
+
+
+def test_rejected_patch_is_dropped_and_later_requests_applied_alone():
+    bus, applied = _recording_bus(error=ApiException(status=422))
+
+    async def run():
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"x": "bad"}})
+        await asyncio.sleep(0.01)
+        assert len(bus) == 0
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"y": 1}})
+        await asyncio.sleep(0.01)
+        await bus.close()
+
+    asyncio.run(run())
+
+    assert applied == [None, ("ns", "a", {"status": {"y": 1}})]
+
+
+def test_patch_of_deleted_object_is_dropped():
+    bus, applied = _recording_bus(error=ApiException(status=404))
+
+    async def run():
+        bus.request("KasprAgent", "ns", "a", {"field": "status", "value": {"x": 1}})
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert applied == [None]
+    assert len(bus) == 0
@@ -0,0 +1,118 @@
+"""Unit tests for the cardinality of PrometheusMonitor series."""
+
+from prometheus_client import CollectorRegistry
+
+from kaspr.sensors.prometheus import PrometheusMonitor
+
+
+def _monitor(**kwargs):
+    registry = CollectorRegistry()
+    return PrometheusMonitor(registry=registry, **kwargs), registry
+
+
+def _series(registry, name):
+    return [
+        sample.labels
+        for metric in registry.collect()
+        for sample in metric.samples
+        if sample.name == name
+    ]
+
+
+def test_deleted_app_series_are_removed():
+    monitor, registry = _monitor()
+    for app in ("a", "b"):
+        monitor.on_hung_member_detected(app, "ns", 0, 1, 120.0)
+        monitor.on_status_update(app, "ns", ["members"])
+
+    monitor.on_app_deleted("a", "ns")
+
+    assert [labels["app_name"] for labels in _series(registry, "kasprop_hung_members_detected_total")] == ["b"]
+    assert [labels["app_name"] for labels in _series(registry, "kasprop_status_updates_total")] == ["b"]
+    assert monitor.series.member_series == 3
+
+
+def test_series_of_departed_members_are_removed():
+    monitor, registry = _monitor()
+    for member_id in range(3):
+        monitor.on_member_terminated("a", "ns", member_id, "hung")
+
+    monitor.on_members_observed("a", "ns", [0, 1])
+
+    members = _series(registry, "kasprop_member_terminations_total")
+    assert sorted(labels["member_id"] for labels in members) == ["0", "1"]
+    assert monitor.series.member_series == 6
+
+
+def test_member_series_budget_overflows():
+    monitor, registry = _monitor(max_member_series=2)
+    for member_id in range(4):
+        monitor.on_member_state_change("a", "ns", member_id, "running", "rebalancing")
+
+    transitions = {
+        member_id: registry.get_sample_value(
+            "kasprop_member_state_transitions_total",
+            {
+                "app_name": "a",
+                "namespace": "ns",
+                "member_id": member_id,
+                "from_state": "running",
+                "to_state": "rebalancing",
+            },
+        )
+        for member_id in ("0", "1", "2", "overflow")
+    }
+    assert transitions == {"0": 1.0, "1": 1.0, "2": None, "overflow": 2.0}
+    assert registry.get_sample_value("kasprop_member_series_overflow_total") == 2.0
+
+    # Removing a member frees budget for new ones
+    monitor.on_members_observed("a", "ns", [1])
+    monitor.on_member_state_change("a", "ns", 5, "running", "rebalancing")
+    members = _series(registry, "kasprop_member_state_transitions_total")
+    assert sorted(labels["member_id"] for labels in members) == ["1", "5", "overflow"]
+
+
+def test_overflowed_members_are_counted_once_and_stay_in_overflow():
+    monitor, registry = _monitor(max_member_series=1)
+    for _ in range(3):
+        monitor.on_member_state_change("a", "ns", 0, "running", "rebalancing")
+        monitor.on_member_state_change("a", "ns", 1, "running", "rebalancing")
+        monitor.on_member_terminated("a", "ns", 1, "hung")
+
+    assert registry.get_sample_value("kasprop_member_series_overflow_total") == 1.0
+
+    # Budget freed by a departed member is not given to a member in overflow
+    monitor.on_members_observed("a", "ns", [1])
+    monitor.on_member_terminated("a", "ns", 1, "hung")
+    members = _series(registry, "kasprop_member_terminations_total")
+    assert [labels["member_id"] for labels in members] == ["overflow"]
+    assert registry.get_sample_value("kasprop_member_series_overflow_total") == 1.0
+
+
+def test_aggregated_members_are_recorded_per_app():
+    monitor, registry = _monitor(aggregate_members=True)
+    monitor.on_hung_member_detected("a", "ns", 0, 2, 300.0)
+    monitor.on_hung_member_detected("a", "ns", 1, 3, 600.0)
+    monitor.on_member_terminated("a", "ns", 1, "hung")
+
+    labels = {"app_name": "a", "namespace": "ns"}
+    assert registry.get_sample_value("kasprop_hung_members_detected_total", labels) == 2.0
+    assert registry.get_sample_value("kasprop_hung_member_duration_seconds_count", labels) == 2.0
+    assert registry.get_sample_value("kasprop_hung_member_duration_seconds_sum", labels) == 900.0
+    assert registry.get_sample_value(
+        "kasprop_member_terminations_total", {**labels, "reason": "hung"}
+    ) == 1.0
+    assert monitor.series.member_series == 0
+
+
+def test_cache_samples_advance_counters():
+    monitor, registry = _monitor()
+    monitor.on_cache_sample("spec", 5, 2, 3)
+    monitor.on_cache_sample("spec", 9, 3, 4)
+    # A replaced cache starts counting from zero again
+    monitor.on_cache_sample("spec", 1, 1, 1)
+
+    labels = {"cache": "spec"}
+    assert registry.get_sample_value("kasprop_cache_hits_total", labels) == 10.0
+    assert registry.get_sample_value("kasprop_cache_misses_total", labels) == 4.0
+    assert registry.get_sample_value("kasprop_cache_entries", labels) == 1.0
@@ -933,6 +933,68 @@ class TestPhase2InstallScript:
         assert "ERROR_TYPE:" in script
         assert "/tmp/pip-error.log" in script
 
+    def test_scripts_publish_result_as_termination_message(self):
+        """Test cache and GCS scripts publish their result on success."""
+        from kaspr.utils.python_packages import (
+            TERMINATION_MESSAGE_PATH,
+            generate_gcs_install_script,
+            generate_install_script,
+        )
+
+        spec = PythonPackagesSpec(packages=["requests"])
+        script = generate_install_script(spec, packages_hash="abc123")
+        assert f"> {TERMINATION_MESSAGE_PATH}" in script
+        # Published both when installing and when reusing the cache
+        assert script.count('publish_result "/opt/kaspr/packages/.installed-abc123" ""') == 2
+
+        script = generate_gcs_install_script(spec, packages_hash="abc123")
+        assert 'publish_result "" ""' in script
+        assert 'publish_result "" "$INSTALL_DURATION"' in script
+
+    def test_publish_result_writes_parsable_message(self, tmp_path):
+        """Test the published message is parsed back by the operator."""
+        import json
+        import subprocess
+        from kaspr.utils.python_packages import (
+            TERMINATION_MESSAGE_PATH,
+            _build_publish_result_block,
+            parse_install_result,
+        )
+
+        marker = tmp_path / "marker"
+        marker.write_text(json.dumps({
+            "packages": ["requests"],
+            "python_version": "3.12",
+            "install_time": "2025-01-01T00:00:00+00:00",
+            "duration": "12s",
+            "pod_name": "app-0",
+        }))
+        message = tmp_path / "termination-log"
+        block = _build_publish_result_block("abc123").replace(
+            TERMINATION_MESSAGE_PATH, str(message)
+        )
+        subprocess.run(
+            ["bash", "-c", f'set -e\n{block}\npublish_result "{marker}" ""'],
+            check=True,
+        )
+
+        assert parse_install_result(message.read_text()) == {
+            "hash": "abc123",
+            "installTime": "2025-01-01T00:00:00+00:00",
+            "duration": "12s",
+            "installedBy": "app-0",
+            "pythonVersion": "3.12",
+        }
+
+    def test_parse_install_result_ignores_other_messages(self):
+        """Test error messages and truncated results are not parsed."""
+        from kaspr.utils.python_packages import parse_install_result
+
+        assert parse_install_result(None) is None
+        assert parse_install_result("Package installation failed") is None
+        assert parse_install_result('{"hash":"abc1') is None
+        assert parse_install_result('{"duration":"1s"}') is None
+
     def test_error_messages_dict(self):
         """Test ERROR_MESSAGES contains expected keys."""
         from kaspr.utils.python_packages import ERROR_MESSAGES
@@ -1011,6 +1073,22 @@ class TestGCSCacheConfig:
         assert result.max_archive_size == "1Gi"
         assert result.secret_ref.name == "gcs-sa-key"
 
+    def test_schema_compression(self):
+        schema = GCSCacheConfigSchema()
+        data = {
+            "bucket": "my-bucket",
+            "compression": "zstd",
+            "compressionLevel": 12,
+            "secretRef": {"name": "gcs-sa-key"},
+        }
+        result = schema.load(data)
+        assert result.compression == "zstd"
+        assert result.compression_level == 12
+        with pytest.raises(ValidationError):
+            schema.load(dict(data, compression="gzip"))
+        with pytest.raises(ValidationError):
+            schema.load(dict(data, compression="bzip2"))
+
     def test_schema_bucket_required(self):
         schema = GCSCacheConfigSchema()
         with pytest.raises(ValidationError):
@@ -1022,6 +1100,31 @@ class TestGCSCacheConfig:
             schema.load({"bucket": "b"})
 
 
+class TestWheelCacheConfig:
+    """Tests for WheelCacheConfig model and schema."""
+
+    def test_schema_valid(self):
+        result = PythonPackagesCacheSchema().load({
+            "wheelCache": {
+                "claimName": "kaspr-wheels",
+                "retentionDays": 7,
+                "maxSize": "20Gi",
+            },
+        })
+        assert result.wheel_cache.claim_name == "kaspr-wheels"
+        assert result.wheel_cache.retention_days == 7
+        assert result.wheel_cache.max_size == "20Gi"
+
+    def test_schema_invalid_values(self):
+        schema = PythonPackagesCacheSchema()
+        with pytest.raises(ValidationError):
+            schema.load({"wheelCache": {}})
+        with pytest.raises(ValidationError):
+            schema.load({"wheelCache": {"claimName": "w", "retentionDays": 0}})
+        with pytest.raises(ValidationError):
+            schema.load({"wheelCache": {"claimName": "w", "maxSize": "lots"}})
+
+
 class TestPythonPackagesCacheGCS:
     """Tests for PythonPackagesCache with GCS type."""
 
@@ -1198,11 +1301,311 @@ class TestGenerateGcsInstallScript:
         assert "ERROR_TYPE:" in script
         assert "/tmp/pip-error.log" in script
 
-    def test_extracts_archive_on_hit(self):
+    def test_streams_archives(self):
         from kaspr.utils.python_packages import generate_gcs_install_script
 
         spec = PythonPackagesSpec(packages=["requests"])
         script = generate_gcs_install_script(spec)
-        assert "tar xzf" in script
-        assert "tar czf" in script
+        assert "/tmp/packages.tar.gz" not in script
+        assert '"tar", "-x"' in script
+        assert "uploadType=resumable" in script
+        # A partial extraction is cleared before falling back to pip
+        assert '"$GCS_DOWNLOAD_EXIT" -eq 2' in script
+
+    def test_zstd_compression(self):
+        import subprocess
+        from kaspr.utils.python_packages import generate_gcs_install_script
+
+        spec = PythonPackagesSpec(packages=["requests"])
+        script = generate_gcs_install_script(spec, compression="zstd", compression_level=7)
+        assert '${GCS_OBJECT_KEY%.tar.zst}-py${PYTHON_VERSION}.tar.zst' in script
+        assert '["zstd", "-q", "-T0", "-7"]' in script
+        subprocess.run(["bash", "-n"], input=script, text=True, check=True)
+
+
+
+def _write_wheel(directory, name, version, requires=()):
+    """Write a minimal pure-Python wheel of ``name``."""
+    import zipfile
+
+    dist_info = f"{name}-{version}.dist-info"
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    metadata += "".join(f"Requires-Dist: {requirement}\n" for requirement in requires)
+    files = {
+        f"{name}/__init__.py": f"VERSION = {version!r}\n",
+        f"{dist_info}/METADATA": metadata,
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+    }
+    files[f"{dist_info}/RECORD"] = "".join(f"{path},,\n" for path in files) + f"{dist_info}/RECORD,,\n"
+    path = directory / f"{name}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(path, "w") as wheel:
+        for member, content in files.items():
+            wheel.writestr(member, content)
+    return path
+
+
+_SDIST_BACKEND = """
+import zipfile
+
+NAME, VERSION = {name!r}, {version!r}
+
+
+def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
+    dist_info = f"{{NAME}}-{{VERSION}}.dist-info"
+    files = {{
+        f"{{NAME}}/__init__.py": f"VERSION = {{VERSION!r}}\\n",
+        f"{{dist_info}}/METADATA": f"Metadata-Version: 2.1\\nName: {{NAME}}\\nVersion: {{VERSION}}\\n",
+        f"{{dist_info}}/WHEEL": "Wheel-Version: 1.0\\nRoot-Is-Purelib: true\\nTag: py3-none-any\\n",
+    }}
+    files[f"{{dist_info}}/RECORD"] = "".join(f"{{path}},,\\n" for path in files) + f"{{dist_info}}/RECORD,,\\n"
+    filename = f"{{NAME}}-{{VERSION}}-py3-none-any.whl"
+    with zipfile.ZipFile(f"{{wheel_directory}}/{{filename}}", "w") as wheel:
+        for member, content in files.items():
+            wheel.writestr(member, content)
+    return filename
+"""
+
+
+def _write_sdist(directory, name, version):
+    """Write a minimal source distribution of ``name`` with an in-tree build backend."""
+    import io
+    import tarfile
+
+    root = f"{name}-{version}"
+    files = {
+        f"{root}/PKG-INFO": f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n",
+        f"{root}/pyproject.toml": (
+            '[build-system]\nrequires = []\nbuild-backend = "backend"\nbackend-path = ["."]\n'
+        ),
+        f"{root}/backend.py": _SDIST_BACKEND.format(name=name, version=version),
+    }
+    path = directory / f"{root}.tar.gz"
+    with tarfile.open(path, "w:gz") as sdist:
+        for member, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(member)
+            info.size = len(data)
+            sdist.addfile(info, io.BytesIO(data))
+    return path
+
+
+class TestWheelCache:
+    """Tests for the shared wheel cache of the install scripts."""
+
+    def _install(self, tmp_path, packages, **kwargs):
+        import os
+        import subprocess
+        from kaspr.utils.python_packages import generate_emptydir_install_script
+
+        spec = PythonPackagesSpec(packages=packages)
+        script = generate_emptydir_install_script(
+            spec,
+            cache_path=str(tmp_path / "packages"),
+            wheelhouse=str(tmp_path / "wheels"),
+            **kwargs,
+        )
+        env = dict(
+            os.environ,
+            PIP_NO_INDEX="1",
+            PIP_FIND_LINKS=str(tmp_path / "index"),
+            PIP_DISABLE_PIP_VERSION_CHECK="1",
+        )
+        return subprocess.run(
+            ["bash", "-c", script], env=env, capture_output=True, text=True, timeout=300
+        )
+
+    def test_script_without_wheelhouse(self):
+        from kaspr.utils.python_packages import generate_install_script
+
+        script = generate_install_script(PythonPackagesSpec(packages=["requests"]))
+        assert "pip wheel" not in script
+        assert "store_wheels" not in script
+
+    def test_installs_delta_and_collects_garbage(self, tmp_path):
+        import os
+        import time
+
+        (tmp_path / "index").mkdir()
+        (tmp_path / "wheels").mkdir()
+        cached = _write_wheel(tmp_path / "wheels", "demo", "1.0")
+        stale = _write_wheel(tmp_path / "wheels", "demo", "0.9")
+        old = time.time() - 40 * 86400
+        os.utime(stale, (old, old))
+        os.utime(cached, (old + 20 * 86400, old + 20 * 86400))
+        _write_wheel(tmp_path / "index", "other", "2.0")
+
+        result = self._install(tmp_path, ["demo==1.0", "other==2.0"])
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert (tmp_path / "packages" / "demo" / "__init__.py").exists()
+        assert (tmp_path / "packages" / "other" / "__init__.py").exists()
+        assert "reused 1 wheels, stored 1 new wheels" in result.stdout
+        # The used wheel is marked as recently used, the stale one removed
+        assert cached.stat().st_mtime > time.time() - 3600
+        assert not stale.exists()
+        assert sorted(os.listdir(tmp_path / "wheels")) == [
+            ".gc.lock",
+            "demo-1.0-py3-none-any.whl",
+            "other-2.0-py3-none-any.whl",
+        ]
+
+    def test_evicts_least_recently_used_above_max_size(self, tmp_path):
+        import os
+        import time
+
+        (tmp_path / "index").mkdir()
+        (tmp_path / "wheels").mkdir()
+        older = _write_wheel(tmp_path / "wheels", "older", "1.0")
+        used_before = time.time() - 3600
+        os.utime(older, (used_before, used_before))
+        _write_wheel(tmp_path / "wheels", "demo", "1.0")
+        size = (tmp_path / "wheels" / "demo-1.0-py3-none-any.whl").stat().st_size
+
+        result = self._install(tmp_path, ["demo==1.0"], wheel_max_size_bytes=size)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "removed 1 wheels" in result.stdout
+        assert not older.exists()
+        assert (tmp_path / "wheels" / "demo-1.0-py3-none-any.whl").exists()
+
+
+class TestPackagesLock:
+    """Tests for resolving packages into a lock and installing from it."""
+
+    def _run(self, tmp_path, script):
+        import os
+        import subprocess
+
+        env = dict(
+            os.environ,
+            PIP_NO_INDEX="1",
+            PIP_FIND_LINKS=str(tmp_path / "index"),
+            PIP_DISABLE_PIP_VERSION_CHECK="1",
+        )
+        return subprocess.run(
+            ["bash", "-c", script], env=env, capture_output=True, text=True, timeout=300
+        )
+
+    def _resolve(self, tmp_path, spec):
+        from kaspr.utils.python_packages import (
+            LOCK_FILE_KEY,
+            LOCK_HASH_KEY,
+            compute_packages_hash,
+            generate_resolver_script,
+            parse_packages_lock,
+        )
+
+        result = self._run(tmp_path, generate_resolver_script(spec))
+        assert result.returncode == 0, result.stdout + result.stderr
+        lock = parse_packages_lock(result.stdout)
+        (tmp_path / "lock").mkdir()
+        (tmp_path / "lock" / LOCK_FILE_KEY).write_text(lock)
+        (tmp_path / "lock" / LOCK_HASH_KEY).write_text(compute_packages_hash(spec))
+        return lock
+
+    def _install(self, tmp_path, spec, **kwargs):
+        from kaspr.utils.python_packages import generate_emptydir_install_script
+
+        script = generate_emptydir_install_script(
+            spec,
+            cache_path=str(tmp_path / "packages"),
+            retries=1,
+            lock_dir=str(tmp_path / "lock"),
+            **kwargs,
+        )
+        return self._run(tmp_path, script)
+
+    def _index(self, tmp_path):
+        (tmp_path / "index").mkdir()
+        _write_wheel(tmp_path / "index", "demo", "1.0", requires=["other>=2"])
+        _write_wheel(tmp_path / "index", "other", "2.0")
+
+    def test_schema_lock(self):
+        result = PythonPackagesSpecSchema().load({
+            "packages": ["requests"],
+            "lock": {"enabled": True},
+        })
+        assert result.lock.enabled is True
+
+    def test_parse_packages_lock(self):
+        from kaspr.utils.python_packages import parse_packages_lock
+
+        log = "noise\nKASPR_PACKAGES_LOCK_BEGIN\na==1 --hash=sha256:00\n\nKASPR_PACKAGES_LOCK_END\n"
+        assert parse_packages_lock(log) == "a==1 --hash=sha256:00\n"
+        assert parse_packages_lock("KASPR_PACKAGES_LOCK_BEGIN\na==1\n") is None
+        assert parse_packages_lock("") is None
+
+    def test_installs_from_lock_without_resolving(self, tmp_path):
+        import hashlib
+
+        self._index(tmp_path)
+        spec = PythonPackagesSpec(packages=["demo==1.0"])
+
+        lock = self._resolve(tmp_path, spec)
+        other = (tmp_path / "index" / "other-2.0-py3-none-any.whl").read_bytes()
+        lines = lock.splitlines()
+        assert [line.split()[0] for line in lines] == ["demo==1.0", "other==2.0"]
+        assert lines[1] == f"other==2.0 --hash=sha256:{hashlib.sha256(other).hexdigest()}"
+
+        result = self._install(tmp_path, spec)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Installing from resolution lock" in result.stderr
+        assert (tmp_path / "packages" / "demo" / "__init__.py").exists()
+        assert (tmp_path / "packages" / "other" / "__init__.py").exists()
+
+    def test_lock_rejects_changed_distribution(self, tmp_path):
+        self._index(tmp_path)
+        spec = PythonPackagesSpec(packages=["demo==1.0"])
+        self._resolve(tmp_path, spec)
+        # Same name and version, different content
+        with open(tmp_path / "index" / "other-2.0-py3-none-any.whl", "ab") as wheel:
+            wheel.write(b"tampered")
+
+        result = self._install(tmp_path, spec)
+
+        assert result.returncode == 1
+        assert "ERROR_TYPE: hash_mismatch" in result.stdout
+
+    def test_resolves_without_lock_of_current_hash(self, tmp_path):
+        from kaspr.utils.python_packages import LOCK_HASH_KEY
+
+        self._index(tmp_path)
+        spec = PythonPackagesSpec(packages=["demo==1.0"])
+        self._resolve(tmp_path, spec)
+        (tmp_path / "lock" / LOCK_HASH_KEY).write_text("previous-hash")
+
+        result = self._install(tmp_path, spec)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "No resolution lock for hash" in result.stderr
+        assert (tmp_path / "packages" / "other" / "__init__.py").exists()
+
+    def test_lock_uses_and_fills_wheelhouse(self, tmp_path):
+        import shutil
+
+        (tmp_path / "index").mkdir()
+        _write_sdist(tmp_path / "index", "built", "1.0")
+        _write_wheel(tmp_path / "index", "other", "2.0")
+        spec = PythonPackagesSpec(packages=["built==1.0", "other==2.0"])
+        self._resolve(tmp_path, spec)
+        wheelhouse = tmp_path / "wheels"
+
+        result = self._install(tmp_path, spec, wheelhouse=str(wheelhouse))
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Installing from resolution lock" in result.stderr
+        assert (wheelhouse / "built-1.0-py3-none-any.whl").exists()
+        assert (wheelhouse / "other-2.0-py3-none-any.whl").exists()
+
+        # Another pod installs the same lock from the wheelhouse alone
+        shutil.rmtree(tmp_path / "index")
+        (tmp_path / "index").mkdir()
+        shutil.rmtree(tmp_path / "packages")
+
+        result = self._install(tmp_path, spec, wheelhouse=str(wheelhouse))
 
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Wheel cache: 2 locked distributions found" in result.stdout
+        assert (tmp_path / "packages" / "built" / "__init__.py").exists()
+        assert (tmp_path / "packages" / "other" / "__init__.py").exists()
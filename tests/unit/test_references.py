@@ -0,0 +1,150 @@
+"""Unit tests for the reference index and component existence checks."""
+
+import asyncio
+
+import kaspr.handlers.kaspragent as kaspragent
+from kaspr.informers import ReferenceIndex, reported_existence
+from kaspr.utils.patch_bus import PatchBus
+
+
+def _body(kind, name, app="app", namespace="ns"):
+    return {
+        "apiVersion": "kaspr.io/v1alpha1",
+        "kind": kind,
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"uid-{name}",
+            "labels": {"kaspr.io/app": app},
+        },
+    }
+
+
+def test_index_notifies_referrers_on_transitions_only():
+    index = ReferenceIndex()
+    notified = []
+
+    def listener(referrer, role, exists):
+        notified.append((referrer["metadata"]["name"], role, exists))
+
+    index.subscribe("KasprJoin", listener)
+    index.track(
+        _body("KasprJoin", "join"),
+        {"app": ("KasprApp", "app"), "leftTable": ("KasprTable", "left")},
+    )
+
+    assert index.exists("KasprApp", "ns", "app") is None
+    assert index.observe("KasprApp", "ns", "app", True)
+    assert not index.observe("KasprApp", "ns", "app", True)
+    index.observe("KasprTable", "ns", "left", True)
+    index.observe("KasprTable", "other", "left", False)
+    index.observe("KasprApp", "ns", "app", False)
+
+    assert index.exists("KasprApp", "ns", "app") is False
+    assert index.references_of("KasprJoin", "ns", "join") == {
+        "app": "app",
+        "leftTable": "left",
+    }
+    assert notified == [
+        ("join", "app", True),
+        ("join", "leftTable", True),
+        ("join", "app", False),
+    ]
+
+
+def test_index_skips_referrers_that_reported_the_state():
+    index = ReferenceIndex()
+    notified = []
+    index.subscribe("KasprAgent", lambda referrer, role, exists: notified.append(
+        (referrer["metadata"]["name"], exists)
+    ))
+    status = {"app": {"name": "app", "status": "AppFound"}}
+    index.track(
+        _body("KasprAgent", "found"),
+        {"app": ("KasprApp", "app")},
+        reported={"app": reported_existence(status, "app", "AppFound", "AppNotFound")},
+    )
+    index.track(_body("KasprAgent", "new"), {"app": ("KasprApp", "app")})
+
+    # Initial listing after a restart
+    index.observe("KasprApp", "ns", "app", True)
+    index.observe("KasprApp", "ns", "app", False)
+
+    assert notified == [("new", True), ("found", False), ("new", False)]
+
+
+def test_index_keeps_notified_state_over_stale_referrer_events():
+    index = ReferenceIndex()
+    notified = []
+    index.subscribe("KasprAgent", lambda referrer, role, exists: notified.append(exists))
+    found = {"app": {"name": "app", "status": "AppFound"}}
+
+    def track(status):
+        index.track(
+            _body("KasprAgent", "agent"),
+            {"app": ("KasprApp", "app")},
+            reported={"app": reported_existence(status, "app", "AppFound", "AppNotFound")},
+        )
+
+    track(found)
+    index.observe("KasprApp", "ns", "app", True)
+    index.observe("KasprApp", "ns", "app", False)
+    # Event of the agent from before its AppNotFound status was patched
+    track(found)
+    index.observe("KasprApp", "ns", "app", True)
+
+    assert notified == [False, True]
+
+
+def test_index_confirm_only_trusts_indexed_objects():
+    index = ReferenceIndex()
+    fetched = []
+
+    async def fetch(name, namespace):
+        fetched.append(name)
+        return {"metadata": {"name": name}} if name == "unseen" else None
+
+    index.observe("KasprApp", "ns", "app", True)
+
+    async def run():
+        return [
+            await index.confirm("KasprApp", "ns", name, fetch)
+            for name in ("app", "unseen", "gone")
+        ]
+
+    assert asyncio.run(run()) == [True, True, False]
+    assert fetched == ["unseen", "gone"]
+
+
+def test_index_untrack_and_retrack_drop_stale_references():
+    index = ReferenceIndex()
+    index.track(_body("KasprAgent", "agent", app="a"), {"app": ("KasprApp", "a")})
+    index.track(_body("KasprAgent", "agent", app="b"), {"app": ("KasprApp", "b")})
+
+    assert index.referrers("KasprApp", "ns", "a") == {}
+    assert index.referrers("KasprApp", "ns", "b") == {("KasprAgent", "ns", "agent"): "app"}
+
+    index.untrack("KasprAgent", "ns", "agent")
+    assert index.referrers("KasprApp", "ns", "b") == {}
+
+
+def test_agent_status_follows_app_existence(monkeypatch):
+    events = []
+    def record(body, **kwargs):
+        events.append(kwargs["reason"])
+
+    monkeypatch.setattr(kaspragent.kopf, "event", record)
+    monkeypatch.setattr(kaspragent.kopf, "warn", record)
+    bus = PatchBus(debounce_seconds=60)
+    monkeypatch.setattr(kaspragent, "patch_bus", bus)
+
+    async def run():
+        kaspragent.on_app_reference_changed(_body("KasprAgent", "agent"), "app", False)
+        kaspragent.on_app_reference_changed(_body("KasprAgent", "agent"), "app", True)
+        pending = bus.pending("KasprAgent", "ns", "agent")
+        await bus.close()
+        return pending
+
+    # Both updates are coalesced into one patch
+    assert asyncio.run(run()) == {"status": {"app": {"status": kaspragent.APP_FOUND}}}
+    assert events == [kaspragent.APP_NOT_FOUND, kaspragent.APP_FOUND]
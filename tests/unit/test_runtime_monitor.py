@@ -0,0 +1,51 @@
+"""Unit tests for the runtime health monitor."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+from kaspr.utils.runtime_monitor import RuntimeMonitor
+
+
+def test_sample_reports_tasks_queues_and_pools():
+    monitor = RuntimeMonitor()
+    sensor = Mock()
+
+    async def run():
+        worker = asyncio.create_task(asyncio.sleep(1), name="worker for ('default', 'app')")
+        monitor.sensor = sensor
+        monitor.queues = {"reconciliation": lambda: 3}
+        monitor.pools = {"member_status": lambda: (2, 200, 5)}
+        monitor.caches = {"spec": lambda: (8, 2, 4)}
+        monitor.sample(0.25)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+    asyncio.run(run())
+
+    lag, tasks = sensor.on_event_loop_sample.call_args.args
+    assert lag == 0.25
+    assert tasks >= 2
+    assert [call.args for call in sensor.on_queue_depth.call_args_list] == [
+        ("kopf_workers", 1),
+        ("reconciliation", 3),
+    ]
+    sensor.on_http_pool_sample.assert_called_once_with("member_status", 2, 200, 5)
+    sensor.on_cache_sample.assert_called_once_with("spec", 8, 2, 4)
+
+
+def test_monitor_measures_event_loop_lag():
+    sensor = Mock()
+    monitor = RuntimeMonitor()
+
+    async def run():
+        monitor.start(sensor, interval_seconds=0.01)
+        await asyncio.sleep(0)
+        # Block the event loop past the scheduled wakeup
+        time.sleep(0.1)
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+    asyncio.run(run())
+
+    assert sensor.on_event_loop_sample.call_args_list[0].args[0] >= 0.05
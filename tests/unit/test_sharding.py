@@ -0,0 +1,143 @@
+"""Unit tests for operator sharding."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import kopf
+from kubernetes_asyncio.client.rest import ApiException
+
+from kaspr.sharding import (
+    HashRing,
+    OwnedDiffBaseStorage,
+    ShardCoordinator,
+    set_coordinator,
+)
+
+
+def _lease(identity, age_seconds, duration=15):
+    return SimpleNamespace(
+        spec=SimpleNamespace(
+            holder_identity=identity,
+            lease_duration_seconds=duration,
+            renew_time=datetime.now(timezone.utc) - timedelta(seconds=age_seconds),
+        )
+    )
+
+
+class FakeCoordinationApi:
+    def __init__(self, leases):
+        self.leases = leases
+        self.created = []
+
+    async def patch_namespaced_lease(self, name, namespace, body):
+        raise ApiException(status=404)
+
+    async def create_namespaced_lease(self, namespace, body):
+        self.created.append(body)
+
+    async def list_namespaced_lease(self, namespace, label_selector=None):
+        return SimpleNamespace(items=self.leases)
+
+
+def test_hash_ring_only_moves_keys_of_removed_member():
+    keys = [f"ns/app-{i}" for i in range(500)]
+    ring = HashRing(["a", "b", "c"])
+    before = {key: ring.owner(key) for key in keys}
+    ring.set_members(["a", "b"])
+    after = {key: ring.owner(key) for key in keys}
+
+    assert set(before.values()) == {"a", "b", "c"}
+    assert all(after[key] == owner for key, owner in before.items() if owner != "c")
+    assert HashRing().owner("ns/app") is None
+
+
+def test_coordinator_ignores_expired_leases():
+    api = FakeCoordinationApi([_lease("a", 1), _lease("b", 2), _lease("gone", 60)])
+    changes = []
+    coordinator = ShardCoordinator(api, "kaspr", "a", on_change=changes.append)
+
+    asyncio.run(coordinator.renew())
+    asyncio.run(coordinator.refresh_members())
+
+    assert api.created[0].metadata.name == "kaspr-operator-shard-a"
+    assert coordinator.ring.members == {"a", "b"}
+    assert changes == [frozenset({"a", "b"})]
+
+
+def test_lease_times_always_carry_microseconds():
+    api = FakeCoordinationApi([])
+    patches = []
+
+    async def patch_namespaced_lease(name, namespace, body):
+        patches.append(body)
+
+    api.patch_namespaced_lease = patch_namespaced_lease
+    coordinator = ShardCoordinator(api, "kaspr", "a")
+    now = datetime(2024, 1, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+    asyncio.run(coordinator.renew())
+    lease = coordinator.prepare_lease(now)
+
+    assert patches[0]["spec"]["renewTime"].endswith("Z")
+    assert lease.spec.renew_time == "2024-01-02T12:00:00.000000Z"
+    assert lease.spec.acquire_time == "2024-01-02T12:00:00.000000Z"
+
+
+def test_coordinator_reports_apps_gained_from_leaving_member():
+    api = FakeCoordinationApi([_lease("a", 1), _lease("b", 1)])
+    coordinator = ShardCoordinator(api, "kaspr", "a")
+    apps = [f"app-{i}" for i in range(50)]
+
+    asyncio.run(coordinator.refresh_members())
+    assert not any(coordinator.gained("ns", app) for app in apps)
+
+    api.leases = [_lease("a", 1)]
+    asyncio.run(coordinator.refresh_members())
+    gained = [app for app in apps if coordinator.gained("ns", app)]
+
+    assert gained
+    assert all(coordinator.previous_ring.owner(f"ns/{app}") == "b" for app in gained)
+    assert all(coordinator.owns("ns", app) for app in apps)
+
+
+def test_components_follow_their_app():
+    coordinator = ShardCoordinator(FakeCoordinationApi([]), "kaspr", "a")
+    coordinator.ring.set_members(["a", "b"])
+    owned = [
+        f"app-{i}" for i in range(50) if coordinator.owns("ns", f"app-{i}")
+    ]
+    not_owned = [
+        f"app-{i}" for i in range(50) if not coordinator.owns("ns", f"app-{i}")
+    ]
+
+    def agent(app):
+        return {
+            "kind": "KasprAgent",
+            "metadata": {"name": "agent", "namespace": "ns", "labels": {"kaspr.io/app": app}},
+        }
+
+    assert owned and not_owned
+    assert coordinator.owns_object({"kind": "KasprApp", "metadata": {"name": owned[0], "namespace": "ns"}})
+    assert coordinator.owns_object(agent(owned[0]))
+    assert not coordinator.owns_object(agent(not_owned[0]))
+
+
+def test_owned_diffbase_storage_skips_objects_of_other_shards():
+    coordinator = ShardCoordinator(FakeCoordinationApi([]), "kaspr", "a")
+    coordinator.ring.set_members(["b"])
+    storage = OwnedDiffBaseStorage()
+    body = kopf.Body({"kind": "KasprApp", "metadata": {"name": "app", "namespace": "ns"}})
+    essence = kopf.BodyEssence(spec={"replicas": 1})
+
+    set_coordinator(coordinator)
+    try:
+        patch = kopf.Patch()
+        storage.store(body=body, patch=patch, essence=essence)
+        assert not patch
+    finally:
+        set_coordinator(None)
+
+    patch = kopf.Patch()
+    storage.store(body=body, patch=patch, essence=essence)
+    assert patch["metadata"]["annotations"]
@@ -0,0 +1,59 @@
+"""Unit tests for memoized spec loading."""
+
+from marshmallow import Schema, fields, post_load
+
+from kaspr.utils.spec_memo import SpecMemo
+
+
+class Model:
+    def __init__(self, name):
+        self.name = name
+
+
+class CountingSchema(Schema):
+    loads = 0
+
+    name = fields.Str()
+
+    @post_load
+    def make(self, data, **kwargs):
+        CountingSchema.loads += 1
+        return Model(**data)
+
+
+def test_unchanged_spec_is_loaded_once_per_object():
+    CountingSchema.loads = 0
+    memo = SpecMemo(maxsize=8)
+
+    first = memo.load(CountingSchema, {"name": "a"}, ("ns", "agent"))
+    again = memo.load(CountingSchema, {"name": "a"}, ("ns", "agent"))
+    other = memo.load(CountingSchema, {"name": "a"}, ("ns", "other-agent"))
+
+    assert again is first
+    assert other is not first
+    assert CountingSchema.loads == 2
+    assert (memo.hits, memo.misses) == (1, 2)
+    assert memo.usage() == (1, 2, 2)
+
+
+def test_changed_spec_is_reloaded():
+    CountingSchema.loads = 0
+    memo = SpecMemo(maxsize=8)
+
+    first = memo.load(CountingSchema, {"name": "a"}, ("ns", "agent"))
+    changed = memo.load(CountingSchema, {"name": "b"}, ("ns", "agent"))
+
+    assert changed.name == "b" and first.name == "a"
+    assert CountingSchema.loads == 2
+
+
+def test_disabled_memo_always_loads_with_shared_schema():
+    CountingSchema.loads = 0
+    memo = SpecMemo(maxsize=0)
+
+    memo.load(CountingSchema, {"name": "a"})
+    memo.load(CountingSchema, {"name": "a"})
+
+    assert CountingSchema.loads == 2
+    assert memo.hit_ratio is None
+    assert memo.schema(CountingSchema) is memo.schema(CountingSchema)
@@ -0,0 +1,40 @@
+"""Unit tests for the per-cycle status context."""
+
+import asyncio
+
+from kaspr.utils.status_context import StatusContext
+
+
+def test_concurrent_readers_share_one_fetch():
+    calls = []
+
+    async def fetch():
+        calls.append("pods")
+        await asyncio.sleep(0)
+        return ["app-0", "app-1"]
+
+    async def run():
+        context = StatusContext()
+        first, second = await asyncio.gather(
+            context.get("pods", fetch), context.get("pods", fetch)
+        )
+        return first, second, await context.get("pods", fetch), "pods" in context
+
+    first, second, third, contained = asyncio.run(run())
+
+    assert first == second == third == ["app-0", "app-1"]
+    assert contained
+    assert calls == ["pods"]
+
+
+def test_put_seeds_a_fetched_object():
+    async def fetch():
+        raise AssertionError("should not be fetched")
+
+    async def run():
+        context = StatusContext()
+        assert "stateful_set" not in context
+        context.put("stateful_set", "sts")
+        return await context.get("stateful_set", fetch)
+
+    assert asyncio.run(run()) == "sts"
@@ -0,0 +1,45 @@
+"""Tests for the status delta of KasprApp status patches."""
+
+from kaspr.utils.helpers import status_delta
+
+
+def test_unchanged_status_has_no_delta():
+    current = {"availableMembers": "3/3", "members": [{"id": 0, "leader": True}]}
+    update = {"availableMembers": "3/3", "members": [{"id": 0, "leader": True}]}
+    assert status_delta(current, update) == {}
+
+
+def test_volatile_only_changes_have_no_delta():
+    current = {
+        "lastUpdateTime": "2024-01-01T00:00:00Z",
+        "members": [{"id": 0, "lastUpdateTime": "2024-01-01T00:00:00Z"}],
+    }
+    update = {
+        "lastUpdateTime": "2024-01-01T00:00:05Z",
+        "members": [{"id": 0, "lastUpdateTime": "2024-01-01T00:00:05Z"}],
+    }
+    assert status_delta(current, update) == {}
+
+
+def test_changed_entries_are_returned_with_volatile_fields():
+    current = {
+        "lastUpdateTime": "2024-01-01T00:00:00Z",
+        "availableMembers": "2/3",
+        "phase": "Running",
+    }
+    update = {
+        "lastUpdateTime": "2024-01-01T00:00:05Z",
+        "availableMembers": "3/3",
+        "phase": "Running",
+    }
+    assert status_delta(current, update) == {
+        "lastUpdateTime": "2024-01-01T00:00:05Z",
+        "availableMembers": "3/3",
+    }
+
+
+def test_clearing_unset_field_is_not_a_change():
+    assert status_delta({}, {"rebalanceState": None}) == {}
+    assert status_delta({"rebalanceState": "x"}, {"rebalanceState": None}) == {
+        "rebalanceState": None
+    }
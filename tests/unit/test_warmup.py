@@ -0,0 +1,138 @@
+"""Unit tests for the startup warm-up."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from kaspr.resources.base import BaseResource
+from kaspr.utils.warmup import MANAGED_BY_SELECTOR, ChildInventory, StartupWarmup
+
+HASH = "kaspr.io/resource-hash"
+
+
+def _items(*children):
+    return SimpleNamespace(
+        items=[
+            SimpleNamespace(
+                metadata=SimpleNamespace(
+                    name=name, annotations={HASH: hash} if hash else None
+                )
+            )
+            for name, hash in children
+        ]
+    )
+
+
+def _inventory(calls, fail=False, selectors=None):
+    inventory = object.__new__(ChildInventory)
+    inventory.annotation = HASH
+    inventory.label_selector = MANAGED_BY_SELECTOR
+    inventory._namespaces = {}
+
+    def lister(result):
+        async def list_namespaced(namespace, label_selector=None):
+            calls.append(namespace)
+            if selectors is not None:
+                selectors.append(label_selector)
+            await asyncio.sleep(0)
+            if fail:
+                raise RuntimeError("forbidden")
+            return result
+
+        return list_namespaced
+
+    inventory.apps_v1_api = Mock(
+        list_namespaced_stateful_set=lister(_items(("app", "sts-1")))
+    )
+    inventory.core_v1_api = Mock(
+        list_namespaced_service=lister(_items(("app", "svc-1"), ("app-hl", None))),
+        list_namespaced_config_map=lister(_items(("app-settings", "cm-1"))),
+    )
+    inventory.autoscaling_v2_api = Mock(
+        list_namespaced_horizontal_pod_autoscaler=lister(_items())
+    )
+    return inventory
+
+
+def _unchanged(warmup, hashes, namespace="default"):
+    return warmup.unchanged(namespace, hashes)
+
+
+def test_unchanged_compares_listed_hashes():
+    calls = []
+    selectors = []
+
+    async def run():
+        warmup = StartupWarmup()
+        warmup.start(
+            _inventory(calls, selectors=selectors), window_seconds=60, jitter_seconds=5
+        )
+        return await asyncio.gather(
+            _unchanged(
+                warmup,
+                {
+                    ("StatefulSet", "app"): "sts-1",
+                    ("Service", "app"): "svc-1",
+                    ("Service", "app-hl"): None,
+                },
+            ),
+            _unchanged(warmup, {("StatefulSet", "app"): "sts-2"}),
+            _unchanged(warmup, {("HorizontalPodAutoscaler", "app"): "hpa-1"}),
+            _unchanged(warmup, {("ConfigMap", "app-settings"): "cm-1"}),
+        )
+
+    assert asyncio.run(run()) == [True, False, False, True]
+    # Concurrent callers share one listing of each kind
+    assert calls == ["default"] * 4
+    # Only resources managed by the operator are listed
+    assert selectors == [
+        f"app.kubernetes.io/managed-by={BaseResource.KASPR_OPERATOR_NAME}"
+    ] * 4
+
+
+def test_unchanged_is_false_when_inactive():
+    calls = []
+
+    async def run():
+        warmup = StartupWarmup()
+        before = await _unchanged(warmup, {})
+        warmup.start(_inventory(calls), window_seconds=60, jitter_seconds=5)
+        warmup.finish()
+        return before, await _unchanged(warmup, {}), warmup.active
+
+    assert asyncio.run(run()) == (False, False, False)
+    assert calls == []
+
+
+def test_unchanged_is_false_when_listing_fails():
+    async def run():
+        warmup = StartupWarmup()
+        warmup.start(_inventory([], fail=True), window_seconds=60, jitter_seconds=5)
+        return await _unchanged(warmup, {})
+
+    assert asyncio.run(run()) is False
+
+
+def test_delay_is_within_jitter_window():
+    warmup = StartupWarmup()
+    warmup.jitter_seconds = 5
+    assert all(0 <= warmup.delay() <= 5 for _ in range(100))
+
+
+def test_prepare_hash_annotation_patch():
+    def obj(annotations):
+        return SimpleNamespace(metadata=SimpleNamespace(annotations=annotations))
+
+    desired = obj({HASH: "new"})
+    prepare_hash_annotation_patch = object.__new__(
+        BaseResource
+    ).prepare_hash_annotation_patch
+
+    assert prepare_hash_annotation_patch(obj({HASH: "new"}), desired) == []
+    assert prepare_hash_annotation_patch(obj({HASH: "old"}), obj({})) == []
+    assert prepare_hash_annotation_patch(obj({HASH: "old"}), desired) == [
+        {"op": "add", "path": "/metadata/annotations/kaspr.io~1resource-hash", "value": "new"}
+    ]
+    assert prepare_hash_annotation_patch(obj(None), desired) == [
+        {"op": "add", "path": "/metadata/annotations", "value": {HASH: "new"}}
+    ]
@@ -0,0 +1,88 @@
+"""Unit tests for the reconciliation work queue."""
+
+import asyncio
+
+from kaspr.utils.workqueue import Priority, TokenBucket, WorkQueue
+
+
+def test_get_returns_highest_priority_first():
+    async def run():
+        queue = WorkQueue(qps=0)
+        queue.add("periodic", Priority.PERIODIC)
+        queue.add("drift", Priority.DRIFT)
+        queue.add("edit", Priority.USER_EDIT)
+        return [(await queue.get())[0] for _ in range(3)]
+
+    assert asyncio.run(run()) == ["edit", "drift", "periodic"]
+
+
+def test_add_deduplicates_and_upgrades_priority():
+    async def run():
+        queue = WorkQueue(qps=0)
+        assert queue.add("app", Priority.PERIODIC) is True
+        assert queue.add("app", Priority.USER_EDIT) is False
+        queue.add("other", Priority.DRIFT)
+        first = await queue.get()
+        second = await queue.get()
+        return len(queue), first, second
+
+    remaining, first, second = asyncio.run(run())
+    assert remaining == 0
+    assert first[:2] == ("app", Priority.USER_EDIT)
+    assert second[:2] == ("other", Priority.DRIFT)
+
+
+def test_key_added_while_processing_is_requeued_after_done():
+    async def run():
+        queue = WorkQueue(qps=0)
+        queue.add("app")
+        key, _, _ = await queue.get()
+        queue.add("app", Priority.DRIFT)
+        assert "app" not in queue
+        queue.done(key)
+        return queue.priority_of("app")
+
+    assert asyncio.run(run()) == Priority.DRIFT
+
+
+def test_add_rate_limited_backs_off_exponentially_until_forget():
+    async def run():
+        queue = WorkQueue(qps=0, base_delay=1.0, max_delay=3.0)
+        delays = [queue.add_rate_limited("app") for _ in range(4)]
+        queue.forget("app")
+        delays.append(queue.backoff("app"))
+        queue.shutdown()
+        return delays
+
+    assert asyncio.run(run()) == [1.0, 2.0, 3.0, 3.0, 1.0]
+
+
+def test_add_after_and_discard():
+    async def run():
+        queue = WorkQueue(qps=0)
+        queue.add_after("app", 0.01)
+        queue.add_after("gone", 0.01)
+        queue.discard("gone")
+        await asyncio.sleep(0.05)
+        return "app" in queue, "gone" in queue
+
+    assert asyncio.run(run()) == (True, False)
+
+
+def test_shutdown_releases_waiting_workers():
+    async def run():
+        queue = WorkQueue(qps=0)
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.shutdown()
+        return await asyncio.wait_for(waiter, 1)
+
+    assert asyncio.run(run()) is None
+
+
+def test_token_bucket_delays_once_burst_is_spent():
+    bucket = TokenBucket(qps=10, burst=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() > 0.0